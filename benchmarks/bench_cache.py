@@ -0,0 +1,85 @@
+"""
+[v2.1.0] IndexCache 저장/로드 벤치마크
+합성 셀 데이터를 캐시에 저장하고 다시 읽어 DB 크기와 저장/로드 시간을 측정합니다.
+
+사용법: python benchmarks/bench_cache.py [--files 5] [--rows 20000] [--cols 8]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.cache import IndexCache  # noqa: E402
+
+
+def make_cells(file_idx: int, rows: int, cols: int):
+    """시트 2개에 걸친 합성 셀 데이터와 헤더를 생성합니다."""
+    headers = [f"컬럼_{c}" for c in range(cols)]
+    cells = {}
+    for sheet_no in range(2):
+        batch = cells.setdefault(f"Sheet{sheet_no + 1}", [])
+        for r in range(rows // 2):
+            for c in range(cols):
+                batch.append((r, c, f"값{file_idx}-{r}-{c}" if c % 2 else str(r * 10 + c)))
+    return cells, {"Sheet1": headers, "Sheet2": headers}
+
+
+def db_size(db_path: str) -> int:
+    """DB 본체와 WAL 파일 크기의 합"""
+    total = 0
+    for suffix in ('', '-wal'):
+        p = db_path + suffix
+        if os.path.exists(p):
+            total += os.path.getsize(p)
+    return total
+
+
+def run(files: int, rows: int, cols: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        cache = IndexCache(db_path)
+
+        # 캐시 유효성 검사용 원본 파일 (내용이 서로 달라야 공유되지 않음)
+        sources = []
+        for i in range(files):
+            p = os.path.join(tmp, f"src_{i}.csv")
+            Path(p).write_text(f"id\n{i}\n", encoding='utf-8')
+            sources.append(p)
+
+        datasets = [make_cells(i, rows, cols) for i in range(files)]
+        total_cells = sum(len(b) for d in datasets for b in d[0].values())
+
+        start = time.perf_counter()
+        for path, (cells, headers) in zip(sources, datasets):
+            cache.save_file_data(path, Path(path).name, cells, headers)
+        save_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        loaded = 0
+        for path in sources:
+            data = cache.load_file_data(path)
+            loaded += len(data['cells'])
+        load_time = time.perf_counter() - start
+
+        cache._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        size = db_size(db_path)
+        cache.close()
+
+    print(f"셀 수        : {total_cells:,} (로드 {loaded:,})")
+    print(f"DB 크기      : {size / 1024 / 1024:.1f} MB")
+    print(f"저장 시간    : {save_time:.2f}초 ({total_cells / save_time:,.0f} 셀/초)")
+    print(f"로드 시간    : {load_time:.2f}초 ({total_cells / load_time:,.0f} 셀/초)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="IndexCache 벤치마크")
+    parser.add_argument("--files", type=int, default=5)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--cols", type=int, default=8)
+    args = parser.parse_args()
+    run(args.files, args.rows, args.cols)
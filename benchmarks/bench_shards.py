@@ -0,0 +1,77 @@
+"""
+[v2.1.0] 샤드 병렬 검색 벤치마크
+합성 데이터로 인덱스를 만든 뒤 병렬도(workers)별 퍼지 검색과 숫자 범위 검색 시간을 측정합니다.
+코어가 하나뿐인 환경에서는 병렬도에 따른 차이가 나타나지 않습니다.
+
+사용법: python benchmarks/bench_shards.py [--rows 200000] [--repeat 3] [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd  # noqa: E402
+
+from src.core.indexer import SearchIndex  # noqa: E402
+from src.core.searcher import MultiLayerSearcher  # noqa: E402
+
+
+def make_index(rows: int) -> SearchIndex:
+    """단어 컬럼 2개와 숫자 컬럼 1개로 구성된 합성 인덱스를 생성합니다."""
+    rng = random.Random(42)
+
+    def word():
+        return ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+
+    df = pd.DataFrame({
+        '상품명': [word() for _ in range(rows)],
+        '설명': [f"{word()} {word()}" for _ in range(rows)],
+        '금액': [str(rng.randint(0, 1_000_000)) for _ in range(rows)],
+    })
+    index = SearchIndex()
+    index.add_dataframe('bench.xlsx', 'bench.xlsx', 'Sheet1', df)
+    index.build_bm25()
+    return index
+
+
+def measure(searcher: MultiLayerSearcher, query: str, repeat: int) -> float:
+    """검색 repeat회 중 가장 빠른 시간 (초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        searcher.search(query)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(rows: int, repeat: int, workers_list):
+    start = time.perf_counter()
+    index = make_index(rows)
+    print(f"인덱스 구축  : {time.perf_counter() - start:.2f}초 "
+          f"(셀 {index.total_cells:,}, 어휘 {len(index.vocabulary):,}, CPU {os.cpu_count()})")
+
+    queries = {'퍼지': 'abcdefg', '범위': '250000~260000'}
+    base = {}
+    for workers in workers_list:
+        searcher = MultiLayerSearcher(index, workers=workers)
+        line = []
+        for name, query in queries.items():
+            elapsed = measure(searcher, query, repeat)
+            base.setdefault(name, elapsed)
+            line.append(f"{name} {elapsed * 1000:8.1f}ms (x{base[name] / elapsed:.2f})")
+        print(f"workers={workers:<2}: " + "  ".join(line))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="샤드 병렬 검색 벤치마크")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+    run(args.rows, args.repeat, args.workers)
@@ -0,0 +1,130 @@
+"""
+[v2.1.0] 시작 시간 벤치마크
+1) import 시간 보고서: `python -X importtime`으로 메인 윈도우 모듈을 import하여 누적 시간 상위 모듈과,
+   창을 띄우기 전에 불러오면 안 되는 무거운 모듈(pandas, openpyxl 등)이 섞였는지 보여 줍니다.
+2) 창 표시 시간: 새 프로세스에서 앱을 띄워 창이 표시될 때까지와 캐시 DB 준비(검색 가능)까지의
+   시간을 측정합니다. 설정/캐시 파일이 섞이지 않도록 임시 폴더에서 실행합니다.
+
+사용법: python benchmarks/bench_startup.py [--top 20] [--repeat 3] [--module src.ui.main_window]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 창 표시 전에 import되면 안 되는 모듈 (파일 읽기/검색/내보내기/BM25 구축 때 불러옴)
+DEFERRED_MODULES = ('pandas', 'openpyxl', 'rank_bm25', 'xlsxwriter', 'rapidfuzz', 'numpy', 'xxhash')
+
+# 창 표시/준비 시각을 출력하는 자식 프로세스 코드
+_LAUNCH_CODE = """
+import sys
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QTimer
+app = QApplication(sys.argv)
+from src.ui.main_window import MainWindow
+window = MainWindow()
+window.show()
+app.processEvents()
+print('window', flush=True)
+
+def poll():
+    if window._backend_ready:
+        print('ready', flush=True)
+        window.close()
+        app.quit()
+    else:
+        QTimer.singleShot(5, poll)
+
+poll()
+app.exec()
+"""
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = str(ROOT) + os.pathsep + env.get('PYTHONPATH', '')
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return env
+
+
+def import_times(module: str) -> List[Tuple[str, int, int]]:
+    """-X importtime 결과를 (모듈, 자체 µs, 누적 µs) 목록으로 반환합니다."""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, env=_env(), capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def report_imports(module: str, top: int):
+    rows = import_times(module)
+    total = next((cum for name, _, cum in rows if name == module), 0)
+    print(f"import {module}: {total / 1000:.1f}ms (모듈 {len(rows)}개)")
+
+    print(f"\n누적 시간 상위 {top}개")
+    for name, self_us, cum_us in sorted(rows, key=lambda r: r[2], reverse=True)[:top]:
+        print(f"  {cum_us / 1000:8.1f}ms  (자체 {self_us / 1000:6.1f}ms)  {name}")
+
+    loaded = {name for name, _, _ in rows}
+    early = [m for m in DEFERRED_MODULES if m in loaded]
+    print(f"\n창 표시 전 불러온 지연 대상 모듈: {', '.join(early) if early else '없음'}")
+
+
+def launch_times(repeat: int) -> Tuple[List[float], List[float]]:
+    """앱을 repeat회 띄워 (창 표시까지, 준비까지) 시간 목록(초)을 반환합니다."""
+    window_times, ready_times = [], []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as workdir:
+            start = time.perf_counter()
+            proc = subprocess.Popen(
+                [sys.executable, '-c', _LAUNCH_CODE], cwd=workdir, env=_env(),
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            )
+            for line in proc.stdout:
+                elapsed = time.perf_counter() - start
+                if line.strip() == 'window':
+                    window_times.append(elapsed)
+                elif line.strip() == 'ready':
+                    ready_times.append(elapsed)
+            proc.wait()
+    return window_times, ready_times
+
+
+def report_launch(repeat: int):
+    window_times, ready_times = launch_times(repeat)
+    if not window_times:
+        print("\n창 표시 시간: 측정 실패 (PySide6/플랫폼 플러그인 확인)")
+        return
+    print(f"\n창 표시까지  : 중앙값 {statistics.median(window_times) * 1000:.0f}ms "
+          f"(최소 {min(window_times) * 1000:.0f}ms, {len(window_times)}회)")
+    if ready_times:
+        print(f"검색 준비까지: 중앙값 {statistics.median(ready_times) * 1000:.0f}ms "
+              f"(최소 {min(ready_times) * 1000:.0f}ms)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="시작 시간 벤치마크")
+    parser.add_argument("--module", default="src.ui.main_window")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-launch", action="store_true", help="import 시간 보고서만 출력")
+    args = parser.parse_args()
+    report_imports(args.module, args.top)
+    if not args.no_launch:
+        report_launch(args.repeat)
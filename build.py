@@ -25,6 +25,8 @@ def run_build(dry_run=False):
         "--include-package=pandas",       # Pandas 명시적 포함
         "--include-package=openpyxl",
         "--windows-console-mode=disable", # GUI 앱이므로 콘솔 숨김
+        # [v2.1.0] 압축 해제 폴더를 버전별로 고정하여 두 번째 실행부터 해제 과정 생략 (시작 시간 단축)
+        "--onefile-tempdir-spec={CACHE_DIR}/{COMPANY}/{PRODUCT}/{VERSION}",
 
         # 메타데이터 및 회사 정보
         "--company-name=Antigravity",
@@ -2,184 +2,1032 @@
 [v2.0.0] SQLite 기반 인덱스 캐시
 파일 데이터를 SQLite에 캐싱하여 앱 재시작 시 Excel 파일을 다시 읽지 않고도
 인덱스를 재구축할 수 있게 합니다. 파일 변경 시점(mtime)과 크기로 유효성을 판단합니다.
+
+mtime이 바뀌었더라도(복사, OneDrive 재동기화 등) 내용 지문(fingerprint)이 같으면
+캐시를 그대로 사용하며, 내용이 같은 파일은 경로가 달라도 하나의 캐시 데이터를 공유합니다.
+
+[v2.1.0] 스키마 v2: 셀마다 경로/시트명/컬럼명 문자열을 반복 저장하던 cell_data 테이블을
+정수 키(file_id, sheet_id, row_idx, col_idx)로 클러스터링된 WITHOUT ROWID 테이블로 정규화했습니다.
+기존 DB는 처음 열 때 자동으로 변환됩니다.
+
+[v2.1.0] 스키마 v3: 시트별 인덱스 세그먼트(토큰/초성 포스팅, 숫자 컬럼)를 함께 저장하여
+복원 시 셀을 다시 토큰화하지 않습니다. 세그먼트가 없는 캐시는 셀 데이터로 재인덱싱합니다.
+
+[v2.1.0] 스키마 v4: 세그먼트와 함께 시트별 메모리 맵 인덱스 파일(mapped_index)을
+DB 옆 디렉터리에 기록합니다. 복원 시 파일을 매핑만 하므로 시작 비용이 데이터 크기와 무관합니다.
+
+[v2.1.0] 스키마 v5: 경로별 마지막 사용 시각(last_access)을 기록하고, run_maintenance()로
+존재하지 않는 파일 정리, 용량 한도 초과 시 오래 쓰지 않은 파일부터 제거(LRU), 증분 VACUUM을 수행합니다.
+
+[v2.1.0] 스키마 v6: 시트별 지문을 저장합니다. part_sig는 .xlsx 워크시트 파트의 CRC/크기,
+shared_sig는 공용 파트(공유 문자열, 스타일)의 CRC/크기로 파일을 열지 않고 비교할 수 있습니다.
+content_hash는 .xlsx면 공유 문자열과 셀 서식을 풀어 쓴 시트 XML 값의 해시(DataFrame으로 읽지 않고
+계산), 그 외 형식은 시트의 헤더와 셀 값 해시입니다. 파일이 바뀌면 지문이 다른 시트만 다시 읽고,
+save_file_data(keep=...)로 바뀐 시트만 교체합니다.
 """
 
 import sqlite3
 import os
 import json
+import hashlib
+import threading
+import time
+import uuid
+import zipfile
+import posixpath
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
+from src.core.segment import IndexSegment, SEGMENT_FORMAT
+from src.core.mapped_index import MappedSheet, write_mapped_sheet
 from src.utils.logger import logger
 
+
 # 캐시 DB 파일명
 CACHE_DB_NAME = "data_scavenger_cache.db"
 
+# 스키마 버전 (PRAGMA user_version)
+SCHEMA_VERSION = 6
+
+# 전체 해시 시 한 번에 읽는 블록 크기
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# validate_files() 결과 상태
+FILE_VALID = 'valid'      # 캐시 그대로 사용 가능
+FILE_STALE = 'stale'      # 캐시 없음 또는 변경됨 → 재인덱싱 필요
+FILE_MISSING = 'missing'  # 파일이 존재하지 않음
+
+# SQLite 바인딩 변수 한도 내에서 IN 조회 시 한 번에 넘길 경로 수
+_IN_CHUNK = 500
+
+# 기본 캐시 용량 한도 (DB 사용 페이지 + 인덱스 파일)
+DEFAULT_CACHE_BUDGET = 1024 * 1024 * 1024
+
+# 셀 한 행의 값 외 저장 공간 추정치 (키 정수 + 레코드 헤더 + 셀 포인터, 용량 정리 계산용)
+_CELL_ROW_OVERHEAD = 16
+
+# 다른 연결(캐시 기록 스레드 등)이 쓰기 락을 잡고 있을 때 기다리는 최대 시간 (초)
+BUSY_TIMEOUT = 5.0
+
+# DB에서 참조하지 않는 인덱스 파일을 삭제하기 전 유예 시간 (기록 스레드가 커밋 전에 만든 파일 보호)
+ORPHAN_GRACE_SECONDS = 3600
+
+
+@lru_cache(maxsize=None)
+def _xxhash():
+    """xxhash 모듈 (미설치면 None). 처음 지문을 계산할 때 import합니다."""
+    try:
+        import xxhash
+    except ImportError:
+        return None
+    return xxhash
+
+
+def _new_hasher():
+    """xxhash가 설치되어 있으면 xxh3(고속), 없으면 blake2b를 사용합니다."""
+    xxhash = _xxhash()
+    if xxhash is not None:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
+
+
+def compute_fingerprint(file_path: str) -> str:
+    """
+    파일 내용의 지문을 계산합니다.
+
+    .xlsx는 ZIP 중앙 디렉터리에 모든 내부 파트의 CRC32와 크기가 기록되어 있으므로
+    중앙 디렉터리만 읽어 해시합니다 (파일 크기와 무관하게 수 ms).
+    그 외 형식(CSV, .xls)은 파일 전체를 블록 단위로 해시합니다.
+    """
+    hasher = _new_hasher()
+
+    if Path(file_path).suffix.lower() == '.xlsx':
+        try:
+            with zipfile.ZipFile(file_path) as zf:
+                for info in zf.infolist():
+                    hasher.update(
+                        f"{info.filename}\0{info.CRC:08x}\0{info.file_size}\n".encode('utf-8')
+                    )
+            return "zip:" + hasher.hexdigest()
+        except zipfile.BadZipFile:
+            # 손상되었거나 ZIP이 아닌 파일은 전체 해시로 대체
+            hasher = _new_hasher()
+
+    with open(file_path, 'rb') as f:
+        while True:
+            block = f.read(HASH_BLOCK_SIZE)
+            if not block:
+                break
+            hasher.update(block)
+    return "full:" + hasher.hexdigest()
+
+
+# .xlsx 워크북 XML 네임스페이스
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+# 모든 시트의 값 해석에 영향을 주는 공용 파트 (공유 문자열, 날짜 판별용 셀 서식)
+_SHARED_PARTS = ('xl/sharedStrings.xml', 'xl/styles.xml')
+
+
+def _workbook_sheet_parts(zf: zipfile.ZipFile) -> Optional[Dict[str, str]]:
+    """워크북의 {시트명: 워크시트 파트 경로} (시트 순서). 관계를 찾을 수 없는 시트가 있으면 None."""
+    rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    targets = {}
+    for rel in rels.iter(f'{_NS_PKG_REL}Relationship'):
+        target = rel.get('Target', '')
+        # 상대 경로는 xl/ 기준, 절대 경로는 패키지 루트 기준
+        if target.startswith('/'):
+            target = target.lstrip('/')
+        else:
+            target = posixpath.normpath(posixpath.join('xl', target))
+        targets[rel.get('Id')] = target
+
+    workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+    parts = {}
+    for sheet in workbook.iter(f'{_NS_MAIN}sheet'):
+        part = targets.get(sheet.get(f'{_NS_REL}id'))
+        if part is None:
+            return None
+        parts[sheet.get('name')] = part
+    return parts
+
+
+def _part_sig(zf: zipfile.ZipFile, name: str) -> str:
+    """ZIP 중앙 디렉터리의 파트 CRC32/크기 (파트가 없으면 '-')."""
+    try:
+        info = zf.getinfo(name)
+    except KeyError:
+        return "-"
+    return f"{info.CRC:08x}:{info.file_size}"
+
+
+def compute_sheet_signatures(file_path: str) -> Optional[Dict[str, str]]:
+    """
+    .xlsx 시트별 서명을 워크시트 파트의 ZIP 중앙 디렉터리 CRC32/크기로 계산합니다 (시트 데이터는 읽지 않음).
+    서명이 같으면 시트 XML이 그대로이므로, 공용 파트(compute_shared_signature)도 같으면 내용도 같습니다.
+    .xlsx가 아니거나 구조를 읽을 수 없으면 None.
+
+    Returns:
+        {시트명: 서명} (워크북의 시트 순서)
+    """
+    if Path(file_path).suffix.lower() != '.xlsx':
+        return None
+    try:
+        with zipfile.ZipFile(file_path) as zf:
+            parts = _workbook_sheet_parts(zf)
+            if parts is None:
+                return None
+            return {name: _part_sig(zf, part) for name, part in parts.items()}
+    except (zipfile.BadZipFile, KeyError, ET.ParseError, OSError) as e:
+        logger.debug(f"시트 서명 계산 실패: {file_path} — {e}")
+        return None
+
+
+def compute_shared_signature(file_path: str) -> Optional[str]:
+    """
+    .xlsx 공용 파트(공유 문자열, 스타일)의 서명. Excel은 글자 하나만 고쳐도 공유 문자열 파트를
+    다시 쓰므로, 이 서명이 바뀌면 워크시트 파트가 그대로인 시트도 값 해시로 비교해야 합니다.
+    """
+    if Path(file_path).suffix.lower() != '.xlsx':
+        return None
+    try:
+        with zipfile.ZipFile(file_path) as zf:
+            return '|'.join(_part_sig(zf, name) for name in _SHARED_PARTS)
+    except (zipfile.BadZipFile, OSError) as e:
+        logger.debug(f"공용 파트 서명 계산 실패: {file_path} — {e}")
+        return None
+
+
+def _string_item_text(item) -> str:
+    """공유 문자열/인라인 문자열 항목의 텍스트 (서식 있는 텍스트는 이어 붙이고 윗주는 제외)."""
+    parts = []
+    for child in item:
+        if child.tag == f'{_NS_MAIN}t':
+            parts.append(child.text or '')
+        elif child.tag == f'{_NS_MAIN}r':
+            parts.append(child.findtext(f'{_NS_MAIN}t') or '')
+    return ''.join(parts)
+
+
+def _read_shared_strings(zf: zipfile.ZipFile) -> List[str]:
+    """공유 문자열 테이블을 스트리밍으로 읽습니다."""
+    if 'xl/sharedStrings.xml' not in zf.namelist():
+        return []
+    strings = []
+    root = None
+    for event, el in ET.iterparse(zf.open('xl/sharedStrings.xml'), events=('start', 'end')):
+        if root is None:
+            root = el
+        elif event == 'end' and el.tag == f'{_NS_MAIN}si':
+            strings.append(_string_item_text(el))
+            root.clear()
+    return strings
+
+
+def _read_cell_formats(zf: zipfile.ZipFile) -> List[str]:
+    """셀 서식 번호(s) → 표시 형식 (날짜/숫자 해석에 쓰이는 numFmtId와 사용자 형식 문자열)."""
+    if 'xl/styles.xml' not in zf.namelist():
+        return []
+    root = ET.fromstring(zf.read('xl/styles.xml'))
+    codes = {fmt.get('numFmtId'): fmt.get('formatCode', '')
+             for fmt in root.iter(f'{_NS_MAIN}numFmt')}
+    xfs = root.find(f'{_NS_MAIN}cellXfs')
+    if xfs is None:
+        return []
+    formats = []
+    for xf in xfs.iter(f'{_NS_MAIN}xf'):
+        fmt_id = xf.get('numFmtId', '0')
+        formats.append(f"{fmt_id}:{codes.get(fmt_id, '')}")
+    return formats
+
+
+def _sheet_value_hash(zf: zipfile.ZipFile, part: str, strings: List[str],
+                      formats: List[str], date1904: str) -> str:
+    """
+    시트 XML의 셀 값을 공유 문자열과 셀 서식으로 풀어 해시합니다.
+    공유 문자열 번호나 서식 번호가 바뀌어도(다른 시트 편집으로 테이블이 재배치) 값이 같으면 같은 해시입니다.
+    """
+    tag_row, tag_v, tag_is = f'{_NS_MAIN}row', f'{_NS_MAIN}v', f'{_NS_MAIN}is'
+    hasher = _new_hasher()
+    hasher.update(f"1904={date1904}".encode('utf-8'))
+    sheet_data = None
+    for event, el in ET.iterparse(zf.open(part), events=('start', 'end')):
+        if event == 'start':
+            if sheet_data is None and el.tag == f'{_NS_MAIN}sheetData':
+                sheet_data = el
+            continue
+        if el.tag == tag_row:
+            # 행 단위로 셀을 풀어 한 번에 해시
+            items = [f"\x1d{el.get('r', '')}"]
+            for cell in el:
+                cell_type = cell.get('t', 'n')
+                if cell_type == 's':
+                    value = strings[int(cell.findtext(tag_v))]
+                elif cell_type == 'inlineStr':
+                    item = cell.find(tag_is)
+                    value = _string_item_text(item) if item is not None else ''
+                else:
+                    value = cell.findtext(tag_v) or ''
+                style = cell.get('s')
+                fmt = formats[int(style)] if style and int(style) < len(formats) else ''
+                items.append(f"\x1e{cell.get('r', '')}\x1f{cell_type}\x1f{fmt}\x1f{value}")
+            hasher.update(''.join(items).encode('utf-8'))
+            # 처리한 행은 버려 큰 시트도 메모리를 일정하게 유지
+            if sheet_data is not None:
+                sheet_data.clear()
+        elif el.tag == f'{_NS_MAIN}dimension':
+            # read_only 모드의 열 수는 dimension 범위를 따름
+            hasher.update(f"\x1c{el.get('ref', '')}".encode('utf-8'))
+    return "xml:" + hasher.hexdigest()
+
+
+def compute_sheet_value_hashes(file_path: str,
+                               sheet_names: Optional[List[str]] = None) -> Optional[Dict[str, str]]:
+    """
+    .xlsx 시트별 값 해시를 계산합니다 (시트를 DataFrame으로 읽지 않음).
+    공유 문자열과 셀 서식은 한 번만 풀고, 요청한 시트의 XML만 훑습니다.
+    .xlsx가 아니거나 구조를 읽을 수 없으면 None.
+
+    Args:
+        sheet_names: 계산할 시트 (None이면 전체)
+    """
+    if Path(file_path).suffix.lower() != '.xlsx':
+        return None
+    try:
+        with zipfile.ZipFile(file_path) as zf:
+            parts = _workbook_sheet_parts(zf)
+            if parts is None:
+                return None
+            names = [n for n in (sheet_names if sheet_names is not None else parts) if n in parts]
+            if not names:
+                return {}
+            pr = ET.fromstring(zf.read('xl/workbook.xml')).find(f'{_NS_MAIN}workbookPr')
+            date1904 = pr.get('date1904', '') if pr is not None else ''
+            strings = _read_shared_strings(zf)
+            formats = _read_cell_formats(zf)
+            return {name: _sheet_value_hash(zf, parts[name], strings, formats, date1904)
+                    for name in names}
+    except (zipfile.BadZipFile, KeyError, ET.ParseError, OSError, ValueError, IndexError, TypeError) as e:
+        logger.debug(f"시트 값 해시 계산 실패: {file_path} — {e}")
+        return None
+
+
+def sheet_content_hash(headers: List[str], cells: List[Tuple[int, int, str]]) -> str:
+    """시트의 헤더와 (row_idx, col_idx, value) 목록의 해시 (시트 내용 비교용)."""
+    hasher = _new_hasher()
+    hasher.update('\x1f'.join(str(h) for h in headers).encode('utf-8'))
+    for row_idx, col_idx, value in cells:
+        hasher.update(f"\x1e{row_idx}\x1f{col_idx}\x1f{value}".encode('utf-8'))
+    return hasher.hexdigest()
+
 
 class IndexCache:
     """
     SQLite 기반 파일 데이터 캐시.
     인덱싱된 셀 데이터를 디스크에 보관하여 재시작 시 파일 재로드 없이 인덱스 복원이 가능합니다.
+
+    테이블 구성:
+    - file_meta: 경로별 유효성 정보 (mtime, 크기, 내용 지문)와 셀 데이터 묶음 ID(file_id)
+    - sheets / sheet_columns: file_id별 시트와 (sheet_id, col_idx)로 식별되는 컬럼명
+    - cells: (file_id, sheet_id, row_idx, col_idx) 클러스터 키의 셀 값
+    내용이 같은 파일이 여러 경로에 있으면 같은 file_id를 공유하여 셀 데이터를 한 번만 저장합니다.
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, use_content_hash: bool = True,
+                 use_mapped_index: bool = True):
         self.db_path = db_path or CACHE_DB_NAME
+        self.use_content_hash = use_content_hash
+        self.use_mapped_index = use_mapped_index
+        # 메모리 맵 인덱스 파일 디렉터리 (DB 파일명 + '.segments')
+        self.mapped_dir = str(Path(self.db_path).with_suffix('.segments'))
         self._conn: Optional[sqlite3.Connection] = None
+        # 인덱싱 워커 스레드와 GUI 스레드가 연결을 공유하므로 락으로 직렬화
+        self._lock = threading.RLock()
         self._init_db()
 
     def _init_db(self):
-        """DB 스키마를 초기화합니다."""
+        """DB 스키마를 초기화하고, 구버전 스키마면 변환합니다."""
         try:
-            self._conn = sqlite3.connect(self.db_path)
+            self._conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT,
+                                         check_same_thread=False)
+            # 새 DB는 처음부터 증분 VACUUM 모드로 생성 (기존 DB는 run_maintenance에서 전환)
+            is_new = self._conn.execute(
+                "SELECT COUNT(*) FROM sqlite_master"
+            ).fetchone()[0] == 0
+            if is_new:
+                self._conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
             self._conn.execute("PRAGMA journal_mode=WAL")
             self._conn.execute("PRAGMA synchronous=NORMAL")
 
+            legacy = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'cell_data'"
+            ).fetchone() is not None
+            if legacy:
+                self._conn.execute("ALTER TABLE file_meta RENAME TO file_meta_v1")
+
             self._conn.executescript("""
                 CREATE TABLE IF NOT EXISTS file_meta (
                     file_path TEXT PRIMARY KEY,
+                    file_id INTEGER NOT NULL,
                     file_name TEXT NOT NULL,
                     file_mtime REAL NOT NULL,
                     file_size INTEGER NOT NULL,
-                    indexed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    file_hash TEXT,
+                    indexed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_access REAL
                 );
 
-                CREATE TABLE IF NOT EXISTS cell_data (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    file_path TEXT NOT NULL,
+                CREATE INDEX IF NOT EXISTS idx_meta_file_id
+                    ON file_meta(file_id);
+                CREATE INDEX IF NOT EXISTS idx_meta_hash
+                    ON file_meta(file_size, file_hash);
+
+                CREATE TABLE IF NOT EXISTS sheets (
+                    sheet_id INTEGER PRIMARY KEY,
+                    file_id INTEGER NOT NULL,
                     sheet_name TEXT NOT NULL,
-                    row_idx INTEGER NOT NULL,
+                    UNIQUE (file_id, sheet_name)
+                );
+
+                CREATE TABLE IF NOT EXISTS sheet_columns (
+                    sheet_id INTEGER NOT NULL REFERENCES sheets(sheet_id),
                     col_idx INTEGER NOT NULL,
                     col_name TEXT NOT NULL,
-                    cell_value TEXT NOT NULL,
-                    FOREIGN KEY (file_path) REFERENCES file_meta(file_path)
-                );
+                    PRIMARY KEY (sheet_id, col_idx)
+                ) WITHOUT ROWID;
 
-                CREATE INDEX IF NOT EXISTS idx_cell_file
-                    ON cell_data(file_path);
+                CREATE TABLE IF NOT EXISTS cells (
+                    file_id INTEGER NOT NULL,
+                    sheet_id INTEGER NOT NULL REFERENCES sheets(sheet_id),
+                    row_idx INTEGER NOT NULL,
+                    col_idx INTEGER NOT NULL,
+                    cell_value TEXT NOT NULL,
+                    PRIMARY KEY (file_id, sheet_id, row_idx, col_idx)
+                ) WITHOUT ROWID;
 
-                CREATE TABLE IF NOT EXISTS sheet_headers (
-                    file_path TEXT NOT NULL,
-                    sheet_name TEXT NOT NULL,
-                    headers_json TEXT NOT NULL,
-                    PRIMARY KEY (file_path, sheet_name)
+                CREATE TABLE IF NOT EXISTS sheet_segments (
+                    sheet_id INTEGER PRIMARY KEY REFERENCES sheets(sheet_id),
+                    format INTEGER NOT NULL,
+                    data BLOB NOT NULL,
+                    mapped_file TEXT
                 );
             """)
+
+            # v3 DB에는 mapped_file 컬럼이, v4 이하에는 last_access 컬럼이 없음
+            columns = {r[1] for r in self._conn.execute("PRAGMA table_info(sheet_segments)")}
+            if 'mapped_file' not in columns:
+                self._conn.execute("ALTER TABLE sheet_segments ADD COLUMN mapped_file TEXT")
+            columns = {r[1] for r in self._conn.execute("PRAGMA table_info(file_meta)")}
+            if 'last_access' not in columns:
+                self._conn.execute("ALTER TABLE file_meta ADD COLUMN last_access REAL")
+            # v5 이하에는 시트별 지문 컬럼이 없음 (기존 시트는 지문 없이 유지 → 다음 변경 시 전체 재인덱싱)
+            columns = {r[1] for r in self._conn.execute("PRAGMA table_info(sheets)")}
+            if 'part_sig' not in columns:
+                self._conn.execute("ALTER TABLE sheets ADD COLUMN part_sig TEXT")
+                self._conn.execute("ALTER TABLE sheets ADD COLUMN content_hash TEXT")
+            if 'shared_sig' not in columns:
+                self._conn.execute("ALTER TABLE sheets ADD COLUMN shared_sig TEXT")
+
+            if legacy:
+                self._migrate_v1()
+
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
             self._conn.commit()
         except Exception as e:
             logger.error(f"캐시 DB 초기화 실패: {e}")
             self._conn = None
 
+    def _migrate_v1(self):
+        """
+        구버전 스키마(cell_data, sheet_headers, file_meta_v1)를 v2로 변환합니다.
+        셀 데이터를 가진 경로(data_path)마다 file_id를 부여하고 모든 데이터를 정수 키로 옮깁니다.
+        """
+        logger.info("캐시 DB 스키마 변환 시작 (v1 → v2)")
+        conn = self._conn
+        columns = {r[1] for r in conn.execute("PRAGMA table_info(file_meta_v1)")}
+        has_hash = 'file_hash' in columns
+        # 셀 데이터를 실제로 가진 경로 (data_path 컬럼은 내용 공유 도입 이후에만 존재)
+        if 'data_path' in columns:
+            owner_expr = "COALESCE(m.data_path, m.file_path)"
+        else:
+            owner_expr = "m.file_path"
+
+        conn.executescript(f"""
+            CREATE TEMP TABLE owner_map (
+                data_path TEXT PRIMARY KEY,
+                file_id INTEGER NOT NULL
+            );
+            INSERT INTO owner_map (data_path, file_id)
+                SELECT data_path, ROW_NUMBER() OVER (ORDER BY data_path)
+                FROM (SELECT DISTINCT {owner_expr} AS data_path FROM file_meta_v1 m);
+
+            INSERT INTO file_meta (file_path, file_id, file_name, file_mtime,
+                                   file_size, file_hash, indexed_at)
+                SELECT m.file_path, o.file_id, m.file_name, m.file_mtime, m.file_size,
+                       {'m.file_hash' if has_hash else 'NULL'}, m.indexed_at
+                FROM file_meta_v1 m
+                JOIN owner_map o ON o.data_path = {owner_expr};
+
+            INSERT OR IGNORE INTO sheets (file_id, sheet_name)
+                SELECT o.file_id, h.sheet_name
+                FROM sheet_headers h JOIN owner_map o ON o.data_path = h.file_path;
+            INSERT OR IGNORE INTO sheets (file_id, sheet_name)
+                SELECT DISTINCT o.file_id, c.sheet_name
+                FROM cell_data c JOIN owner_map o ON o.data_path = c.file_path;
+
+            INSERT OR IGNORE INTO cells (file_id, sheet_id, row_idx, col_idx, cell_value)
+                SELECT o.file_id, s.sheet_id, c.row_idx, c.col_idx, c.cell_value
+                FROM cell_data c
+                JOIN owner_map o ON o.data_path = c.file_path
+                JOIN sheets s ON s.file_id = o.file_id AND s.sheet_name = c.sheet_name
+                ORDER BY o.file_id, s.sheet_id, c.row_idx, c.col_idx;
+        """)
+
+        # 헤더 JSON을 컬럼 행으로 펼침
+        header_rows = conn.execute("""
+            SELECT s.sheet_id, h.headers_json
+            FROM sheet_headers h
+            JOIN owner_map o ON o.data_path = h.file_path
+            JOIN sheets s ON s.file_id = o.file_id AND s.sheet_name = h.sheet_name
+        """).fetchall()
+        conn.executemany(
+            "INSERT OR IGNORE INTO sheet_columns (sheet_id, col_idx, col_name) VALUES (?, ?, ?)",
+            [(sheet_id, i, name)
+             for sheet_id, headers_json in header_rows
+             for i, name in enumerate(json.loads(headers_json))]
+        )
+
+        conn.executescript("""
+            DROP TABLE cell_data;
+            DROP TABLE sheet_headers;
+            DROP TABLE file_meta_v1;
+            DROP TABLE temp.owner_map;
+        """)
+        conn.commit()
+        # 삭제된 구 테이블 공간 반환
+        conn.execute("VACUUM")
+        logger.info("캐시 DB 스키마 변환 완료")
+
     def is_file_cached(self, file_path: str) -> bool:
-        """파일이 캐시에 존재하고 변경되지 않았는지 확인합니다."""
+        """
+        파일이 캐시에 존재하고 변경되지 않았는지 확인합니다.
+
+        mtime/크기가 일치하면 즉시 유효로 판단합니다. 일치하지 않더라도 같은 크기의
+        캐시 항목이 있으면 내용 지문을 비교하여, 내용이 같으면 mtime만 갱신하거나
+        (같은 경로) 기존 셀 데이터를 공유하는 항목을 추가(다른 경로)한 뒤 유효로 판단합니다.
+        """
         if not self._conn:
             return False
 
         try:
-            path_obj = Path(file_path)
-            if not path_obj.exists():
-                return False
+            st = os.stat(file_path)
+        except OSError:
+            return False
 
-            current_mtime = path_obj.stat().st_mtime
-            current_size = path_obj.stat().st_size
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT file_mtime, file_size FROM file_meta WHERE file_path = ?",
+                    (file_path,)
+                ).fetchone()
 
-            row = self._conn.execute(
-                "SELECT file_mtime, file_size FROM file_meta WHERE file_path = ?",
-                (file_path,)
-            ).fetchone()
+                # 수정 시간과 크기가 모두 일치하면 유효한 캐시
+                if row is not None and row[0] == st.st_mtime and row[1] == st.st_size:
+                    self._touch_quietly([file_path])
+                    return True
 
-            if row is None:
+                if not self.use_content_hash:
+                    return False
+
+                # 크기가 같은 캐시 항목이 없으면 내용이 같을 수 없으므로 해시 생략
+                candidates = self._conn.execute(
+                    "SELECT file_path, file_hash, file_id FROM file_meta "
+                    "WHERE file_size = ? AND file_hash IS NOT NULL",
+                    (st.st_size,)
+                ).fetchall()
+            if not candidates:
                 return False
 
-            # 수정 시간과 크기가 모두 일치하면 유효한 캐시
-            return row[0] == current_mtime and row[1] == current_size
-        except Exception:
+            # 해시 계산은 락 밖에서 수행 (대용량 파일에서 다른 스레드를 막지 않도록)
+            fingerprint = compute_fingerprint(file_path)
+            match = next((c for c in candidates if c[1] == fingerprint), None)
+            if match is None:
+                return False
+
+            with self._lock:
+                if match[0] == file_path:
+                    # 내용은 그대로이고 mtime만 바뀜 → 메타만 갱신.
+                    # 쓰기 락을 얻지 못해도 캐시 데이터는 유효 (다음 확인 때 지문을 다시 비교)
+                    try:
+                        self._conn.execute(
+                            "UPDATE file_meta SET file_mtime = ?, last_access = ? WHERE file_path = ?",
+                            (st.st_mtime, time.time(), file_path)
+                        )
+                        self._conn.commit()
+                    except sqlite3.OperationalError as e:
+                        self._conn.rollback()
+                        logger.debug(f"캐시 메타 갱신 건너뜀: {file_path} — {e}")
+                    return True
+
+                # 다른 경로의 동일 내용 → 셀 데이터를 공유하는 항목 추가
+                self._detach(file_path)
+                self._conn.execute(
+                    "INSERT INTO file_meta (file_path, file_id, file_name, file_mtime, "
+                    "file_size, file_hash, last_access) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (file_path, match[2], Path(file_path).name, st.st_mtime,
+                     st.st_size, fingerprint, time.time())
+                )
+                self._conn.commit()
+                logger.info(f"동일 내용 캐시 공유: {file_path} → {match[0]}")
+            return True
+        except Exception as e:
+            logger.error(f"캐시 확인 실패: {file_path} — {e}")
+            with self._lock:
+                self._conn.rollback()
             return False
 
+    def validate_files(self, file_paths: List[str], max_workers: int = 8) -> Dict[str, str]:
+        """
+        여러 파일의 캐시 유효성을 한 번에 판단합니다 (세션 복원용).
+        파일 상태는 병렬로 조회하고, 캐시 메타는 IN 쿼리로 일괄 조회합니다.
+        mtime만 바뀐 파일 등 내용 지문 비교가 필요한 경우에만 is_file_cached()로 개별 확인합니다.
+
+        Returns:
+            {파일 경로: FILE_VALID | FILE_STALE | FILE_MISSING}
+        """
+        def safe_stat(path):
+            try:
+                return os.stat(path)
+            except OSError:
+                return None
+
+        # 네트워크 드라이브에서는 stat 지연이 크므로 병렬 조회
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            stats = dict(zip(file_paths, pool.map(safe_stat, file_paths)))
+
+        result = {}
+        existing = [p for p in file_paths if stats[p] is not None]
+        for p in file_paths:
+            if stats[p] is None:
+                result[p] = FILE_MISSING
+        if not self._conn:
+            result.update({p: FILE_STALE for p in existing})
+            return result
+
+        try:
+            with self._lock:
+                meta = {}
+                for i in range(0, len(existing), _IN_CHUNK):
+                    chunk = existing[i:i + _IN_CHUNK]
+                    placeholders = ','.join('?' * len(chunk))
+                    for path, mtime, size in self._conn.execute(
+                        "SELECT file_path, file_mtime, file_size FROM file_meta "
+                        f"WHERE file_path IN ({placeholders})",
+                        chunk
+                    ):
+                        meta[path] = (mtime, size)
+                cached_sizes = {r[0] for r in self._conn.execute(
+                    "SELECT DISTINCT file_size FROM file_meta WHERE file_hash IS NOT NULL"
+                )}
+        except Exception as e:
+            logger.error(f"캐시 일괄 확인 실패: {e}")
+            result.update({p: FILE_STALE for p in existing})
+            return result
+
+        fresh = []
+        for path in existing:
+            st = stats[path]
+            row = meta.get(path)
+            if row is not None and row[0] == st.st_mtime and row[1] == st.st_size:
+                result[path] = FILE_VALID
+                fresh.append(path)
+            elif self.use_content_hash and st.st_size in cached_sizes:
+                # 같은 크기의 캐시가 있을 때만 지문 비교 (mtime 변경, 복사본 공유)
+                result[path] = FILE_VALID if self.is_file_cached(path) else FILE_STALE
+            else:
+                result[path] = FILE_STALE
+
+        if fresh:
+            self._touch_quietly(fresh)
+        return result
+
+    def _touch(self, file_paths: List[str]):
+        """경로들의 마지막 사용 시각을 갱신합니다 (커밋은 호출자 담당)."""
+        now = time.time()
+        self._conn.executemany(
+            "UPDATE file_meta SET last_access = ? WHERE file_path = ?",
+            [(now, p) for p in file_paths]
+        )
+
+    def _touch_quietly(self, file_paths: List[str]):
+        """
+        마지막 사용 시각을 갱신하고 커밋합니다.
+        기록 스레드가 쓰기 락을 오래 잡아 실패하면 건너뜁니다 — 사용 시각은 용량 정리 순서에만
+        쓰이므로, 실패를 캐시 미스로 취급해 파일을 다시 파싱하지 않습니다.
+        """
+        with self._lock:
+            try:
+                self._touch(file_paths)
+                self._conn.commit()
+            except sqlite3.OperationalError as e:
+                self._conn.rollback()
+                logger.debug(f"마지막 사용 시각 갱신 건너뜀: {e}")
+
     def save_file_data(self, file_path: str, file_name: str,
-                       cells: List[Dict], headers: Dict[str, List[str]]):
-        """파일의 셀 데이터를 캐시에 저장합니다."""
+                       cells: Dict[str, List[Tuple[int, int, str]]],
+                       headers: Dict[str, List[str]],
+                       segments: Optional[Dict[str, IndexSegment]] = None,
+                       keep: Optional[List[str]] = None):
+        """
+        파일의 셀 데이터를 캐시에 저장합니다.
+        내용 지문이 같은 캐시 데이터가 이미 있으면 셀 데이터는 다시 쓰지 않고 참조만 추가합니다.
+
+        Args:
+            cells: 시트명 → (row_idx, col_idx, value) 목록 (SearchIndex.add_dataframe 반환값, 행 → 열 순)
+            headers: 시트명 → 컬럼명 목록
+            segments: 시트명 → 인덱스 세그먼트. 지정하면 셀 데이터와 함께 저장합니다.
+            keep: 지정하면 시트 단위 갱신입니다. cells에는 바뀐 시트만 담고, keep의 시트는
+                  캐시 데이터를 그대로 두며, 나머지 기존 시트는 삭제합니다.
+        """
+        self.save_many([(file_path, file_name, cells, headers, segments, keep)])
+
+    def save_many(self, entries: List[Tuple]) -> int:
+        """
+        여러 파일을 하나의 트랜잭션으로 저장합니다 (CacheWriter의 일괄 커밋용).
+
+        Args:
+            entries: save_file_data() 인자 튜플 (file_path, file_name, cells, headers, segments[, keep]) 목록
+
+        Returns:
+            저장한 파일 수. 트랜잭션이 실패하면 0.
+        """
         if not self._conn:
-            return
+            return 0
+
+        # 파일 상태와 지문(파일, 시트별)은 락 밖에서 계산 (읽을 수 없는 파일은 건너뜀)
+        prepared = []
+        for entry in entries:
+            file_path, _, cells, headers = entry[:4]
+            try:
+                st = os.stat(file_path)
+                fingerprint = compute_fingerprint(file_path) if self.use_content_hash else None
+            except Exception as e:
+                logger.error(f"캐시 저장 실패: {file_path} — {e}")
+                continue
+            sheet_sigs = compute_sheet_signatures(file_path) or {}
+            shared_sig = compute_shared_signature(file_path) if sheet_sigs else None
+            # .xlsx는 시트 XML 값 해시 (재인덱싱 때 DataFrame 없이 비교), 그 외는 읽은 셀 값 해시
+            hashes = (compute_sheet_value_hashes(file_path, list(cells)) if sheet_sigs else None) or {}
+            for name, batch in cells.items():
+                if name not in hashes:
+                    hashes[name] = sheet_content_hash(headers.get(name, []), batch)
+            prepared.append((entry, st, fingerprint, sheet_sigs, shared_sig, hashes))
+        if not prepared:
+            return 0
 
         try:
-            path_obj = Path(file_path)
-            mtime = path_obj.stat().st_mtime
-            size = path_obj.stat().st_size
+            with self._lock:
+                for entry, st, fingerprint, sheet_sigs, shared_sig, hashes in prepared:
+                    file_path, file_name, cells, headers, segments = entry[:5]
+                    keep = entry[5] if len(entry) > 5 else None
+                    if keep is None or not self._update_sheets(
+                        file_path, file_name, cells, headers, segments, keep,
+                        st, fingerprint, sheet_sigs, shared_sig, hashes
+                    ):
+                        if keep is not None:
+                            # 시트 단위 갱신을 할 수 없으면 불완전한 데이터를 남기지 않도록 항목 제거
+                            logger.warning(f"시트 단위 캐시 갱신 불가, 캐시 항목 제거: {file_name}")
+                            self._detach(file_path)
+                            continue
+                        self._write_file_data(
+                            file_path, file_name, cells, headers, segments,
+                            st=st, fingerprint=fingerprint, sheet_sigs=sheet_sigs,
+                            shared_sig=shared_sig, hashes=hashes
+                        )
+                self._conn.commit()
+        except Exception as e:
+            self._conn.rollback()
+            paths = ', '.join(p[0][0] for p in prepared)
+            logger.error(f"캐시 저장 실패: {paths} — {e}")
+            return 0
+        return len(prepared)
 
-            # 기존 데이터 삭제 후 재삽입
-            self._conn.execute(
-                "DELETE FROM cell_data WHERE file_path = ?", (file_path,)
-            )
-            self._conn.execute(
-                "DELETE FROM sheet_headers WHERE file_path = ?", (file_path,)
+    def _write_file_data(self, file_path: str, file_name: str,
+                         cells: Dict[str, List[Tuple[int, int, str]]],
+                         headers: Dict[str, List[str]],
+                         segments: Optional[Dict[str, IndexSegment]],
+                         st: os.stat_result, fingerprint: Optional[str],
+                         sheet_sigs: Optional[Dict[str, str]] = None,
+                         shared_sig: Optional[str] = None,
+                         hashes: Optional[Dict[str, str]] = None):
+        """파일 하나의 캐시 데이터를 기록합니다 (커밋은 호출자 담당)."""
+        # 기존 데이터 삭제 (다른 경로가 공유 중이면 참조만 제거)
+        self._detach(file_path)
+
+        shared = None
+        if fingerprint:
+            shared = self._conn.execute(
+                "SELECT file_id FROM file_meta "
+                "WHERE file_size = ? AND file_hash = ? LIMIT 1",
+                (st.st_size, fingerprint)
+            ).fetchone()
+
+        if shared:
+            file_id = shared[0]
+        else:
+            file_id = self._conn.execute(
+                "SELECT COALESCE(MAX(file_id), 0) + 1 FROM file_meta"
+            ).fetchone()[0]
+
+        # 메타 정보 저장
+        self._conn.execute(
+            "INSERT INTO file_meta (file_path, file_id, file_name, file_mtime, "
+            "file_size, file_hash, last_access) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (file_path, file_id, file_name, st.st_mtime, st.st_size, fingerprint, time.time())
+        )
+
+        if shared:
+            logger.info(f"캐시 저장 생략 (동일 내용 공유): {file_name}")
+            return
+
+        self._write_sheets(file_id, cells, headers, segments,
+                           sheet_sigs or {}, shared_sig, hashes or {})
+        logger.info(
+            f"캐시 저장 완료: {file_name} ({sum(len(b) for b in cells.values())} 셀)"
+        )
+
+    def _update_sheets(self, file_path: str, file_name: str,
+                       cells: Dict[str, List[Tuple[int, int, str]]],
+                       headers: Dict[str, List[str]],
+                       segments: Optional[Dict[str, IndexSegment]],
+                       keep: List[str], st: os.stat_result, fingerprint: Optional[str],
+                       sheet_sigs: Dict[str, str], shared_sig: Optional[str],
+                       hashes: Dict[str, str]) -> bool:
+        """
+        바뀐 시트만 교체하는 시트 단위 갱신 (커밋은 호출자 담당).
+        경로의 캐시 데이터를 다른 경로가 공유 중이거나 keep 시트가 캐시에 없으면 False.
+        """
+        row = self._conn.execute(
+            "SELECT file_id FROM file_meta WHERE file_path = ?", (file_path,)
+        ).fetchone()
+        if row is None:
+            return False
+        file_id = row[0]
+        if self._conn.execute(
+            "SELECT COUNT(*) FROM file_meta WHERE file_id = ?", (file_id,)
+        ).fetchone()[0] > 1:
+            return False
+
+        existing = dict(self._conn.execute(
+            "SELECT sheet_name, sheet_id FROM sheets WHERE file_id = ?", (file_id,)
+        ).fetchall())
+        if any(name not in existing for name in keep):
+            return False
+
+        # 유지하는 시트 외의 기존 시트(바뀐 시트의 이전 데이터, 삭제된 시트)를 제거
+        self._drop_sheets([sid for name, sid in existing.items() if name not in keep])
+        self._write_sheets(file_id, cells, headers, segments, sheet_sigs, shared_sig, hashes)
+        # 유지한 시트는 값이 같다고 확인된 것이므로 서명만 현재 파트 기준으로 갱신
+        self._conn.executemany(
+            "UPDATE sheets SET part_sig = ?, shared_sig = ? WHERE sheet_id = ?",
+            [(sheet_sigs.get(name), shared_sig, existing[name]) for name in keep]
+        )
+        self._conn.execute(
+            "UPDATE file_meta SET file_name = ?, file_mtime = ?, file_size = ?, "
+            "file_hash = ?, last_access = ? WHERE file_path = ?",
+            (file_name, st.st_mtime, st.st_size, fingerprint, time.time(), file_path)
+        )
+        logger.info(
+            f"캐시 시트 단위 갱신: {file_name} (교체 {len(cells)}개, 유지 {len(keep)}개)"
+        )
+        return True
+
+    def _write_sheets(self, file_id: int,
+                      cells: Dict[str, List[Tuple[int, int, str]]],
+                      headers: Dict[str, List[str]],
+                      segments: Optional[Dict[str, IndexSegment]],
+                      sheet_sigs: Dict[str, str], shared_sig: Optional[str],
+                      hashes: Dict[str, str]):
+        """시트, 셀, 세그먼트를 기록합니다 (커밋은 호출자 담당)."""
+        # 시트 및 컬럼 정보 저장
+        sheet_ids = {}
+        for sheet_name, header_list in headers.items():
+            sheet_ids[sheet_name] = self._insert_sheet(
+                file_id, sheet_name, header_list,
+                sheet_sigs.get(sheet_name), shared_sig, hashes.get(sheet_name)
             )
-            self._conn.execute(
-                "DELETE FROM file_meta WHERE file_path = ?", (file_path,)
+
+        # 셀 데이터 일괄 삽입 (시트별 배치를 중간 목록 없이 스트리밍)
+        for sheet_name, batch in cells.items():
+            if sheet_name not in sheet_ids:
+                sheet_ids[sheet_name] = self._insert_sheet(file_id, sheet_name, [])
+            sheet_id = sheet_ids[sheet_name]
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cells (file_id, sheet_id, row_idx, col_idx, cell_value) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ((file_id, sheet_id, row_idx, col_idx, value)
+                 for row_idx, col_idx, value in batch)
             )
 
-            # 메타 정보 저장
-            self._conn.execute(
-                "INSERT INTO file_meta (file_path, file_name, file_mtime, file_size) VALUES (?, ?, ?, ?)",
-                (file_path, file_name, mtime, size)
+        if segments:
+            mapped = self._write_mapped_files(file_id, cells, headers, segments)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sheet_segments "
+                "(sheet_id, format, data, mapped_file) VALUES (?, ?, ?, ?)",
+                [(sheet_ids[name], SEGMENT_FORMAT, seg.to_bytes(), mapped.get(name))
+                 for name, seg in segments.items() if name in sheet_ids]
             )
 
-            # 헤더 정보 저장
-            for sheet_name, header_list in headers.items():
-                self._conn.execute(
-                    "INSERT INTO sheet_headers (file_path, sheet_name, headers_json) VALUES (?, ?, ?)",
-                    (file_path, sheet_name, json.dumps(header_list, ensure_ascii=False))
+    def _write_mapped_files(self, file_id: int,
+                            cells: Dict[str, List[Tuple[int, int, str]]],
+                            headers: Dict[str, List[str]],
+                            segments: Dict[str, IndexSegment]) -> Dict[str, str]:
+        """
+        시트별 메모리 맵 인덱스 파일을 기록하고 {시트명: 파일명}을 반환합니다.
+        파일명은 매번 새로 만들어, 다른 프로세스가 매핑 중인 이전 파일과 겹치지 않게 합니다.
+        """
+        if not self.use_mapped_index:
+            return {}
+
+        written = {}
+        os.makedirs(self.mapped_dir, exist_ok=True)
+        for sheet_name, segment in segments.items():
+            name = f"{file_id}_{uuid.uuid4().hex}.dmap"
+            try:
+                write_mapped_sheet(
+                    os.path.join(self.mapped_dir, name), sheet_name,
+                    headers.get(sheet_name, []), cells.get(sheet_name, []), segment
                 )
+                written[sheet_name] = name
+            except Exception as e:
+                logger.warning(f"인덱스 파일 기록 실패: {sheet_name} — {e}")
+        return written
 
-            # 셀 데이터 일괄 삽입
-            self._conn.executemany(
-                "INSERT INTO cell_data (file_path, sheet_name, row_idx, col_idx, col_name, cell_value) VALUES (?, ?, ?, ?, ?, ?)",
-                [(c['file_path'], c['sheet_name'], c['row_idx'],
-                  c['col_idx'], c['col_name'], c['value']) for c in cells]
-            )
+    def open_mapped_sheets(self, file_path: str) -> Optional[Dict]:
+        """
+        파일의 모든 시트를 메모리 맵 인덱스로 엽니다.
+        한 시트라도 인덱스 파일이 없거나 열 수 없으면 None을 반환합니다.
 
-            self._conn.commit()
-            logger.info(f"캐시 저장 완료: {file_name} ({len(cells)} 셀)")
+        Returns:
+            {'file_path', 'file_name', 'sheets': [MappedSheet, ...]}
+        """
+        if not self._conn or not self.use_mapped_index:
+            return None
+
+        try:
+            with self._lock:
+                meta = self._conn.execute(
+                    "SELECT file_name, file_id FROM file_meta WHERE file_path = ?",
+                    (file_path,)
+                ).fetchone()
+                if not meta:
+                    return None
+                file_name, file_id = meta
+                rows = self._conn.execute(
+                    "SELECT g.mapped_file FROM sheets s "
+                    "LEFT JOIN sheet_segments g ON g.sheet_id = s.sheet_id "
+                    "WHERE s.file_id = ? ORDER BY s.sheet_id",
+                    (file_id,)
+                ).fetchall()
+        except Exception as e:
+            logger.error(f"인덱스 파일 조회 실패: {file_path} — {e}")
+            return None
+
+        if not rows or any(r[0] is None for r in rows):
+            return None
+
+        sheets = []
+        try:
+            for (name,) in rows:
+                sheets.append(MappedSheet(os.path.join(self.mapped_dir, name)))
         except Exception as e:
-            logger.error(f"캐시 저장 실패: {file_path} — {e}")
+            logger.warning(f"인덱스 파일 열기 실패: {file_path} — {e}")
+            for sheet in sheets:
+                sheet.close()
+            return None
+
+        return {'file_path': file_path, 'file_name': file_name, 'sheets': sheets}
+
+    def _remove_mapped_files(self, names: List[str]):
+        """인덱스 파일을 삭제합니다. 다른 프로세스가 매핑 중이라 실패하면 남겨둡니다."""
+        for name in names:
+            try:
+                os.remove(os.path.join(self.mapped_dir, name))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.debug(f"인덱스 파일 삭제 보류: {name} — {e}")
+
+    def _insert_sheet(self, file_id: int, sheet_name: str, header_list: List[str],
+                      part_sig: Optional[str] = None, shared_sig: Optional[str] = None,
+                      content_hash: Optional[str] = None) -> int:
+        """시트와 컬럼명을 저장하고 sheet_id를 반환합니다 (커밋은 호출자 담당)."""
+        sheet_id = self._conn.execute(
+            "INSERT INTO sheets (file_id, sheet_name, part_sig, shared_sig, content_hash) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (file_id, sheet_name, part_sig, shared_sig, content_hash)
+        ).lastrowid
+        self._conn.executemany(
+            "INSERT INTO sheet_columns (sheet_id, col_idx, col_name) VALUES (?, ?, ?)",
+            [(sheet_id, i, str(name)) for i, name in enumerate(header_list)]
+        )
+        return sheet_id
 
     def load_file_data(self, file_path: str) -> Optional[Dict]:
-        """캐시에서 파일 데이터를 로드합니다."""
+        """캐시에서 파일 데이터를 로드합니다. 공유 데이터는 요청한 경로 기준으로 반환합니다."""
         if not self._conn:
             return None
 
         try:
-            # 메타 정보 조회
-            meta = self._conn.execute(
-                "SELECT file_name FROM file_meta WHERE file_path = ?",
-                (file_path,)
-            ).fetchone()
-            if not meta:
-                return None
+            with self._lock:
+                # 메타 정보 조회
+                meta = self._conn.execute(
+                    "SELECT file_name, file_id FROM file_meta WHERE file_path = ?",
+                    (file_path,)
+                ).fetchone()
+                if not meta:
+                    return None
+
+                file_name, file_id = meta
+
+                # 시트 및 헤더 정보 조회
+                sheet_names = {}
+                headers = {}
+                for sheet_id, sheet_name in self._conn.execute(
+                    "SELECT sheet_id, sheet_name FROM sheets WHERE file_id = ? ORDER BY sheet_id",
+                    (file_id,)
+                ):
+                    sheet_names[sheet_id] = sheet_name
+                    headers[sheet_name] = []
+                for sheet_id, col_name in self._conn.execute(
+                    "SELECT c.sheet_id, c.col_name FROM sheet_columns c "
+                    "JOIN sheets s ON s.sheet_id = c.sheet_id "
+                    "WHERE s.file_id = ? ORDER BY c.sheet_id, c.col_idx",
+                    (file_id,)
+                ):
+                    headers[sheet_names[sheet_id]].append(col_name)
 
-            file_name = meta[0]
-
-            # 헤더 정보 조회
-            headers = {}
-            for row in self._conn.execute(
-                "SELECT sheet_name, headers_json FROM sheet_headers WHERE file_path = ?",
-                (file_path,)
-            ):
-                headers[row[0]] = json.loads(row[1])
-
-            # 셀 데이터 조회
-            cells = []
-            for row in self._conn.execute(
-                "SELECT sheet_name, row_idx, col_idx, col_name, cell_value FROM cell_data WHERE file_path = ?",
-                (file_path,)
-            ):
-                cells.append({
-                    'file_path': file_path,
-                    'file_name': file_name,
-                    'sheet_name': row[0],
-                    'row_idx': row[1],
-                    'col_idx': row[2],
-                    'col_name': row[3],
-                    'value': row[4]
-                })
+                # 셀 데이터 조회 (클러스터 키 순서대로 순차 읽기)
+                cells = []
+                for sheet_id, row_idx, col_idx, value in self._conn.execute(
+                    "SELECT sheet_id, row_idx, col_idx, cell_value FROM cells WHERE file_id = ?",
+                    (file_id,)
+                ):
+                    sheet_name = sheet_names[sheet_id]
+                    sheet_headers = headers[sheet_name]
+                    cells.append({
+                        'file_path': file_path,
+                        'file_name': file_name,
+                        'sheet_name': sheet_name,
+                        'row_idx': row_idx,
+                        'col_idx': col_idx,
+                        'col_name': sheet_headers[col_idx] if col_idx < len(sheet_headers) else str(col_idx),
+                        'value': value
+                    })
 
             return {
                 'file_path': file_path,
@@ -191,15 +1039,153 @@ class IndexCache:
             logger.error(f"캐시 로드 실패: {file_path} — {e}")
             return None
 
+    def load_sheet_segments(self, file_path: str) -> Optional[Dict]:
+        """
+        캐시에서 시트별 세그먼트와 셀 값을 로드합니다.
+        모든 시트에 현재 포맷의 세그먼트가 있을 때만 결과를 반환하고, 아니면 None.
+
+        Returns:
+            {'file_path', 'file_name',
+             'sheets': {시트명: {'headers': [...], 'cells': [(row_idx, col_idx, value)],
+                                'segment': IndexSegment}}}
+        """
+        if not self._conn:
+            return None
+
+        try:
+            with self._lock:
+                meta = self._conn.execute(
+                    "SELECT file_name, file_id FROM file_meta WHERE file_path = ?",
+                    (file_path,)
+                ).fetchone()
+                if not meta:
+                    return None
+                file_name, file_id = meta
+
+                sheet_rows = self._conn.execute(
+                    "SELECT s.sheet_id, s.sheet_name, g.format, g.data FROM sheets s "
+                    "LEFT JOIN sheet_segments g ON g.sheet_id = s.sheet_id "
+                    "WHERE s.file_id = ? ORDER BY s.sheet_id",
+                    (file_id,)
+                ).fetchall()
+                if not sheet_rows or any(
+                    fmt != SEGMENT_FORMAT or data is None for _, _, fmt, data in sheet_rows
+                ):
+                    return None
+
+                sheets = {}
+                by_id = {}
+                for sheet_id, sheet_name, _, data in sheet_rows:
+                    entry = {'headers': [], 'cells': [], 'segment': data}
+                    sheets[sheet_name] = entry
+                    by_id[sheet_id] = entry
+                for sheet_id, col_name in self._conn.execute(
+                    "SELECT c.sheet_id, c.col_name FROM sheet_columns c "
+                    "JOIN sheets s ON s.sheet_id = c.sheet_id "
+                    "WHERE s.file_id = ? ORDER BY c.sheet_id, c.col_idx",
+                    (file_id,)
+                ):
+                    by_id[sheet_id]['headers'].append(col_name)
+
+                # 클러스터 키 순서 = 세그먼트 로컬 셀 번호 순서 (행 → 열)
+                for sheet_id, row_idx, col_idx, value in self._conn.execute(
+                    "SELECT sheet_id, row_idx, col_idx, cell_value FROM cells "
+                    "WHERE file_id = ? ORDER BY sheet_id, row_idx, col_idx",
+                    (file_id,)
+                ):
+                    by_id[sheet_id]['cells'].append((row_idx, col_idx, value))
+
+            for entry in sheets.values():
+                entry['segment'] = IndexSegment.from_bytes(entry['segment'])
+                if entry['segment'].cell_count != len(entry['cells']):
+                    return None
+
+            return {'file_path': file_path, 'file_name': file_name, 'sheets': sheets}
+        except Exception as e:
+            logger.error(f"세그먼트 로드 실패: {file_path} — {e}")
+            return None
+
+    def get_sheet_fingerprints(self, file_path: str) -> Optional[Dict[str, Tuple[Optional[str], Optional[str], str]]]:
+        """
+        경로의 시트별 지문 {시트명: (part_sig, shared_sig, content_hash)}을 반환합니다.
+        캐시 항목이 없거나, 다른 경로와 데이터를 공유하거나(시트 단위 갱신 불가),
+        지문이 없는 구버전 시트가 있으면 None.
+        """
+        if not self._conn:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT file_id FROM file_meta WHERE file_path = ?", (file_path,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if self._conn.execute(
+                    "SELECT COUNT(*) FROM file_meta WHERE file_id = ?", (row[0],)
+                ).fetchone()[0] > 1:
+                    return None
+                rows = self._conn.execute(
+                    "SELECT sheet_name, part_sig, shared_sig, content_hash FROM sheets WHERE file_id = ?",
+                    (row[0],)
+                ).fetchall()
+        except Exception as e:
+            logger.error(f"시트 지문 조회 실패: {file_path} — {e}")
+            return None
+        if not rows or any(row[3] is None for row in rows):
+            return None
+        return {name: (part_sig, shared_sig, content_hash)
+                for name, part_sig, shared_sig, content_hash in rows}
+
+    def _detach(self, file_path: str):
+        """
+        경로의 캐시 항목을 제거합니다 (커밋은 호출자 담당).
+        같은 file_id를 공유하는 다른 경로가 없을 때만 셀 데이터를 삭제합니다.
+        """
+        row = self._conn.execute(
+            "SELECT file_id FROM file_meta WHERE file_path = ?", (file_path,)
+        ).fetchone()
+        if row is None:
+            return
+        file_id = row[0]
+
+        self._conn.execute("DELETE FROM file_meta WHERE file_path = ?", (file_path,))
+
+        still_shared = self._conn.execute(
+            "SELECT 1 FROM file_meta WHERE file_id = ? LIMIT 1", (file_id,)
+        ).fetchone()
+        if still_shared:
+            return
+
+        self._drop_sheets([r[0] for r in self._conn.execute(
+            "SELECT sheet_id FROM sheets WHERE file_id = ?", (file_id,)
+        )])
+
+    def _drop_sheets(self, sheet_ids: List[int]):
+        """시트와 그 셀/세그먼트/인덱스 파일을 삭제합니다 (커밋은 호출자 담당)."""
+        for sheet_id in sheet_ids:
+            self._remove_mapped_files([r[0] for r in self._conn.execute(
+                "SELECT mapped_file FROM sheet_segments "
+                "WHERE sheet_id = ? AND mapped_file IS NOT NULL",
+                (sheet_id,)
+            )])
+            file_id = self._conn.execute(
+                "SELECT file_id FROM sheets WHERE sheet_id = ?", (sheet_id,)
+            ).fetchone()[0]
+            self._conn.execute(
+                "DELETE FROM cells WHERE file_id = ? AND sheet_id = ?", (file_id, sheet_id)
+            )
+            self._conn.execute("DELETE FROM sheet_segments WHERE sheet_id = ?", (sheet_id,))
+            self._conn.execute("DELETE FROM sheet_columns WHERE sheet_id = ?", (sheet_id,))
+            self._conn.execute("DELETE FROM sheets WHERE sheet_id = ?", (sheet_id,))
+
     def remove_file(self, file_path: str):
         """캐시에서 파일 데이터를 제거합니다."""
         if not self._conn:
             return
         try:
-            self._conn.execute("DELETE FROM cell_data WHERE file_path = ?", (file_path,))
-            self._conn.execute("DELETE FROM sheet_headers WHERE file_path = ?", (file_path,))
-            self._conn.execute("DELETE FROM file_meta WHERE file_path = ?", (file_path,))
-            self._conn.commit()
+            with self._lock:
+                self._detach(file_path)
+                self._conn.commit()
         except Exception as e:
             logger.error(f"캐시 삭제 실패: {file_path} — {e}")
 
@@ -208,7 +1194,8 @@ class IndexCache:
         if not self._conn:
             return []
         try:
-            rows = self._conn.execute("SELECT file_path FROM file_meta").fetchall()
+            with self._lock:
+                rows = self._conn.execute("SELECT file_path FROM file_meta").fetchall()
             return [r[0] for r in rows]
         except Exception:
             return []
@@ -218,17 +1205,225 @@ class IndexCache:
         if not self._conn:
             return
         try:
-            self._conn.executescript("""
-                DELETE FROM cell_data;
-                DELETE FROM sheet_headers;
-                DELETE FROM file_meta;
-            """)
-            self._conn.commit()
+            with self._lock:
+                self._remove_mapped_files([r[0] for r in self._conn.execute(
+                    "SELECT mapped_file FROM sheet_segments WHERE mapped_file IS NOT NULL"
+                )])
+                self._conn.executescript("""
+                    DELETE FROM cells;
+                    DELETE FROM sheet_segments;
+                    DELETE FROM sheet_columns;
+                    DELETE FROM sheets;
+                    DELETE FROM file_meta;
+                """)
+                self._conn.commit()
         except Exception as e:
             logger.error(f"캐시 전체 삭제 실패: {e}")
 
+    # ─── 용량 관리 ───
+
+    def get_stats(self) -> Dict:
+        """
+        캐시 사용량 통계를 반환합니다.
+
+        Returns:
+            files(경로 수), datasets(고유 데이터 수), db_bytes, free_bytes(재사용 대기 페이지),
+            wal_bytes, mapped_bytes(인덱스 파일), used_bytes(실사용 = db - free + mapped)
+        """
+        stats = {'files': 0, 'datasets': 0, 'db_bytes': 0, 'free_bytes': 0,
+                 'wal_bytes': 0, 'mapped_bytes': 0, 'used_bytes': 0}
+        if not self._conn:
+            return stats
+        try:
+            with self._lock:
+                page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+                page_count = self._conn.execute("PRAGMA page_count").fetchone()[0]
+                freelist = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+                stats['files'], stats['datasets'] = self._conn.execute(
+                    "SELECT COUNT(*), COUNT(DISTINCT file_id) FROM file_meta"
+                ).fetchone()
+        except Exception as e:
+            logger.error(f"캐시 통계 조회 실패: {e}")
+            return stats
+
+        stats['db_bytes'] = page_size * page_count
+        stats['free_bytes'] = page_size * freelist
+        try:
+            stats['wal_bytes'] = os.path.getsize(self.db_path + '-wal')
+        except OSError:
+            pass
+        stats['mapped_bytes'] = sum(size for _, size, _ in self._scan_mapped_dir())
+        stats['used_bytes'] = stats['db_bytes'] - stats['free_bytes'] + stats['mapped_bytes']
+        return stats
+
+    def _scan_mapped_dir(self):
+        """인덱스 디렉터리의 (파일명, 크기, 수정 시각)을 순회합니다."""
+        try:
+            entries = list(os.scandir(self.mapped_dir))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            yield entry.name, st.st_size, st.st_mtime
+
+    def remove_orphans(self, max_workers: int = 8) -> Dict[str, int]:
+        """
+        더 이상 존재하지 않는 파일의 캐시, 어떤 파일에도 속하지 않는 데이터,
+        DB가 참조하지 않는 인덱스 파일을 정리합니다.
+
+        Returns:
+            {'missing_files': 제거한 경로 수, 'stray_files': 삭제한 인덱스 파일 수}
+        """
+        result = {'missing_files': 0, 'stray_files': 0}
+        if not self._conn:
+            return result
+
+        with self._lock:
+            paths = [r[0] for r in self._conn.execute("SELECT file_path FROM file_meta")]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            exists = list(pool.map(os.path.exists, paths))
+        missing = [p for p, ok in zip(paths, exists) if not ok]
+
+        try:
+            with self._lock:
+                for path in missing:
+                    self._detach(path)
+                # 소유 경로가 없는 데이터 (중단된 저장 등)
+                self._conn.executescript("""
+                    DELETE FROM cells WHERE file_id NOT IN (SELECT file_id FROM file_meta);
+                    DELETE FROM sheet_segments WHERE sheet_id IN (
+                        SELECT sheet_id FROM sheets
+                        WHERE file_id NOT IN (SELECT file_id FROM file_meta));
+                    DELETE FROM sheet_columns WHERE sheet_id IN (
+                        SELECT sheet_id FROM sheets
+                        WHERE file_id NOT IN (SELECT file_id FROM file_meta));
+                    DELETE FROM sheets WHERE file_id NOT IN (SELECT file_id FROM file_meta);
+                """)
+                self._conn.commit()
+                referenced = {r[0] for r in self._conn.execute(
+                    "SELECT mapped_file FROM sheet_segments WHERE mapped_file IS NOT NULL"
+                )}
+        except Exception as e:
+            logger.error(f"캐시 정리 실패: {e}")
+            return result
+        result['missing_files'] = len(missing)
+
+        cutoff = time.time() - ORPHAN_GRACE_SECONDS
+        stray = [name for name, _, mtime in self._scan_mapped_dir()
+                 if name not in referenced and mtime < cutoff]
+        self._remove_mapped_files(stray)
+        result['stray_files'] = len(stray)
+        return result
+
+    def evict_to_budget(self, max_bytes: int, protect=()) -> List[str]:
+        """
+        사용량이 max_bytes 이하가 될 때까지 오래 사용하지 않은 데이터부터 제거합니다.
+        같은 데이터를 공유하는 경로들은 함께 제거되며, protect에 포함된 경로의 데이터는 남깁니다.
+
+        Returns:
+            제거한 파일 경로 목록
+        """
+        if not self._conn:
+            return []
+
+        protect = set(protect)
+        evicted = []
+        try:
+            with self._lock:
+                groups: Dict[int, List] = {}
+                for file_id, file_path, last_access in self._conn.execute(
+                    "SELECT file_id, file_path, "
+                    "COALESCE(last_access, CAST(strftime('%s', indexed_at) AS REAL), 0) "
+                    "FROM file_meta"
+                ):
+                    entry = groups.setdefault(file_id, [0.0, []])
+                    entry[0] = max(entry[0], last_access)
+                    entry[1].append(file_path)
+
+                # 사용량은 한 번만 측정하고, 제거한 데이터의 추정 크기를 빼 나감
+                # (데이터마다 get_stats()를 다시 부르면 PRAGMA 조회와 인덱스 디렉터리 순회가 반복됨)
+                used = self.get_stats()['used_bytes']
+
+                # 마지막 사용 시각이 오래된 데이터부터
+                for file_id, (_, paths) in sorted(groups.items(), key=lambda g: g[1][0]):
+                    if used <= max_bytes:
+                        break
+                    if protect.intersection(paths):
+                        continue
+                    size = self._dataset_bytes(file_id)
+                    for path in paths:
+                        self._detach(path)
+                    self._conn.commit()
+                    used -= size
+                    evicted.extend(paths)
+        except Exception as e:
+            logger.error(f"캐시 용량 정리 실패: {e}")
+        if evicted:
+            logger.info(f"캐시 용량 초과로 {len(evicted)}개 파일 제거")
+        return evicted
+
+    def _dataset_bytes(self, file_id: int) -> int:
+        """file_id 데이터가 차지하는 대략적인 크기 (셀/세그먼트 행 + 인덱스 파일)."""
+        cell_bytes, cell_count = self._conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(CAST(cell_value AS BLOB))), 0), COUNT(*) "
+            "FROM cells WHERE file_id = ?", (file_id,)
+        ).fetchone()
+        total = cell_bytes + cell_count * _CELL_ROW_OVERHEAD
+        for data_len, mapped_file in self._conn.execute(
+            "SELECT LENGTH(g.data), g.mapped_file FROM sheet_segments g "
+            "JOIN sheets s ON s.sheet_id = g.sheet_id WHERE s.file_id = ?", (file_id,)
+        ):
+            total += data_len
+            if mapped_file:
+                try:
+                    total += os.path.getsize(os.path.join(self.mapped_dir, mapped_file))
+                except OSError:
+                    pass
+        return total
+
+    def run_maintenance(self, max_bytes: int = DEFAULT_CACHE_BUDGET, protect=()) -> Dict:
+        """
+        캐시 정리를 한 번에 수행합니다: 누락 파일/고아 데이터 정리 → LRU 제거 → 증분 VACUUM.
+        오래 걸릴 수 있으므로 별도 스레드에서 별도 연결로 호출하는 것을 권장합니다.
+
+        Returns:
+            remove_orphans() 결과 + evicted(제거 경로 수) + stats(정리 후 get_stats())
+        """
+        if not self._conn:
+            return {}
+
+        # 증분 VACUUM 모드가 아닌 기존 DB는 한 번 전체 VACUUM으로 전환
+        with self._lock:
+            mode = self._conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        if mode != 2:
+            try:
+                with self._lock:
+                    self._conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                    self._conn.execute("VACUUM")
+                logger.info("캐시 DB를 증분 VACUUM 모드로 전환")
+            except Exception as e:
+                logger.warning(f"증분 VACUUM 전환 실패: {e}")
+
+        result = dict(self.remove_orphans())
+        result['evicted'] = len(self.evict_to_budget(max_bytes, protect))
+
+        try:
+            with self._lock:
+                self._conn.execute("PRAGMA incremental_vacuum").fetchall()
+                self._conn.commit()
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except Exception as e:
+            logger.warning(f"증분 VACUUM 실패: {e}")
+
+        result['stats'] = self.get_stats()
+        return result
+
     def close(self):
         """DB 연결을 닫습니다."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
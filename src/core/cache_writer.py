@@ -0,0 +1,157 @@
+"""
+[v2.1.0] 백그라운드 캐시 기록 스레드
+인덱싱 워커가 파일마다 SQLite에 직접 쓰면 디스크 쓰기가 인덱싱 경로를 막습니다.
+CacheWriter는 자체 DB 연결을 가진 전용 스레드에서 저장 요청을 처리하고,
+대기 중인 여러 파일을 하나의 트랜잭션으로 묶어 커밋합니다.
+
+큐는 크기가 제한되어 있어, 디스크가 인덱싱을 따라가지 못하면 워커가 잠시 대기합니다
+(저장 대기 데이터가 메모리에 무한정 쌓이지 않도록).
+"""
+
+import queue
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from src.core.cache import IndexCache
+from src.core.segment import IndexSegment
+from src.utils.logger import logger
+
+# 큐에 대기할 수 있는 최대 파일 수
+DEFAULT_MAX_PENDING = 4
+# 한 트랜잭션으로 묶을 최대 셀 수 / 파일 수
+MAX_BATCH_CELLS = 500_000
+MAX_BATCH_FILES = 16
+
+# 종료 신호
+_STOP = object()
+
+
+class CacheWriter(threading.Thread):
+    """
+    캐시 저장 전용 스레드.
+    save_file_data()는 IndexCache와 같은 인자를 받아 큐에 넣고 즉시 반환합니다.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, use_content_hash: bool = True,
+                 use_mapped_index: bool = True, max_pending: int = DEFAULT_MAX_PENDING):
+        super().__init__(name="CacheWriter", daemon=True)
+        self.db_path = db_path
+        self.use_content_hash = use_content_hash
+        self.use_mapped_index = use_mapped_index
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._launched = False
+
+        # 통계 (테스트 및 로그용)
+        self.files_written = 0
+        self.batches_committed = 0
+
+    def save_file_data(self, file_path: str, file_name: str,
+                       cells: Dict[str, List[Tuple[int, int, str]]],
+                       headers: Dict[str, List[str]],
+                       segments: Optional[Dict[str, IndexSegment]] = None,
+                       keep: Optional[List[str]] = None):
+        """
+        저장 요청을 큐에 넣습니다. 큐가 가득 차 있으면 자리가 날 때까지 대기합니다.
+        스레드가 시작 전이거나 죽은 상태면 큐가 비워지지 않으므로 호출 스레드에서 바로 저장합니다.
+        """
+        if self._closed:
+            logger.warning(f"캐시 기록 스레드가 종료되어 저장을 건너뜀: {file_name}")
+            return
+        entry = (file_path, file_name, cells, headers, segments, keep)
+        if self.is_alive():
+            self._queue.put(entry)
+            return
+        if self._launched:
+            logger.warning(f"캐시 기록 스레드가 실행 중이 아니어서 직접 저장: {file_name}")
+        elif not self._queue.full():
+            # 시작 전 요청은 큐에 담아 두었다가 스레드가 시작되면 함께 커밋
+            self._queue.put(entry)
+            return
+        self._save_sync([entry])
+
+    def start(self):
+        self._launched = True
+        super().start()
+
+    def flush(self):
+        """지금까지 요청된 저장이 모두 커밋될 때까지 대기합니다."""
+        if self.is_alive():
+            self._queue.join()
+
+    def close(self, timeout: Optional[float] = None):
+        """남은 요청을 모두 기록한 뒤 스레드를 종료합니다."""
+        if self._closed:
+            return
+        self._closed = True
+        if self.is_alive():
+            self._queue.put(_STOP)
+            self.join(timeout)
+
+    def _save_sync(self, batch: List[Tuple]):
+        """호출 스레드에서 별도 연결로 바로 저장합니다 (기록 스레드를 쓸 수 없을 때)."""
+        cache = IndexCache(
+            self.db_path,
+            use_content_hash=self.use_content_hash,
+            use_mapped_index=self.use_mapped_index
+        )
+        try:
+            self.files_written += cache.save_many(batch)
+            self.batches_committed += 1
+        except Exception as e:
+            logger.error(f"캐시 직접 저장 실패: {e}")
+        finally:
+            cache.close()
+
+    def run(self):
+        """큐에서 요청을 꺼내 묶음 단위로 커밋합니다."""
+        # SQLite 연결은 이 스레드에서 생성하여 이 스레드에서만 사용
+        cache = IndexCache(
+            self.db_path,
+            use_content_hash=self.use_content_hash,
+            use_mapped_index=self.use_mapped_index
+        )
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    self._queue.task_done()
+                    break
+
+                batch, stop = self._collect_batch(item)
+                try:
+                    written = cache.save_many(batch)
+                    self.files_written += written
+                    self.batches_committed += 1
+                    if len(batch) > 1:
+                        logger.info(f"캐시 일괄 저장: {written}/{len(batch)}개 파일")
+                except Exception as e:
+                    # 한 묶음이 실패해도 스레드는 계속 (죽으면 이후 요청이 큐에서 영원히 대기)
+                    logger.error(f"캐시 일괄 저장 실패 ({len(batch)}개 파일): {e}")
+                finally:
+                    for _ in range(len(batch) + (1 if stop else 0)):
+                        self._queue.task_done()
+                if stop:
+                    break
+        finally:
+            cache.close()
+
+    def _collect_batch(self, first) -> Tuple[List[Tuple], bool]:
+        """
+        대기 중인 요청을 한도 내에서 더 꺼내 하나의 묶음으로 만듭니다.
+
+        Returns:
+            (요청 목록, 종료 신호를 만났는지 여부)
+        """
+        batch = [first]
+        cells = sum(len(b) for b in first[2].values())
+        while len(batch) < MAX_BATCH_FILES and cells < MAX_BATCH_CELLS:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+            cells += sum(len(b) for b in item[2].values())
+        return batch, False
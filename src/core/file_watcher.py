@@ -0,0 +1,211 @@
+"""
+[v2.1.0] 파일 감시기
+추가된 파일과 폴더를 QFileSystemWatcher로 감시하여 변경 사항을 묶어서 알립니다.
+
+- 변경 알림은 디바운스 후 한 번에 처리합니다 (Excel 저장처럼 짧은 시간에 여러 번 발생하는 이벤트).
+- 파일 상태(mtime, 크기)를 비교하여 실제로 바뀐 파일만 changed로 알립니다.
+- 임시 파일에 쓰고 이름을 바꾸는 저장 방식(원자적 교체)에서는 감시 대상이 사라지므로
+  처리 시점에 파일이 다시 있으면 감시를 재등록하고, 끝내 없으면 removed로 알립니다.
+- 감시 폴더에 새로 생긴 지원 파일은 added로 알립니다 (하위 폴더 포함).
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+
+from src.core.scanner import FileScanner
+from src.utils.logger import logger
+
+# Excel이 문서를 여는 동안 만드는 잠금 파일 접두어
+LOCK_FILE_PREFIX = '~$'
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    """변경 판단용 파일 상태 (mtime_ns, 크기). 파일이 없으면 None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class FileWatcher(QObject):
+    """
+    [v2.1.0] 디바운스 파일/폴더 감시기.
+    GUI 스레드에서 생성하고 사용합니다 (QFileSystemWatcher 이벤트는 생성 스레드로 전달됨).
+    """
+
+    files_changed = Signal(list)   # 내용이 바뀐 파일 경로 목록
+    files_removed = Signal(list)   # 삭제된 파일 경로 목록
+    files_added = Signal(list)     # 감시 폴더에 새로 생긴 파일 경로 목록
+
+    # 마지막 이벤트 후 처리까지 기다리는 시간 (ms)
+    DEBOUNCE_MS = 1000
+    # 원자적 교체 중 파일이 잠시 없을 때 다시 확인하는 최대 횟수
+    MISSING_RETRIES = 3
+
+    def __init__(self, parent=None, debounce_ms: int = DEBOUNCE_MS):
+        super().__init__(parent)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_event)
+        self._watcher.directoryChanged.connect(self._on_dir_event)
+        self._scanner = FileScanner()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._flush)
+
+        # 감시 파일 → 마지막으로 확인한 상태
+        self._files: Dict[str, Optional[Tuple[int, int]]] = {}
+        # 감시 폴더(루트) → 마지막으로 확인한 지원 파일 집합
+        self._folders: Dict[str, Set[str]] = {}
+        # 디바운스 대기 중인 파일/폴더, 원자적 교체 대기 횟수
+        self._pending_files: Set[str] = set()
+        self._pending_dirs: Set[str] = set()
+        self._missing: Dict[str, int] = {}
+
+    # ─── 감시 대상 관리 ───
+
+    def watched_files(self) -> List[str]:
+        return list(self._files)
+
+    def watched_folders(self) -> List[str]:
+        return list(self._folders)
+
+    def set_files(self, file_paths: Iterable[str]):
+        """감시 파일 목록을 주어진 목록과 같게 맞춥니다 (파일 트리 목록과 동기화)."""
+        wanted = set(file_paths)
+        for fp in [f for f in self._files if f not in wanted]:
+            self.unwatch_file(fp)
+        self.watch_files([f for f in wanted if f not in self._files])
+
+    def watch_files(self, file_paths: Iterable[str]):
+        """파일 감시를 시작합니다."""
+        added = []
+        for fp in file_paths:
+            if fp in self._files:
+                continue
+            self._files[fp] = _stat_key(fp)
+            if os.path.exists(fp):
+                added.append(fp)
+        if added:
+            self._watcher.addPaths(added)
+
+    def unwatch_file(self, file_path: str):
+        """파일 감시를 중지합니다."""
+        self._files.pop(file_path, None)
+        if file_path in self._watcher.files():
+            self._watcher.removePath(file_path)
+        self._pending_files.discard(file_path)
+        self._missing.pop(file_path, None)
+
+    def watch_folder(self, folder: str):
+        """폴더(하위 폴더 포함)를 감시하여 새 파일을 알립니다."""
+        folder = str(Path(folder).resolve())
+        if folder in self._folders:
+            return
+        self._folders[folder] = self._scan_folder(folder)
+        self._watch_dirs(folder)
+        logger.info(f"폴더 감시 시작: {folder}")
+
+    def clear(self):
+        """모든 감시를 중지합니다."""
+        paths = self._watcher.files() + self._watcher.directories()
+        if paths:
+            self._watcher.removePaths(paths)
+        self._files.clear()
+        self._folders.clear()
+        self._pending_files.clear()
+        self._pending_dirs.clear()
+        self._missing.clear()
+        self._timer.stop()
+
+    def _watch_dirs(self, folder: str):
+        """폴더와 하위 폴더를 감시 목록에 추가합니다 (QFileSystemWatcher는 재귀 감시를 지원하지 않음)."""
+        watched = set(self._watcher.directories())
+        dirs = [root for root, _, _ in os.walk(folder) if root not in watched]
+        if dirs:
+            self._watcher.addPaths(dirs)
+
+    def _scan_folder(self, folder: str) -> Set[str]:
+        """폴더의 지원 파일 집합 (Excel 잠금 파일 제외)"""
+        return {
+            fp for fp in self._scanner.get_supported_files([folder])
+            if not Path(fp).name.startswith(LOCK_FILE_PREFIX)
+        }
+
+    # ─── 이벤트 처리 ───
+
+    def _on_file_event(self, path: str):
+        self._pending_files.add(path)
+        self._timer.start()
+
+    def _on_dir_event(self, path: str):
+        self._pending_dirs.add(path)
+        self._timer.start()
+
+    def _flush(self):
+        """디바운스가 끝난 변경 이벤트를 처리합니다."""
+        pending_files, self._pending_files = self._pending_files, set()
+        pending_dirs, self._pending_dirs = self._pending_dirs, set()
+
+        changed, removed = self._check_files(pending_files)
+        added = self._check_folders(pending_dirs)
+
+        if removed:
+            logger.info(f"감시 파일 삭제: {len(removed)}개")
+            self.files_removed.emit(removed)
+        if changed:
+            logger.info(f"감시 파일 변경: {len(changed)}개")
+            self.files_changed.emit(changed)
+        if added:
+            logger.info(f"감시 폴더에 새 파일: {len(added)}개")
+            self.files_added.emit(added)
+
+    def _check_files(self, paths: Set[str]) -> Tuple[List[str], List[str]]:
+        """대기 중인 파일의 상태를 비교하여 (변경 목록, 삭제 목록)을 반환합니다."""
+        changed, removed = [], []
+        watched = set(self._watcher.files())
+        for fp in sorted(paths):
+            if fp not in self._files:
+                continue
+            current = _stat_key(fp)
+            if current is None:
+                # 원자적 교체 중일 수 있으므로 몇 번 더 확인한 뒤 삭제로 판단
+                retries = self._missing.get(fp, 0) + 1
+                if retries <= self.MISSING_RETRIES:
+                    self._missing[fp] = retries
+                    self._pending_files.add(fp)
+                    self._timer.start()
+                else:
+                    self._missing.pop(fp, None)
+                    self._files.pop(fp, None)
+                    removed.append(fp)
+                continue
+
+            self._missing.pop(fp, None)
+            # 이름 바꾸기로 교체된 파일은 감시가 풀리므로 다시 등록
+            if fp not in watched:
+                self._watcher.addPath(fp)
+            if current != self._files[fp]:
+                self._files[fp] = current
+                changed.append(fp)
+        return changed, removed
+
+    def _check_folders(self, dirs: Set[str]) -> List[str]:
+        """변경된 폴더가 속한 감시 폴더를 다시 스캔하여 새 파일 목록을 반환합니다."""
+        added = []
+        for folder, known in self._folders.items():
+            if not any(d == folder or d.startswith(folder + os.sep) for d in dirs):
+                continue
+            if not os.path.isdir(folder):
+                continue
+            current = self._scan_folder(folder)
+            added.extend(sorted(current - known - set(self._files)))
+            self._folders[folder] = current
+            # 새로 생긴 하위 폴더도 감시
+            self._watch_dirs(folder)
+        return added
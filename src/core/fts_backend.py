@@ -0,0 +1,573 @@
+"""
+[v2.1.0] SQLite FTS5 검색 백엔드
+메모리 인덱스(SearchIndex)는 셀/토큰을 모두 RAM에 올리므로 데이터가 메모리보다 크면 쓸 수 없습니다.
+FtsSearchBackend는 IndexCache의 SQLite DB 안에 검색 테이블을 만들어 디스크에서 직접 검색하며,
+메모리 사용량은 열려 있는 파일/시트 메타데이터 정도로 데이터 크기와 무관합니다.
+
+테이블 구성 (캐시 DB에 함께 저장):
+- search_cells: 셀마다 값, 초성 문자열, 숫자값(범위 검색용). 정수 cell_id가 셀 번호
+- fts_cells: search_cells를 외부 콘텐츠로 하는 FTS5 테이블 (trigram 토크나이저, 값/초성 컬럼)
+- search_vocab: 데이터 묶음(file_id)별 고유 토큰 (퍼지 매칭 대상)
+- search_files: 검색 테이블 구축이 끝난 file_id와 행/셀 수
+캐시에서 시트가 삭제되면(파일 제거, LRU 정리 등) 트리거가 검색 테이블도 함께 정리합니다.
+
+지연 시간/용량 트레이드오프:
+- 3글자 이상 부분 문자열/초성 검색은 trigram 인덱스 조회로 수 ms~수십 ms 수준이지만,
+  1~2글자 검색은 trigram을 쓸 수 없어 search_cells 전체를 순차 탐색합니다 (데이터 크기에 비례).
+- 검색마다 디스크에서 셀/행을 읽으므로 같은 데이터에서 메모리 인덱스보다 느립니다.
+  대신 결과 셀 수는 MAX_MATCH_CELLS로 제한합니다.
+- 셀 값이 cells 테이블과 search_cells에 중복 저장되고 trigram 인덱스가 추가되므로,
+  검색 테이블을 구축한 파일은 캐시 용량이 대략 3~4배가 됩니다.
+- 퍼지 매칭 어휘는 DB에서 묶음 단위로 읽어 처리합니다.
+- BM25는 FTS5 bm25()를 셀 단위로 계산해 행별로 합산하므로 메모리 인덱스의 행 단위 BM25와
+  점수 분포가 다릅니다 (결과 정렬 가산점으로만 사용).
+"""
+
+import sqlite3
+import threading
+from contextlib import nullcontext
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.core.cache import BUSY_TIMEOUT, CACHE_DB_NAME, IndexCache
+from src.core.indexer import CellInfo, RowData, parse_number, tokenize_text
+from src.core.jamo_utils import extract_chosung, is_hangul_syllable
+from src.utils.logger import logger
+
+# 쿼리 하나가 반환하는 최대 셀 수 (매우 흔한 키워드에서 결과가 무한정 커지지 않도록)
+MAX_MATCH_CELLS = 50_000
+# 검색 테이블 구축 시 한 번에 커밋할 셀 수
+BUILD_CHUNK = 20_000
+# IN 조건 한 번에 넣을 최대 변수 수
+_IN_CHUNK = 500
+# trigram 인덱스를 사용할 수 있는 최소 검색어 길이
+_TRIGRAM_MIN = 3
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS search_cells (
+        cell_id INTEGER PRIMARY KEY,
+        sheet_id INTEGER NOT NULL,
+        row_idx INTEGER NOT NULL,
+        col_idx INTEGER NOT NULL,
+        value TEXT NOT NULL,
+        chosung TEXT,
+        numeric REAL
+    );
+    CREATE INDEX IF NOT EXISTS idx_search_cells_row
+        ON search_cells(sheet_id, row_idx, col_idx);
+    CREATE INDEX IF NOT EXISTS idx_search_cells_numeric
+        ON search_cells(numeric) WHERE numeric IS NOT NULL;
+
+    CREATE VIRTUAL TABLE IF NOT EXISTS fts_cells USING fts5(
+        value, chosung,
+        content='search_cells', content_rowid='cell_id',
+        tokenize='trigram'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS search_cells_ai AFTER INSERT ON search_cells BEGIN
+        INSERT INTO fts_cells(rowid, value, chosung)
+            VALUES (new.cell_id, new.value, new.chosung);
+    END;
+    CREATE TRIGGER IF NOT EXISTS search_cells_ad AFTER DELETE ON search_cells BEGIN
+        INSERT INTO fts_cells(fts_cells, rowid, value, chosung)
+            VALUES ('delete', old.cell_id, old.value, old.chosung);
+    END;
+
+    CREATE TABLE IF NOT EXISTS search_vocab (
+        file_id INTEGER NOT NULL,
+        token TEXT NOT NULL,
+        PRIMARY KEY (file_id, token)
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS search_files (
+        file_id INTEGER PRIMARY KEY,
+        row_count INTEGER NOT NULL,
+        cell_count INTEGER NOT NULL
+    );
+
+    CREATE TRIGGER IF NOT EXISTS sheets_search_cleanup AFTER DELETE ON sheets BEGIN
+        DELETE FROM search_cells WHERE sheet_id = old.sheet_id;
+        DELETE FROM search_vocab WHERE file_id = old.file_id;
+        DELETE FROM search_files WHERE file_id = old.file_id;
+    END;
+"""
+
+
+def is_fts5_available() -> bool:
+    """현재 SQLite 빌드가 FTS5 trigram 토크나이저를 지원하는지 확인합니다."""
+    try:
+        conn = sqlite3.connect(':memory:')
+        try:
+            conn.execute("CREATE VIRTUAL TABLE t USING fts5(x, tokenize='trigram')")
+        finally:
+            conn.close()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def _fts_phrase(column: str, text: str) -> str:
+    """FTS5 MATCH용 컬럼 한정 구문 쿼리를 만듭니다 (따옴표 이스케이프)."""
+    return f'{column} : "' + text.replace('"', '""') + '"'
+
+
+def _like_pattern(text: str) -> str:
+    """LIKE 부분 일치 패턴을 만듭니다 (와일드카드 이스케이프)."""
+    escaped = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+
+class FtsSearchBackend:
+    """
+    [v2.1.0] IndexCache DB 위에서 동작하는 SearchBackend 구현.
+    add_file()로 캐시에 저장된 파일을 검색 대상에 추가하며, 검색 테이블이 아직 없으면
+    캐시의 셀 데이터로 한 번 구축합니다. 이후 재시작 시에는 구축 없이 바로 검색됩니다.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or CACHE_DB_NAME
+        # 정리 트리거가 캐시의 sheets 테이블을 참조하므로 캐시 스키마를 먼저 준비
+        IndexCache(self.db_path).close()
+        self._conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        # 검색 대상 시트 목록 (이 연결 전용 임시 테이블)
+        self._conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS active_sheets (sheet_id INTEGER PRIMARY KEY)"
+        )
+        self._conn.commit()
+        # 인덱싱 워커와 검색 워커가 연결을 공유하므로 락으로 직렬화.
+        # 아래 검색 대상 사전도 이 락 안에서만 읽고 고치며, 별칭 목록은 제자리 수정하지 않고 교체
+        self._lock = threading.RLock()
+
+        # 검색 대상 파일: 경로 → file_id, file_id → [(경로, 파일명)]
+        self._path_ids: Dict[str, int] = {}
+        self._aliases: Dict[int, List[Tuple[str, str]]] = {}
+        # sheet_id → (file_id, 시트명, 헤더)
+        self._sheets: Dict[int, Tuple[int, str, List[str]]] = {}
+        # (file_id, 시트명) → sheet_id
+        self._sheet_ids: Dict[Tuple[int, str], int] = {}
+        # file_id → (행 수, 셀 수)
+        self._counts: Dict[int, Tuple[int, int]] = {}
+        # 검색 대상이 바뀔 때마다 증가하는 세대 번호 (검색 후보 캐시 무효화용)
+        self._generation = 0
+
+    # ─── SearchBackend 상태 ───
+
+    @property
+    def generation(self) -> int:
+        """검색 대상 파일이 추가/제외될 때마다 증가하는 세대 번호"""
+        return self._generation
+
+    @property
+    def total_cells(self) -> int:
+        with self._lock:
+            return sum(self._counts[fid][1] for fid in self._path_ids.values())
+
+    @property
+    def total_rows(self) -> int:
+        with self._lock:
+            return sum(self._counts[fid][0] for fid in self._path_ids.values())
+
+    @property
+    def total_files(self) -> int:
+        with self._lock:
+            return len(self._path_ids)
+
+    @property
+    def indexed_files(self) -> Set[str]:
+        with self._lock:
+            return set(self._path_ids)
+
+    @property
+    def is_partial(self) -> bool:
+        return False
+
+    @property
+    def file_headers(self) -> Dict[Tuple[str, str], List[str]]:
+        """(경로, 시트명) → 헤더 스냅샷"""
+        headers = {}
+        with self._lock:
+            for file_path, file_id in self._path_ids.items():
+                for fid, sheet_name, sheet_headers in self._sheets.values():
+                    if fid == file_id:
+                        headers[(file_path, sheet_name)] = list(sheet_headers)
+        return headers
+
+    def is_file_known(self, file_path: str) -> bool:
+        with self._lock:
+            return file_path in self._path_ids
+
+    def read_lock(self):
+        """
+        구축은 묶음 단위로 커밋되고 파일은 구축이 끝난 뒤에만 검색 대상이 되므로
+        검색 구간 동안 별도로 잡을 락이 없습니다.
+        """
+        return nullcontext()
+
+    # ─── 파일 등록 ───
+
+    def add_file(self, file_path: str) -> Optional[List[str]]:
+        """
+        캐시에 저장된 파일을 검색 대상에 추가합니다. 검색 테이블이 없으면 구축합니다.
+
+        Returns:
+            시트명 목록. 캐시에 파일이 없으면 None.
+        """
+        with self._lock:
+            meta = self._conn.execute(
+                "SELECT file_id, file_name FROM file_meta WHERE file_path = ?", (file_path,)
+            ).fetchone()
+        if meta is None:
+            return None
+        file_id, file_name = meta
+
+        with self._lock:
+            built = self._conn.execute(
+                "SELECT row_count, cell_count FROM search_files WHERE file_id = ?", (file_id,)
+            ).fetchone()
+        if built is None:
+            built = self._build(file_id)
+
+        with self._lock:
+            if file_path in self._path_ids:
+                self._detach_path(file_path)
+            sheets = self._load_sheets(file_id)
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO temp.active_sheets(sheet_id) VALUES (?)",
+                [(sheet_id,) for sheet_id in sheets]
+            )
+            self._conn.commit()
+            self._counts[file_id] = tuple(built)
+            self._aliases[file_id] = self._aliases.get(file_id, []) + [(file_path, file_name)]
+            self._path_ids[file_path] = file_id
+            self._generation += 1
+            return [self._sheets[sheet_id][1] for sheet_id in sheets]
+
+    def _load_sheets(self, file_id: int) -> List[int]:
+        """file_id의 시트/헤더 정보를 읽어 등록하고 sheet_id 목록을 반환합니다."""
+        sheet_ids = []
+        for sheet_id, sheet_name in self._conn.execute(
+            "SELECT sheet_id, sheet_name FROM sheets WHERE file_id = ? ORDER BY sheet_id",
+            (file_id,)
+        ).fetchall():
+            self._sheets[sheet_id] = (file_id, sheet_name, [])
+            self._sheet_ids[(file_id, sheet_name)] = sheet_id
+            sheet_ids.append(sheet_id)
+        for sheet_id, col_name in self._conn.execute(
+            "SELECT c.sheet_id, c.col_name FROM sheet_columns c "
+            "JOIN sheets s ON s.sheet_id = c.sheet_id "
+            "WHERE s.file_id = ? ORDER BY c.sheet_id, c.col_idx",
+            (file_id,)
+        ).fetchall():
+            self._sheets[sheet_id][2].append(col_name)
+        return sheet_ids
+
+    def _build(self, file_id: int) -> Tuple[int, int]:
+        """
+        캐시의 cells 테이블로부터 file_id의 검색 테이블을 구축합니다.
+        초성/숫자/토큰 계산은 락 밖에서 하고, 묶음 단위로 커밋하여 구축 중에도 검색이 가능합니다.
+        """
+        with self._lock:
+            # 이전에 중단된 구축의 잔여 데이터 제거
+            self._conn.execute(
+                "DELETE FROM search_cells WHERE sheet_id IN "
+                "(SELECT sheet_id FROM sheets WHERE file_id = ?)", (file_id,)
+            )
+            self._conn.execute("DELETE FROM search_vocab WHERE file_id = ?", (file_id,))
+            self._conn.commit()
+
+        # 구축용 읽기 전용 연결 (공유 연결의 락을 오래 잡지 않도록)
+        reader = sqlite3.connect(self.db_path)
+        rows = set()
+        cells = 0
+        try:
+            cursor = reader.execute(
+                "SELECT sheet_id, row_idx, col_idx, cell_value FROM cells WHERE file_id = ?",
+                (file_id,)
+            )
+            while True:
+                batch = cursor.fetchmany(BUILD_CHUNK)
+                if not batch:
+                    break
+                records = []
+                vocab = set()
+                for sheet_id, row_idx, col_idx, value in batch:
+                    chosung = None
+                    if any(is_hangul_syllable(c) for c in value):
+                        chosung = extract_chosung(value).lower()
+                    numeric = parse_number(value)
+                    records.append((
+                        sheet_id, row_idx, col_idx, value, chosung,
+                        None if numeric != numeric else numeric
+                    ))
+                    vocab.update(tokenize_text(value.lower().strip()))
+                    rows.add((sheet_id, row_idx))
+                cells += len(batch)
+                with self._lock:
+                    self._conn.executemany(
+                        "INSERT INTO search_cells(sheet_id, row_idx, col_idx, value, chosung, numeric) "
+                        "VALUES (?, ?, ?, ?, ?, ?)", records
+                    )
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO search_vocab(file_id, token) VALUES (?, ?)",
+                        [(file_id, token) for token in vocab]
+                    )
+                    self._conn.commit()
+        finally:
+            reader.close()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_files(file_id, row_count, cell_count) "
+                "VALUES (?, ?, ?)", (file_id, len(rows), cells)
+            )
+            self._conn.commit()
+        logger.info(f"FTS 검색 테이블 구축: file_id={file_id}, {len(rows)}개 행, {cells}개 셀")
+        return len(rows), cells
+
+    def remove_file(self, file_path: str):
+        """파일을 검색 대상에서 제외합니다 (캐시의 검색 테이블은 유지)."""
+        with self._lock:
+            if file_path in self._path_ids:
+                self._detach_path(file_path)
+                self._conn.commit()
+
+    def _detach_path(self, file_path: str):
+        """
+        경로를 검색 대상에서 제외합니다. 같은 데이터를 쓰는 다른 경로가 없으면 시트도 제외.
+        호출자가 self._lock을 잡은 상태여야 합니다.
+        """
+        file_id = self._path_ids.pop(file_path)
+        self._generation += 1
+        aliases = [a for a in self._aliases.get(file_id, []) if a[0] != file_path]
+        if aliases:
+            self._aliases[file_id] = aliases
+            return
+        self._aliases.pop(file_id, None)
+        self._counts.pop(file_id, None)
+        for sheet_id in [s for s, info in self._sheets.items() if info[0] == file_id]:
+            _, sheet_name, _ = self._sheets.pop(sheet_id)
+            self._sheet_ids.pop((file_id, sheet_name), None)
+            self._conn.execute("DELETE FROM temp.active_sheets WHERE sheet_id = ?", (sheet_id,))
+
+    def clear(self):
+        """모든 파일을 검색 대상에서 제외합니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM temp.active_sheets")
+            self._conn.commit()
+            self._path_ids.clear()
+            self._aliases.clear()
+            self._sheets.clear()
+            self._sheet_ids.clear()
+            self._counts.clear()
+            self._generation += 1
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+    # ─── 셀/행 접근자 ───
+
+    def get_cells(self, cell_ids: Iterable[int]) -> Iterator[CellInfo]:
+        """셀 번호 목록의 셀 정보를 순회합니다. 같은 데이터를 쓰는 경로마다 하나씩 반환합니다."""
+        ids = list(cell_ids)
+        for i in range(0, len(ids), _IN_CHUNK):
+            chunk = ids[i:i + _IN_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            with self._lock:
+                records = self._conn.execute(
+                    f"SELECT cell_id, sheet_id, row_idx, col_idx, value FROM search_cells "
+                    f"WHERE cell_id IN ({placeholders})", chunk
+                ).fetchall()
+                # 락을 푼 뒤 순회하는 동안 검색 대상이 바뀌어도 되도록 시트/경로 정보를 함께 복사
+                sheets = {r[1]: self._sheets.get(r[1]) for r in records}
+                aliases = {
+                    sheet[0]: self._aliases.get(sheet[0], ())
+                    for sheet in sheets.values() if sheet is not None
+                }
+            # 요청 순서 유지
+            order = {cell_id: n for n, cell_id in enumerate(chunk)}
+            records.sort(key=lambda r: order[r[0]])
+            for _, sheet_id, row_idx, col_idx, value in records:
+                sheet = sheets[sheet_id]
+                if sheet is None:
+                    continue
+                file_id, sheet_name, headers = sheet
+                col_name = headers[col_idx] if col_idx < len(headers) else str(col_idx)
+                for file_path, file_name in aliases[file_id]:
+                    yield CellInfo(
+                        file_path=file_path,
+                        file_name=file_name,
+                        sheet_name=sheet_name,
+                        row_idx=row_idx,
+                        col_idx=col_idx,
+                        col_name=col_name,
+                        value=value
+                    )
+
+    def get_row(self, row_key: Tuple[str, str, int]) -> Optional[RowData]:
+        """행 키로 행 데이터를 반환합니다."""
+        file_path, sheet_name, row_idx = row_key
+        with self._lock:
+            file_id = self._path_ids.get(file_path)
+            sheet_id = self._sheet_ids.get((file_id, sheet_name))
+            if sheet_id is None:
+                return None
+            headers = self._sheets[sheet_id][2]
+            file_name = next(name for path, name in self._aliases[file_id] if path == file_path)
+            records = self._conn.execute(
+                "SELECT col_idx, value FROM search_cells "
+                "WHERE sheet_id = ? AND row_idx = ? ORDER BY col_idx",
+                (sheet_id, row_idx)
+            ).fetchall()
+        if not records:
+            return None
+        return RowData(
+            file_path=file_path,
+            file_name=file_name,
+            sheet_name=sheet_name,
+            row_idx=row_idx,
+            cells={
+                headers[col] if col < len(headers) else str(col): value
+                for col, value in records
+            },
+            headers=headers
+        )
+
+    def iter_vocabulary(self, chunk_size: int = 50_000) -> Iterator[List[str]]:
+        """검색 대상 파일의 토큰을 DB에서 묶음 단위로 읽어 순회합니다."""
+        with self._lock:
+            file_ids = list(self._aliases)
+        if not file_ids:
+            return
+        placeholders = ','.join('?' * len(file_ids))
+        sql = f"SELECT DISTINCT token FROM search_vocab WHERE file_id IN ({placeholders})"
+        if len(file_ids) == 1:
+            sql = "SELECT token FROM search_vocab WHERE file_id = ?"
+        last = None
+        while True:
+            # 묶음마다 락을 풀 수 있도록 키셋 페이지네이션으로 읽음
+            with self._lock:
+                if last is None:
+                    page = self._conn.execute(
+                        f"SELECT token FROM ({sql}) ORDER BY token LIMIT ?",
+                        (*file_ids, chunk_size)
+                    ).fetchall()
+                else:
+                    page = self._conn.execute(
+                        f"SELECT token FROM ({sql}) WHERE token > ? ORDER BY token LIMIT ?",
+                        (*file_ids, last, chunk_size)
+                    ).fetchall()
+            if not page:
+                return
+            yield [r[0] for r in page]
+            last = page[-1][0]
+
+    def get_vocabulary(self) -> List[str]:
+        """퍼지 매칭 대상 토큰 목록 (전체를 메모리에 올리므로 테스트/소규모 데이터용)"""
+        return [token for chunk in self.iter_vocabulary() for token in chunk]
+
+    # ─── 검색 ───
+
+    def _match_cells(self, column: str, text: str) -> Set[int]:
+        """값 또는 초성 컬럼에서 text를 부분 문자열로 포함하는 검색 대상 셀 번호를 찾습니다."""
+        if len(text) >= _TRIGRAM_MIN:
+            sql = (
+                "SELECT c.cell_id FROM fts_cells f "
+                "JOIN search_cells c ON c.cell_id = f.rowid "
+                "WHERE fts_cells MATCH ? "
+                "AND c.sheet_id IN (SELECT sheet_id FROM temp.active_sheets) LIMIT ?"
+            )
+            params = (_fts_phrase(column, text), MAX_MATCH_CELLS)
+        else:
+            # trigram 인덱스를 쓸 수 없는 짧은 검색어는 검색 대상 시트를 순차 탐색
+            sql = (
+                f"SELECT cell_id FROM search_cells "
+                f"WHERE sheet_id IN (SELECT sheet_id FROM temp.active_sheets) "
+                f"AND {column} LIKE ? ESCAPE '\\' LIMIT ?"
+            )
+            params = (_like_pattern(text), MAX_MATCH_CELLS)
+        with self._lock:
+            return {r[0] for r in self._conn.execute(sql, params)}
+
+    def find_cells_containing(self, keyword: str) -> Set[int]:
+        """키워드를 포함하는 셀 번호를 반환합니다."""
+        keyword_lower = keyword.lower().strip()
+        if not keyword_lower:
+            return set()
+        return self._match_cells('value', keyword_lower)
+
+    def find_cells_by_chosung(self, chosung_query: str) -> Set[int]:
+        """초성 쿼리로 매칭되는 셀 번호를 반환합니다."""
+        query_lower = chosung_query.lower().strip()
+        if not query_lower:
+            return set()
+        return self._match_cells('chosung', query_lower)
+
+    def find_cells_with_token(self, token: str) -> Set[int]:
+        """토큰과 정확히 일치하는 셀 번호를 반환합니다 (부분 일치 후보를 토큰화로 확인)."""
+        if not token:
+            return set()
+        candidates = list(self._match_cells('value', token))
+        result = set()
+        for i in range(0, len(candidates), _IN_CHUNK):
+            chunk = candidates[i:i + _IN_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            with self._lock:
+                records = self._conn.execute(
+                    f"SELECT cell_id, value FROM search_cells WHERE cell_id IN ({placeholders})",
+                    chunk
+                ).fetchall()
+            result.update(
+                cell_id for cell_id, value in records
+                if token in tokenize_text(value.lower().strip())
+            )
+        return result
+
+    def find_cells_in_range(self, min_val: float, max_val: float) -> Set[int]:
+        """숫자값이 min_val 이상 max_val 이하인 셀 번호를 반환합니다."""
+        with self._lock:
+            return {r[0] for r in self._conn.execute(
+                "SELECT cell_id FROM search_cells "
+                "WHERE numeric BETWEEN ? AND ? "
+                "AND sheet_id IN (SELECT sheet_id FROM temp.active_sheets) LIMIT ?",
+                (min_val, max_val, MAX_MATCH_CELLS)
+            )}
+
+    def build_bm25(self):
+        """FTS5가 검색 시 bm25()를 계산하므로 별도 구축이 필요 없습니다."""
+
+    def get_bm25_scores(self, query: str) -> Dict[Tuple, float]:
+        """
+        검색어 단어별 FTS5 bm25() 점수를 행 단위로 합산합니다.
+        trigram 인덱스를 쓸 수 없는 2글자 이하 단어는 점수에서 제외합니다.
+        """
+        scores: Dict[Tuple[int, int], float] = {}
+        for word in query.lower().split():
+            if len(word) < _TRIGRAM_MIN:
+                continue
+            # 검색 대상 시트로 먼저 거른 뒤 제한 (제외된 파일의 셀이 한도를 차지하지 않도록)
+            with self._lock:
+                records = self._conn.execute(
+                    "SELECT c.sheet_id, c.row_idx, -bm25(fts_cells) FROM fts_cells "
+                    "JOIN search_cells c ON c.cell_id = fts_cells.rowid "
+                    "WHERE fts_cells MATCH ? "
+                    "AND c.sheet_id IN (SELECT sheet_id FROM temp.active_sheets) LIMIT ?",
+                    (_fts_phrase('value', word), MAX_MATCH_CELLS)
+                ).fetchall()
+            for sheet_id, row_idx, score in records:
+                key = (sheet_id, row_idx)
+                scores[key] = scores.get(key, 0.0) + score
+
+        result = {}
+        with self._lock:
+            for (sheet_id, row_idx), score in scores.items():
+                sheet = self._sheets.get(sheet_id)
+                if sheet is None or score <= 0:
+                    continue
+                file_id, sheet_name, _ = sheet
+                for file_path, _ in self._aliases.get(file_id, ()):
+                    result[(file_path, sheet_name, row_idx)] = score
+        return result
@@ -2,18 +2,113 @@
 [v2.0.0] 검색 인덱스 엔진
 Inverted Index, 초성 인덱스, BM25 인덱스를 구축하여 고속 검색을 지원합니다.
 파일 로드 시 1회 인덱싱하면 이후 검색은 O(1)~O(n) 수준으로 수행됩니다.
+
+[v2.1.0] 캐시의 메모리 맵 인덱스 파일(MappedSheet)을 연결하면 셀을 메모리에 올리지 않고
+매핑된 상태 그대로 검색합니다. 검색 계층은 get_cell()/get_row()/iter_rows() 접근자로
+메모리 셀과 매핑 셀을 구분 없이 다룹니다.
+
+[v2.1.0] 인덱싱 워커와 검색 스레드가 동시에 접근하므로 읽기-쓰기 락으로 보호합니다.
+쓰기는 토큰화 등 준비 작업을 락 밖에서 끝낸 뒤 짧게 반영하고, 검색은 read_lock() 구간 동안
+일관된 상태를 봅니다 (청크 단위로 전부 반영되었거나 전혀 반영되지 않은 상태).
 """
 
 import re
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Optional
 from collections import defaultdict
+from functools import lru_cache
 from src.core.jamo_utils import extract_chosung, is_hangul_syllable
+from src.core.segment import IndexSegment, SegmentBuilder
+from src.core.mapped_index import MappedSheet, MappedSheetTable
+from src.core.rwlock import ReadWriteLock
+from src.core.parallel import map_shards, split_ranges
+
+NAN = float('nan')
+
+# 매핑 시트의 전역 셀 번호 시작값 (메모리 셀 번호와 겹치지 않는 범위)
+MAPPED_ID_BASE = 1 << 40
+
+# 범위 검색 시 메모리 숫자 컬럼을 나누는 샤드 크기 (셀 수)
+RANGE_SHARD_CELLS = 1 << 20
+
+# 인덱싱하지 않는 무효 셀 값
+EMPTY_VALUES = ('nan', 'None', 'NaT', '')
+
+# 토큰 분리 기준 (구두점/공백)
+_TOKEN_SPLIT = re.compile(r'[\s,;|/\\()\[\]{}<>:\"\']+')
+
+@lru_cache(maxsize=None)
+def _bm25_class():
+    """
+    [v2.1.0] rank_bm25.BM25Okapi (미설치면 None).
+    rank_bm25는 numpy 등을 함께 불러와 무거우므로 처음 BM25를 구축할 때 import합니다.
+    """
+    try:
+        from rank_bm25 import BM25Okapi
+    except ImportError:
+        return None
+    return BM25Okapi
+
+
+def tokenize_text(text: str) -> Set[str]:
+    """텍스트를 검색용 토큰으로 분리합니다 (전체 텍스트 + 구두점/공백 기준 단어)."""
+    tokens = set()
+    if not text:
+        return tokens
+    # 전체 텍스트 자체도 토큰으로 추가 (완전 일치용)
+    tokens.add(text)
+    for w in _TOKEN_SPLIT.split(text):
+        w = w.strip()
+        if w:
+            tokens.add(w)
+    return tokens
+
 
-try:
-    from rank_bm25 import BM25Okapi
-except ImportError:
-    BM25Okapi = None
+def parse_number(value: str) -> float:
+    """셀 값을 숫자로 변환합니다 (쉼표 허용). 숫자가 아니면 NaN."""
+    try:
+        return float(value.replace(',', '').strip())
+    except ValueError:
+        return NAN
+
+
+def cell_terms(value: str) -> Tuple[float, Set[str], Set[str]]:
+    """
+    셀 값의 (숫자값, 검색 토큰, 초성 토큰)을 계산합니다.
+    정규화(소문자/공백 제거) 후 토큰을 분리하고, 한글이 포함된 경우 초성 토큰도 추출합니다.
+    """
+    tokens = tokenize_text(value.lower().strip())
+    chosung_tokens = set()
+    if any(is_hangul_syllable(c) for c in value):
+        chosung_tokens = tokenize_text(extract_chosung(value).lower())
+    return parse_number(value), tokens, chosung_tokens
+
+
+def build_segment(cells: Iterable[Tuple[int, int, str]]) -> IndexSegment:
+    """(row_idx, col_idx, value) 목록으로 인덱스 세그먼트를 구축합니다 (인덱스 반영 없이)."""
+    builder = SegmentBuilder()
+    for _, _, value in cells:
+        numeric, tokens, chosung_tokens = cell_terms(value)
+        builder.add_cell(tokens, chosung_tokens, numeric)
+    return builder.build()
+
+
+def dataframe_cells(df, row_offset: int = 0) -> List[Tuple[int, int, str]]:
+    """
+    DataFrame에서 인덱싱 대상 셀의 (row_idx, col_idx, value) 목록을 만듭니다 (행 → 열 순).
+    add_dataframe()과 같은 규칙으로 무효값을 건너뜁니다.
+    """
+    n_cols = len(df.columns)
+    cells = []
+    for local_idx, (_, row) in enumerate(df.iterrows()):
+        for col_idx in range(n_cols):
+            raw_val = row.iloc[col_idx] if col_idx < len(row) else None
+            value = str(raw_val) if raw_val is not None else ''
+            if value in EMPTY_VALUES:
+                continue
+            cells.append((row_offset + local_idx, col_idx, value))
+    return cells
 
 
 @dataclass
@@ -39,22 +134,47 @@ class RowData:
     headers: List[str]
 
 
+@dataclass
+class SheetMeta:
+    """시트 메타데이터 (지연 인덱싱 시 셀 데이터보다 먼저 등록)"""
+    file_path: str
+    file_name: str
+    sheet_name: str
+    rows: int          # 데이터 행 수 (알 수 없으면 -1)
+    cols: int
+    headers: List[str]
+
+
 class SearchIndex:
     """
     [v2.0.0] 다중 계층 검색 인덱스.
     - inverted_index: 정규화된 토큰 → 셀 인덱스 집합 (정확/부분 매칭용)
     - chosung_index: 초성 문자열 → 셀 인덱스 집합 (초성 검색용)
     - vocabulary: 고유 토큰 집합 (퍼지 매칭 대상)
+    - numeric_values: 셀별 숫자값 (숫자가 아니면 NaN, 범위 검색용)
     - bm25: BM25 랭킹 인스턴스 (관련도 순위용)
     """
 
     def __init__(self):
+        # 인덱싱 워커(쓰기)와 검색 스레드(읽기) 사이의 동기화
+        self._rwlock = ReadWriteLock()
+        # 검색 데이터가 바뀔 때마다 증가하는 세대 번호 (검색 측 캐시 무효화용)
+        self._generation = 0
+        self._reset()
+
+    def _reset(self):
+        """모든 인덱스 데이터를 빈 상태로 초기화합니다."""
         # 셀 데이터 저장소
         self.cells: List[CellInfo] = []
+        # 셀 번호와 같은 순서의 숫자 컬럼 (범위 검색 시 매번 문자열을 변환하지 않도록)
+        self.numeric_values = array('d')
         # 행 데이터 저장소: (file_path, sheet_name, row_idx) → RowData
         self.rows: Dict[Tuple[str, str, int], RowData] = {}
         # 시트별 헤더 정보
         self.file_headers: Dict[Tuple[str, str], List[str]] = {}
+        # 시트별 메타데이터 및 인덱싱 대기 중인 시트 (지연 인덱싱용)
+        self.sheet_meta: Dict[Tuple[str, str], SheetMeta] = {}
+        self._pending_sheets: Set[Tuple[str, str]] = set()
 
         # 검색 인덱스들
         self.inverted_index: Dict[str, Set[int]] = defaultdict(set)
@@ -66,16 +186,27 @@ class SearchIndex:
         self._bm25_row_keys: List[Tuple[str, str, int]] = []
         self._bm25_dirty = True
 
+        # 메모리 맵으로 연결된 시트 (셀 번호 MAPPED_ID_BASE 이상)
+        self._mapped = MappedSheetTable(MAPPED_ID_BASE)
+
         # 파일 관리
         self._indexed_files: Set[str] = set()
 
+        # 퍼지 매칭용 어휘 목록 스냅샷 (세대 번호, 목록) — 인덱스가 그대로면 검색마다 재사용
+        self._vocab_snapshot: Optional[Tuple[int, List[str]]] = None
+
+    @property
+    def generation(self) -> int:
+        """셀이 추가/제거될 때마다 증가하는 세대 번호"""
+        return self._generation
+
     @property
     def total_cells(self) -> int:
-        return len(self.cells)
+        return len(self.cells) + sum(s.cell_count for _, _, _, s in self._mapped)
 
     @property
     def total_rows(self) -> int:
-        return len(self.rows)
+        return len(self.rows) + sum(s.row_count for _, _, _, s in self._mapped)
 
     @property
     def total_files(self) -> int:
@@ -85,12 +216,56 @@ class SearchIndex:
     def indexed_files(self) -> Set[str]:
         return self._indexed_files.copy()
 
+    @property
+    def pending_sheets(self) -> Set[Tuple[str, str]]:
+        return self._pending_sheets.copy()
+
+    @property
+    def is_partial(self) -> bool:
+        """메타데이터만 등록되고 아직 인덱싱되지 않은 시트가 있으면 True"""
+        return bool(self._pending_sheets)
+
+    def read_lock(self):
+        """
+        검색 동안 인덱스를 일관된 상태로 유지하는 읽기 락 (with 문).
+        같은 스레드에서 중첩해 잡을 수 있습니다.
+        """
+        return self._rwlock.read_locked()
+
+    def is_file_known(self, file_path: str) -> bool:
+        """인덱싱되었거나 메타데이터가 등록된 파일인지 확인합니다."""
+        with self._rwlock.read_locked():
+            return file_path in self._indexed_files or any(
+                k[0] == file_path for k in self.sheet_meta
+            )
+
+    def register_sheet_meta(self, meta: SheetMeta):
+        """
+        시트 메타데이터를 등록하고 인덱싱 대기 목록에 추가합니다.
+        셀 데이터 없이도 파일 트리와 헤더 정보를 먼저 사용할 수 있게 합니다.
+        """
+        key = (meta.file_path, meta.sheet_name)
+        with self._rwlock.write_locked():
+            self.sheet_meta[key] = meta
+            if key not in self.file_headers:
+                self.file_headers[key] = meta.headers
+            self._pending_sheets.add(key)
+
+    def mark_sheet_indexed(self, file_path: str, sheet_name: str):
+        """시트의 전체 인덱싱이 끝났음을 기록합니다."""
+        with self._rwlock.write_locked():
+            self._pending_sheets.discard((file_path, sheet_name))
+
     def clear(self):
         """인덱스 전체 초기화"""
-        self.__init__()
+        with self._rwlock.write_locked():
+            self._reset()
+            self._generation += 1
 
     def add_dataframe(self, file_path: str, file_name: str,
-                      sheet_name: str, df, row_offset: int = 0):
+                      sheet_name: str, df, row_offset: int = 0,
+                      builder: Optional[SegmentBuilder] = None
+                      ) -> List[Tuple[int, int, str]]:
         """
         DataFrame을 인덱스에 추가합니다.
         scanner에서 전달받은 chunk 데이터를 처리합니다.
@@ -101,18 +276,20 @@ class SearchIndex:
             sheet_name: 시트명
             df: pandas DataFrame
             row_offset: 청크 처리 시 행 인덱스 오프셋
+            builder: 지정하면 캐시 저장용 세그먼트에 토큰화 결과를 함께 기록
+
+        Returns:
+            인덱싱된 셀의 (row_idx, col_idx, value) 목록 (행 → 열 순).
+            캐시 저장 시 DataFrame을 다시 순회하지 않고 이 목록을 그대로 사용합니다.
         """
         headers = [str(col) for col in df.columns]
-        header_key = (file_path, sheet_name)
-        if header_key not in self.file_headers:
-            self.file_headers[header_key] = headers
-
-        self._indexed_files.add(file_path)
-        self._bm25_dirty = True
 
+        # 1단계 (락 밖): 셀 값 변환, 토큰화, 초성 추출
+        batch: List[Tuple[int, int, str]] = []
+        prepared = []   # (CellInfo, 숫자값, 토큰, 초성 토큰)
+        row_cells: List[Tuple[int, Dict[str, str]]] = []
         for local_idx, (_, row) in enumerate(df.iterrows()):
             actual_row_idx = row_offset + local_idx
-            row_key = (file_path, sheet_name, actual_row_idx)
             cells_dict = {}
 
             for col_idx, col_name in enumerate(headers):
@@ -120,7 +297,7 @@ class SearchIndex:
                 value = str(raw_val) if raw_val is not None else ''
 
                 # NaN, None 등 무효값 건너뛰기
-                if value in ('nan', 'None', 'NaT', ''):
+                if value in EMPTY_VALUES:
                     continue
 
                 cells_dict[col_name] = value
@@ -135,26 +312,38 @@ class SearchIndex:
                     col_name=col_name,
                     value=value
                 )
+                batch.append((actual_row_idx, col_idx, value))
+                numeric, tokens, chosung_tokens = cell_terms(value)
+
+                prepared.append((cell_info, numeric, tokens, chosung_tokens))
+                if builder is not None:
+                    builder.add_cell(tokens, chosung_tokens, numeric)
+
+            # 유효한 셀이 있는 행만 저장
+            if cells_dict:
+                row_cells.append((actual_row_idx, cells_dict))
+
+        # 2단계 (쓰기 락): 인덱스에 반영 — 검색은 청크 전체가 반영되기 전이나 후만 봄
+        with self._rwlock.write_locked():
+            header_key = (file_path, sheet_name)
+            if header_key not in self.file_headers:
+                self.file_headers[header_key] = headers
+            self._indexed_files.add(file_path)
+            self._bm25_dirty = True
+            self._generation += 1
+
+            for cell_info, numeric, tokens, chosung_tokens in prepared:
                 cell_idx = len(self.cells)
                 self.cells.append(cell_info)
-
-                # 정규화 후 인버티드 인덱스에 추가
-                normalized = value.lower().strip()
-                tokens = self._tokenize(normalized)
+                self.numeric_values.append(numeric)
                 for token in tokens:
                     self.inverted_index[token].add(cell_idx)
-                    self.vocabulary.add(token)
-
-                # 한글이 포함된 경우 초성 인덱스에도 추가
-                if any(is_hangul_syllable(c) for c in value):
-                    chosung_str = extract_chosung(value)
-                    chosung_tokens = self._tokenize(chosung_str.lower())
-                    for ct in chosung_tokens:
-                        self.chosung_index[ct].add(cell_idx)
+                self.vocabulary.update(tokens)
+                for ct in chosung_tokens:
+                    self.chosung_index[ct].add(cell_idx)
 
-            # 행 데이터 저장 (유효한 셀이 있는 경우만)
-            if cells_dict:
-                self.rows[row_key] = RowData(
+            for actual_row_idx, cells_dict in row_cells:
+                self.rows[(file_path, sheet_name, actual_row_idx)] = RowData(
                     file_path=file_path,
                     file_name=file_name,
                     sheet_name=sheet_name,
@@ -163,12 +352,333 @@ class SearchIndex:
                     headers=headers
                 )
 
+        return batch
+
+    def load_segment(self, file_path: str, file_name: str, sheet_name: str,
+                     headers: List[str], cells: List[Tuple[int, int, str]],
+                     segment: IndexSegment):
+        """
+        캐시에 저장된 세그먼트를 토큰화 없이 인덱스에 일괄 적재합니다.
+
+        Args:
+            cells: (row_idx, col_idx, value) 목록. 세그먼트를 만들 때와 같은
+                   행 → 열 오름차순이어야 하며 개수가 segment.cell_count와 같아야 합니다.
+        """
+        # 셀/행 객체는 락 밖에서 만들고 반영만 쓰기 락 안에서 수행
+        prepared = self._prepare_segment(file_path, file_name, sheet_name, headers, cells, segment)
+        with self._rwlock.write_locked():
+            self._apply_segment(prepared)
+
+    def replace_file(self, file_path: str, file_name: str,
+                     sheets: Dict[str, Tuple[List[str], List[Tuple[int, int, str]], IndexSegment]]):
+        """
+        파일의 기존 데이터를 새 시트 데이터로 한 번에 교체합니다 (변경된 파일 재인덱싱용).
+        셀/행 객체는 락 밖에서 만들고 제거와 적재는 하나의 쓰기 락 안에서 수행하므로,
+        검색은 교체 전이나 교체 후의 상태만 봅니다.
+
+        Args:
+            sheets: 시트명 → (헤더, (row_idx, col_idx, value) 목록, 세그먼트)
+        """
+        prepared = [
+            self._prepare_segment(file_path, file_name, sheet_name, headers, cells, segment)
+            for sheet_name, (headers, cells, segment) in sheets.items()
+        ]
+        with self._rwlock.write_locked():
+            self.remove_file(file_path)
+            for item in prepared:
+                self._apply_segment(item)
+
+    def replace_sheets(self, file_path: str, file_name: str,
+                       sheets: Dict[str, Tuple[List[str], List[Tuple[int, int, str]], IndexSegment]],
+                       removed: Iterable[str] = ()):
+        """
+        파일의 일부 시트만 새 데이터로 교체하고 removed 시트는 제거합니다 (시트 단위 재인덱싱용).
+        다른 시트의 데이터는 그대로 두며, replace_file()과 같이 하나의 쓰기 락 안에서 반영합니다.
+
+        Args:
+            sheets: 바뀐 시트명 → (헤더, (row_idx, col_idx, value) 목록, 세그먼트)
+            removed: 파일에서 없어진 시트명
+        """
+        prepared = [
+            self._prepare_segment(file_path, file_name, sheet_name, headers, cells, segment)
+            for sheet_name, (headers, cells, segment) in sheets.items()
+        ]
+        names = set(sheets) | set(removed)
+        with self._rwlock.write_locked():
+            self._purge_cells(lambda c: c.file_path == file_path and c.sheet_name in names)
+            for sheet_name in names:
+                key = (file_path, sheet_name)
+                self._mapped.remove(file_path, sheet_name)
+                self.file_headers.pop(key, None)
+                self.sheet_meta.pop(key, None)
+                self._pending_sheets.discard(key)
+            for k in [k for k in self.rows if k[0] == file_path and k[1] in names]:
+                del self.rows[k]
+
+            for item in prepared:
+                self._apply_segment(item)
+
+            if not any(k[0] == file_path for k in self.rows) and \
+                    not any(k[0] == file_path for k in self._mapped.keys()):
+                self._indexed_files.discard(file_path)
+            self._bm25_dirty = True
+            self._generation += 1
+
+    def _prepare_segment(self, file_path: str, file_name: str, sheet_name: str,
+                         headers: List[str], cells: List[Tuple[int, int, str]],
+                         segment: IndexSegment):
+        """세그먼트 적재에 필요한 셀/행 객체를 만듭니다 (락 밖에서 호출)."""
+        if len(cells) != segment.cell_count:
+            raise ValueError(
+                f"세그먼트 셀 수 불일치: {sheet_name} ({len(cells)} != {segment.cell_count})"
+            )
+
+        n_headers = len(headers)
+        new_cells = []
+        new_rows = []
+        current_row = None
+        cells_dict = None
+        for row_idx, col_idx, value in cells:
+            col_name = headers[col_idx] if col_idx < n_headers else str(col_idx)
+            new_cells.append(CellInfo(
+                file_path=file_path,
+                file_name=file_name,
+                sheet_name=sheet_name,
+                row_idx=row_idx,
+                col_idx=col_idx,
+                col_name=col_name,
+                value=value
+            ))
+            if row_idx != current_row:
+                current_row = row_idx
+                cells_dict = {}
+                new_rows.append(RowData(
+                    file_path=file_path,
+                    file_name=file_name,
+                    sheet_name=sheet_name,
+                    row_idx=row_idx,
+                    cells=cells_dict,
+                    headers=headers
+                ))
+            cells_dict[col_name] = value
+        return file_path, sheet_name, headers, new_cells, new_rows, segment
+
+    def _apply_segment(self, prepared):
+        """_prepare_segment() 결과를 인덱스에 반영합니다 (쓰기 락 안에서 호출)."""
+        file_path, sheet_name, headers, new_cells, new_rows, segment = prepared
+        header_key = (file_path, sheet_name)
+        if header_key not in self.file_headers:
+            self.file_headers[header_key] = headers
+        self._indexed_files.add(file_path)
+        self._bm25_dirty = True
+        self._generation += 1
+
+        base = len(self.cells)
+        self.cells.extend(new_cells)
+        for row in new_rows:
+            self.rows[(file_path, sheet_name, row.row_idx)] = row
+        self.numeric_values.extend(segment.numeric)
+
+        # 로컬 셀 번호를 전역 번호로 옮겨 포스팅 병합
+        for token, local_ids in segment.iter_postings():
+            self.inverted_index[token].update([base + i for i in local_ids])
+        self.vocabulary.update(segment.tokens)
+        for token, local_ids in segment.iter_chosung_postings():
+            self.chosung_index[token].update([base + i for i in local_ids])
+
+    def attach_mapped(self, file_path: str, file_name: str, sheet: MappedSheet):
+        """
+        메모리 맵 시트를 인덱스에 연결합니다. 셀/토큰을 복사하지 않으므로
+        연결 비용은 시트 크기와 무관합니다.
+        """
+        with self._rwlock.write_locked():
+            self._mapped.add(file_path, file_name, sheet)
+            header_key = (file_path, sheet.sheet_name)
+            if header_key not in self.file_headers:
+                self.file_headers[header_key] = sheet.headers
+            self._indexed_files.add(file_path)
+            self._bm25_dirty = True
+            self._generation += 1
+
+    def get_cell(self, cell_idx: int) -> Optional[CellInfo]:
+        """셀 번호로 셀 정보를 반환합니다. 제거된 셀이면 None."""
+        if cell_idx < MAPPED_ID_BASE:
+            return self.cells[cell_idx]
+        found = self._mapped.lookup(cell_idx)
+        if found is None:
+            return None
+        file_path, file_name, sheet, local = found
+        row_idx, col_idx, value = sheet.cell(local)
+        return CellInfo(
+            file_path=file_path,
+            file_name=file_name,
+            sheet_name=sheet.sheet_name,
+            row_idx=row_idx,
+            col_idx=col_idx,
+            col_name=sheet.col_name(col_idx),
+            value=value
+        )
+
+    def get_cells(self, cell_ids: Iterable[int]) -> Iterator[CellInfo]:
+        """셀 번호 목록의 셀 정보를 순회합니다 (제거된 셀은 건너뜀)."""
+        for cell_idx in cell_ids:
+            cell = self.get_cell(cell_idx)
+            if cell is not None:
+                yield cell
+
+    def get_row(self, row_key: Tuple[str, str, int]) -> Optional[RowData]:
+        """행 키로 행 데이터를 반환합니다."""
+        row = self.rows.get(row_key)
+        if row is not None or not len(self._mapped):
+            return row
+        found = self._mapped.get(row_key[0], row_key[1])
+        if found is None:
+            return None
+        file_name, sheet = found
+        cells = sheet.row_cells(row_key[2])
+        if cells is None:
+            return None
+        return RowData(
+            file_path=row_key[0],
+            file_name=file_name,
+            sheet_name=row_key[1],
+            row_idx=row_key[2],
+            cells=cells,
+            headers=sheet.headers
+        )
+
+    def iter_rows(self) -> Iterator[Tuple[Tuple[str, str, int], RowData]]:
+        """메모리 행과 매핑 행을 모두 순회합니다."""
+        yield from list(self.rows.items())
+        for _, file_path, file_name, sheet in self._mapped:
+            for row_idx, cells in sheet.iter_rows():
+                yield (file_path, sheet.sheet_name, row_idx), RowData(
+                    file_path=file_path,
+                    file_name=file_name,
+                    sheet_name=sheet.sheet_name,
+                    row_idx=row_idx,
+                    cells=cells,
+                    headers=sheet.headers
+                )
+
+    def get_vocabulary(self) -> List[str]:
+        """퍼지 매칭 대상 토큰 목록 (매핑 시트 포함)"""
+        with self._rwlock.read_locked():
+            if not len(self._mapped):
+                return list(self.vocabulary)
+            vocab = set(self.vocabulary)
+            for _, _, _, sheet in self._mapped:
+                vocab.update(sheet.vocabulary)
+            return list(vocab)
+
+    def iter_vocabulary(self, chunk_size: int = 50_000) -> Iterator[List[str]]:
+        """
+        퍼지 매칭 대상 토큰을 묶음 단위로 순회합니다.
+        인덱스가 바뀌지 않았으면 이전 검색에서 만든 목록을 그대로 재사용합니다.
+        """
+        with self._rwlock.read_locked():
+            snapshot = self._vocab_snapshot
+            if snapshot is None or snapshot[0] != self._generation:
+                snapshot = (self._generation, self.get_vocabulary())
+                self._vocab_snapshot = snapshot
+        vocab = snapshot[1]
+        for i in range(0, len(vocab), chunk_size):
+            yield vocab[i:i + chunk_size]
+
+    def find_cells_with_token(self, token: str) -> Set[int]:
+        """토큰과 정확히 일치하는 셀 번호를 반환합니다."""
+        with self._rwlock.read_locked():
+            result = set(self.inverted_index.get(token, ()))
+            for base, _, _, sheet in self._mapped:
+                result.update((sheet.find_token(token).astype('int64') + base).tolist())
+        return result
+
+    def find_cells_in_range(self, min_val: float, max_val: float) -> Set[int]:
+        """숫자값이 min_val 이상 max_val 이하인 셀 번호를 반환합니다."""
+        import numpy as np
+
+        def scan(shard) -> np.ndarray:
+            kind, target = shard
+            if kind == 'mapped':
+                base, _, _, sheet = target
+                return sheet.find_in_range(min_val, max_val).astype('int64') + base
+            # 읽기 락 동안에는 배열이 늘어나지 않으므로 복사 없이 버퍼 구간을 직접 비교
+            # (뷰는 이 함수의 지역 변수라 반환 시 해제되어 락 해제 후 워커의 append와 충돌하지 않음,
+            #  NaN은 항상 False)
+            view = np.frombuffer(
+                self.numeric_values, dtype=np.float64,
+                count=len(target), offset=target.start * self.numeric_values.itemsize
+            )
+            return np.flatnonzero((view >= min_val) & (view <= max_val)) + target.start
+
+        with self._rwlock.read_locked():
+            # 메모리 숫자 컬럼 구간과 매핑 시트를 샤드로 나누어 병렬 비교 (numpy 연산은 GIL을 놓음)
+            shards = [('memory', span) for span in
+                      split_ranges(len(self.numeric_values), RANGE_SHARD_CELLS)]
+            shards.extend(('mapped', entry) for entry in self._mapped)
+            parts = map_shards(scan, shards)
+        if not parts:
+            return set()
+        return set(np.concatenate(parts).tolist())
+
     def remove_file(self, file_path: str):
         """파일을 인덱스에서 제거하고 관련 데이터를 정리합니다."""
+        if not self.is_file_known(file_path):
+            return
+
+        with self._rwlock.write_locked():
+            self._purge_cells(lambda c: c.file_path == file_path)
+            self._mapped.remove_file(file_path)
+
+            # 행 데이터 제거
+            row_keys_to_remove = [k for k in self.rows if k[0] == file_path]
+            for k in row_keys_to_remove:
+                del self.rows[k]
+
+            # 헤더 제거
+            header_keys_to_remove = [k for k in self.file_headers if k[0] == file_path]
+            for k in header_keys_to_remove:
+                del self.file_headers[k]
+
+            # 시트 메타데이터 및 대기 목록 제거
+            meta_keys_to_remove = [k for k in self.sheet_meta if k[0] == file_path]
+            for k in meta_keys_to_remove:
+                del self.sheet_meta[k]
+                self._pending_sheets.discard(k)
+
+            self._indexed_files.discard(file_path)
+            self._bm25_dirty = True
+            self._generation += 1
+
+    def remove_sheet(self, file_path: str, sheet_name: str):
+        """
+        시트 하나의 셀/행 데이터를 인덱스에서 제거합니다.
+        메타데이터와 헤더는 유지되므로 같은 시트를 처음부터 다시 인덱싱할 수 있습니다.
+        """
+        with self._rwlock.write_locked():
+            self._purge_cells(
+                lambda c: c.file_path == file_path and c.sheet_name == sheet_name
+            )
+            self._mapped.remove(file_path, sheet_name)
+
+            row_keys_to_remove = [
+                k for k in self.rows if k[0] == file_path and k[1] == sheet_name
+            ]
+            for k in row_keys_to_remove:
+                del self.rows[k]
+
+            if not any(k[0] == file_path for k in self.rows) and \
+                    not any(k[0] == file_path for k in self._mapped.keys()):
+                self._indexed_files.discard(file_path)
+            self._bm25_dirty = True
+            self._generation += 1
+
+    def _purge_cells(self, predicate):
+        """조건에 맞는 셀을 무효화하고 인버티드/초성 인덱스에서 제거합니다 (쓰기 락 안에서 호출)."""
         # 제거할 셀 인덱스 수집
         remove_indices = {
             i for i, c in enumerate(self.cells)
-            if c is not None and c.file_path == file_path
+            if c is not None and predicate(c)
         }
         if not remove_indices:
             return
@@ -195,70 +705,74 @@ class SearchIndex:
         # 셀 데이터 무효화 (인덱스 순서 유지를 위해 None 처리)
         for i in remove_indices:
             self.cells[i] = None
+            self.numeric_values[i] = NAN
 
-        # 행 데이터 제거
-        row_keys_to_remove = [k for k in self.rows if k[0] == file_path]
-        for k in row_keys_to_remove:
-            del self.rows[k]
-
-        # 헤더 제거
-        header_keys_to_remove = [k for k in self.file_headers if k[0] == file_path]
-        for k in header_keys_to_remove:
-            del self.file_headers[k]
-
-        self._indexed_files.discard(file_path)
-        self._bm25_dirty = True
+    @property
+    def bm25_dirty(self) -> bool:
+        """마지막 BM25 구축 이후 셀이 추가/제거되었는지"""
+        return self._bm25_dirty
 
     def build_bm25(self):
-        """BM25 인덱스를 (재)구축합니다. 행 단위로 토큰화하여 관련도 랭킹에 사용."""
-        if BM25Okapi is None:
+        """
+        BM25 인덱스를 (재)구축합니다. 행 단위로 토큰화하여 관련도 랭킹에 사용.
+        인덱싱 워커가 묶음 처리 뒤에 호출하며, 변경이 없으면 아무것도 하지 않습니다.
+        말뭉치만 읽기 락 안에서 모으고 구축은 락 밖에서 하므로, 그동안 검색은 이전 BM25를 사용합니다.
+        """
+        if not self._bm25_dirty:
+            return
+        bm25_class = _bm25_class()
+        if bm25_class is None:
             return
 
         corpus = []
-        self._bm25_row_keys = []
+        row_keys = []
+
+        with self._rwlock.read_locked():
+            for row_key, row_data in self.iter_rows():
+                # 행의 모든 셀 값을 결합하여 하나의 "문서"로 취급
+                row_text = ' '.join(row_data.cells.values()).lower()
+                tokens = row_text.split()
+                corpus.append(tokens)
+                row_keys.append(row_key)
+            # 이후의 쓰기는 다시 dirty로 표시하므로 구축 중 변경이 유실되지 않음
+            self._bm25_dirty = False
 
-        for row_key, row_data in self.rows.items():
-            # 행의 모든 셀 값을 결합하여 하나의 "문서"로 취급
-            row_text = ' '.join(row_data.cells.values()).lower()
-            tokens = row_text.split()
-            corpus.append(tokens)
-            self._bm25_row_keys.append(row_key)
+        bm25 = bm25_class(corpus) if corpus else None
 
-        if corpus:
-            self._bm25 = BM25Okapi(corpus)
-        self._bm25_dirty = False
+        # 검색 스레드가 중간 상태를 보지 않도록 완성된 뒤 교체
+        with self._rwlock.write_locked():
+            self._bm25 = bm25
+            self._bm25_row_keys = row_keys
 
     def get_bm25_scores(self, query: str) -> Dict[Tuple, float]:
-        """BM25 기반 관련도 점수를 반환합니다."""
-        if self._bm25_dirty:
-            self.build_bm25()
+        """
+        BM25 기반 관련도 점수를 반환합니다.
+        검색 경로에서는 재구축하지 않고 마지막으로 구축된 BM25를 사용합니다
+        (이후 추가된 행은 점수가 없고, 제거된 행의 점수는 후보 행이 아니므로 무시됨).
+        """
+        with self._rwlock.read_locked():
+            bm25, row_keys = self._bm25, self._bm25_row_keys
 
-        if self._bm25 is None or not self._bm25_row_keys:
+        if bm25 is None or not row_keys:
             return {}
 
         tokens = query.lower().split()
-        scores = self._bm25.get_scores(tokens)
+        scores = bm25.get_scores(tokens)
 
         result = {}
         for i, score in enumerate(scores):
             if score > 0:
-                result[self._bm25_row_keys[i]] = float(score)
+                result[row_keys[i]] = float(score)
         return result
 
+    @staticmethod
+    def _parse_number(value: str) -> float:
+        """셀 값을 숫자로 변환합니다 (쉼표 허용). 숫자가 아니면 NaN."""
+        return parse_number(value)
+
     def _tokenize(self, text: str) -> Set[str]:
         """텍스트를 검색용 토큰으로 분리합니다."""
-        tokens = set()
-        if not text:
-            return tokens
-        # 전체 텍스트 자체도 토큰으로 추가 (완전 일치용)
-        tokens.add(text)
-        # 구두점/공백 기준 단어 분리
-        words = re.split(r'[\s,;|/\\()\[\]{}<>:\"\']+', text)
-        for w in words:
-            w = w.strip()
-            if w and len(w) > 0:
-                tokens.add(w)
-        return tokens
+        return tokenize_text(text)
 
     def find_cells_containing(self, keyword: str) -> Set[int]:
         """
@@ -270,14 +784,20 @@ class SearchIndex:
             return set()
 
         result = set()
-        # 정확한 토큰 매칭 (O(1))
-        if keyword_lower in self.inverted_index:
-            result.update(self.inverted_index[keyword_lower])
+        # 읽기 락 동안에는 워커가 토큰을 추가하지 않으므로 스냅샷 없이 직접 순회
+        with self._rwlock.read_locked():
+            # 정확한 토큰 매칭 (O(1))
+            if keyword_lower in self.inverted_index:
+                result.update(self.inverted_index[keyword_lower])
+
+            # 부분 문자열 매칭 (토큰 순회)
+            for token, cell_indices in self.inverted_index.items():
+                if token != keyword_lower and keyword_lower in token:
+                    result.update(cell_indices)
 
-        # 부분 문자열 매칭 (토큰 순회)
-        for token, cell_indices in self.inverted_index.items():
-            if token != keyword_lower and keyword_lower in token:
-                result.update(cell_indices)
+            # 매핑 시트는 토큰 블롭에서 직접 탐색
+            for base, _, _, sheet in self._mapped:
+                result.update((sheet.find_containing(keyword_lower).astype('int64') + base).tolist())
 
         return result
 
@@ -288,14 +808,17 @@ class SearchIndex:
             return set()
 
         result = set()
-        for token, cell_indices in self.chosung_index.items():
-            if query_lower in token:
-                result.update(cell_indices)
+        with self._rwlock.read_locked():
+            for token, cell_indices in self.chosung_index.items():
+                if query_lower in token:
+                    result.update(cell_indices)
+            for base, _, _, sheet in self._mapped:
+                result.update((sheet.find_chosung(query_lower).astype('int64') + base).tolist())
         return result
 
     def cell_to_row_key(self, cell_idx: int) -> Optional[Tuple[str, str, int]]:
         """셀 인덱스로부터 행 키를 추출합니다."""
-        cell = self.cells[cell_idx]
+        cell = self.get_cell(cell_idx)
         if cell is None:
             return None
         return (cell.file_path, cell.sheet_name, cell.row_idx)
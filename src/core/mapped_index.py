@@ -0,0 +1,381 @@
+"""
+[v2.1.0] 메모리 맵 인덱스 파일
+시트 하나의 인덱스(문자열 테이블, 포스팅 배열, 행 테이블, 숫자 컬럼)를 고정 레이아웃의
+바이너리 파일로 저장하고, mmap + NumPy 뷰로 복사 없이 바로 검색합니다.
+
+파일을 여는 비용은 시트 크기와 무관하며, 실제로 접근한 페이지만 OS가 읽어 들입니다.
+읽기 전용으로 매핑하므로 여러 앱 인스턴스가 OS 페이지 캐시를 공유합니다.
+NumPy는 창 표시 전 import 비용을 줄이기 위해 파일을 쓰거나 열 때 불러옵니다.
+
+레이아웃 (모든 정수/실수는 리틀 엔디언, 각 섹션은 8바이트 정렬):
+    헤더: 매직, 포맷, 섹션 수, (오프셋, 길이) × 섹션 수
+    섹션: _SECTIONS 순서
+"""
+
+import bisect
+import json
+import mmap
+import os
+import struct
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple
+
+from src.core.segment import IndexSegment
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# 파일 포맷 식별자 및 버전
+MAPPED_MAGIC = b'DMAP'
+MAPPED_FORMAT = 1
+
+# 섹션 이름과 NumPy dtype (None = 바이트열)
+_SECTIONS = (
+    ('meta', None),             # JSON: sheet_name, headers
+    ('token_blob', None),       # 정렬된 토큰을 '\0'으로 이어 붙인 UTF-8
+    ('token_starts', '<u4'),    # 토큰별 시작 바이트 위치 (토큰 수 + 1)
+    ('token_offsets', '<u4'),   # CSR 오프셋 (토큰 수 + 1)
+    ('token_postings', '<u4'),  # 로컬 셀 번호
+    ('chosung_blob', None),
+    ('chosung_starts', '<u4'),
+    ('chosung_offsets', '<u4'),
+    ('chosung_postings', '<u4'),
+    ('cell_rows', '<u4'),       # 셀별 행 번호
+    ('cell_cols', '<u4'),       # 셀별 열 번호
+    ('value_offsets', '<u8'),   # 셀 값 시작 바이트 위치 (셀 수 + 1)
+    ('value_blob', None),       # 셀 값 UTF-8
+    ('numeric', '<f8'),         # 셀별 숫자값 (숫자가 아니면 NaN)
+    ('row_ids', '<u4'),         # 고유 행 번호 (오름차순)
+    ('row_starts', '<u4'),      # 행별 첫 셀 번호 (행 수 + 1)
+)
+
+_HEADER = struct.Struct('<4sII')
+_ENTRY = struct.Struct('<QQ')
+
+
+def _string_table(strings: List[str]) -> Tuple[bytes, 'np.ndarray']:
+    """문자열 목록을 '\\0' 구분 블롭과 시작 위치 배열로 변환합니다."""
+    import numpy as np
+
+    starts = np.zeros(len(strings) + 1, dtype='<u4')
+    parts = []
+    pos = 0
+    for i, s in enumerate(strings):
+        encoded = s.encode('utf-8')
+        starts[i] = pos
+        parts.append(encoded)
+        pos += len(encoded) + 1
+    starts[len(strings)] = pos
+    blob = b'\0'.join(parts) + b'\0' if parts else b''
+    return blob, starts
+
+
+def write_mapped_sheet(path: str, sheet_name: str, headers: List[str],
+                       cells: List[Tuple[int, int, str]], segment: IndexSegment):
+    """
+    시트 인덱스를 메모리 맵 파일로 저장합니다.
+    다른 프로세스가 읽는 중일 수 있으므로 임시 파일에 쓴 뒤 교체합니다.
+
+    Args:
+        cells: (row_idx, col_idx, value) 목록 — 세그먼트의 로컬 셀 번호 순서 (행 → 열)
+    """
+    import numpy as np
+
+    if len(cells) != segment.cell_count:
+        raise ValueError(
+            f"세그먼트 셀 수 불일치: {sheet_name} ({len(cells)} != {segment.cell_count})"
+        )
+
+    n = len(cells)
+    cell_rows = np.fromiter((c[0] for c in cells), dtype='<u4', count=n)
+    cell_cols = np.fromiter((c[1] for c in cells), dtype='<u4', count=n)
+    encoded = [c[2].encode('utf-8') for c in cells]
+    value_offsets = np.zeros(n + 1, dtype='<u8')
+    if n:
+        np.cumsum([len(e) for e in encoded], out=value_offsets[1:])
+
+    # 행 테이블: 셀이 행 순서로 정렬되어 있으므로 행마다 연속 구간
+    row_ids, row_first = np.unique(cell_rows, return_index=True)
+    row_starts = np.append(row_first, n).astype('<u4')
+
+    token_blob, token_starts = _string_table(segment.tokens)
+    chosung_blob, chosung_starts = _string_table(segment.chosung_tokens)
+
+    sections = {
+        'meta': json.dumps(
+            {'sheet_name': sheet_name, 'headers': headers}, ensure_ascii=False
+        ).encode('utf-8'),
+        'token_blob': token_blob,
+        'token_starts': token_starts,
+        'token_offsets': np.asarray(segment.token_offsets, dtype='<u4'),
+        'token_postings': np.asarray(segment.token_postings, dtype='<u4'),
+        'chosung_blob': chosung_blob,
+        'chosung_starts': chosung_starts,
+        'chosung_offsets': np.asarray(segment.chosung_offsets, dtype='<u4'),
+        'chosung_postings': np.asarray(segment.chosung_postings, dtype='<u4'),
+        'cell_rows': cell_rows,
+        'cell_cols': cell_cols,
+        'value_offsets': value_offsets,
+        'value_blob': b''.join(encoded),
+        'numeric': np.asarray(segment.numeric, dtype='<f8'),
+        'row_ids': row_ids.astype('<u4'),
+        'row_starts': row_starts,
+    }
+
+    table_size = _HEADER.size + _ENTRY.size * len(_SECTIONS)
+    pos = (table_size + 7) & ~7
+    entries = []
+    payloads = []
+    for name, _ in _SECTIONS:
+        data = sections[name]
+        data = data.tobytes() if isinstance(data, np.ndarray) else data
+        entries.append((pos, len(data)))
+        payloads.append((pos, data))
+        pos = (pos + len(data) + 7) & ~7
+
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAPPED_MAGIC, MAPPED_FORMAT, len(_SECTIONS)))
+        for entry in entries:
+            f.write(_ENTRY.pack(*entry))
+        for offset, data in payloads:
+            f.seek(offset)
+            f.write(data)
+        f.truncate(max(pos, table_size))
+    os.replace(tmp_path, path)
+
+
+class MappedSheet:
+    """
+    메모리 맵으로 연 시트 인덱스.
+    포스팅/행 테이블/숫자 컬럼은 mmap 위의 NumPy 뷰이며, 셀 값은 요청 시에만 디코딩합니다.
+    셀 번호는 시트 내 로컬 번호(0부터)입니다.
+    """
+
+    def __init__(self, path: str):
+        import numpy as np
+
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, fmt, count = _HEADER.unpack_from(self._mm)
+            if magic != MAPPED_MAGIC or fmt != MAPPED_FORMAT or count != len(_SECTIONS):
+                raise ValueError(f"지원하지 않는 인덱스 파일 포맷: {path}")
+
+            self._ranges: Dict[str, Tuple[int, int]] = {}
+            for i, (name, dtype) in enumerate(_SECTIONS):
+                offset, length = _ENTRY.unpack_from(self._mm, _HEADER.size + i * _ENTRY.size)
+                if offset + length > len(self._mm):
+                    raise ValueError(f"손상된 인덱스 파일: {path}")
+                self._ranges[name] = (offset, offset + length)
+                if dtype is not None:
+                    view = np.frombuffer(
+                        self._mm, dtype=dtype,
+                        count=length // np.dtype(dtype).itemsize, offset=offset
+                    )
+                    setattr(self, name, view)
+
+            meta = json.loads(self._section_bytes('meta').decode('utf-8'))
+        except Exception:
+            self._mm.close()
+            raise
+
+        self.sheet_name: str = meta['sheet_name']
+        self.headers: List[str] = meta['headers']
+        self._vocabulary: Optional[List[str]] = None
+
+    @property
+    def cell_count(self) -> int:
+        return len(self.numeric)
+
+    @property
+    def row_count(self) -> int:
+        return len(self.row_ids)
+
+    def close(self):
+        """매핑을 해제합니다. 이후 NumPy 뷰를 사용하면 안 됩니다."""
+        for name, dtype in _SECTIONS:
+            if dtype is not None and hasattr(self, name):
+                delattr(self, name)
+        try:
+            self._mm.close()
+        except BufferError:
+            # 외부에 남은 뷰가 있으면 GC 시점에 해제됨
+            pass
+
+    def _section_bytes(self, name: str) -> bytes:
+        start, end = self._ranges[name]
+        return self._mm[start:end]
+
+    # --- 셀 / 행 접근 ---
+
+    def cell_value(self, local_idx: int) -> str:
+        start, _ = self._ranges['value_blob']
+        lo = int(self.value_offsets[local_idx])
+        hi = int(self.value_offsets[local_idx + 1])
+        return self._mm[start + lo:start + hi].decode('utf-8')
+
+    def cell(self, local_idx: int) -> Tuple[int, int, str]:
+        """(row_idx, col_idx, value)를 반환합니다."""
+        return (int(self.cell_rows[local_idx]), int(self.cell_cols[local_idx]),
+                self.cell_value(local_idx))
+
+    def col_name(self, col_idx: int) -> str:
+        return self.headers[col_idx] if col_idx < len(self.headers) else str(col_idx)
+
+    def row_cells(self, row_idx: int) -> Optional[Dict[str, str]]:
+        """행의 {컬럼명: 값}을 반환합니다. 셀이 없는 행이면 None."""
+        import numpy as np
+
+        pos = int(np.searchsorted(self.row_ids, row_idx))
+        if pos >= len(self.row_ids) or int(self.row_ids[pos]) != row_idx:
+            return None
+        return self._row_at(pos)
+
+    def _row_at(self, pos: int) -> Dict[str, str]:
+        cells = {}
+        for i in range(int(self.row_starts[pos]), int(self.row_starts[pos + 1])):
+            cells[self.col_name(int(self.cell_cols[i]))] = self.cell_value(i)
+        return cells
+
+    def iter_rows(self) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """(row_idx, {컬럼명: 값})을 행 순서대로 순회합니다."""
+        for pos in range(len(self.row_ids)):
+            yield int(self.row_ids[pos]), self._row_at(pos)
+
+    # --- 검색 ---
+
+    def _find_in_table(self, keyword: str, blob: str, starts: 'np.ndarray',
+                       offsets: 'np.ndarray', postings: 'np.ndarray') -> 'np.ndarray':
+        """문자열 테이블에서 keyword를 포함하는 토큰들의 로컬 셀 번호를 반환합니다."""
+        import numpy as np
+
+        needle = keyword.encode('utf-8')
+        base, end = self._ranges[blob]
+        token_ids = []
+        pos = self._mm.find(needle, base, end)
+        while pos != -1:
+            # '\0' 구분자 덕분에 한 토큰 안에서만 일치하므로 위치로 토큰 번호를 역산
+            tid = int(np.searchsorted(starts, pos - base, side='right')) - 1
+            token_ids.append(tid)
+            pos = self._mm.find(needle, base + int(starts[tid + 1]), end)
+
+        if not token_ids:
+            return np.empty(0, dtype='<u4')
+        return np.unique(np.concatenate([
+            postings[offsets[t]:offsets[t + 1]] for t in token_ids
+        ]))
+
+    def find_containing(self, keyword: str) -> 'np.ndarray':
+        """keyword를 포함하는 토큰이 있는 셀의 로컬 번호 (SearchIndex.find_cells_containing과 동일 규칙)"""
+        return self._find_in_table(
+            keyword, 'token_blob', self.token_starts,
+            self.token_offsets, self.token_postings
+        )
+
+    def find_chosung(self, keyword: str) -> 'np.ndarray':
+        return self._find_in_table(
+            keyword, 'chosung_blob', self.chosung_starts,
+            self.chosung_offsets, self.chosung_postings
+        )
+
+    def find_token(self, token: str) -> 'np.ndarray':
+        """토큰과 정확히 일치하는 셀의 로컬 번호 (토큰은 UTF-8 바이트 순으로 정렬됨)"""
+        import numpy as np
+
+        needle = token.encode('utf-8')
+        base, _ = self._ranges['token_blob']
+        starts = self.token_starts
+        lo, hi = 0, len(starts) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = self._mm[base + int(starts[mid]):base + int(starts[mid + 1]) - 1]
+            if current < needle:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(starts) - 1:
+            current = self._mm[base + int(starts[lo]):base + int(starts[lo + 1]) - 1]
+            if current == needle:
+                return self.token_postings[self.token_offsets[lo]:self.token_offsets[lo + 1]]
+        return np.empty(0, dtype='<u4')
+
+    def find_in_range(self, min_val: float, max_val: float) -> 'np.ndarray':
+        import numpy as np
+
+        return np.flatnonzero((self.numeric >= min_val) & (self.numeric <= max_val))
+
+    @property
+    def vocabulary(self) -> List[str]:
+        """퍼지 매칭용 토큰 목록 (처음 요청 시 한 번만 디코딩)"""
+        if self._vocabulary is None:
+            blob = self._section_bytes('token_blob').decode('utf-8')
+            self._vocabulary = blob.split('\0')[:-1] if blob else []
+        return self._vocabulary
+
+
+class MappedSheetTable:
+    """
+    SearchIndex에 연결된 매핑 시트들의 전역 셀 번호 관리.
+    전역 번호 = 시트 기준 번호 + 로컬 번호이며, 기준 번호는 재사용하지 않습니다.
+    """
+
+    def __init__(self, id_base: int):
+        self._next = id_base
+        self._bases: List[int] = []
+        self._entries: List[Optional[Tuple[str, str, MappedSheet]]] = []
+        self._by_key: Dict[Tuple[str, str], int] = {}
+
+    def add(self, file_path: str, file_name: str, sheet: MappedSheet) -> int:
+        """시트를 추가하고 기준 번호를 반환합니다."""
+        key = (file_path, sheet.sheet_name)
+        if key in self._by_key:
+            self.remove(*key)
+        base = self._next
+        self._next += max(sheet.cell_count, 1)
+        self._by_key[key] = len(self._entries)
+        self._bases.append(base)
+        self._entries.append((file_path, file_name, sheet))
+        return base
+
+    def remove(self, file_path: str, sheet_name: str):
+        pos = self._by_key.pop((file_path, sheet_name), None)
+        if pos is not None:
+            self._entries[pos][2].close()
+            self._entries[pos] = None
+
+    def remove_file(self, file_path: str):
+        for key in [k for k in self._by_key if k[0] == file_path]:
+            self.remove(*key)
+
+    def lookup(self, cell_idx: int) -> Optional[Tuple[str, str, MappedSheet, int]]:
+        """전역 셀 번호 → (file_path, file_name, 시트, 로컬 번호)"""
+        pos = bisect.bisect_right(self._bases, cell_idx) - 1
+        if pos < 0 or self._entries[pos] is None:
+            return None
+        file_path, file_name, sheet = self._entries[pos]
+        local = cell_idx - self._bases[pos]
+        if local >= sheet.cell_count:
+            return None
+        return file_path, file_name, sheet, local
+
+    def get(self, file_path: str, sheet_name: str) -> Optional[Tuple[str, MappedSheet]]:
+        """(file_name, 시트)를 반환합니다."""
+        pos = self._by_key.get((file_path, sheet_name))
+        if pos is None:
+            return None
+        _, file_name, sheet = self._entries[pos]
+        return file_name, sheet
+
+    def __iter__(self) -> Iterator[Tuple[int, str, str, MappedSheet]]:
+        """(기준 번호, file_path, file_name, 시트)를 순회합니다."""
+        for base, entry in zip(self._bases, self._entries):
+            if entry is not None:
+                yield (base,) + entry
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def keys(self) -> Set[Tuple[str, str]]:
+        return set(self._by_key)
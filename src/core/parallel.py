@@ -0,0 +1,80 @@
+"""
+[v2.1.0] 샤드 병렬 실행
+검색 데이터를 샤드(어휘 묶음, 숫자 컬럼 구간, 메모리 맵 시트)로 나누어 공용 스레드 풀에서 동시에
+처리하고, 샤드별 상위 결과를 top-K로 병합합니다.
+
+인덱스가 한 프로세스의 메모리에 있으므로 프로세스 풀 대신 스레드 풀을 사용합니다.
+샤드 작업은 GIL을 놓는 네이티브 커널(rapidfuzz cdist, numpy 비교 연산)로만 구성되어
+스레드끼리 실제로 여러 코어에서 병렬 실행됩니다.
+"""
+
+import heapq
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Callable, Iterable, List, Optional, Sequence, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# 기본 병렬도 (코어 수, 최대 8)
+DEFAULT_WORKERS = max(1, min(8, os.cpu_count() or 1))
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """앱 전체에서 공유하는 샤드 스레드 풀 (처음 사용할 때 생성)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=DEFAULT_WORKERS, thread_name_prefix="shard"
+            )
+        return _pool
+
+
+def map_shards(fn: Callable[[T], R], shards: Iterable[T],
+               workers: int = DEFAULT_WORKERS) -> List[R]:
+    """
+    샤드마다 fn을 실행해 결과 목록을 샤드 순서대로 반환합니다.
+    샤드가 하나뿐이거나 workers <= 1이면 호출 스레드에서 바로 실행합니다.
+    동시에 제출하는 샤드는 workers개로 제한하므로, 샤드를 생성기로 넘기면
+    메모리에 올라가는 샤드도 workers개를 넘지 않습니다.
+    """
+    if workers <= 1:
+        return [fn(shard) for shard in shards]
+
+    it = iter(shards)
+    first = next(it, None)
+    if first is None:
+        return []
+    second = next(it, None)
+    if second is None:
+        return [fn(first)]
+
+    pool = _get_pool()
+    results: List[R] = []
+    window = []
+    for shard in chain((first, second), it):
+        window.append(pool.submit(fn, shard))
+        if len(window) >= workers:
+            results.append(window.pop(0).result())
+    results.extend(f.result() for f in window)
+    return results
+
+
+def split_ranges(total: int, shard_size: int) -> List[range]:
+    """0..total 구간을 shard_size 크기의 구간들로 나눕니다."""
+    return [range(start, min(start + shard_size, total))
+            for start in range(0, total, max(shard_size, 1))]
+
+
+def top_k(partials: Iterable[Sequence[T]], k: int, key: Callable[[T], float]) -> List[T]:
+    """
+    샤드별 부분 결과를 합쳐 key 기준 상위 k개를 반환합니다.
+    같은 점수는 샤드 순서 → 샤드 내 순서를 유지합니다 (sorted(..., reverse=True)[:k]와 동일).
+    """
+    return heapq.nlargest(k, chain.from_iterable(partials), key=key)
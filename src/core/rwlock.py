@@ -0,0 +1,91 @@
+"""
+[v2.1.0] 읽기-쓰기 락
+여러 검색 스레드가 인덱스를 동시에 읽고, 인덱싱 워커는 짧은 쓰기 구간에서만 독점하도록 합니다.
+
+- 읽기 락은 같은 스레드에서 중첩해 잡을 수 있습니다 (검색 중 접근자 호출).
+- 쓰기 대기자가 있으면 새 읽기 요청은 대기합니다 (연속 검색으로 인덱싱이 멈추지 않도록).
+- 쓰기 락을 잡은 스레드는 읽기 락도 바로 잡을 수 있습니다.
+"""
+
+import threading
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    """쓰기 우선 읽기-쓰기 락 (읽기 재진입 가능)"""
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None        # 쓰기 락을 잡은 스레드 ID
+        self._write_depth = 0
+        self._writers_waiting = 0
+        self._local = threading.local()
+
+    def _read_depth(self) -> int:
+        return getattr(self._local, 'depth', 0)
+
+    def acquire_read(self):
+        """읽기 락 획득"""
+        depth = self._read_depth()
+        me = threading.get_ident()
+        if depth == 0 and self._writer != me:
+            with self._cond:
+                while self._writer is not None or self._writers_waiting:
+                    self._cond.wait()
+                self._readers += 1
+        self._local.depth = depth + 1
+
+    def release_read(self):
+        """읽기 락 해제"""
+        depth = self._read_depth() - 1
+        self._local.depth = depth
+        if depth == 0 and self._writer != threading.get_ident():
+            with self._cond:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._cond.notify_all()
+
+    def acquire_write(self):
+        """쓰기 락 획득 (읽기 락을 잡은 스레드에서 호출하면 교착되므로 금지)"""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            if self._read_depth():
+                raise RuntimeError("읽기 락을 잡은 상태에서 쓰기 락으로 올릴 수 없습니다")
+            self._writers_waiting += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self):
+        """쓰기 락 해제"""
+        with self._cond:
+            self._write_depth -= 1
+            if self._write_depth == 0:
+                self._writer = None
+                self._cond.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        """with 문용 읽기 락"""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        """with 문용 쓰기 락"""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
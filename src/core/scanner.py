@@ -1,10 +1,11 @@
 import os
-import pandas as pd
 from pathlib import Path
 from typing import List, Generator, Dict, Any
-from openpyxl import load_workbook
 from src.utils.logger import logger
 
+# [v2.1.0] pandas/openpyxl은 파일을 처음 읽을 때 import합니다 (파일 트리가 이 모듈을 쓰므로
+# 창을 띄우는 시점의 import 시간에서 제외)
+
 class FileScanner:
     """
     [KR] 파일 시스템 스캐너 및 데이터 로더 클래스.
@@ -56,6 +57,9 @@ class FileScanner:
             Dict[str, Any]: {'sheet_name': str, 'data': pd.DataFrame} 형태의 딕셔너리
             에러 발생 시 예외가 전파됩니다.
         """
+        import pandas as pd
+        from openpyxl import load_workbook
+
         file_path_obj = Path(file_path)
         ext = file_path_obj.suffix.lower()
 
@@ -82,27 +86,7 @@ class FileScanner:
                 try:
                     wb = load_workbook(file_path, read_only=True, data_only=True)
                     for sheet_name in wb.sheetnames:
-                        ws = wb[sheet_name]
-                        rows_iter = ws.iter_rows(values_only=True)
-
-                        # 헤더 읽기
-                        try:
-                            header = next(rows_iter)
-                        except StopIteration:
-                            continue # 빈 시트 스킵
-
-                        buffer = []
-                        for row in rows_iter:
-                            buffer.append(row)
-                            if len(buffer) >= chunksize:
-                                df_chunk = pd.DataFrame(buffer, columns=header)
-                                yield {'sheet_name': sheet_name, 'data': df_chunk}
-                                buffer = []
-
-                        # 남은 데이터 처리
-                        if buffer:
-                            df_chunk = pd.DataFrame(buffer, columns=header)
-                            yield {'sheet_name': sheet_name, 'data': df_chunk}
+                        yield from self._iter_xlsx_sheet(wb, sheet_name, chunksize)
                 finally:
                     # [KR] 제너레이터 중단 시에도 파일 리소스 해제 보장
                     if wb:
@@ -125,3 +109,167 @@ class FileScanner:
             # [KR] 읽기 실패 시 로깅 후 예외 전파
             logger.error(f"Failed to read file {file_path}: {e}")
             raise RuntimeError(f"Failed to read file {file_path}: {e}")
+
+    def read_workbook_meta(self, file_path: str) -> List[Dict[str, Any]]:
+        """
+        [KR] 워크북의 메타데이터(시트명, 크기, 헤더 행)만 읽어옵니다.
+        지연 인덱싱 모드에서 셀 데이터를 읽기 전에 시트 구조를 먼저 파악하는 데 사용합니다.
+
+        Args:
+            file_path (str): 읽을 파일의 경로
+
+        Returns:
+            List[Dict[str, Any]]: {'sheet_name': str, 'rows': int, 'cols': int, 'headers': List[str]} 리스트
+            rows는 헤더를 제외한 데이터 행 수이며, 알 수 없으면 -1입니다.
+        """
+        import pandas as pd
+        from openpyxl import load_workbook
+
+        file_path_obj = Path(file_path)
+        ext = file_path_obj.suffix.lower()
+
+        if not file_path_obj.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        sheets = []
+        try:
+            if ext == '.csv':
+                # [KR] CSV는 헤더만 읽음 (행 수는 전체를 읽어야 하므로 미확정)
+                df_head = pd.read_csv(
+                    file_path, nrows=0, encoding='utf-8-sig', on_bad_lines='skip'
+                )
+                headers = [str(c) for c in df_head.columns]
+                sheets.append({
+                    'sheet_name': file_path_obj.name,
+                    'rows': -1,
+                    'cols': len(headers),
+                    'headers': headers
+                })
+
+            elif ext == '.xlsx':
+                # [KR] read_only 모드에서는 dimension 태그와 첫 행만 읽으므로 빠름
+                wb = load_workbook(file_path, read_only=True, data_only=True)
+                try:
+                    for sheet_name in wb.sheetnames:
+                        ws = wb[sheet_name]
+                        try:
+                            header = next(ws.iter_rows(max_row=1, values_only=True))
+                        except StopIteration:
+                            continue  # 빈 시트 스킵
+                        max_row = ws.max_row
+                        sheets.append({
+                            'sheet_name': sheet_name,
+                            'rows': max_row - 1 if max_row else -1,
+                            'cols': len(header),
+                            'headers': [str(h) for h in header]
+                        })
+                finally:
+                    wb.close()
+
+            elif ext == '.xls':
+                xls = pd.ExcelFile(file_path)
+                try:
+                    for sheet_name in xls.sheet_names:
+                        df_head = pd.read_excel(xls, sheet_name=sheet_name, nrows=0)
+                        headers = [str(c) for c in df_head.columns]
+                        sheets.append({
+                            'sheet_name': sheet_name,
+                            'rows': -1,
+                            'cols': len(headers),
+                            'headers': headers
+                        })
+                finally:
+                    xls.close()
+
+        except Exception as e:
+            logger.error(f"Failed to read metadata {file_path}: {e}")
+            raise RuntimeError(f"Failed to read metadata {file_path}: {e}")
+
+        return sheets
+
+    def open_workbook(self, file_path: str):
+        """
+        [KR] .xlsx 워크북 핸들을 엽니다. 같은 파일의 여러 시트를 연속으로 읽을 때
+        공유 문자열 테이블을 매번 다시 파싱하지 않도록 read_sheet_chunks에 전달합니다.
+        .xlsx가 아니면 None을 반환합니다. 사용 후 호출자가 close()해야 합니다.
+        """
+        if Path(file_path).suffix.lower() != '.xlsx':
+            return None
+        from openpyxl import load_workbook
+        return load_workbook(file_path, read_only=True, data_only=True)
+
+    def read_sheet_chunks(self, file_path: str, sheet_name: str, chunksize: int = 10000,
+                          workbook=None) -> Generator[Dict[str, Any], None, None]:
+        """
+        [KR] 지정된 시트 하나만 chunksize 단위로 읽어오는 제너레이터입니다.
+        지연 인덱싱 모드에서 우선순위가 높은 시트부터 개별적으로 읽을 때 사용합니다.
+
+        Args:
+            file_path (str): 읽을 파일의 경로
+            sheet_name (str): 읽을 시트명 (CSV는 파일명)
+            chunksize (int): 한 번에 읽을 행(Row)의 수
+            workbook: open_workbook()으로 미리 연 .xlsx 워크북 (선택)
+
+        Yields:
+            Dict[str, Any]: {'sheet_name': str, 'data': pd.DataFrame} 형태의 딕셔너리
+        """
+        import pandas as pd
+        from openpyxl import load_workbook
+
+        file_path_obj = Path(file_path)
+        ext = file_path_obj.suffix.lower()
+
+        if not file_path_obj.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        try:
+            if ext == '.csv':
+                # [KR] CSV는 시트가 하나뿐이므로 파일 전체를 읽음
+                yield from self.read_file_chunks(file_path, chunksize)
+
+            elif ext == '.xlsx':
+                wb = workbook
+                try:
+                    if wb is None:
+                        wb = load_workbook(file_path, read_only=True, data_only=True)
+                    yield from self._iter_xlsx_sheet(wb, sheet_name, chunksize)
+                finally:
+                    # [KR] 직접 연 워크북만 닫음 (전달받은 핸들은 호출자가 관리)
+                    if wb is not None and workbook is None:
+                        wb.close()
+
+            elif ext == '.xls':
+                df = pd.read_excel(file_path, sheet_name=sheet_name)
+                for i in range(0, len(df), chunksize):
+                    yield {'sheet_name': sheet_name, 'data': df.iloc[i:i+chunksize]}
+
+        except Exception as e:
+            logger.error(f"Failed to read sheet {file_path}::{sheet_name}: {e}")
+            raise RuntimeError(f"Failed to read sheet {file_path}::{sheet_name}: {e}")
+
+    @staticmethod
+    def _iter_xlsx_sheet(wb, sheet_name: str, chunksize: int) -> Generator[Dict[str, Any], None, None]:
+        """[KR] 열린 워크북에서 시트 하나를 청크 단위로 읽습니다. 빈 시트는 건너뜁니다."""
+        import pandas as pd
+
+        ws = wb[sheet_name]
+        rows_iter = ws.iter_rows(values_only=True)
+
+        # 헤더 읽기
+        try:
+            header = next(rows_iter)
+        except StopIteration:
+            return  # 빈 시트 스킵
+
+        buffer = []
+        for row in rows_iter:
+            buffer.append(row)
+            if len(buffer) >= chunksize:
+                df_chunk = pd.DataFrame(buffer, columns=header)
+                yield {'sheet_name': sheet_name, 'data': df_chunk}
+                buffer = []
+
+        # 남은 데이터 처리
+        if buffer:
+            df_chunk = pd.DataFrame(buffer, columns=header)
+            yield {'sheet_name': sheet_name, 'data': df_chunk}
@@ -0,0 +1,74 @@
+"""
+[v2.1.0] 검색 백엔드 인터페이스
+MultiLayerSearcher와 UI가 사용하는 인덱스 접근자 집합입니다.
+메모리 인덱스(SearchIndex)와 SQLite FTS5 인덱스(FtsSearchBackend)가 같은 인터페이스를 제공하므로
+검색 계층은 어느 백엔드인지 구분하지 않습니다.
+
+셀 번호는 백엔드 내부에서만 의미가 있는 정수이며, get_cells()로 CellInfo를 얻어 사용합니다.
+"""
+
+from typing import ContextManager, Dict, Iterable, Iterator, List, Optional, Protocol, Set, Tuple
+
+from src.core.indexer import CellInfo, RowData
+
+# 검색 백엔드 종류 (설정값)
+BACKEND_MEMORY = 'memory'
+BACKEND_FTS = 'fts'
+
+
+class SearchBackend(Protocol):
+    """검색 백엔드 인터페이스"""
+
+    file_headers: Dict[Tuple[str, str], List[str]]
+
+    @property
+    def generation(self) -> int:
+        """검색 결과가 달라질 수 있는 변경(파일 추가/제거)마다 증가하는 세대 번호"""
+        ...
+
+    @property
+    def total_cells(self) -> int: ...
+
+    @property
+    def total_rows(self) -> int: ...
+
+    @property
+    def total_files(self) -> int: ...
+
+    @property
+    def indexed_files(self) -> Set[str]: ...
+
+    @property
+    def is_partial(self) -> bool: ...
+
+    def is_file_known(self, file_path: str) -> bool: ...
+
+    def read_lock(self) -> ContextManager:
+        """검색 한 번 동안 인덱스를 일관된 상태로 유지하는 구간 (with 문)."""
+        ...
+
+    def get_cells(self, cell_ids: Iterable[int]) -> Iterator[CellInfo]:
+        """셀 번호 목록의 셀 정보를 순회합니다 (제거된 셀은 건너뜀)."""
+        ...
+
+    def get_row(self, row_key: Tuple[str, str, int]) -> Optional[RowData]: ...
+
+    def iter_vocabulary(self, chunk_size: int = 50_000) -> Iterator[List[str]]:
+        """퍼지 매칭 대상 토큰을 묶음 단위로 순회합니다."""
+        ...
+
+    def find_cells_containing(self, keyword: str) -> Set[int]: ...
+
+    def find_cells_by_chosung(self, chosung_query: str) -> Set[int]: ...
+
+    def find_cells_with_token(self, token: str) -> Set[int]: ...
+
+    def find_cells_in_range(self, min_val: float, max_val: float) -> Set[int]: ...
+
+    def get_bm25_scores(self, query: str) -> Dict[Tuple, float]: ...
+
+    def build_bm25(self): ...
+
+    def remove_file(self, file_path: str): ...
+
+    def clear(self): ...
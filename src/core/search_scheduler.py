@@ -0,0 +1,126 @@
+"""
+[v2.1.0] 적응형 검색 스케줄러
+최근 검색 소요 시간과 인덱스 크기로 타이핑 디바운스를 정하고, 검색이 진행 중일 때 들어온
+중간 검색어는 건너뛴 뒤 마지막 검색어만 이어서 실행하도록 요청 흐름을 관리합니다.
+
+- 작은 데이터: 검색이 몇 ms면 디바운스도 최소값으로 줄여 입력 즉시 결과를 보여 줍니다.
+- 큰 데이터: 검색 시간에 비례해 디바운스를 늘리고, 검색 중에는 새 검색을 보내지 않으므로
+  검색 요청이 쌓이지 않습니다.
+
+Qt에 의존하지 않으며 타이머는 호출 측(SearchBar)이 가집니다.
+"""
+
+import statistics
+import time
+from collections import deque
+from typing import Callable, Deque, Optional, Tuple
+
+
+class SearchScheduler:
+    """
+    [v2.1.0] 검색 요청 스케줄러.
+    request()로 검색어를 넘기면 바로 보낼 검색어를 반환하거나(None이면 보류),
+    finished()로 검색 완료를 알리면 보류 중이던 마지막 검색어를 반환합니다.
+    """
+
+    # 디바운스 범위 (ms)
+    MIN_DEBOUNCE_MS = 40
+    MAX_DEBOUNCE_MS = 800
+    # 측정값이 없을 때의 디바운스 (ms)
+    DEFAULT_DEBOUNCE_MS = 300
+    # 측정값이 없어도 최소 디바운스를 쓰는 인덱스 크기 (행)
+    SMALL_INDEX_ROWS = 50_000
+    # 디바운스 = 최소값 + 예상 검색 시간 × 배수
+    LATENCY_FACTOR = 1.5
+    # 보관하는 최근 검색 시간 수
+    SAMPLES = 8
+    # 완료 알림이 오지 않은 검색을 끝난 것으로 보는 시간 (초)
+    IN_FLIGHT_TIMEOUT = 30.0
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        # (검색 시간 ms, 측정 당시 인덱스 행 수)
+        self._samples: Deque[Tuple[float, int]] = deque(maxlen=self.SAMPLES)
+        self._index_rows = 0
+        self._in_flight: Optional[str] = None
+        self._in_flight_since = 0.0
+        self._pending: Optional[str] = None
+
+    # ─── 측정 ───
+
+    def set_index_size(self, rows: int):
+        self._index_rows = max(0, rows)
+
+    def record_latency(self, elapsed: float):
+        """검색 소요 시간(초)을 기록합니다."""
+        self._samples.append((elapsed * 1000.0, self._index_rows))
+
+    def estimated_latency_ms(self) -> Optional[float]:
+        """
+        현재 인덱스 크기에서의 예상 검색 시간 (ms).
+        각 측정값을 측정 당시 대비 현재 인덱스 크기 비율로 보정한 뒤 중앙값을 씁니다.
+        """
+        if not self._samples:
+            return None
+        scaled = []
+        for ms, rows in self._samples:
+            if rows > 0 and self._index_rows > 0:
+                ms *= self._index_rows / rows
+            scaled.append(ms)
+        return statistics.median(scaled)
+
+    def debounce_ms(self) -> int:
+        """다음 키 입력에 적용할 디바운스 (ms)"""
+        latency = self.estimated_latency_ms()
+        if latency is None:
+            if self._index_rows < self.SMALL_INDEX_ROWS:
+                return self.MIN_DEBOUNCE_MS
+            return self.DEFAULT_DEBOUNCE_MS
+        debounce = self.MIN_DEBOUNCE_MS + latency * self.LATENCY_FACTOR
+        return int(min(max(debounce, self.MIN_DEBOUNCE_MS), self.MAX_DEBOUNCE_MS))
+
+    # ─── 요청 흐름 ───
+
+    @property
+    def in_flight(self) -> Optional[str]:
+        """진행 중인 검색어 (완료 알림 없이 IN_FLIGHT_TIMEOUT이 지나면 None)"""
+        if (self._in_flight is not None
+                and self._clock() - self._in_flight_since > self.IN_FLIGHT_TIMEOUT):
+            self._in_flight = None
+        return self._in_flight
+
+    @property
+    def pending(self) -> Optional[str]:
+        return self._pending
+
+    def request(self, query: str) -> Optional[str]:
+        """
+        검색어 요청. 진행 중인 검색이 없으면 query를 반환하고(바로 보냄),
+        있으면 마지막 검색어로 보관하고 None을 반환합니다 (이전 보류 검색어는 건너뜀).
+        """
+        if self.in_flight is None:
+            # 만료된 검색 동안 보류된 검색어는 이 검색어로 대체됨
+            self._pending = None
+            self._start(query)
+            return query
+        self._pending = query
+        return None
+
+    def finished(self, elapsed: Optional[float] = None) -> Optional[str]:
+        """
+        검색 완료(또는 실패/취소) 알림. elapsed(초)가 있으면 측정값으로 기록합니다.
+        보류 중인 검색어가 있으면 그 검색어를 반환합니다 (바로 보냄).
+        같은 검색어라도 유사도 등 다른 조건이 바뀌었을 수 있으므로 다시 실행합니다.
+        """
+        if elapsed is not None:
+            self.record_latency(elapsed)
+        self._in_flight = None
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return None
+        self._start(pending)
+        return pending
+
+    def _start(self, query: str):
+        self._in_flight = query
+        self._in_flight_since = self._clock()
@@ -2,20 +2,37 @@
 [v2.0.0] 다중 계층 검색 엔진
 쿼리 파싱, 정확 매칭, 퍼지 매칭, 초성 검색, BM25 랭킹을 통합하여
 사용자가 단순히 텍스트를 입력하면 최적의 결과를 반환합니다.
+
+[v2.1.0] 인덱스는 SearchBackend 인터페이스로만 접근하므로 메모리 인덱스(SearchIndex)와
+SQLite FTS5 인덱스(FtsSearchBackend) 중 어느 것이든 사용할 수 있습니다.
+
+[v2.1.0] 퍼지 매칭은 어휘를 샤드로 나누어 여러 코어에서 동시에 계산하고 top-K로 병합합니다.
+
+[v2.1.0] max_results=None이면 결과 수 제한 없이 점수순 행 키만 보관하는 RankedResults(커서)를
+반환하고, 행 데이터는 페이지 단위로 필요할 때 만듭니다.
+
+[v2.1.0] 최근 검색어의 계층별 매칭(퍼지는 가장 느슨한 임계값으로 계산)을 보관하여,
+같은 검색어에 유사도 임계값만 바뀌면 인덱스를 다시 조회하지 않고 메모리에서 다시 거르고 순위를 매깁니다.
+
+[v2.1.0] 결과 페이지를 미리보기(스니펫)로 만들 수 있습니다. 넓은 시트의 행은 매칭 컬럼과 양옆 컬럼만
+담고 강조 범위를 함께 계산하며, 전체 행은 load_full_rows()로 필요할 때 다시 읽습니다.
 """
 
+import heapq
+import importlib.util
 import re
-from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Set, Optional
-from src.core.indexer import SearchIndex, RowData
+from dataclasses import dataclass, field, replace
+from typing import Iterable, Iterator, List, Dict, Tuple, Set, Optional, Sequence, Union, overload
+from src.core.indexer import RowData
+from src.core.search_backend import SearchBackend
+from src.core.parallel import DEFAULT_WORKERS, map_shards, top_k
 from src.core.jamo_utils import is_chosung_query, match_chosung, extract_chosung
+from src.core.snippet import RowSnippet, build_snippet
 from src.utils.logger import logger
 
-try:
-    from rapidfuzz import fuzz, process as rfprocess
-    HAS_RAPIDFUZZ = True
-except ImportError:
-    HAS_RAPIDFUZZ = False
+# [v2.1.0] rapidfuzz(numpy 포함)는 무거우므로 설치 여부만 확인하고, 처음 퍼지 매칭할 때 import
+HAS_RAPIDFUZZ = importlib.util.find_spec('rapidfuzz') is not None
+if not HAS_RAPIDFUZZ:
     logger.warning("rapidfuzz 미설치 — 퍼지 매칭 비활성화")
 
 
@@ -39,12 +56,164 @@ class MatchDetail:
 
 @dataclass
 class SearchResult:
-    """검색 결과 단위 (행 기준)"""
+    """
+    검색 결과 단위 (행 기준).
+    snippet.truncated이면 row.cells에는 스니펫 컬럼만 있으므로 전체 행은 load_full_rows()로 읽습니다.
+    """
     row: RowData
     score: float              # 종합 점수
     match_type: str           # 최우선 매칭 유형
     similarity: float         # 최고 유사도
     matches: List[MatchDetail] = field(default_factory=list)
+    snippet: Optional[RowSnippet] = None  # 미리보기 (미리보기 페이지에서만)
+
+    @property
+    def is_preview(self) -> bool:
+        """행 데이터가 스니펫 컬럼만 담고 있는지"""
+        return self.snippet is not None and self.snippet.truncated
+
+
+def load_full_rows(index: SearchBackend, results: Sequence[SearchResult]) -> List[SearchResult]:
+    """
+    미리보기 결과를 전체 행 결과로 바꿉니다 (전체 행인 결과는 그대로).
+    검색 후 재인덱싱으로 사라진 행은 건너뜁니다.
+    """
+    if not any(r.is_preview for r in results):
+        return list(results)
+    full = []
+    with index.read_lock():
+        for r in results:
+            if not r.is_preview:
+                full.append(r)
+                continue
+            row = index.get_row((r.row.file_path, r.row.sheet_name, r.row.row_idx))
+            if row is not None:
+                full.append(replace(r, row=row, snippet=None))
+    return full
+
+
+class RankedResults(Sequence):
+    """
+    [v2.1.0] 한 검색의 전체 순위 결과 (커서).
+    점수순으로 정렬한 (행 키, 점수 정보)만 보관하고 SearchResult는 인덱싱/슬라이싱/순회 시점에 만듭니다.
+    페이지마다 인덱스 읽기 구간을 잡으므로 어느 스레드에서 읽어도 됩니다.
+    검색 후 재인덱싱으로 사라진 행은 건너뛰므로 실제로 얻는 결과가 len()보다 적을 수 있습니다.
+    """
+
+    # 순회 시 한 번에 만드는 결과 수
+    PAGE_SIZE = 200
+
+    def __init__(self, index: SearchBackend, ranked: List[Tuple[tuple, dict]],
+                 terms: Sequence[str] = ()):
+        self.index = index
+        self._ranked = ranked
+        # 미리보기 강조에 쓰는 검색 키워드
+        self.terms = list(terms)
+
+    def __len__(self) -> int:
+        return len(self._ranked)
+
+    @overload
+    def __getitem__(self, i: int) -> SearchResult: ...
+
+    @overload
+    def __getitem__(self, s: slice) -> List[SearchResult]: ...
+
+    def __getitem__(self, key: Union[int, slice]):
+        if isinstance(key, slice):
+            return self._materialize(self._ranked[key])
+        row_key, info = self._ranked[key]
+        results = self._materialize([(row_key, info)])
+        if not results:
+            raise IndexError(f"제거된 행: {row_key}")
+        return results[0]
+
+    def __iter__(self) -> Iterator[SearchResult]:
+        for offset in range(0, len(self._ranked), self.PAGE_SIZE):
+            yield from self.page(offset)
+
+    def sheet_headers(self) -> Iterator[List[str]]:
+        """결과가 있는 시트의 헤더를 순위 순서로 순회합니다 (행 데이터를 만들지 않음)."""
+        sheets = dict.fromkeys((row_key[0], row_key[1]) for row_key, _ in self._ranked)
+        with self.index.read_lock():
+            headers = [self.index.file_headers.get(key, []) for key in sheets]
+        yield from headers
+
+    def page(self, offset: int, count: int = PAGE_SIZE,
+             snippet_context: Optional[int] = None) -> List[SearchResult]:
+        """
+        순위 offset부터 count개 결과 (제거된 행 제외).
+        snippet_context를 주면 매칭 컬럼 양옆 snippet_context개 컬럼만 담은 미리보기 결과를 만듭니다.
+        """
+        return self._materialize(self._ranked[offset:offset + count], snippet_context)
+
+    def _materialize(self, items: List[Tuple[tuple, dict]],
+                     snippet_context: Optional[int] = None) -> List[SearchResult]:
+        results = []
+        with self.index.read_lock():
+            for row_key, info in items:
+                row_data = self.index.get_row(row_key)
+                if row_data is None:
+                    continue
+                matches = info.get('matches', [])
+                snippet = None
+                if snippet_context is not None:
+                    snippet = build_snippet(
+                        row_data.headers, row_data.cells,
+                        ((m.col_name, m.cell_value) for m in matches),
+                        self.terms, snippet_context
+                    )
+                    if snippet.truncated:
+                        # 스니펫 컬럼만 보관 (헤더 목록은 시트와 공유)
+                        row_data = replace(row_data, cells=snippet.cells)
+                results.append(SearchResult(
+                    row=row_data,
+                    score=info['score'],
+                    match_type=info['match_type'],
+                    similarity=info['similarity'],
+                    matches=matches,
+                    snippet=snippet
+                ))
+        return results
+
+
+class _Candidates:
+    """
+    한 검색어의 임계값 적용 전 검색 결과.
+    hits는 계층이 매칭을 만든 순서대로 (행 키, 점수, 매칭 유형, 유사도, 매칭 상세, 퍼지 원점수)이며,
+    퍼지 매칭은 계산 임계값(cutoff) 이상인 것이 모두 들어 있습니다.
+    """
+
+    def __init__(self, cutoff: float, hits: list, bm25: Dict[Tuple, float], rejected: Set[Tuple]):
+        self.cutoff = cutoff
+        self.hits = hits
+        self.bm25 = bm25
+        self.rejected = rejected
+
+    def row_scores(self, min_similarity: float) -> Dict[Tuple, dict]:
+        """임계값 미만 퍼지 매칭을 빼고 행별 점수를 누적합니다 (새로 검색한 것과 같은 결과)."""
+        # 검색 시 rapidfuzz에 넘기는 것과 같은 0~100 스케일 비교
+        cutoff_100 = min_similarity * 100
+        row_scores: Dict[Tuple, dict] = {}
+        for row_key, score, match_type, sim, match, raw in self.hits:
+            if match_type == 'fuzzy' and raw < cutoff_100:
+                continue
+            MultiLayerSearcher._update_row_score(row_scores, row_key, score, match_type, sim, match)
+
+        # 계층 4: BM25 관련도 점수 가산 (정규화는 검색어 전체 BM25 최대값 기준)
+        if self.bm25:
+            max_bm25 = max(self.bm25.values())
+            if max_bm25 != 0:
+                for row_key, bm25_score in self.bm25.items():
+                    if row_key in row_scores:
+                        row_scores[row_key]['score'] += (
+                            bm25_score / max_bm25 * MultiLayerSearcher.WEIGHT_BM25
+                        )
+
+        # 제외/AND 조건
+        for row_key in self.rejected:
+            row_scores.pop(row_key, None)
+        return row_scores
 
 
 class QueryParser:
@@ -118,84 +287,109 @@ class MultiLayerSearcher:
     WEIGHT_BM25 = 0.3
     WEIGHT_RANGE = 0.9
 
-    def __init__(self, index: SearchIndex):
+    # 퍼지 매칭에서 키워드당 사용할 최대 유사 토큰 수
+    FUZZY_LIMIT = 50
+    # 퍼지 매칭 어휘 샤드 크기 (이보다 작은 어휘는 병렬화하지 않음)
+    VOCAB_SHARD_SIZE = 50_000
+    # 퍼지 후보를 계산하는 가장 느슨한 임계값 (유사도 슬라이더 최솟값)
+    LOOSEST_SIMILARITY = 0.4
+
+    def __init__(self, index: SearchBackend, workers: int = DEFAULT_WORKERS):
         self.index = index
+        self.workers = workers
+        # 최근 검색어의 후보: (검색어, 인덱스 세대, _Candidates)
+        self._cached: Optional[Tuple[str, int, _Candidates]] = None
 
     def search(self, raw_query: str, min_similarity: float = 0.6,
-               max_results: int = 500) -> List[SearchResult]:
+               max_results: Optional[int] = 500) -> Union[List[SearchResult], RankedResults]:
         """
         검색을 실행하고 점수순으로 정렬된 결과를 반환합니다.
 
         Args:
             raw_query: 사용자 입력 검색어
             min_similarity: 퍼지 매칭 최소 유사도 (0.0~1.0)
-            max_results: 최대 결과 수
+            max_results: 최대 결과 수. None이면 전체 결과를 RankedResults로 반환
         """
         query = QueryParser.parse(raw_query)
 
         if not query.keywords and not query.ranges:
-            return []
-
-        # 행 키 → {score, match_type, similarity, matches} 누적 딕셔너리
-        row_scores: Dict[Tuple, dict] = {}
+            return [] if max_results is not None else RankedResults(self.index, [])
 
-        # 각 키워드에 대해 다중 계층 검색 수행
-        for keyword in query.keywords:
-            # 계층 1: 정확 매칭
-            self._exact_search(keyword, row_scores)
+        candidates = self._get_candidates(raw_query, query, min_similarity)
+        row_scores = candidates.row_scores(min_similarity)
 
-            # 계층 2: 초성 검색 (입력이 초성인 경우)
-            if is_chosung_query(keyword):
-                self._chosung_search(keyword, row_scores)
+        # 점수 내림차순 정렬 (행 키만 정렬하고 행 데이터는 필요한 만큼만 만듦)
+        def by_score(item):
+            return item[1]['score']
 
-            # 계층 3: 퍼지 매칭
-            if HAS_RAPIDFUZZ:
-                self._fuzzy_search(keyword, row_scores, min_similarity)
+        if max_results is None:
+            ranked = sorted(row_scores.items(), key=by_score, reverse=True)
+            return RankedResults(self.index, ranked, query.keywords)
 
-        # 범위 검색
-        for min_val, max_val in query.ranges:
-            self._range_search(min_val, max_val, row_scores)
+        # 상위 max_results개 (전체 정렬 없이 top-K 선택)
+        ranked = heapq.nlargest(max_results, row_scores.items(), key=by_score)
+        return RankedResults(self.index, ranked, query.keywords).page(0, max_results)
 
-        # 계층 4: BM25 관련도 점수 가산
-        if query.keywords:
-            bm25_query = ' '.join(query.keywords)
-            self._apply_bm25(bm25_query, row_scores)
-
-        # 제외 조건 적용
-        if query.excludes:
-            self._apply_excludes(query.excludes, row_scores)
-
-        # AND 조건 적용: 모든 키워드가 행에 포함되어야 함 (2개 이상일 때)
-        if len(query.keywords) > 1:
-            self._apply_and_condition(query.keywords, row_scores)
-
-        # 결과 생성 및 정렬
-        results = []
-        for row_key, info in row_scores.items():
-            row_data = self.index.rows.get(row_key)
-            if row_data is None:
-                continue
-            results.append(SearchResult(
-                row=row_data,
-                score=info['score'],
-                match_type=info['match_type'],
-                similarity=info['similarity'],
-                matches=info.get('matches', [])
-            ))
-
-        # 점수 내림차순 정렬
-        results.sort(key=lambda r: r.score, reverse=True)
-        return results[:max_results]
-
-    def _exact_search(self, keyword: str, row_scores: dict):
+    def _get_candidates(self, raw_query: str, query: SearchQuery,
+                        min_similarity: float) -> _Candidates:
+        """
+        검색어의 후보를 반환합니다. 같은 검색어를 같은 인덱스 상태에서 검색한 적이 있고
+        그때의 퍼지 임계값이 지금 이하이면 보관한 후보를 재사용합니다.
+        """
+        generation = getattr(self.index, 'generation', None)
+        cached = self._cached
+        if (cached is not None and generation is not None
+                and cached[0] == raw_query and cached[1] == generation
+                and cached[2].cutoff <= min_similarity):
+            return cached[2]
+
+        candidates = self._collect(query, min(min_similarity, self.LOOSEST_SIMILARITY))
+        self._cached = (raw_query, generation, candidates) if generation is not None else None
+        return candidates
+
+    def _collect(self, query: SearchQuery, cutoff: float) -> _Candidates:
+        """모든 검색 계층을 실행하여 임계값 적용 전 후보를 모읍니다."""
+        # 검색 전체를 하나의 읽기 구간으로 실행 (인덱싱 중에도 일관된 상태에서 검색)
+        with self.index.read_lock():
+            hits: list = []
+
+            # 각 키워드에 대해 다중 계층 검색 수행
+            for keyword in query.keywords:
+                # 계층 1: 정확 매칭
+                self._exact_search(keyword, hits)
+
+                # 계층 2: 초성 검색 (입력이 초성인 경우)
+                if is_chosung_query(keyword):
+                    self._chosung_search(keyword, hits)
+
+                # 계층 3: 퍼지 매칭
+                if HAS_RAPIDFUZZ:
+                    self._fuzzy_search(keyword, hits, cutoff)
+
+            # 범위 검색
+            for min_val, max_val in query.ranges:
+                self._range_search(min_val, max_val, hits)
+
+            # 계층 4: BM25 관련도 점수 (행 점수 누적 시 가산)
+            bm25 = {}
+            if query.keywords:
+                bm25 = self.index.get_bm25_scores(' '.join(query.keywords)) or {}
+
+            # 제외 조건, AND 조건 (2개 이상일 때): 후보 행 중 빠질 행
+            row_keys = dict.fromkeys(hit[0] for hit in hits)
+            rejected: Set[Tuple] = set()
+            if query.excludes:
+                rejected |= self._apply_excludes(query.excludes, row_keys)
+            if len(query.keywords) > 1:
+                rejected |= self._apply_and_condition(query.keywords, row_keys)
+
+        return _Candidates(cutoff, hits, bm25, rejected)
+
+    def _exact_search(self, keyword: str, hits: list):
         """계층 1: 인버티드 인덱스 기반 정확/부분 매칭"""
         cell_indices = self.index.find_cells_containing(keyword)
 
-        for cell_idx in cell_indices:
-            cell = self.index.cells[cell_idx]
-            if cell is None:
-                continue
-
+        for cell in self.index.get_cells(cell_indices):
             row_key = (cell.file_path, cell.sheet_name, cell.row_idx)
 
             # 완전 일치 vs 부분 일치 구분
@@ -213,17 +407,13 @@ class MultiLayerSearcher:
                 match_type='exact',
                 similarity=sim
             )
-            self._update_row_score(row_scores, row_key, score, 'exact', sim, match)
+            hits.append((row_key, score, 'exact', sim, match, None))
 
-    def _chosung_search(self, keyword: str, row_scores: dict):
+    def _chosung_search(self, keyword: str, hits: list):
         """계층 2: 한글 초성 인덱스 기반 검색"""
         cell_indices = self.index.find_cells_by_chosung(keyword)
 
-        for cell_idx in cell_indices:
-            cell = self.index.cells[cell_idx]
-            if cell is None:
-                continue
-
+        for cell in self.index.get_cells(cell_indices):
             row_key = (cell.file_path, cell.sheet_name, cell.row_idx)
 
             # 초성 유사도 계산
@@ -240,26 +430,25 @@ class MultiLayerSearcher:
                 match_type='chosung',
                 similarity=sim
             )
-            self._update_row_score(row_scores, row_key, score, 'chosung', sim, match)
+            hits.append((row_key, score, 'chosung', sim, match, None))
 
-    def _fuzzy_search(self, keyword: str, row_scores: dict,
+    def _fuzzy_search(self, keyword: str, hits: list,
                       min_similarity: float):
-        """계층 3: rapidfuzz 기반 퍼지 매칭"""
-        if not self.index.vocabulary:
-            return
-
+        """
+        계층 3: rapidfuzz 기반 퍼지 매칭.
+        매칭마다 원점수(0~100)를 함께 남겨 더 높은 임계값으로 다시 거를 수 있게 합니다.
+        """
         kw_lower = keyword.lower()
         # 임계값을 0~100 스케일로 변환 (rapidfuzz 기준)
         cutoff = min_similarity * 100
 
-        # 어휘 목록에서 유사한 토큰 찾기
-        vocab_list = list(self.index.vocabulary)
-        matches = rfprocess.extract(
-            kw_lower, vocab_list,
-            scorer=fuzz.WRatio,
-            score_cutoff=cutoff,
-            limit=50
+        # 어휘 샤드별 상위 토큰을 병렬로 구한 뒤 병합 (어휘 전체를 한 번에 메모리에 올리지 않음)
+        partials = map_shards(
+            lambda vocab_chunk: self._fuzzy_shard(kw_lower, vocab_chunk, cutoff),
+            self.index.iter_vocabulary(self.VOCAB_SHARD_SIZE),
+            self.workers
         )
+        matches = top_k(partials, self.FUZZY_LIMIT, key=lambda m: m[1])
 
         for matched_token, score_100, _ in matches:
             sim = score_100 / 100.0
@@ -267,12 +456,8 @@ class MultiLayerSearcher:
             if matched_token == kw_lower:
                 continue
 
-            cell_indices = self.index.inverted_index.get(matched_token, set())
-            for cell_idx in cell_indices:
-                cell = self.index.cells[cell_idx]
-                if cell is None:
-                    continue
-
+            cell_indices = self.index.find_cells_with_token(matched_token)
+            for cell in self.index.get_cells(cell_indices):
                 row_key = (cell.file_path, cell.sheet_name, cell.row_idx)
                 weighted_score = self.WEIGHT_FUZZY * sim
                 match = MatchDetail(
@@ -281,79 +466,70 @@ class MultiLayerSearcher:
                     match_type='fuzzy',
                     similarity=sim
                 )
-                self._update_row_score(
-                    row_scores, row_key, weighted_score, 'fuzzy', sim, match
-                )
+                hits.append((row_key, weighted_score, 'fuzzy', sim, match, score_100))
+
+    @classmethod
+    def _fuzzy_shard(cls, kw_lower: str, vocab_chunk: List[str],
+                     cutoff: float) -> List[Tuple[str, float, int]]:
+        """
+        어휘 샤드 하나에서 유사도 상위 FUZZY_LIMIT개 토큰을 찾습니다.
+        rapidfuzz.process.extract와 같은 (토큰, 점수, 위치) 형식과 순서(점수 내림차순, 동점은 위치순)로
+        반환하며, cdist는 계산 중 GIL을 놓으므로 샤드들이 여러 코어에서 동시에 실행됩니다.
+        """
+        import numpy as np
+        from rapidfuzz import fuzz, process as rfprocess
 
-    def _range_search(self, min_val: float, max_val: float,
-                      row_scores: dict):
+        scores = rfprocess.cdist(
+            [kw_lower], vocab_chunk,
+            scorer=fuzz.WRatio,
+            score_cutoff=cutoff,
+            dtype=np.float64,
+            workers=1
+        )[0]
+        hits = np.flatnonzero(scores >= cutoff)
+        hits = hits[np.lexsort((hits, -scores[hits]))][:cls.FUZZY_LIMIT]
+        return [(vocab_chunk[i], float(scores[i]), int(i)) for i in hits]
+
+    def _range_search(self, min_val: float, max_val: float, hits: list):
         """숫자 범위 검색: min_val 이상 max_val 이하인 숫자가 있는 셀 탐색"""
-        for cell_idx, cell in enumerate(self.index.cells):
-            if cell is None:
-                continue
-            try:
-                # 쉼표 제거 후 숫자 변환 시도
-                num_val = float(cell.value.replace(',', '').strip())
-                if min_val <= num_val <= max_val:
-                    row_key = (cell.file_path, cell.sheet_name, cell.row_idx)
-                    match = MatchDetail(
-                        col_name=cell.col_name,
-                        cell_value=cell.value,
-                        match_type='range',
-                        similarity=0.9
-                    )
-                    self._update_row_score(
-                        row_scores, row_key, self.WEIGHT_RANGE, 'range', 0.9, match
-                    )
-            except (ValueError, AttributeError):
-                continue
+        # 인덱싱 시 미리 변환한 숫자 컬럼 사용
+        cell_indices = sorted(self.index.find_cells_in_range(min_val, max_val))
+        for cell in self.index.get_cells(cell_indices):
+            row_key = (cell.file_path, cell.sheet_name, cell.row_idx)
+            match = MatchDetail(
+                col_name=cell.col_name,
+                cell_value=cell.value,
+                match_type='range',
+                similarity=0.9
+            )
+            hits.append((row_key, self.WEIGHT_RANGE, 'range', 0.9, match, None))
 
-    def _apply_bm25(self, query: str, row_scores: dict):
-        """계층 4: BM25 관련도 점수를 기존 결과에 가산"""
-        bm25_scores = self.index.get_bm25_scores(query)
-        if not bm25_scores:
-            return
-
-        # BM25 점수 정규화 (최대값 기준)
-        max_bm25 = max(bm25_scores.values()) if bm25_scores else 1.0
-        if max_bm25 == 0:
-            return
-
-        for row_key, bm25_score in bm25_scores.items():
-            if row_key in row_scores:
-                normalized = (bm25_score / max_bm25) * self.WEIGHT_BM25
-                row_scores[row_key]['score'] += normalized
-
-    def _apply_excludes(self, excludes: List[str], row_scores: dict):
-        """제외 조건: 제외 키워드가 포함된 행을 결과에서 제거"""
-        keys_to_remove = []
-        for row_key in row_scores:
-            row_data = self.index.rows.get(row_key)
+    def _apply_excludes(self, excludes: List[str], row_keys: Iterable[Tuple]) -> Set[Tuple]:
+        """제외 조건: 제외 키워드가 포함된 행 (결과에서 제거할 행 키)"""
+        keys_to_remove = set()
+        for row_key in row_keys:
+            row_data = self.index.get_row(row_key)
             if row_data is None:
                 continue
             row_text = ' '.join(row_data.cells.values()).lower()
             for ex in excludes:
                 if ex.lower() in row_text:
-                    keys_to_remove.append(row_key)
+                    keys_to_remove.add(row_key)
                     break
+        return keys_to_remove
 
-        for key in keys_to_remove:
-            del row_scores[key]
-
-    def _apply_and_condition(self, keywords: List[str], row_scores: dict):
-        """AND 조건: 모든 키워드가 행에 포함되어야 결과에 유지"""
-        keys_to_remove = []
-        for row_key in row_scores:
-            row_data = self.index.rows.get(row_key)
+    def _apply_and_condition(self, keywords: List[str], row_keys: Iterable[Tuple]) -> Set[Tuple]:
+        """AND 조건: 모든 키워드가 행에 포함되지 않은 행 (결과에서 제거할 행 키)"""
+        keys_to_remove = set()
+        for row_key in row_keys:
+            row_data = self.index.get_row(row_key)
             if row_data is None:
                 continue
             row_text = ' '.join(row_data.cells.values()).lower()
             all_found = all(kw.lower() in row_text for kw in keywords)
             if not all_found:
-                keys_to_remove.append(row_key)
-
-        for key in keys_to_remove:
-            del row_scores[key]
+                keys_to_remove.add(row_key)
+        return keys_to_remove
 
     @staticmethod
     def _update_row_score(row_scores: dict, row_key: tuple,
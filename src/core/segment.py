@@ -0,0 +1,163 @@
+"""
+[v2.1.0] 인덱스 세그먼트
+시트 하나를 인덱싱하며 만들어진 토큰 포스팅, 초성 포스팅, 숫자 컬럼을 묶은 단위입니다.
+캐시에 직렬화해 두면 재시작 시 토큰화/초성 추출 없이 SearchIndex에 일괄 적재할 수 있습니다.
+
+포스팅의 셀 번호는 시트 내 셀 순서(행 → 열 오름차순)의 0부터 시작하는 로컬 번호입니다.
+"""
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Set
+
+# 직렬화 포맷 식별자 및 버전
+SEGMENT_MAGIC = b'DSEG'
+SEGMENT_FORMAT = 1
+
+# 매직, 포맷, JSON 길이, 토큰 포스팅 길이, 초성 포스팅 길이, 셀 수
+_HEADER = struct.Struct('<4sIIIII')
+
+
+def _le(arr: array) -> bytes:
+    """배열을 리틀 엔디언 바이트로 변환합니다."""
+    if sys.byteorder != 'little':
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _from_le(typecode: str, data: bytes) -> array:
+    """리틀 엔디언 바이트를 배열로 복원합니다."""
+    arr = array(typecode)
+    arr.frombytes(data)
+    if sys.byteorder != 'little':
+        arr.byteswap()
+    return arr
+
+
+def _csr(postings: Dict[str, List[int]]):
+    """토큰 → 셀 번호 목록을 (정렬된 토큰, 오프셋, 포스팅) CSR 배열로 변환합니다."""
+    tokens = sorted(postings)
+    offsets = array('I', [0])
+    flat = array('I')
+    for token in tokens:
+        flat.extend(postings[token])
+        offsets.append(len(flat))
+    return tokens, offsets, flat
+
+
+@dataclass
+class IndexSegment:
+    """시트 하나의 인덱스 구조 (CSR 형식 포스팅 + 숫자 컬럼)"""
+    tokens: List[str]
+    token_offsets: array      # 'I', len(tokens) + 1
+    token_postings: array     # 'I', 로컬 셀 번호
+    chosung_tokens: List[str]
+    chosung_offsets: array
+    chosung_postings: array
+    numeric: array            # 'd', 셀마다 숫자값 (숫자가 아니면 NaN)
+
+    @property
+    def cell_count(self) -> int:
+        return len(self.numeric)
+
+    def iter_postings(self):
+        """(토큰, 로컬 셀 번호 배열 슬라이스)를 순회합니다."""
+        offsets, flat = self.token_offsets, self.token_postings
+        for i, token in enumerate(self.tokens):
+            yield token, flat[offsets[i]:offsets[i + 1]]
+
+    def iter_chosung_postings(self):
+        """(초성 토큰, 로컬 셀 번호 배열 슬라이스)를 순회합니다."""
+        offsets, flat = self.chosung_offsets, self.chosung_postings
+        for i, token in enumerate(self.chosung_tokens):
+            yield token, flat[offsets[i]:offsets[i + 1]]
+
+    def to_bytes(self) -> bytes:
+        """캐시 저장용 바이트로 직렬화합니다 (zlib 압축)."""
+        strings = json.dumps(
+            [self.tokens, self.chosung_tokens], ensure_ascii=False
+        ).encode('utf-8')
+        header = _HEADER.pack(
+            SEGMENT_MAGIC, SEGMENT_FORMAT, len(strings),
+            len(self.token_postings), len(self.chosung_postings), self.cell_count
+        )
+        body = b''.join([
+            header, strings,
+            _le(self.token_offsets), _le(self.token_postings),
+            _le(self.chosung_offsets), _le(self.chosung_postings),
+            _le(self.numeric),
+        ])
+        return zlib.compress(body, 1)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'IndexSegment':
+        """to_bytes()로 직렬화한 데이터를 복원합니다. 포맷이 다르면 ValueError."""
+        body = zlib.decompress(data)
+        magic, fmt, str_len, n_tok_post, n_ch_post, n_cells = _HEADER.unpack_from(body)
+        if magic != SEGMENT_MAGIC or fmt != SEGMENT_FORMAT:
+            raise ValueError("지원하지 않는 세그먼트 포맷")
+
+        pos = _HEADER.size
+        tokens, chosung_tokens = json.loads(body[pos:pos + str_len].decode('utf-8'))
+        pos += str_len
+
+        def take(typecode: str, count: int) -> array:
+            nonlocal pos
+            size = count * array(typecode).itemsize
+            arr = _from_le(typecode, body[pos:pos + size])
+            pos += size
+            return arr
+
+        return cls(
+            tokens=tokens,
+            token_offsets=take('I', len(tokens) + 1),
+            token_postings=take('I', n_tok_post),
+            chosung_tokens=chosung_tokens,
+            chosung_offsets=take('I', len(chosung_tokens) + 1),
+            chosung_postings=take('I', n_ch_post),
+            numeric=take('d', n_cells),
+        )
+
+
+class SegmentBuilder:
+    """
+    SearchIndex.add_dataframe()가 셀을 인덱싱하면서 함께 기록하는 세그먼트 수집기.
+    토큰화 결과를 재사용하므로 추가 토큰화 비용이 없습니다.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, List[int]] = {}
+        self._chosung: Dict[str, List[int]] = {}
+        self._numeric = array('d')
+
+    @property
+    def cell_count(self) -> int:
+        return len(self._numeric)
+
+    def add_cell(self, tokens: Set[str], chosung_tokens: Set[str], numeric: float):
+        """셀 하나의 토큰/초성 토큰/숫자값을 다음 로컬 번호로 기록합니다."""
+        ordinal = len(self._numeric)
+        for token in tokens:
+            self._postings.setdefault(token, []).append(ordinal)
+        for token in chosung_tokens:
+            self._chosung.setdefault(token, []).append(ordinal)
+        self._numeric.append(numeric)
+
+    def build(self) -> IndexSegment:
+        """수집한 데이터를 IndexSegment로 만듭니다."""
+        tokens, token_offsets, token_postings = _csr(self._postings)
+        ch_tokens, ch_offsets, ch_postings = _csr(self._chosung)
+        return IndexSegment(
+            tokens=tokens,
+            token_offsets=token_offsets,
+            token_postings=token_postings,
+            chosung_tokens=ch_tokens,
+            chosung_offsets=ch_offsets,
+            chosung_postings=ch_postings,
+            numeric=self._numeric,
+        )
@@ -0,0 +1,96 @@
+"""
+[v2.1.0] 결과 행 미리보기 (스니펫)
+넓은 시트의 결과 행을 매칭된 컬럼과 그 양옆 컬럼으로만 줄이고, 셀 안에서 강조할 글자 범위를 계산합니다.
+결과 화면은 스니펫 컬럼만 그리며, 전체 행은 사용자가 펼칠 때 인덱스에서 다시 읽습니다.
+
+- 강조 범위는 검색 키워드가 셀 값에 나타나는 위치(대소문자 무시)입니다.
+- 키워드가 글자 그대로 나타나지 않는 매칭(퍼지, 초성, 범위)은 셀 전체를 강조합니다.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# 매칭 컬럼 양옆으로 함께 보여 주는 컬럼 수
+SNIPPET_CONTEXT = 2
+
+
+@dataclass
+class RowSnippet:
+    """결과 행의 미리보기"""
+    columns: List[str]             # 스니펫 컬럼 (헤더 순서)
+    cells: Dict[str, str]          # 스니펫 컬럼의 셀 값
+    highlights: Dict[str, List[Tuple[int, int]]] = field(default_factory=dict)  # 컬럼 → [시작, 끝) 범위
+    total_columns: int = 0         # 원래 행의 컬럼 수
+
+    @property
+    def truncated(self) -> bool:
+        """원래 행보다 컬럼이 적은지 (전체 행을 다시 읽어야 모든 셀을 볼 수 있음)"""
+        return len(self.columns) < self.total_columns
+
+
+def highlight_spans(value: str, terms: Iterable[str]) -> List[Tuple[int, int]]:
+    """셀 값에서 검색어가 나타나는 [시작, 끝) 범위 목록 (겹치는 범위는 합침)"""
+    spans = []
+    for term in terms:
+        if not term:
+            continue
+        for m in re.finditer(re.escape(term), value, re.IGNORECASE):
+            spans.append((m.start(), m.end()))
+    if not spans:
+        return []
+
+    spans.sort()
+    merged = [spans[0]]
+    for start, end in spans[1:]:
+        last_start, last_end = merged[-1]
+        if start <= last_end:
+            merged[-1] = (last_start, max(last_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def snippet_columns(headers: Sequence[str], matched: Iterable[str],
+                    context: int = SNIPPET_CONTEXT) -> List[str]:
+    """매칭 컬럼과 양옆 context개 컬럼 (헤더 순서). 매칭 컬럼이 없으면 앞쪽 컬럼."""
+    positions = {col: i for i, col in enumerate(headers)}
+    keep = set()
+    for col in matched:
+        i = positions.get(col)
+        if i is None:
+            continue
+        keep.update(range(max(0, i - context), min(len(headers), i + context + 1)))
+    if not keep:
+        keep = set(range(min(len(headers), context * 2 + 1)))
+    return [headers[i] for i in sorted(keep)]
+
+
+def build_snippet(headers: Sequence[str], cells: Dict[str, str],
+                  matches: Iterable[Tuple[str, str]], terms: Sequence[str],
+                  context: int = SNIPPET_CONTEXT) -> RowSnippet:
+    """
+    행의 스니펫을 만듭니다.
+
+    Args:
+        headers: 행의 전체 헤더
+        cells: 행의 셀 값 (컬럼명 → 값)
+        matches: 매칭된 (컬럼명, 셀 값) 목록
+        terms: 강조할 검색 키워드
+        context: 매칭 컬럼 양옆으로 포함할 컬럼 수
+    """
+    matches = list(matches)
+    columns = snippet_columns(headers, (col for col, _ in matches), context)
+
+    highlights: Dict[str, List[Tuple[int, int]]] = {}
+    for col, value in matches:
+        if col in highlights or not value:
+            continue
+        highlights[col] = highlight_spans(value, terms) or [(0, len(value))]
+
+    return RowSnippet(
+        columns=columns,
+        cells={col: cells.get(col, '') for col in columns},
+        highlights=highlights,
+        total_columns=len(headers)
+    )
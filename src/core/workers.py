@@ -3,13 +3,24 @@
 인덱싱과 검색을 별도 스레드에서 수행하여 GUI 프리징을 방지합니다.
 """
 
+import importlib
+import threading
+import time
 from PySide6.QtCore import QThread, Signal
-from typing import List
+from typing import List, Optional, Tuple
 from pathlib import Path
 from src.core.scanner import FileScanner
-from src.core.indexer import SearchIndex
-from src.core.searcher import MultiLayerSearcher, SearchResult
-from src.core.cache import IndexCache
+from src.core.indexer import SearchIndex, SheetMeta, build_segment, dataframe_cells
+from src.core.segment import SegmentBuilder
+from src.core.searcher import MultiLayerSearcher, RankedResults, SearchResult
+from src.core.cache import (
+    IndexCache, FILE_VALID, FILE_MISSING, compute_shared_signature, compute_sheet_signatures,
+    compute_sheet_value_hashes, sheet_content_hash
+)
+from src.core.cache_writer import CacheWriter
+from src.core.fts_backend import FtsSearchBackend
+from src.utils.clipboard_manager import ClipboardManager
+from src.utils.exporter import ExportCancelled, ResultExporter
 from src.utils.logger import logger
 
 
@@ -18,24 +29,54 @@ class IndexWorker(QThread):
     [v2.0.0] 파일 인덱싱 워커.
     파일을 스캔하고 SearchIndex를 구축합니다.
     SQLite 캐시가 유효한 경우 파일을 다시 읽지 않고 캐시에서 복원합니다.
+
+    지연 모드(lazy=True)에서는 먼저 모든 파일의 메타데이터(시트명, 크기, 헤더)만 읽어
+    즉시 검색 가능한 상태로 만든 뒤, 시트 단위로 우선순위에 따라 전체 인덱싱을 수행합니다.
+    사용자가 파일 트리에서 펼친 시트는 prioritize()로 대기열 앞으로 이동합니다.
+
+    cache_writer가 주어지면 캐시 저장을 백그라운드 기록 스레드에 맡기고 바로 다음 파일로 넘어갑니다.
     """
 
     # 시그널 정의
     progress_updated = Signal(str, int)   # (메시지, 백분율)
     indexing_complete = Signal(int, int)   # (총 파일 수, 총 행 수)
     error_occurred = Signal(str)           # 에러 메시지
+    metadata_ready = Signal(str, list)     # (파일 경로, 시트명 목록) — 지연 모드
+    sheet_indexed = Signal(str, str)       # (파일 경로, 시트명) — 지연 모드
+
+    # 인덱싱 중 BM25 재구축 최소 간격 (초). 그동안 검색은 이전 BM25를 사용
+    BM25_REBUILD_INTERVAL = 3.0
 
     def __init__(self, files: List[str], index: SearchIndex,
-                 cache: IndexCache = None):
+                 cache: IndexCache = None, lazy: bool = False,
+                 cache_writer: CacheWriter = None):
         super().__init__()
         self.files = files
         self.index = index
         self.cache = cache
+        self.lazy = lazy
+        # 캐시 저장 대상 (기록 스레드가 없으면 캐시에 직접 저장)
+        self._cache_sink = cache_writer or cache
         self.scanner = FileScanner()
         self._is_running = True
+        # 마지막 BM25 구축 시각과 소요 시간 (큰 인덱스일수록 재구축 간격을 늘림)
+        self._bm25_built_at = 0.0
+        self._bm25_cost = 0.0
+
+        # 지연 모드 시트 대기열 및 우선순위 요청 (GUI 스레드에서 접근하므로 락으로 보호)
+        self._queue_lock = threading.Lock()
+        self._sheet_queue: List[Tuple[str, str]] = []
+        self._boosts: List[Tuple[str, Optional[str]]] = []
 
     def run(self):
         """인덱싱 작업 수행"""
+        if self.lazy:
+            self._run_lazy()
+        else:
+            self._run_eager()
+
+    def _run_eager(self):
+        """모든 파일을 순서대로 전체 인덱싱합니다."""
         logger.info(f"인덱싱 시작: {len(self.files)}개 파일")
         total = len(self.files)
 
@@ -47,6 +88,7 @@ class IndexWorker(QThread):
             file_name = Path(file_path).name
             pct = int(((i) / max(total, 1)) * 100)
             self.progress_updated.emit(f"인덱싱 중: {file_name}", pct)
+            self._rebuild_bm25()
 
             # 이미 인덱싱된 파일은 건너뛰기
             if file_path in self.index.indexed_files:
@@ -55,15 +97,14 @@ class IndexWorker(QThread):
             try:
                 # 캐시 확인 — 캐시가 유효하면 파일을 다시 읽지 않음
                 if self.cache and self.cache.is_file_cached(file_path):
-                    cached = self.cache.load_file_data(file_path)
-                    if cached:
-                        self._restore_from_cache(cached)
+                    if self._restore_from_cache(file_path) is not None:
                         logger.info(f"캐시에서 복원: {file_name}")
                         continue
 
                 # 파일에서 직접 로드 + 인덱싱
-                cells_for_cache = []
+                cells_for_cache = {}
                 headers_for_cache = {}
+                builders = {}
                 row_offset = 0
 
                 for chunk_info in self.scanner.read_file_chunks(file_path):
@@ -74,37 +115,27 @@ class IndexWorker(QThread):
                     df = chunk_info['data']
                     headers = [str(c) for c in df.columns]
 
-                    # 인덱스에 추가
-                    self.index.add_dataframe(
-                        file_path, file_name, sheet_name, df, row_offset
+                    # 인덱스에 추가 (캐시 사용 시 시트별 세그먼트도 함께 구축)
+                    builder = None
+                    if self.cache:
+                        builder = builders.setdefault(sheet_name, SegmentBuilder())
+                    batch = self.index.add_dataframe(
+                        file_path, file_name, sheet_name, df, row_offset, builder
                     )
 
-                    # 캐시용 데이터 수집
+                    # 캐시용 데이터 수집 (인덱서가 반환한 셀 목록을 그대로 사용)
                     if self.cache:
                         if sheet_name not in headers_for_cache:
                             headers_for_cache[sheet_name] = headers
-                        for local_idx, (_, row) in enumerate(df.iterrows()):
-                            actual_row = row_offset + local_idx
-                            for col_idx, col_name in enumerate(headers):
-                                val = row.iloc[col_idx] if col_idx < len(row) else None
-                                val_str = str(val) if val is not None else ''
-                                if val_str not in ('nan', 'None', 'NaT', ''):
-                                    cells_for_cache.append({
-                                        'file_path': file_path,
-                                        'file_name': file_name,
-                                        'sheet_name': sheet_name,
-                                        'row_idx': actual_row,
-                                        'col_idx': col_idx,
-                                        'col_name': col_name,
-                                        'value': val_str
-                                    })
+                        cells_for_cache.setdefault(sheet_name, []).extend(batch)
 
                     row_offset += len(df)
 
                 # 캐시에 저장
-                if self.cache and cells_for_cache:
-                    self.cache.save_file_data(
-                        file_path, file_name, cells_for_cache, headers_for_cache
+                if self.cache and any(cells_for_cache.values()):
+                    self._cache_sink.save_file_data(
+                        file_path, file_name, cells_for_cache, headers_for_cache,
+                        {name: b.build() for name, b in builders.items()}
                     )
 
             except Exception as e:
@@ -112,10 +143,217 @@ class IndexWorker(QThread):
                 logger.error(err_msg, exc_info=True)
                 self.error_occurred.emit(err_msg)
 
+        self._finish()
+
+    def _run_lazy(self):
+        """
+        메타데이터를 먼저 등록한 뒤 시트 단위로 우선순위에 따라 인덱싱합니다.
+        이전 워커가 중단되며 남긴 대기 시트도 이어서 처리합니다.
+        """
+        start = time.perf_counter()
+        logger.info(f"지연 인덱싱 시작: {len(self.files)}개 파일")
+        total = len(self.files)
+
+        # 1단계: 캐시 복원 또는 메타데이터 등록
+        for i, file_path in enumerate(self.files):
+            if not self._is_running:
+                break
+
+            file_name = Path(file_path).name
+            pct = int((i / max(total, 1)) * 10)
+            self.progress_updated.emit(f"시트 정보 읽는 중: {file_name}", pct)
+
+            if self.index.is_file_known(file_path):
+                continue
+
+            try:
+                if self.cache and self.cache.is_file_cached(file_path):
+                    sheet_names = self._restore_from_cache(file_path)
+                    if sheet_names is not None:
+                        self.metadata_ready.emit(file_path, sheet_names)
+                        logger.info(f"캐시에서 복원: {file_name}")
+                        continue
+
+                sheets = self.scanner.read_workbook_meta(file_path)
+                for sheet in sheets:
+                    self.index.register_sheet_meta(SheetMeta(
+                        file_path=file_path,
+                        file_name=file_name,
+                        sheet_name=sheet['sheet_name'],
+                        rows=sheet['rows'],
+                        cols=sheet['cols'],
+                        headers=sheet['headers']
+                    ))
+                self.metadata_ready.emit(file_path, [s['sheet_name'] for s in sheets])
+            except Exception as e:
+                err_msg = f"인덱싱 실패: {file_name} — {str(e)}"
+                logger.error(err_msg, exc_info=True)
+                self.error_occurred.emit(err_msg)
+
+        logger.info(f"메타데이터 등록 완료 ({time.perf_counter() - start:.2f}초)")
+        # 캐시에서 연결한 시트를 바로 관련도 순위에 반영
+        self._rebuild_bm25()
+
+        # 2단계: 대기 시트를 우선순위 순으로 전체 인덱싱
+        pending = self.index.pending_sheets
+        with self._queue_lock:
+            self._sheet_queue = [
+                k for k in self.index.sheet_meta if k in pending
+            ]
+        total_sheets = len(self._sheet_queue)
+
+        # 파일별 캐시 수집 버퍼 (파일의 모든 시트가 끝나면 저장)
+        cache_cells = {}
+        cache_headers = {}
+        cache_segments = {}
+        failed_files = set()
+        open_wb_path, open_wb = None, None
+        done = 0
+
+        try:
+            while self._is_running:
+                key = self._next_sheet()
+                if key is None:
+                    break
+                file_path, sheet_name = key
+                meta = self.index.sheet_meta.get(key)
+                if meta is None:
+                    continue  # 인덱싱 도중 파일이 제거됨
+
+                pct = 10 + int((done / max(total_sheets, 1)) * 85)
+                self.progress_updated.emit(
+                    f"인덱싱 중: {meta.file_name} › {sheet_name}", pct
+                )
+
+                # 같은 .xlsx 파일의 시트를 연속으로 읽을 때 워크북 핸들 재사용
+                if open_wb_path != file_path:
+                    if open_wb:
+                        open_wb.close()
+                    open_wb_path, open_wb = file_path, None
+                    try:
+                        open_wb = self.scanner.open_workbook(file_path)
+                    except Exception:
+                        open_wb = None
+
+                builder = SegmentBuilder() if self.cache else None
+                try:
+                    completed = self._index_sheet(
+                        meta, open_wb,
+                        cache_cells.setdefault(file_path, {}).setdefault(sheet_name, [])
+                        if file_path not in failed_files else [],
+                        builder
+                    )
+                except Exception as e:
+                    err_msg = f"인덱싱 실패: {meta.file_name} › {sheet_name} — {str(e)}"
+                    logger.error(err_msg, exc_info=True)
+                    self.error_occurred.emit(err_msg)
+                    # 실패한 시트는 대기 목록에서 빼서 무한 재시도를 막고,
+                    # 불완전한 데이터가 캐시되지 않도록 파일 전체의 캐시 저장을 건너뜀
+                    self.index.mark_sheet_indexed(file_path, sheet_name)
+                    failed_files.add(file_path)
+                    cache_cells.pop(file_path, None)
+                    cache_segments.pop(file_path, None)
+                    continue
+
+                if not completed:
+                    # 중단된 시트는 일부 행만 들어갔으므로 되돌려서 다음 워커가 처음부터 읽게 함
+                    self.index.remove_sheet(file_path, sheet_name)
+                    break
+
+                self.index.mark_sheet_indexed(file_path, sheet_name)
+                cache_headers.setdefault(file_path, {})[sheet_name] = meta.headers
+                if builder is not None:
+                    cache_segments.setdefault(file_path, {})[sheet_name] = builder.build()
+                done += 1
+                self.sheet_indexed.emit(file_path, sheet_name)
+                self._rebuild_bm25()
+
+                # 이 워커가 파일의 모든 시트를 인덱싱했으면 캐시에 저장
+                # (이전 워커가 처리한 시트가 섞인 파일은 데이터가 불완전하므로 저장하지 않음)
+                file_sheets = {k[1] for k in self.index.sheet_meta if k[0] == file_path}
+                if (self.cache and file_path not in failed_files
+                        and file_sheets == set(cache_headers[file_path])):
+                    cells = cache_cells.pop(file_path, {})
+                    if any(cells.values()):
+                        self._cache_sink.save_file_data(
+                            file_path, meta.file_name, cells,
+                            cache_headers.pop(file_path, {}),
+                            cache_segments.pop(file_path, None)
+                        )
+        finally:
+            if open_wb:
+                open_wb.close()
+
+        if not self._is_running:
+            logger.info("인덱싱 중단됨 (사용자 요청)")
+
+        self._finish()
+
+    def _index_sheet(self, meta: SheetMeta, workbook, cells_for_cache: list,
+                     builder: Optional[SegmentBuilder] = None) -> bool:
+        """
+        시트 하나를 읽어 인덱스에 추가합니다.
+        cells_for_cache에는 인덱서가 반환한 (row_idx, col_idx, value)가 누적됩니다.
+        중단 요청으로 끝까지 읽지 못한 경우 False를 반환합니다.
+        """
+        row_offset = 0
+        for chunk_info in self.scanner.read_sheet_chunks(
+            meta.file_path, meta.sheet_name, workbook=workbook
+        ):
+            if not self._is_running:
+                return False
+
+            df = chunk_info['data']
+            batch = self.index.add_dataframe(
+                meta.file_path, meta.file_name, meta.sheet_name, df, row_offset, builder
+            )
+            if self.cache:
+                cells_for_cache.extend(batch)
+
+            row_offset += len(df)
+        return True
+
+    def _next_sheet(self) -> Optional[Tuple[str, str]]:
+        """우선순위 요청을 반영하여 다음에 인덱싱할 시트를 꺼냅니다."""
+        with self._queue_lock:
+            # 가장 최근 요청부터 대기열에서 일치하는 시트를 찾음
+            while self._boosts:
+                boost_path, boost_sheet = self._boosts[-1]
+                for i, (fp, sheet) in enumerate(self._sheet_queue):
+                    if fp == boost_path and boost_sheet in (None, sheet):
+                        return self._sheet_queue.pop(i)
+                self._boosts.pop()
+            if self._sheet_queue:
+                return self._sheet_queue.pop(0)
+            return None
+
+    def prioritize(self, file_path: str, sheet_name: Optional[str] = None):
+        """
+        파일(또는 특정 시트)을 인덱싱 대기열의 맨 앞으로 이동합니다.
+        GUI 스레드에서 호출해도 안전합니다.
+        """
+        with self._queue_lock:
+            self._boosts.append((file_path, sheet_name))
+
+    def _rebuild_bm25(self, force: bool = False):
+        """
+        묶음(파일/시트) 처리 뒤 BM25를 다시 구축합니다.
+        검색 경로에서는 구축하지 않으므로, 인덱싱 중에는 일정 간격으로만 갱신하고 끝날 때 한 번 더 갱신합니다.
+        """
+        now = time.perf_counter()
+        interval = max(self.BM25_REBUILD_INTERVAL, self._bm25_cost * 4)
+        if not force and now - self._bm25_built_at < interval:
+            return
+        self.index.build_bm25()
+        self._bm25_built_at = time.perf_counter()
+        self._bm25_cost = self._bm25_built_at - now
+
+    def _finish(self):
+        """BM25 구축 후 완료 시그널을 방출합니다."""
         # BM25 인덱스 구축
         if self._is_running:
             self.progress_updated.emit("BM25 인덱스 구축 중...", 95)
-            self.index.build_bm25()
+            self._rebuild_bm25(force=True)
 
         self.progress_updated.emit("인덱싱 완료", 100)
         self.indexing_complete.emit(self.index.total_files, self.index.total_rows)
@@ -124,8 +362,38 @@ class IndexWorker(QThread):
             f"{self.index.total_rows}개 행, {self.index.total_cells}개 셀"
         )
 
-    def _restore_from_cache(self, cached: dict):
-        """캐시 데이터로부터 인덱스를 복원합니다."""
+    def _restore_from_cache(self, file_path: str) -> Optional[List[str]]:
+        """
+        캐시 데이터로부터 인덱스를 복원합니다.
+        메모리 맵 인덱스 → 세그먼트 → 셀 데이터 재인덱싱 순으로 시도합니다.
+
+        Returns:
+            복원한 시트명 목록. 캐시를 읽지 못하면 None.
+        """
+        # 메모리 맵 인덱스가 있으면 셀을 읽지 않고 매핑만 연결
+        mapped = self.cache.open_mapped_sheets(file_path)
+        if mapped:
+            for sheet in mapped['sheets']:
+                self.index.attach_mapped(file_path, mapped['file_name'], sheet)
+            return [sheet.sheet_name for sheet in mapped['sheets']]
+
+        stored = self.cache.load_sheet_segments(file_path)
+        if stored:
+            for sheet_name, sheet in stored['sheets'].items():
+                self.index.load_segment(
+                    file_path, stored['file_name'], sheet_name,
+                    sheet['headers'], sheet['cells'], sheet['segment']
+                )
+            return list(stored['sheets'].keys())
+
+        cached = self.cache.load_file_data(file_path)
+        if not cached:
+            return None
+        self._restore_cells(cached)
+        return list(cached['headers'].keys())
+
+    def _restore_cells(self, cached: dict):
+        """세그먼트가 없는 캐시의 셀 데이터를 DataFrame으로 재구성해 인덱싱합니다."""
         import pandas as pd
         from collections import defaultdict
 
@@ -161,47 +429,577 @@ class IndexWorker(QThread):
                     file_path, file_name, sheet_name, df, min_row
                 )
 
+    def _read_cells(self, file_path: str) -> Optional[Tuple[dict, dict]]:
+        """
+        파일 전체를 읽어 시트별 셀 목록과 헤더를 반환합니다 (행 번호는 시트마다 0부터).
+        중단 요청으로 끝까지 읽지 못하면 None.
+        """
+        cells = {}
+        headers = {}
+        row_offsets = {}
+        for chunk_info in self.scanner.read_file_chunks(file_path):
+            if not self._is_running:
+                return None
+            sheet_name = chunk_info['sheet_name']
+            df = chunk_info['data']
+            headers.setdefault(sheet_name, [str(c) for c in df.columns])
+            offset = row_offsets.get(sheet_name, 0)
+            cells.setdefault(sheet_name, []).extend(dataframe_cells(df, offset))
+            row_offsets[sheet_name] = offset + len(df)
+        return cells, headers
+
     def stop(self):
         """인덱싱 중단 요청"""
         self._is_running = False
 
 
-class SearchWorker(QThread):
+class SessionRestoreWorker(IndexWorker):
+    """
+    [v2.1.0] 지난 세션 복원 워커.
+    파일 목록 전체의 캐시 유효성을 한 번에 확인하고, 유효한 파일은 캐시에서 한 번에 복원한 뒤
+    변경되었거나 캐시가 없는 파일은 일반 인덱싱(IndexWorker)으로 이어서 처리합니다.
+    """
+
+    restore_finished = Signal(int, int, float)  # (복원 파일 수, 재인덱싱 대기 파일 수, 소요 시간(초))
+    files_missing = Signal(list)                # 디스크에 더 이상 없는 파일 경로 목록
+
+    def run(self):
+        """캐시 일괄 복원 후 남은 파일 인덱싱"""
+        start = time.perf_counter()
+        self.progress_updated.emit("지난 세션 확인 중...", 0)
+
+        if self.cache:
+            statuses = self.cache.validate_files(self.files)
+        else:
+            statuses = {f: None for f in self.files}
+
+        missing = [f for f in self.files if statuses[f] == FILE_MISSING]
+        if missing:
+            self.files_missing.emit(missing)
+
+        valid = [f for f in self.files if statuses[f] == FILE_VALID]
+        queued = [f for f in self.files if statuses[f] not in (FILE_VALID, FILE_MISSING)]
+        restored = 0
+
+        for i, file_path in enumerate(valid):
+            if not self._is_running:
+                break
+            if self.index.is_file_known(file_path):
+                continue
+
+            file_name = Path(file_path).name
+            self.progress_updated.emit(
+                f"세션 복원 중: {file_name}", int(i / max(len(valid), 1) * 50)
+            )
+            try:
+                sheet_names = self._restore_from_cache(file_path)
+            except Exception as e:
+                logger.error(f"세션 복원 실패: {file_name} — {e}", exc_info=True)
+                sheet_names = None
+
+            if sheet_names is None:
+                queued.append(file_path)
+                continue
+            restored += 1
+            self.metadata_ready.emit(file_path, sheet_names)
+            self._rebuild_bm25()
+
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"세션 복원: {restored}개 파일 ({elapsed:.2f}초), "
+            f"재인덱싱 대기 {len(queued)}개, 누락 {len(missing)}개"
+        )
+        self.restore_finished.emit(restored, len(queued), elapsed)
+
+        # 변경되었거나 캐시가 없는 파일은 일반 인덱싱으로 처리
+        self.files = queued
+        super().run()
+
+
+class FtsIndexWorker(IndexWorker):
+    """
+    [v2.1.0] FTS5 검색 백엔드용 인덱싱 워커.
+    셀을 메모리에 인덱싱하지 않고, 캐시가 없거나 변경된 파일만 읽어 캐시에 저장한 뒤
+    FtsSearchBackend.add_file()로 검색 대상에 추가합니다 (index는 FtsSearchBackend).
+    """
+
+    def run(self):
+        """캐시 확인/저장 후 검색 대상 등록"""
+        logger.info(f"FTS 인덱싱 시작: {len(self.files)}개 파일")
+        total = len(self.files)
+
+        for i, file_path in enumerate(self.files):
+            if not self._is_running:
+                logger.info("인덱싱 중단됨 (사용자 요청)")
+                break
+
+            file_name = Path(file_path).name
+            pct = int((i / max(total, 1)) * 100)
+            self.progress_updated.emit(f"인덱싱 중: {file_name}", pct)
+
+            if self.index.is_file_known(file_path):
+                continue
+
+            try:
+                if not self.cache.is_file_cached(file_path):
+                    if not self._cache_file(file_path, file_name):
+                        continue
+                sheet_names = self.index.add_file(file_path)
+                if sheet_names is not None:
+                    self.metadata_ready.emit(file_path, sheet_names)
+            except Exception as e:
+                err_msg = f"인덱싱 실패: {file_name} — {str(e)}"
+                logger.error(err_msg, exc_info=True)
+                self.error_occurred.emit(err_msg)
+
+        self._finish()
+
+    def _cache_file(self, file_path: str, file_name: str) -> bool:
+        """
+        파일을 읽어 셀 데이터를 캐시에 바로 저장합니다.
+        검색 테이블은 캐시의 셀 데이터로 구축하므로 기록 스레드를 거치지 않고 동기 저장합니다.
+        """
+        data = self._read_cells(file_path)
+        if data is None or not any(data[0].values()):
+            return False
+        self.cache.save_file_data(file_path, file_name, *data)
+        return True
+
+
+class ReindexWorker(IndexWorker):
+    """
+    [v2.1.0] 변경된 파일 재인덱싱 워커.
+    파일 감시기(FileWatcher)가 알린 파일만 다시 읽어, 인덱스에서 그 파일의 데이터를
+    replace_file()로 한 번에 교체하고 캐시 항목도 새 데이터로 갱신합니다.
+
+    캐시에 시트별 지문이 있으면 시트 단위로 처리합니다. .xlsx 시트 서명(ZIP CRC)이 같은 시트는
+    읽지 않고, 읽은 시트도 내용 해시가 같으면 토큰화/교체하지 않으므로
+    재인덱싱 시간이 실제로 바뀐 시트 크기에 비례합니다.
+    """
+
+    file_reindexed = Signal(str, list)  # (파일 경로, 시트명 목록)
+
+    def run(self):
+        """파일별 재인덱싱 후 BM25 갱신"""
+        logger.info(f"재인덱싱 시작: {len(self.files)}개 파일")
+        total = len(self.files)
+
+        for i, file_path in enumerate(self.files):
+            if not self._is_running:
+                logger.info("재인덱싱 중단됨 (사용자 요청)")
+                break
+
+            file_name = Path(file_path).name
+            self.progress_updated.emit(
+                f"변경된 파일 재인덱싱 중: {file_name}", int(i / max(total, 1) * 100)
+            )
+            try:
+                sheet_names = self._reindex_file(file_path, file_name)
+            except Exception as e:
+                err_msg = f"재인덱싱 실패: {file_name} — {str(e)}"
+                logger.error(err_msg, exc_info=True)
+                self.error_occurred.emit(err_msg)
+                continue
+
+            if sheet_names is not None:
+                logger.info(f"재인덱싱 완료: {file_name}")
+                self.file_reindexed.emit(file_path, sheet_names)
+                self._rebuild_bm25()
+
+        self._finish()
+
+    def _reindex_file(self, file_path: str, file_name: str) -> Optional[List[str]]:
+        """
+        파일을 다시 읽어 인덱스와 캐시를 갱신합니다.
+        토큰화는 락 밖에서 세그먼트로 끝내고, 인덱스 교체는 쓰기 락 한 번으로 수행합니다.
+        """
+        stored = self.cache.get_sheet_fingerprints(file_path) if self.cache else None
+        if stored:
+            return self._reindex_sheets(file_path, file_name, stored)
+
+        data = self._read_cells(file_path)
+        if data is None:
+            return None
+        cells, headers = data
+        segments = {name: build_segment(sheet_cells) for name, sheet_cells in cells.items()}
+        self.index.replace_file(file_path, file_name, {
+            name: (headers[name], cells[name], segments[name]) for name in cells
+        })
+        if self.cache:
+            self._cache_sink.save_file_data(file_path, file_name, cells, headers, segments)
+        return list(cells)
+
+    def _reindex_sheets(self, file_path: str, file_name: str,
+                        stored: dict) -> Optional[List[str]]:
+        """
+        시트 지문을 비교하여 바뀐 시트만 다시 읽고 교체합니다.
+        워크시트 파트와 공용 파트가 그대로인 시트는 열지 않고, 그 외 시트는 공유 문자열을 한 번만 풀어
+        시트 XML 값 해시를 비교한 뒤 값이 달라진 시트만 DataFrame으로 읽습니다.
+
+        Args:
+            stored: IndexCache.get_sheet_fingerprints() 결과 {시트명: (part_sig, shared_sig, content_hash)}
+        """
+        sigs = compute_sheet_signatures(file_path) or {}
+        if sigs:
+            sheet_names = list(sigs)
+        else:
+            sheet_names = [m['sheet_name'] for m in self.scanner.read_workbook_meta(file_path)]
+        shared_sig = compute_shared_signature(file_path) if sigs else None
+
+        kept, candidates = [], []
+        for sheet_name in sheet_names:
+            old = stored.get(sheet_name)
+            if (old and sigs.get(sheet_name) and old[0] == sigs[sheet_name]
+                    and shared_sig and old[1] == shared_sig):
+                kept.append(sheet_name)
+            else:
+                candidates.append(sheet_name)
+
+        # 파트가 바뀐 시트 또는 공유 문자열/스타일만 바뀐 경우: 값 해시가 같으면 읽지 않음
+        value_hashes = {}
+        if sigs:
+            value_hashes = compute_sheet_value_hashes(
+                file_path, [name for name in candidates if name in stored]
+            ) or {}
+        to_read = []
+        for sheet_name in candidates:
+            old = stored.get(sheet_name)
+            if old and value_hashes.get(sheet_name) == old[2]:
+                kept.append(sheet_name)
+            else:
+                to_read.append(sheet_name)
+
+        changed_cells, changed_headers = {}, {}
+        workbook = None
+        try:
+            for sheet_name in to_read:
+                if not self._is_running:
+                    return None
+                old = stored.get(sheet_name)
+                if workbook is None:
+                    workbook = self.scanner.open_workbook(file_path)
+                headers, cells = None, []
+                row_offset = 0
+                for chunk_info in self.scanner.read_sheet_chunks(
+                    file_path, sheet_name, workbook=workbook
+                ):
+                    if not self._is_running:
+                        return None
+                    df = chunk_info['data']
+                    if headers is None:
+                        headers = [str(c) for c in df.columns]
+                    cells.extend(dataframe_cells(df, row_offset))
+                    row_offset += len(df)
+                if headers is None:
+                    continue  # 빈 시트 (이전에 있었다면 삭제로 처리)
+                # 값 해시를 계산할 수 없는 형식(.xls)은 읽은 값으로 비교해 같으면 교체하지 않음
+                if old and old[2] == sheet_content_hash(headers, cells):
+                    kept.append(sheet_name)
+                    continue
+                changed_cells[sheet_name] = cells
+                changed_headers[sheet_name] = headers
+        finally:
+            if workbook is not None:
+                workbook.close()
+
+        removed = [name for name in stored if name not in kept and name not in changed_cells]
+        logger.info(
+            f"시트 단위 재인덱싱: {file_name} "
+            f"(변경 {len(changed_cells)}개, 유지 {len(kept)}개, 삭제 {len(removed)}개)"
+        )
+
+        segments = {name: build_segment(cells) for name, cells in changed_cells.items()}
+        if changed_cells or removed:
+            self.index.replace_sheets(file_path, file_name, {
+                name: (changed_headers[name], changed_cells[name], segments[name])
+                for name in changed_cells
+            }, removed)
+        # 바뀐 시트가 없어도 파일 상태와 시트 서명은 갱신해야 다음 검사에서 유효로 판단됨
+        self._cache_sink.save_file_data(
+            file_path, file_name, changed_cells, changed_headers, segments, keep=kept
+        )
+        return [name for name in sheet_names if name in kept or name in changed_cells]
+
+
+class FtsReindexWorker(ReindexWorker):
     """
-    [v2.0.0] 검색 워커.
-    다중 계층 검색을 백그라운드에서 수행합니다.
+    [v2.1.0] FTS5 검색 백엔드용 재인덱싱 워커.
+    캐시 항목을 새 데이터로 바로 덮어쓴 뒤 add_file()로 검색 테이블을 다시 구축해 연결합니다
+    (이미 검색 대상인 경로는 새 데이터로 교체됨).
     """
 
-    results_ready = Signal(list)    # List[SearchResult]
-    search_error = Signal(str)
-    search_time = Signal(float)     # 검색 소요 시간 (초)
+    def _reindex_file(self, file_path: str, file_name: str) -> Optional[List[str]]:
+        data = self._read_cells(file_path)
+        if data is None:
+            return None
+        self.cache.save_file_data(file_path, file_name, *data)
+        return self.index.add_file(file_path)
+
+
+class CacheMaintenanceWorker(QThread):
+    """
+    [v2.1.0] 캐시 정리 워커.
+    별도 DB 연결로 누락 파일 정리, 용량 한도 초과분 LRU 제거, 증분 VACUUM을 수행합니다.
+    """
 
-    def __init__(self, query_text: str, index: SearchIndex,
-                 min_similarity: float = 0.6):
+    maintenance_done = Signal(dict)  # IndexCache.run_maintenance() 결과
+
+    def __init__(self, db_path: str, max_bytes: int, protect: List[str] = None):
         super().__init__()
-        self.query_text = query_text
-        self.index = index
-        self.min_similarity = min_similarity
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.protect = protect or []
 
     def run(self):
-        """검색 수행"""
-        import time
+        """정리 수행"""
         start = time.perf_counter()
+        cache = IndexCache(self.db_path)
+        try:
+            result = cache.run_maintenance(self.max_bytes, self.protect)
+        except Exception as e:
+            logger.error(f"캐시 정리 실패: {e}", exc_info=True)
+            result = {}
+        finally:
+            cache.close()
+        logger.info(
+            f"캐시 정리 완료 ({time.perf_counter() - start:.2f}초): "
+            f"누락 {result.get('missing_files', 0)}개, 제거 {result.get('evicted', 0)}개"
+        )
+        self.maintenance_done.emit(result)
+
 
+class StartupWorker(QThread):
+    """
+    [v2.1.0] 시작 준비 워커.
+    창을 먼저 띄운 뒤 캐시 DB 열기(구버전 스키마 변환 포함)와 FTS 백엔드 준비를 백그라운드에서 하고,
+    준비가 끝나면 파일 읽기/검색/내보내기에 쓰는 무거운 모듈을 미리 import합니다.
+    """
+
+    backend_ready = Signal(object, object)  # (IndexCache, FtsSearchBackend 또는 None)
+    error_occurred = Signal(str)
+
+    # 미리 import하는 모듈 (첫 파일 추가/검색/내보내기가 import 시간만큼 늦어지지 않도록)
+    PRELOAD_MODULES = ('pandas', 'openpyxl', 'rank_bm25', 'rapidfuzz')
+
+    def __init__(self, use_fts: bool = False, db_path: Optional[str] = None):
+        super().__init__()
+        self.use_fts = use_fts
+        self.db_path = db_path
+        # 준비한 캐시/백엔드 (창이 받기 전에 종료되면 호출자가 닫음)
+        self.cache: Optional[IndexCache] = None
+        self.fts_backend: Optional[FtsSearchBackend] = None
+        self._is_running = True
+
+    def stop(self):
+        """미리 import 중단 요청 (진행 중인 모듈은 끝까지 불러옴)"""
+        self._is_running = False
+
+    def run(self):
+        start = time.perf_counter()
         try:
-            searcher = MultiLayerSearcher(self.index)
-            results = searcher.search(
-                self.query_text,
-                min_similarity=self.min_similarity
-            )
+            self.cache = IndexCache(self.db_path)
+            if self.use_fts:
+                self.fts_backend = FtsSearchBackend(self.cache.db_path)
+        except Exception as e:
+            logger.error(f"시작 준비 실패: {e}", exc_info=True)
+            self.error_occurred.emit(str(e))
+            return
+        logger.info(f"캐시 DB 준비 완료 ({time.perf_counter() - start:.2f}초)")
+        self.backend_ready.emit(self.cache, self.fts_backend)
+
+        start = time.perf_counter()
+        for name in self.PRELOAD_MODULES:
+            if not self._is_running:
+                return
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                pass
+        logger.info(f"모듈 미리 불러오기 완료 ({time.perf_counter() - start:.2f}초)")
+
+
+class SearchService(QThread):
+    """
+    [v2.1.0] 상주 검색 서비스.
+    키 입력마다 스레드와 검색기를 새로 만들지 않도록 하나의 스레드가 앱 수명 동안 요청을 처리합니다.
+    submit()은 가장 최근 요청 하나만 보관하므로, 검색 중에 들어온 여러 요청은 마지막 것만 실행되고
+    새 요청이 기다리는 동안 끝난 이전 검색의 결과는 버립니다.
+    검색기(MultiLayerSearcher)와 인덱스의 어휘 스냅샷은 요청 사이에 유지됩니다.
+
+    [v2.1.0] 결과 수 제한 없이 검색하고 최근 검색의 전체 순위(RankedResults)를 보관합니다.
+    첫 페이지는 results_ready로, 이후 페이지는 request_page() 요청에 따라 page_ready로 보냅니다.
+    snippet_context가 None이 아니면 화면용 페이지를 미리보기(스니펫) 결과로 만듭니다.
+    """
+
+    results_ready = Signal(list, bool)  # (첫 페이지 List[SearchResult], 부분 결과 여부)
+    ranking_ready = Signal(int, object) # (검색 번호, RankedResults) — results_ready 직전에 방출
+    page_ready = Signal(int, int, list) # (검색 번호, 페이지 시작 순위, List[SearchResult])
+    search_error = Signal(str)          # 검색 실패 (진행 중인 검색이 끝난 것으로 처리)
+    page_error = Signal(int, int, str)  # (검색 번호, 페이지 시작 순위, 오류) — 다음 페이지 실패
+    search_time = Signal(float)         # 검색 소요 시간 (초)
+
+    # 한 페이지 결과 수
+    PAGE_SIZE = 200
+
+    def __init__(self, index: SearchIndex, snippet_context: Optional[int] = None):
+        super().__init__()
+        self.index = index
+        self.snippet_context = snippet_context
+        self._searcher = MultiLayerSearcher(index)
+        self._cond = threading.Condition()
+        self._pending: Optional[Tuple[str, float]] = None
+        self._pending_pages: List[Tuple[int, int]] = []
+        self._is_running = True
+        # 최근 검색 번호와 전체 순위
+        self._query_id = 0
+        self._ranked: Optional[RankedResults] = None
+
+    def submit(self, query_text: str, min_similarity: float = 0.6):
+        """검색 요청을 등록합니다. 아직 시작하지 않은 이전 요청은 대체됩니다."""
+        with self._cond:
+            self._pending = (query_text, min_similarity)
+            self._cond.notify()
+
+    def request_page(self, query_id: int, offset: int):
+        """query_id 검색의 offset 순위부터 한 페이지를 요청합니다 (다른 검색이 끝났으면 무시)."""
+        with self._cond:
+            self._pending_pages.append((query_id, offset))
+            self._cond.notify()
+
+    def stop(self):
+        """서비스 종료 요청 (진행 중인 검색이 끝나면 스레드 종료)"""
+        with self._cond:
+            self._is_running = False
+            self._pending = None
+            self._cond.notify()
+
+    def run(self):
+        """요청 대기 → 최신 요청 검색 → 결과 방출을 반복"""
+        while True:
+            with self._cond:
+                while (self._pending is None and not self._pending_pages
+                       and self._is_running):
+                    self._cond.wait()
+                if not self._is_running:
+                    return
+                # 새 검색이 있으면 이전 검색의 페이지 요청보다 먼저 처리
+                if self._pending is None:
+                    page_request = self._pending_pages.pop(0)
+                    query_text = None
+                else:
+                    query_text, min_similarity = self._pending
+                    self._pending = None
+                    self._pending_pages.clear()
+
+            if query_text is None:
+                self._serve_page(*page_request)
+                continue
+
+            start = time.perf_counter()
+            try:
+                # 검색 시작 시점에 대기 시트가 있으면 부분 결과로 표시
+                partial = self.index.is_partial
+                ranked = self._searcher.search(
+                    query_text, min_similarity=min_similarity, max_results=None
+                )
+                results = ranked.page(0, self.PAGE_SIZE, self.snippet_context)
+            except Exception as e:
+                logger.error(f"검색 오류: {e}", exc_info=True)
+                self.search_error.emit(str(e))
+                continue
             elapsed = time.perf_counter() - start
 
-            self.results_ready.emit(results)
+            # 검색하는 동안 새 요청이 들어왔으면 이 결과는 이미 낡았으므로 버림
+            with self._cond:
+                superseded = self._pending is not None
+            if superseded:
+                logger.debug(f"이전 검색 결과 폐기: '{query_text}'")
+                continue
+
+            self._query_id += 1
+            self._ranked = ranked
+            self.ranking_ready.emit(self._query_id, ranked)
+            self.results_ready.emit(results, partial)
             self.search_time.emit(elapsed)
+            logger.info(f"검색 완료: '{query_text}' → {len(ranked)}건 ({elapsed:.3f}초)")
+
+    def _serve_page(self, query_id: int, offset: int):
+        """최근 검색의 한 페이지를 만들어 보냅니다."""
+        if query_id != self._query_id or self._ranked is None:
+            return
+        try:
+            results = self._ranked.page(offset, self.PAGE_SIZE, self.snippet_context)
+        except Exception as e:
+            logger.error(f"결과 페이지 오류: {e}", exc_info=True)
+            self.page_error.emit(query_id, offset, str(e))
+            return
+        self.page_ready.emit(query_id, offset, results)
 
-            logger.info(
-                f"검색 완료: '{self.query_text}' → {len(results)}건 ({elapsed:.3f}초)"
+
+class ExportWorker(QThread):
+    """
+    [v2.1.0] 검색 결과 내보내기 워커.
+    결과(List 또는 RankedResults)를 백그라운드에서 한 행씩 파일에 스트리밍합니다.
+    stop()으로 취소하면 쓰던 파일을 삭제하고 export_cancelled를 방출합니다.
+    """
+
+    progress_updated = Signal(str, int)  # (메시지, 백분율)
+    export_complete = Signal(str, int)   # (파일 경로, 쓴 행 수)
+    export_cancelled = Signal(str)       # 파일 경로
+    error_occurred = Signal(str)
+
+    def __init__(self, results, file_path: str):
+        super().__init__()
+        self.results = results
+        self.file_path = file_path
+        self._is_running = True
+
+    def stop(self):
+        """내보내기 취소 요청"""
+        self._is_running = False
+
+    def run(self):
+        try:
+            written = ResultExporter.export_results(
+                self.results, self.file_path,
+                progress=self._on_progress,
+                should_stop=lambda: not self._is_running
             )
+        except ExportCancelled:
+            self.export_cancelled.emit(self.file_path)
+            return
+        except Exception as e:
+            logger.error(f"내보내기 실패: {self.file_path} — {e}", exc_info=True)
+            self.error_occurred.emit(str(e))
+            return
+        self.export_complete.emit(self.file_path, written)
+
+    def _on_progress(self, written: int, total: int):
+        pct = int(written * 100 / total) if total else 100
+        self.progress_updated.emit(f"내보내는 중... {written:,}/{total:,}건", min(pct, 100))
+
+
+class ClipboardWorker(QThread):
+    """
+    [v2.1.0] 클립보드 복사 워커.
+    선택한 결과의 TSV 생성과 시스템 클립보드 복사를 백그라운드에서 수행하여
+    많은 행을 복사할 때 창이 멈추지 않게 합니다.
+    """
+
+    copy_done = Signal(int, bool)  # (복사한 행 수, 성공 여부)
+
+    def __init__(self, results):
+        super().__init__()
+        self.results = results
+
+    def run(self):
+        try:
+            text, count = ClipboardManager.format_results(self.results)
         except Exception as e:
-            logger.error(f"검색 오류: {e}", exc_info=True)
-            self.search_error.emit(str(e))
+            logger.error(f"클립보드 데이터 생성 실패: {e}", exc_info=True)
+            self.copy_done.emit(0, False)
+            return
+        if count == 0:
+            self.copy_done.emit(0, True)
+            return
+        self.copy_done.emit(count, ClipboardManager.copy_to_clipboard(text))
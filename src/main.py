@@ -1,9 +1,17 @@
 """
 [v2.0.0] Data Scavenger 진입점
 앱을 초기화하고 메인 윈도우를 표시합니다.
+
+[v2.1.0] 창을 띄우는 데 필요한 모듈만 먼저 import합니다. pandas/openpyxl 등은 처음 쓸 때 불러오고,
+캐시 DB는 창이 표시된 뒤 백그라운드에서 엽니다 (MainWindow 참고).
+import 시간 보고서: python benchmarks/bench_startup.py
 """
 
 import sys
+import time
+
+_START = time.perf_counter()
+
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QFont
 from src.ui.main_window import MainWindow
@@ -25,6 +33,7 @@ def main():
     # 메인 윈도우 생성 및 표시
     window = MainWindow()
     window.show()
+    logger.info(f"창 표시 ({time.perf_counter() - _START:.2f}초)")
 
     exit_code = app.exec()
     logger.info(f"앱 종료 (코드: {exit_code})")
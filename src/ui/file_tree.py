@@ -2,20 +2,120 @@
 [v2.0.0] 파일 트리 패널
 좌측 사이드바에 파일/시트 트리를 표시하고, 즐겨찾기(파일 세트) 관리를 제공합니다.
 파일 추가/제거, 드래그&드롭, 즐겨찾기 저장/로드를 지원합니다.
+
+[v2.1.0] 트리는 FileTreeModel(QStandardItemModel) + QTreeView로 표시합니다.
+파일 추가/제거/시트 갱신은 해당 행만 삽입·삭제하며 트리 전체를 다시 만들지 않습니다.
 """
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QTreeWidget, QTreeWidgetItem, QFileDialog, QMenu,
+    QTreeView, QFileDialog, QMenu, QAbstractItemView,
     QInputDialog, QComboBox, QFrame, QMessageBox
 )
-from PySide6.QtCore import Signal, Qt, QUrl
-from PySide6.QtGui import QAction
+from PySide6.QtCore import Signal, Qt, QUrl, QModelIndex, QPersistentModelIndex
+from PySide6.QtGui import QAction, QStandardItem, QStandardItemModel
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional
 from src.core.scanner import FileScanner
 from src.utils.config import ConfigManager
 
 
+def _file_item(file_path: str, name: str) -> QStandardItem:
+    item = QStandardItem(f"📄 {name}")
+    item.setData(file_path, Qt.UserRole)
+    item.setToolTip(file_path)
+    item.setEditable(False)
+    return item
+
+
+def _sheet_item(file_path: str, sheet_name: str) -> QStandardItem:
+    item = QStandardItem(f"  └ {sheet_name}")
+    item.setData(f"{file_path}::{sheet_name}", Qt.UserRole)
+    item.setEditable(False)
+    return item
+
+
+class FileTreeModel(QStandardItemModel):
+    """
+    [v2.1.0] 파일/시트 트리 모델.
+    파일 경로 → 파일 행 위치(QPersistentModelIndex)를 보관하여 추가/제거/시트 갱신을 해당 행에만 적용합니다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: Dict[str, QPersistentModelIndex] = {}
+
+    def file_index(self, file_path: str) -> QModelIndex:
+        row = self._rows.get(file_path)
+        return QModelIndex(row) if row is not None and row.isValid() else QModelIndex()
+
+    def _item(self, file_path: str) -> Optional[QStandardItem]:
+        index = self.file_index(file_path)
+        return self.itemFromIndex(index) if index.isValid() else None
+
+    def add_files(self, files: Iterable[tuple]):
+        """(파일 경로, 표시 이름) 목록을 끝에 한 번에 추가합니다."""
+        files = list(files)
+        if not files:
+            return
+        start = self.rowCount()
+        self.invisibleRootItem().appendRows([_file_item(fp, name) for fp, name in files])
+        for i, (file_path, _) in enumerate(files):
+            self._rows[file_path] = QPersistentModelIndex(self.index(start + i, 0))
+
+    def remove_file(self, file_path: str) -> bool:
+        return self.remove_files([file_path]) > 0
+
+    def remove_files(self, file_paths: Iterable[str]) -> int:
+        """파일 행을 제거합니다. 연속한 행은 한 번에 제거하며, 제거한 행 수를 반환합니다."""
+        rows = []
+        for fp in file_paths:
+            row = self._rows.pop(fp, None)
+            if row is not None and row.isValid():
+                rows.append(row.row())
+        # 뒤쪽 구간부터 제거해야 앞쪽 행 번호가 바뀌지 않음
+        rows.sort(reverse=True)
+        i = 0
+        while i < len(rows):
+            last = rows[i]
+            first = last
+            while i + 1 < len(rows) and rows[i + 1] == first - 1:
+                i += 1
+                first = rows[i]
+            self.removeRows(first, last - first + 1)
+            i += 1
+        return len(rows)
+
+    def clear_files(self):
+        self._rows.clear()
+        self.removeRows(0, self.rowCount())
+
+    def sheet_names(self, file_path: str) -> List[str]:
+        item = self._item(file_path)
+        if item is None:
+            return []
+        return [str(item.child(i).data(Qt.UserRole)).split('::', 1)[1]
+                for i in range(item.rowCount())]
+
+    def set_sheets(self, file_path: str, sheets: List[str]) -> bool:
+        """
+        파일의 시트 행을 주어진 목록과 같게 맞춥니다.
+        기존 목록 뒤에 시트가 붙은 경우(지연 인덱싱)는 새 시트만 추가합니다.
+        바뀐 것이 있으면 True.
+        """
+        item = self._item(file_path)
+        if item is None:
+            return False
+        current = self.sheet_names(file_path)
+        if current == list(sheets):
+            return False
+        if sheets[:len(current)] != current:
+            item.removeRows(0, item.rowCount())
+            current = []
+        item.appendRows([_sheet_item(file_path, s) for s in sheets[len(current):]])
+        return True
+
+
 class FileTreePanel(QWidget):
     """
     [v2.0.0] 파일 트리 사이드바.
@@ -27,11 +127,14 @@ class FileTreePanel(QWidget):
 
     files_changed = Signal(list)      # 현재 파일 목록 변경 시
     file_removed = Signal(str)        # 개별 파일 제거 시
+    sheet_prioritized = Signal(str, str)  # 펼치거나 클릭한 (파일, 시트) — 시트가 ''면 파일 전체
+    folder_added = Signal(str)        # 폴더 단위로 추가 시 (새 파일 감시용)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAcceptDrops(True)
         self._files = {}  # file_path → {name, sheets}
+        self._model = FileTreeModel(self)
         self._scanner = FileScanner()
         self._setup_ui()
         self._load_favorites()
@@ -48,10 +151,15 @@ class FileTreePanel(QWidget):
         layout.addWidget(header)
 
         # 파일 트리
-        self.tree = QTreeWidget()
+        self.tree = QTreeView()
+        self.tree.setModel(self._model)
         self.tree.setHeaderHidden(True)
+        self.tree.setUniformRowHeights(True)
+        self.tree.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.tree.customContextMenuRequested.connect(self._on_context_menu)
+        self.tree.expanded.connect(self._on_item_activated)
+        self.tree.clicked.connect(self._on_item_activated)
         self.tree.setMinimumWidth(200)
         layout.addWidget(self.tree, 1)
 
@@ -122,46 +230,69 @@ class FileTreePanel(QWidget):
             if fp not in self._files:
                 name = Path(fp).name
                 self._files[fp] = {'name': name, 'sheets': []}
-                new_files.append(fp)
+                new_files.append((fp, name))
 
         if new_files:
-            self._refresh_tree()
+            self._model.add_files(new_files)
             self.files_changed.emit(list(self._files.keys()))
 
     def remove_file(self, file_path: str):
         """파일을 목록에서 제거합니다."""
         if file_path in self._files:
             del self._files[file_path]
-            self._refresh_tree()
+            self._model.remove_file(file_path)
             self.file_removed.emit(file_path)
             self.files_changed.emit(list(self._files.keys()))
 
+    def remove_files(self, file_paths: list):
+        """여러 파일을 한 번에 제거합니다 (목록 변경 알림은 한 번)."""
+        removed = [fp for fp in file_paths if fp in self._files]
+        if not removed:
+            return
+        for fp in removed:
+            del self._files[fp]
+        self._model.remove_files(removed)
+        for fp in removed:
+            self.file_removed.emit(fp)
+        self.files_changed.emit(list(self._files.keys()))
+
     def update_sheets(self, file_path: str, sheets: list):
         """파일의 시트 목록을 업데이트합니다 (인덱싱 완료 후)."""
-        if file_path in self._files:
-            self._files[file_path]['sheets'] = sheets
-            self._refresh_tree()
+        self.update_sheets_batch({file_path: sheets})
+
+    def update_sheets_batch(self, sheets_by_file: Dict[str, list]):
+        """여러 파일의 시트 목록을 한 번에 업데이트합니다 (화면 갱신은 마지막에 한 번)."""
+        changed = []
+        self.tree.setUpdatesEnabled(False)
+        try:
+            for file_path, sheets in sheets_by_file.items():
+                if file_path not in self._files:
+                    continue
+                self._files[file_path]['sheets'] = list(sheets)
+                if self._model.set_sheets(file_path, list(sheets)):
+                    changed.append(file_path)
+            self._expand_files(changed)
+        finally:
+            self.tree.setUpdatesEnabled(True)
+
+    def get_sheets(self, file_path: str) -> list:
+        """파일의 현재 시트 목록 (등록되지 않은 파일은 빈 목록)"""
+        return list(self._files.get(file_path, {}).get('sheets', []))
 
     def get_all_files(self) -> list:
         """현재 등록된 모든 파일 경로를 반환합니다."""
         return list(self._files.keys())
 
-    def _refresh_tree(self):
-        """트리 위젯을 재구성합니다."""
-        self.tree.clear()
-        for fp, info in self._files.items():
-            file_item = QTreeWidgetItem([f"📄 {info['name']}"])
-            file_item.setData(0, Qt.UserRole, fp)
-            file_item.setToolTip(0, fp)
-
-            for sheet_name in info.get('sheets', []):
-                sheet_item = QTreeWidgetItem([f"  └ {sheet_name}"])
-                sheet_item.setData(0, Qt.UserRole, f"{fp}::{sheet_name}")
-                file_item.addChild(sheet_item)
-
-            self.tree.addTopLevelItem(file_item)
-
-        self.tree.expandAll()
+    def _expand_files(self, file_paths: List[str]):
+        """시트가 표시되도록 파일 행을 펼칩니다 (코드로 펼친 것은 우선순위 요청으로 보내지 않음)."""
+        blocked = self.tree.blockSignals(True)
+        try:
+            for fp in file_paths:
+                index = self._model.file_index(fp)
+                if index.isValid():
+                    self.tree.expand(index)
+        finally:
+            self.tree.blockSignals(blocked)
 
     # ─── 이벤트 핸들러 ───
 
@@ -182,20 +313,30 @@ class FileTreePanel(QWidget):
             found = self._scanner.get_supported_files([folder])
             if found:
                 self.add_files(found)
+            self.folder_added.emit(folder)
 
     def _on_clear_all(self):
         """모든 파일 제거"""
         self._files.clear()
-        self._refresh_tree()
+        self._model.clear_files()
         self.files_changed.emit([])
 
+    def _on_item_activated(self, index: QModelIndex):
+        """펼치거나 클릭한 파일/시트를 인덱싱 우선순위 요청으로 전달"""
+        data = str(index.data(Qt.UserRole))
+        if '::' in data:
+            file_path, sheet_name = data.split('::', 1)
+            self.sheet_prioritized.emit(file_path, sheet_name)
+        else:
+            self.sheet_prioritized.emit(data, '')
+
     def _on_context_menu(self, pos):
         """트리 아이템 우클릭 메뉴"""
-        item = self.tree.itemAt(pos)
-        if item is None:
+        index = self.tree.indexAt(pos)
+        if not index.isValid():
             return
 
-        file_path = item.data(0, Qt.UserRole)
+        file_path = index.data(Qt.UserRole)
         if '::' in str(file_path):
             return  # 시트 아이템은 메뉴 미제공
 
@@ -232,6 +373,9 @@ class FileTreePanel(QWidget):
         if all_files:
             self.add_files(all_files)
             event.acceptProposedAction()
+        for p in paths:
+            if Path(p).is_dir():
+                self.folder_added.emit(p)
 
     # ─── 즐겨찾기 (파일 세트 저장/복원) ───
 
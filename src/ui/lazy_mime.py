@@ -0,0 +1,54 @@
+"""
+[v2.1.0] 지연 클립보드 데이터
+많은 결과를 복사할 때 TSV를 바로 만들지 않고, 붙여넣기로 데이터를 요청받는 시점에 만듭니다.
+Qt가 클립보드 요청마다 retrieveData()를 호출하므로 복사 자체는 즉시 끝납니다.
+"""
+
+from typing import Optional
+
+from PySide6.QtCore import QMimeData
+
+from src.utils.clipboard_manager import ClipboardManager
+
+# 지연 복사로 전환하는 선택 행 수
+LAZY_COPY_ROWS = 20_000
+
+TEXT_PLAIN = 'text/plain'
+
+
+class LazyResultMimeData(QMimeData):
+    """
+    [v2.1.0] 붙여넣을 때 TSV를 만드는 클립보드 데이터.
+    한 번 만든 텍스트는 보관하여 여러 번 붙여넣어도 다시 만들지 않습니다.
+    """
+
+    def __init__(self, results):
+        super().__init__()
+        self._results = results
+        self._text: Optional[str] = None
+
+    @property
+    def rendered(self) -> bool:
+        return self._text is not None
+
+    def formats(self):
+        return [TEXT_PLAIN]
+
+    def hasFormat(self, mime_type: str) -> bool:
+        return mime_type == TEXT_PLAIN
+
+    def render(self) -> str:
+        """
+        아직 만들지 않았다면 지금 TSV를 만듭니다.
+        결과가 인덱스/FTS 백엔드를 읽으므로, 백엔드를 닫기 전(앱 종료 시)에도 호출합니다.
+        """
+        if self._text is None:
+            self._text, _ = ClipboardManager.format_results(self._results)
+            # 만든 뒤에는 결과 참조를 놓아 인덱스/행 데이터를 붙잡지 않음
+            self._results = None
+        return self._text
+
+    def retrieveData(self, mime_type: str, preferred_type):
+        if mime_type != TEXT_PLAIN:
+            return None
+        return self.render()
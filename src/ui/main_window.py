@@ -2,6 +2,10 @@
 [v2.0.0] 메인 윈도우
 검색창, 파일 트리, 결과 패널을 조합하여 앱의 전체 레이아웃을 구성합니다.
 인덱싱/검색 워커 관리, 테마 전환, 설정 저장/로드를 담당합니다.
+
+[v2.1.0] 시작은 단계적으로 진행합니다. 창(UI)을 먼저 띄우고, 캐시 DB 열기와 FTS 백엔드 준비는
+StartupWorker가 백그라운드에서 한 뒤 검색 서비스 시작 → 지난 세션 복원 순으로 이어집니다.
+준비 전에 추가된 파일은 준비가 끝나면 인덱싱합니다.
 """
 
 from PySide6.QtWidgets import (
@@ -9,22 +13,32 @@ from PySide6.QtWidgets import (
     QSplitter, QStatusBar, QLabel, QProgressBar,
     QPushButton, QFileDialog, QApplication
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QTimer
 from PySide6.QtGui import QAction
 from pathlib import Path
+from typing import Optional
 
 from src.ui.search_bar import SearchBar
 from src.ui.file_tree import FileTreePanel
 from src.ui.result_cards import ResultPanel
 from src.ui.styles import AppStyle, get_dark_stylesheet, get_light_stylesheet
 from src.ui.toast import ToastMessage
+from src.ui.lazy_mime import LAZY_COPY_ROWS, LazyResultMimeData
 from src.core.indexer import SearchIndex
 from src.core.scanner import FileScanner
-from src.core.workers import IndexWorker, SearchWorker
+from src.core.workers import (
+    IndexWorker, SearchService, SessionRestoreWorker, CacheMaintenanceWorker,
+    FtsIndexWorker, ReindexWorker, FtsReindexWorker, ExportWorker, ClipboardWorker,
+    StartupWorker
+)
+from src.core.file_watcher import FileWatcher
 from src.core.cache import IndexCache
+from src.core.search_backend import BACKEND_FTS
+from src.core.fts_backend import is_fts5_available
+from src.core.cache_writer import CacheWriter
+from src.core.searcher import load_full_rows
+from src.core.snippet import SNIPPET_CONTEXT
 from src.utils.config import ConfigManager
-from src.utils.clipboard_manager import ClipboardManager
-from src.utils.exporter import ResultExporter
 from src.utils.logger import logger
 
 
@@ -34,23 +48,59 @@ class MainWindow(QMainWindow):
     좌측 파일 트리 + 우측 검색/결과 영역의 2-패널 레이아웃.
     """
 
+    # 캐시 정리 주기 (ms)
+    CACHE_MAINTENANCE_DELAY_MS = 15_000
+    CACHE_MAINTENANCE_INTERVAL_MS = 30 * 60 * 1000
+    # 유사도 슬라이더를 끄는 동안의 재검색 간격 (ms)
+    SIMILARITY_THROTTLE_MS = 100
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Data Scavenger v2.0")
         self.setMinimumSize(QSize(1000, 650))
         self.resize(1200, 750)
 
-        # 코어 컴포넌트 초기화
-        self.search_index = SearchIndex()
-        self.cache = IndexCache()
+        # 캐시 DB/캐시 기록 스레드/검색 서비스는 창을 띄운 뒤 준비됨 (_on_backend_ready)
+        self.cache = None
+        self.cache_writer = None
+        self._search_service = None
+        self._backend_ready = False
+        # 준비 전에 바뀐 파일 목록 (준비되면 인덱싱)
+        self._startup_files = None
         self._is_dark = True
         self._recent_keywords = []
         self._index_worker = None
-        self._search_worker = None
+        self._maintenance_worker = None
+        # 변경 감지된 파일 재인덱싱 (인덱싱 워커가 끝난 뒤 순서대로 처리)
+        self._reindex_worker = None
+        self._reindex_pending = []
+        self._export_worker = None
+        self._clipboard_worker = None
 
         # 설정 로드
         self._load_config()
 
+        # 검색 백엔드: 메모리 인덱스(기본) 또는 캐시 DB의 FTS5 인덱스 (RAM보다 큰 데이터용)
+        self._use_fts = self._search_backend == BACKEND_FTS and is_fts5_available()
+        if self._search_backend == BACKEND_FTS and not self._use_fts:
+            logger.warning("SQLite FTS5 trigram 미지원 — 메모리 인덱스 사용")
+        # FTS 백엔드는 캐시 DB를 연 뒤 교체 (그 전까지는 빈 메모리 인덱스)
+        self.search_index = SearchIndex()
+
+        # 최근 검색의 번호/전체 순위와 다음 페이지 시작 순위
+        self._query_id = 0
+        self._ranked = None
+        self._next_page_offset = 0
+
+        # 추가된 파일/폴더 감시 (변경된 파일만 재인덱싱)
+        self.file_watcher = FileWatcher(self)
+
+        # 유사도 슬라이더 드래그 중 재검색 스로틀 (놓으면 바로 재검색)
+        self._similarity_timer = QTimer(self)
+        self._similarity_timer.setSingleShot(True)
+        self._similarity_timer.setInterval(self.SIMILARITY_THROTTLE_MS)
+        self._similarity_timer.timeout.connect(self._research_similarity)
+
         # UI 구성
         self._setup_ui()
         self._setup_statusbar()
@@ -59,8 +109,80 @@ class MainWindow(QMainWindow):
         # 테마 적용
         self._apply_theme()
 
+        # 캐시 정리 타이머 (캐시 DB가 준비되면 시작)
+        self._maintenance_timer = QTimer(self)
+        self._maintenance_timer.setInterval(self.CACHE_MAINTENANCE_INTERVAL_MS)
+        self._maintenance_timer.timeout.connect(self._run_cache_maintenance)
+
+        # 캐시 DB 열기/FTS 백엔드 준비는 백그라운드에서
+        self.status_label.setText("시작 준비 중...")
+        self._startup_worker = StartupWorker(self._use_fts)
+        self._startup_worker.backend_ready.connect(self._on_backend_ready)
+        self._startup_worker.error_occurred.connect(self._on_startup_error)
+        self._startup_worker.start()
+
         logger.info("MainWindow 초기화 완료 (v2.0.0)")
 
+    # ─── 시작 준비 ───
+
+    def _on_backend_ready(self, cache: Optional[IndexCache], fts_backend):
+        """
+        캐시 DB가 열리면 캐시 기록 스레드와 검색 서비스를 시작하고 지난 세션을 복원합니다.
+        cache가 None이면(시작 준비 실패) 캐시 없이 메모리 인덱스로만 동작합니다.
+        """
+        self.cache = cache
+        if cache is not None:
+            # 캐시 저장은 전용 스레드에서 일괄 커밋 (인덱싱 경로에서 디스크 쓰기 제거)
+            self.cache_writer = CacheWriter(cache.db_path)
+            self.cache_writer.start()
+        if fts_backend is not None:
+            self.search_index = fts_backend
+        self._start_search_service()
+        self._backend_ready = True
+        self.status_label.setText("준비됨")
+
+        # 캐시 정리: 시작 직후 부하를 피해 잠시 뒤 1회, 이후 주기적으로
+        if cache is not None:
+            self._update_cache_stats()
+            self._maintenance_timer.start()
+            QTimer.singleShot(self.CACHE_MAINTENANCE_DELAY_MS, self._run_cache_maintenance)
+
+        # 준비 중에 추가된 파일이 있으면 그 목록을, 없으면 지난 세션을 인덱싱
+        if self._startup_files is not None:
+            file_paths, self._startup_files = self._startup_files, None
+            self._on_files_changed(file_paths)
+        elif self._restore_last_session:
+            self._restore_session()
+
+    def _on_startup_error(self, msg: str):
+        """
+        캐시 DB 또는 FTS 백엔드를 열지 못하면 메모리 인덱스로 대체하여 계속 진행합니다.
+        (FTS 백엔드만 실패했다면 이미 열린 캐시는 그대로 사용)
+        """
+        self._use_fts = False
+        self.search_index = SearchIndex()
+        self._on_backend_ready(self._startup_worker.cache, None)
+        if self.cache is None:
+            self.status_label.setText(f"캐시 없이 실행 중 (캐시 DB를 열지 못했습니다: {msg})")
+        else:
+            self.status_label.setText(f"메모리 인덱스로 실행 중 (FTS 백엔드 준비 실패: {msg})")
+        self.show_toast(f"⚠️ 시작 준비 실패: {msg}", duration=5000)
+
+    def _start_search_service(self):
+        """상주 검색 스레드를 시작합니다 (키 입력마다 스레드/검색기를 새로 만들지 않음)."""
+        # 넓은 시트의 결과는 매칭 주변 컬럼만 담은 미리보기로 받음 (전체 행은 펼칠 때 읽음)
+        self._search_service = SearchService(
+            self.search_index,
+            snippet_context=SNIPPET_CONTEXT if self._result_preview else None
+        )
+        self._search_service.ranking_ready.connect(self._on_ranking)
+        self._search_service.results_ready.connect(self._on_results)
+        self._search_service.page_ready.connect(self._on_page)
+        self._search_service.search_error.connect(self._on_search_error)
+        self._search_service.page_error.connect(self._on_page_error)
+        self._search_service.search_time.connect(self._on_search_time)
+        self._search_service.start()
+
     def _setup_ui(self):
         """UI 레이아웃 구성"""
         central = QWidget()
@@ -100,6 +222,7 @@ class MainWindow(QMainWindow):
 
         # 우측 패널
         self.result_panel = ResultPanel()
+        self.result_panel.set_row_loader(self._load_full_rows)
         self.splitter.addWidget(self.result_panel)
 
         # 스플리터 비율 (좌:우 = 1:3)
@@ -120,6 +243,22 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         self.statusBar().addPermanentWidget(self.progress_bar)
 
+        # 내보내기 진행률/취소 (인덱싱 진행률과 별도)
+        self.export_progress = QProgressBar()
+        self.export_progress.setMaximumWidth(150)
+        self.export_progress.setMaximumHeight(12)
+        self.export_progress.setVisible(False)
+        self.statusBar().addPermanentWidget(self.export_progress)
+
+        self.btn_cancel_export = QPushButton("내보내기 취소")
+        self.btn_cancel_export.setVisible(False)
+        self.btn_cancel_export.clicked.connect(self._on_cancel_export)
+        self.statusBar().addPermanentWidget(self.btn_cancel_export)
+
+        self.cache_label = QLabel()
+        self.cache_label.setObjectName("subtextLabel")
+        self.statusBar().addPermanentWidget(self.cache_label)
+
     def _connect_signals(self):
         """시그널-슬롯 연결"""
         # 검색
@@ -128,45 +267,126 @@ class MainWindow(QMainWindow):
         # 파일 트리
         self.file_tree.files_changed.connect(self._on_files_changed)
         self.file_tree.file_removed.connect(self._on_file_removed)
+        self.file_tree.sheet_prioritized.connect(self._on_sheet_prioritized)
+        self.file_tree.folder_added.connect(self._on_folder_added)
+
+        # 파일 감시
+        if self._watch_files:
+            self.file_watcher.files_changed.connect(self._on_watched_files_changed)
+            self.file_watcher.files_removed.connect(self._on_watched_files_removed)
+            self.file_watcher.files_added.connect(self.file_tree.add_files)
 
         # 결과 패널
         self.result_panel.copy_requested.connect(self._on_copy)
         self.result_panel.export_requested.connect(self._on_export)
+        self.result_panel.more_requested.connect(self._on_more_results)
 
         # 유사도 슬라이더 변경 시 재검색
         self.result_panel.sim_slider.valueChanged.connect(self._on_similarity_changed)
+        self.result_panel.sim_slider.sliderReleased.connect(self._on_similarity_released)
 
     # ─── 인덱싱 ───
 
     def _on_files_changed(self, file_paths: list):
         """파일 목록 변경 시 인덱싱 시작"""
+        if self._watch_files:
+            self.file_watcher.set_files(file_paths)
+            if not file_paths:
+                self.file_watcher.clear()
+
         if not file_paths:
             self.search_index.clear()
             self.search_bar.update_stats(0, 0)
             self.status_label.setText("파일이 제거되었습니다")
             return
 
+        if not self._backend_ready:
+            # 캐시 DB를 여는 중 — 준비되면 최신 목록으로 인덱싱
+            self._startup_files = file_paths
+            return
+
         # 기존 인덱싱 중단
         if self._index_worker and self._index_worker.isRunning():
             self._index_worker.stop()
             self._index_worker.wait()
 
-        # 새 파일만 필터링 (이미 인덱싱된 파일 제외)
+        # 새 파일만 필터링 (이미 인덱싱되었거나 메타데이터가 등록된 파일 제외)
         new_files = [
             f for f in file_paths
-            if f not in self.search_index.indexed_files
+            if not self.search_index.is_file_known(f)
         ]
 
-        if not new_files:
+        # 중단된 워커가 남긴 대기 시트가 있으면 새 파일이 없어도 이어서 인덱싱
+        if not new_files and not self.search_index.is_partial:
             return
 
         # 인덱싱 워커 시작
-        self._index_worker = IndexWorker(new_files, self.search_index, self.cache)
-        self._index_worker.progress_updated.connect(self._on_index_progress)
-        self._index_worker.indexing_complete.connect(self._on_index_complete)
-        self._index_worker.error_occurred.connect(self._on_index_error)
+        if self._use_fts:
+            self._start_index_worker(FtsIndexWorker(new_files, self.search_index, self.cache))
+            return
+        self._start_index_worker(IndexWorker(
+            new_files, self.search_index, self.cache, lazy=self._lazy_indexing,
+            cache_writer=self.cache_writer
+        ))
+
+    def _start_index_worker(self, worker: IndexWorker):
+        """인덱싱 워커의 시그널을 연결하고 시작합니다."""
+        self._index_worker = worker
+        worker.progress_updated.connect(self._on_index_progress)
+        worker.indexing_complete.connect(self._on_index_complete)
+        worker.error_occurred.connect(self._on_index_error)
+        worker.metadata_ready.connect(self._on_metadata_ready)
         self.progress_bar.setVisible(True)
-        self._index_worker.start()
+        worker.start()
+
+    def _restore_session(self):
+        """지난 세션의 파일 목록을 복원합니다 (캐시가 유효한 파일은 재인덱싱 없이 로드)."""
+        session_files = ConfigManager.get("last_session_files", [])
+        if not session_files or self.file_tree.get_all_files():
+            return
+
+        # 파일 트리에만 추가 (files_changed로 일반 인덱싱이 시작되지 않도록 시그널 차단)
+        self.file_tree.blockSignals(True)
+        self.file_tree.add_files(session_files)
+        self.file_tree.blockSignals(False)
+        if self._watch_files:
+            self.file_watcher.set_files(self.file_tree.get_all_files())
+
+        # FTS 백엔드는 캐시된 파일의 검색 테이블을 그대로 연결하므로 일반 워커로 충분
+        if self._use_fts:
+            self._start_index_worker(FtsIndexWorker(
+                self.file_tree.get_all_files(), self.search_index, self.cache
+            ))
+            return
+
+        worker = SessionRestoreWorker(
+            self.file_tree.get_all_files(), self.search_index, self.cache,
+            lazy=self._lazy_indexing, cache_writer=self.cache_writer
+        )
+        worker.restore_finished.connect(self._on_session_restored)
+        worker.files_missing.connect(self._on_session_files_missing)
+        self._start_index_worker(worker)
+
+    def _on_session_restored(self, restored: int, queued: int, elapsed: float):
+        """세션 복원 결과 표시"""
+        self.search_bar.update_stats(
+            self.search_index.total_files,
+            self.search_index.total_rows
+        )
+        msg = f"지난 세션 복원: {restored}개 파일 ({elapsed:.2f}초)"
+        if queued:
+            msg += f" · {queued}개 파일 재인덱싱 중"
+        self.status_label.setText(msg)
+        self.show_toast(msg)
+
+    def _on_session_files_missing(self, file_paths: list):
+        """더 이상 존재하지 않는 세션 파일을 트리에서 제거"""
+        self.file_tree.blockSignals(True)
+        self.file_tree.remove_files(file_paths)
+        self.file_tree.blockSignals(False)
+        if self._watch_files:
+            self.file_watcher.set_files(self.file_tree.get_all_files())
+        logger.info(f"세션 파일 누락: {len(file_paths)}개")
 
     def _on_file_removed(self, file_path: str):
         """개별 파일 제거 시 인덱스에서도 제거"""
@@ -176,10 +396,25 @@ class MainWindow(QMainWindow):
             self.search_index.total_rows
         )
 
+    def _on_sheet_prioritized(self, file_path: str, sheet_name: str):
+        """파일 트리에서 펼친 시트를 지연 인덱싱 대기열 앞으로 이동"""
+        if self._index_worker and self._index_worker.isRunning():
+            self._index_worker.prioritize(file_path, sheet_name or None)
+
+    def _on_metadata_ready(self, file_path: str, sheets: list):
+        """지연 인덱싱: 메타데이터를 읽은 즉시 파일 트리에 시트 표시"""
+        self.file_tree.update_sheets(file_path, sheets)
+
     def _on_index_progress(self, msg: str, pct: int):
         """인덱싱 진행 상태 업데이트"""
         self.status_label.setText(msg)
         self.progress_bar.setValue(pct)
+        # 지연 인덱싱 중에는 검색 가능한 행 수가 계속 늘어나므로 통계도 갱신
+        if self._lazy_indexing:
+            self.search_bar.update_stats(
+                self.search_index.total_files,
+                self.search_index.total_rows
+            )
 
     def _on_index_complete(self, file_count: int, row_count: int):
         """인덱싱 완료"""
@@ -189,43 +424,139 @@ class MainWindow(QMainWindow):
             f"✅ 인덱싱 완료 — {file_count}개 파일, {row_count:,}개 행"
         )
 
-        # 파일 트리에 시트 정보 업데이트
-        for (file_path, sheet_name), headers in self.search_index.file_headers.items():
-            existing = self.file_tree._files.get(file_path, {})
-            sheets = existing.get('sheets', [])
+        # 파일 트리에 시트 정보 업데이트 (바뀐 파일만 모아 한 번에 반영)
+        updates = {}
+        for (file_path, sheet_name) in self.search_index.file_headers:
+            sheets = updates.get(file_path)
+            if sheets is None:
+                sheets = updates[file_path] = self.file_tree.get_sheets(file_path)
             if sheet_name not in sheets:
                 sheets.append(sheet_name)
-                self.file_tree.update_sheets(file_path, sheets)
+        self.file_tree.update_sheets_batch(updates)
 
         self.show_toast(f"인덱싱 완료: {file_count}개 파일, {row_count:,}개 행")
+        # 캐시 기록 스레드가 저장을 마치기 전일 수 있으므로 잠시 뒤 갱신
+        QTimer.singleShot(2000, self._update_cache_stats)
+        # 인덱싱 중에 변경된 파일이 있으면 이어서 재인덱싱
+        QTimer.singleShot(0, self._start_reindex)
 
     def _on_index_error(self, msg: str):
         """인덱싱 에러"""
         logger.error(msg)
         self.show_toast(f"⚠️ {msg}")
 
+    # ─── 파일 감시 ───
+
+    def _on_folder_added(self, folder: str):
+        """폴더 단위로 추가된 경우 폴더에 새로 생기는 파일도 감시"""
+        if self._watch_files:
+            self.file_watcher.watch_folder(folder)
+
+    def _on_watched_files_changed(self, file_paths: list):
+        """디스크에서 바뀐 파일을 재인덱싱 대기열에 추가"""
+        for fp in file_paths:
+            if fp in self.file_tree.get_all_files() and fp not in self._reindex_pending:
+                self._reindex_pending.append(fp)
+        self._start_reindex()
+
+    def _on_watched_files_removed(self, file_paths: list):
+        """디스크에서 삭제된 파일을 목록과 인덱스에서 제거 (목록 변경 알림은 한 번)"""
+        self._reindex_pending = [fp for fp in self._reindex_pending if fp not in file_paths]
+        self.file_tree.remove_files(file_paths)
+        self.show_toast(f"🗑 삭제된 파일 {len(file_paths)}개를 목록에서 제거했습니다")
+
+    def _start_reindex(self):
+        """
+        대기 중인 변경 파일을 재인덱싱합니다.
+        인덱싱/재인덱싱 워커가 실행 중이면 끝난 뒤 다시 호출됩니다.
+        """
+        if not self._reindex_pending or self._is_indexing():
+            return
+        if self._reindex_worker and self._reindex_worker.isRunning():
+            return
+
+        # 아직 인덱싱되지 않은 파일은 일반 인덱싱이 최신 내용을 읽으므로 제외
+        files = [f for f in self._reindex_pending if self.search_index.is_file_known(f)]
+        self._reindex_pending = []
+        if not files:
+            return
+
+        if self._use_fts:
+            worker = FtsReindexWorker(files, self.search_index, self.cache)
+        else:
+            worker = ReindexWorker(
+                files, self.search_index, self.cache, cache_writer=self.cache_writer
+            )
+        self._reindex_worker = worker
+        worker.progress_updated.connect(self._on_index_progress)
+        worker.error_occurred.connect(self._on_index_error)
+        worker.file_reindexed.connect(self._on_file_reindexed)
+        worker.indexing_complete.connect(self._on_reindex_complete)
+        worker.start()
+
+    def _on_file_reindexed(self, file_path: str, sheets: list):
+        """재인덱싱된 파일의 시트 목록 갱신"""
+        self.file_tree.update_sheets(file_path, sheets)
+        self.show_toast(f"🔄 변경된 파일을 다시 인덱싱했습니다: {Path(file_path).name}")
+
+    def _on_reindex_complete(self, file_count: int, row_count: int):
+        """재인덱싱 완료 — 통계 갱신 후 그동안 쌓인 변경 처리"""
+        self.search_bar.update_stats(file_count, row_count)
+        self.status_label.setText(f"✅ 재인덱싱 완료 — {file_count}개 파일, {row_count:,}개 행")
+        QTimer.singleShot(2000, self._update_cache_stats)
+        QTimer.singleShot(0, self._start_reindex)
+
+    # ─── 캐시 관리 ───
+
+    def _run_cache_maintenance(self):
+        """백그라운드에서 캐시 정리 (현재 열린 파일의 캐시는 보호)"""
+        if self.cache is None:
+            return
+        if self._maintenance_worker and self._maintenance_worker.isRunning():
+            return
+        self._maintenance_worker = CacheMaintenanceWorker(
+            self.cache.db_path, self._cache_max_mb * 1024 * 1024,
+            protect=self.file_tree.get_all_files()
+        )
+        self._maintenance_worker.maintenance_done.connect(self._on_cache_maintenance_done)
+        self._maintenance_worker.start()
+
+    def _on_cache_maintenance_done(self, result: dict):
+        """캐시 정리 결과 반영"""
+        self._update_cache_stats(result.get('stats'))
+        if result.get('evicted'):
+            self.show_toast(f"🧹 캐시 용량 정리: {result['evicted']}개 파일 제거")
+
+    def _update_cache_stats(self, stats: dict = None):
+        """상태바에 캐시 사용량 표시"""
+        if stats is None and self.cache is None:
+            return
+        stats = stats or self.cache.get_stats()
+        used_mb = stats.get('used_bytes', 0) / (1024 * 1024)
+        self.cache_label.setText(f"💾 캐시 {used_mb:,.1f} MB · {stats.get('files', 0)}개 파일")
+        self.cache_label.setToolTip(
+            f"한도 {self._cache_max_mb:,} MB\n"
+            f"DB {stats.get('db_bytes', 0) / 1048576:,.1f} MB "
+            f"(재사용 대기 {stats.get('free_bytes', 0) / 1048576:,.1f} MB)\n"
+            f"인덱스 파일 {stats.get('mapped_bytes', 0) / 1048576:,.1f} MB"
+        )
+
     # ─── 검색 ───
 
     def _on_search(self, query_text: str):
         """검색 실행"""
-        if self.search_index.total_cells == 0:
+        # 인덱싱 중이면 셀이 아직 없어도 부분 검색 허용
+        if self._search_service is None or (
+                self.search_index.total_cells == 0 and not self.search_index.is_partial
+                and not self._is_indexing()):
             self.show_toast("먼저 파일을 추가하고 인덱싱을 완료해 주세요.")
+            self.search_bar.search_finished()
             return
 
-        # 기존 검색 대기
-        if self._search_worker and self._search_worker.isRunning():
-            self._search_worker.wait()
-
+        # 진행 중인 검색을 기다리지 않고 최신 요청으로 교체 (이전 결과는 서비스가 폐기)
         min_sim = self.result_panel.get_similarity_threshold()
-
-        self._search_worker = SearchWorker(
-            query_text, self.search_index, min_sim
-        )
-        self._search_worker.results_ready.connect(self._on_results)
-        self._search_worker.search_error.connect(self._on_search_error)
-        self._search_worker.search_time.connect(self._on_search_time)
         self.status_label.setText(f"검색 중: '{query_text}'...")
-        self._search_worker.start()
+        self._search_service.submit(query_text, min_sim)
 
         # 최근 검색어 추가
         if query_text not in self._recent_keywords:
@@ -234,53 +565,126 @@ class MainWindow(QMainWindow):
             self.search_bar.update_recent(self._recent_keywords)
             ConfigManager.set("recent_keywords", self._recent_keywords)
 
-    def _on_results(self, results):
-        """검색 결과 수신"""
-        self.result_panel.display_results(results)
+    def _on_ranking(self, query_id: int, ranked):
+        """검색의 전체 순위 수신 (바로 뒤에 첫 페이지가 도착)"""
+        self._query_id = query_id
+        self._ranked = ranked
+        self._next_page_offset = SearchService.PAGE_SIZE
+
+    def _on_results(self, results, partial: bool = False):
+        """검색 결과 첫 페이지 수신 (인덱싱이 진행 중이면 부분 결과로 표시)"""
+        self.result_panel.display_results(
+            results, partial or self._is_indexing(), source=self._ranked
+        )
+
+    def _on_more_results(self):
+        """결과 패널의 다음 페이지 요청"""
+        self._search_service.request_page(self._query_id, self._next_page_offset)
+
+    def _on_page(self, query_id: int, offset: int, results):
+        """다음 결과 페이지 수신 (이전 검색의 페이지는 무시)"""
+        if query_id != self._query_id or self._ranked is None:
+            return
+        self._next_page_offset = offset + SearchService.PAGE_SIZE
+        self.result_panel.append_results(
+            results, self._next_page_offset < len(self._ranked)
+        )
+
+    def _on_page_error(self, query_id: int, offset: int, msg: str):
+        """다음 결과 페이지 실패 — 검색 자체는 끝났으므로 검색창 상태는 건드리지 않음"""
+        if query_id != self._query_id:
+            return
+        self.status_label.setText(f"결과 페이지 오류: {msg}")
+        self.show_toast(f"⚠️ 결과를 더 불러오지 못했습니다: {msg}")
+        self.result_panel.more_failed()
+
+    def _is_indexing(self) -> bool:
+        """인덱싱 워커가 실행 중인지 확인합니다."""
+        return self._index_worker is not None and self._index_worker.isRunning()
 
     def _on_search_error(self, msg: str):
         """검색 에러"""
         self.status_label.setText(f"검색 오류: {msg}")
         self.show_toast(f"⚠️ 검색 오류: {msg}")
+        self.search_bar.search_finished()
 
     def _on_search_time(self, elapsed: float):
         """검색 시간 표시"""
         self.status_label.setText(
             f"검색 완료 ({elapsed:.3f}초)"
         )
+        # 측정한 검색 시간으로 디바운스 조정, 보류된 마지막 검색어 실행
+        self.search_bar.search_finished(elapsed)
 
     def _on_similarity_changed(self, value: int):
-        """유사도 슬라이더 변경 시 재검색"""
+        """
+        유사도 슬라이더 변경 시 재검색.
+        드래그 중에는 SIMILARITY_THROTTLE_MS마다 한 번만 재검색하고, 키보드/클릭 변경은 바로 재검색합니다.
+        검색기가 같은 검색어의 후보를 보관하므로 재검색은 점수 재필터링만 합니다.
+        """
+        if self.result_panel.sim_slider.isSliderDown():
+            if not self._similarity_timer.isActive():
+                self._similarity_timer.start()
+            return
+        self._research_similarity()
+
+    def _on_similarity_released(self):
+        """슬라이더를 놓으면 최종 값으로 바로 재검색"""
+        self._similarity_timer.stop()
+        self._research_similarity()
+
+    def _research_similarity(self):
+        """현재 검색어를 현재 유사도로 다시 검색"""
         current_text = self.search_bar.input.text().strip()
-        if current_text and self.search_index.total_cells > 0:
-            self._on_search(current_text)
+        if current_text and (self.search_index.total_cells > 0
+                             or self.search_index.is_partial):
+            # 검색 중이면 끝난 뒤 실행되도록 검색창 스케줄러를 거침
+            self.search_bar.search_now()
 
     # ─── 복사 & 내보내기 ───
 
     def _on_copy(self, results):
-        """결과를 클립보드에 복사"""
-        rows_data = []
-        for r in results:
-            row_values = [r.row.cells.get(h, '') for h in r.row.headers]
-            rows_data.append(row_values)
-
-        if not rows_data:
+        """
+        결과를 클립보드에 복사합니다.
+        LAZY_COPY_ROWS 이상이면 붙여넣을 때 데이터를 만드는 지연 복사로,
+        그보다 적으면 복사 워커가 백그라운드에서 TSV를 만들어 복사합니다.
+        """
+        if not results:
             return
+        results = self._load_full_rows(results)
 
-        # 헤더 포함
-        headers = results[0].row.headers
-        formatted = '\t'.join(headers) + '\n'
-        formatted += '\n'.join('\t'.join(row) for row in rows_data)
+        if len(results) >= LAZY_COPY_ROWS:
+            QApplication.clipboard().setMimeData(LazyResultMimeData(results))
+            self.show_toast(f"📋 {len(results):,}건을 복사했습니다 (붙여넣을 때 데이터를 만듭니다)")
+            return
 
-        if ClipboardManager.copy_to_clipboard(formatted):
-            self.show_toast(f"📋 {len(results)}건을 클립보드에 복사했습니다")
-        else:
+        if self._clipboard_worker and self._clipboard_worker.isRunning():
+            self.show_toast("이미 복사하는 중입니다")
+            return
+        worker = ClipboardWorker(results)
+        worker.copy_done.connect(self._on_copy_done)
+        worker.finished.connect(self._on_clipboard_worker_finished)
+        self._clipboard_worker = worker
+        self.status_label.setText(f"복사 중... {len(results):,}건")
+        worker.start()
+
+    def _on_copy_done(self, count: int, ok: bool):
+        if not ok:
             self.show_toast("⚠️ 클립보드 복사에 실패했습니다")
+        elif count:
+            self.status_label.setText(f"복사 완료 — {count:,}건")
+            self.show_toast(f"📋 {count:,}건을 클립보드에 복사했습니다")
+
+    def _on_clipboard_worker_finished(self):
+        self._clipboard_worker = None
 
     def _on_export(self, results):
-        """결과를 xlsx 파일로 내보내기"""
+        """결과를 xlsx 파일로 내보내기 (백그라운드 스트리밍)"""
         if not results:
             return
+        if self._export_worker and self._export_worker.isRunning():
+            self.show_toast("이미 내보내는 중입니다")
+            return
 
         file_path, _ = QFileDialog.getSaveFileName(
             self, "내보내기",
@@ -291,12 +695,53 @@ class MainWindow(QMainWindow):
         if not file_path:
             return
 
-        try:
-            ResultExporter.export_results(results, file_path)
-            self.show_toast(f"📤 {len(results)}건을 {Path(file_path).name}에 저장했습니다")
-        except Exception as e:
-            logger.error(f"내보내기 실패: {e}", exc_info=True)
-            self.show_toast(f"⚠️ 내보내기 실패: {str(e)}")
+        results = self._load_full_rows(results)
+        worker = ExportWorker(results, file_path)
+        worker.progress_updated.connect(self._on_export_progress)
+        worker.export_complete.connect(self._on_export_complete)
+        worker.export_cancelled.connect(self._on_export_cancelled)
+        worker.error_occurred.connect(self._on_export_error)
+        worker.finished.connect(self._on_export_finished)
+        self._export_worker = worker
+        self.export_progress.setValue(0)
+        self.export_progress.setVisible(True)
+        self.btn_cancel_export.setVisible(True)
+        self.status_label.setText(f"내보내는 중... 0/{len(results):,}건")
+        worker.start()
+
+    def _load_full_rows(self, results):
+        """
+        미리보기 결과를 전체 행 결과로 바꿉니다.
+        전체 순위(RankedResults)는 순회할 때 전체 행 페이지를 만들므로 그대로 둡니다.
+        """
+        if isinstance(results, list):
+            return load_full_rows(self.search_index, results)
+        return results
+
+    def _on_cancel_export(self):
+        if self._export_worker and self._export_worker.isRunning():
+            self._export_worker.stop()
+
+    def _on_export_progress(self, msg: str, pct: int):
+        self.status_label.setText(msg)
+        self.export_progress.setValue(pct)
+
+    def _on_export_complete(self, file_path: str, written: int):
+        self.status_label.setText(f"내보내기 완료 — {written:,}건")
+        self.show_toast(f"📤 {written:,}건을 {Path(file_path).name}에 저장했습니다")
+
+    def _on_export_cancelled(self, file_path: str):
+        self.status_label.setText("내보내기 취소됨")
+        self.show_toast("내보내기를 취소했습니다")
+
+    def _on_export_error(self, msg: str):
+        self.status_label.setText(f"내보내기 실패: {msg}")
+        self.show_toast(f"⚠️ 내보내기 실패: {msg}")
+
+    def _on_export_finished(self):
+        self.export_progress.setVisible(False)
+        self.btn_cancel_export.setVisible(False)
+        self._export_worker = None
 
     # ─── 테마 ───
 
@@ -319,6 +764,12 @@ class MainWindow(QMainWindow):
         """설정 로드"""
         self._is_dark = ConfigManager.get("is_dark_theme", True)
         self._recent_keywords = ConfigManager.get("recent_keywords", [])
+        self._lazy_indexing = ConfigManager.get("lazy_indexing", True)
+        self._restore_last_session = ConfigManager.get("restore_last_session", True)
+        self._cache_max_mb = ConfigManager.get("cache_max_mb", 1024)
+        self._search_backend = ConfigManager.get("search_backend", "memory")
+        self._watch_files = ConfigManager.get("watch_files", True)
+        self._result_preview = ConfigManager.get("result_preview", True)
 
     # ─── 유틸리티 ───
 
@@ -333,14 +784,44 @@ class MainWindow(QMainWindow):
         if self._index_worker and self._index_worker.isRunning():
             self._index_worker.stop()
             self._index_worker.wait()
-
-        # 캐시 연결 닫기
-        if self.cache:
-            self.cache.close()
+        if self._reindex_worker and self._reindex_worker.isRunning():
+            self._reindex_worker.stop()
+            self._reindex_worker.wait()
+        if self._export_worker and self._export_worker.isRunning():
+            self._export_worker.stop()
+            self._export_worker.wait()
+        if self._clipboard_worker and self._clipboard_worker.isRunning():
+            self._clipboard_worker.wait()
+        self.file_watcher.clear()
+        if self._startup_worker.isRunning():
+            self._startup_worker.stop()
+            self._startup_worker.wait()
+        if self._search_service is not None:
+            self._search_service.stop()
+            self._search_service.wait()
+        self._maintenance_timer.stop()
+        if self._maintenance_worker and self._maintenance_worker.isRunning():
+            self._maintenance_worker.wait()
+
+        # 지연 복사 데이터는 백엔드를 읽으므로 닫기 전에 만들어 둠 (종료 후 붙여넣기/클립보드 플러시 대비)
+        mime = QApplication.clipboard().mimeData()
+        if isinstance(mime, LazyResultMimeData) and not mime.rendered:
+            mime.render()
+
+        # 대기 중인 캐시 저장을 마친 뒤 연결 닫기 (창이 받기 전에 준비된 캐시/백엔드 포함)
+        if self.cache_writer is not None:
+            self.cache_writer.close()
+        cache = self.cache or self._startup_worker.cache
+        if cache:
+            cache.close()
+        fts_backend = self._startup_worker.fts_backend
+        if fts_backend is not None:
+            fts_backend.close()
 
         # 설정 저장
         ConfigManager.set("recent_keywords", self._recent_keywords)
         ConfigManager.set("is_dark_theme", self._is_dark)
+        ConfigManager.set("last_session_files", self.file_tree.get_all_files())
         ConfigManager.save()
 
         logger.info("앱 종료")
@@ -2,19 +2,25 @@
 [v2.0.0] 검색 결과 카드 패널
 파일/시트별로 그룹핑된 카드 형태로 검색 결과를 표시합니다.
 체크박스 선택, 전체 선택, 복사, 내보내기를 지원합니다.
+
+[v2.1.0] 카드의 결과 표는 ResultTableModel + QTableView로 그립니다.
+셀/체크박스 위젯을 만들지 않고 보이는 행만 그리므로 결과가 많아도 표시 시간이 일정합니다.
+카드는 헤더(건수)만 먼저 만들고, 표는 카드가 화면에 들어오거나 펼쳐질 때 만듭니다.
+결과는 페이지 단위로 받으며, 끝까지 스크롤하거나 '더 보기'를 누르면 다음 페이지를 요청합니다.
+미리보기 결과(스니펫)는 매칭 컬럼 주변만 그리고, '전체 열'을 누르면 전체 행을 읽어 모든 컬럼을 보여 줍니다.
 """
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QScrollArea, QFrame, QTableWidget, QTableWidgetItem,
+    QScrollArea, QFrame, QTableView, QToolButton,
     QCheckBox, QHeaderView, QSlider, QAbstractItemView,
     QSizePolicy
 )
-from PySide6.QtCore import Signal, Qt
-from PySide6.QtGui import QColor
-from typing import List, Dict
-from collections import defaultdict
+from PySide6.QtCore import Signal, Qt, QTimer
+from typing import Callable, List, Dict, Optional, Sequence
+from collections import Counter, defaultdict
 from src.core.searcher import SearchResult
+from src.ui.result_model import ResultTableModel, MatchHighlightDelegate, CHECK_COLUMN
 from src.ui.styles import Colors
 
 
@@ -48,14 +54,32 @@ class ResultCard(QFrame):
     파일/시트 단위 결과 카드.
     헤더에 파일명/시트명, 매칭 유형별 건수를 표시하고
     내부에 결과 행 테이블을 포함합니다.
+
+    [v2.1.0] build_table=False면 헤더와 모델만 만들고, 표는 ensure_table() 호출 시 만듭니다.
+    그 전까지는 표와 같은 높이의 빈 영역을 두어 스크롤 위치가 흔들리지 않게 합니다.
+    미리보기 결과는 row_loader(미리보기 결과 → 전체 행 결과)로 전체 행을 필요할 때 읽습니다.
     """
 
+    # 표의 행 높이와 최대 높이 (px)
+    ROW_HEIGHT = 30
+    MAX_TABLE_HEIGHT = 300
+
     def __init__(self, file_name: str, sheet_name: str,
-                 results: List[SearchResult], parent=None):
+                 results: List[SearchResult], parent=None, build_table: bool = True,
+                 row_loader: Optional[Callable[[List[SearchResult]], List[SearchResult]]] = None):
         super().__init__(parent)
         self.results = results
-        self._checked_rows = set()
+        self._row_loader = row_loader
+        self._full_rows = False
+        self.model = None
+        self.table = None
+        self._placeholder = None
+        self._expanded = True
+        self._type_counts: Counter = Counter()
+        self._tags: Dict[str, MatchTag] = {}
         self._setup_ui(file_name, sheet_name)
+        if build_table:
+            self.ensure_table()
 
     def _setup_ui(self, file_name: str, sheet_name: str):
         self.setObjectName("resultCard")
@@ -74,20 +98,21 @@ class ResultCard(QFrame):
 
         # 카드 헤더: 파일명 + 매칭 통계
         header_row = QHBoxLayout()
+        self.btn_toggle = QToolButton()
+        self.btn_toggle.setText("▾")
+        self.btn_toggle.setAutoRaise(True)
+        self.btn_toggle.setToolTip("결과 표 접기/펼치기")
+        self.btn_toggle.clicked.connect(lambda: self.set_expanded(not self._expanded))
+        header_row.addWidget(self.btn_toggle)
+
         title = QLabel(f"📄 {file_name} › {sheet_name}")
         title.setStyleSheet("font-weight: bold; font-size: 13px;")
         header_row.addWidget(title)
         header_row.addStretch()
 
         # 매칭 유형별 건수 태그
-        type_counts = defaultdict(int)
-        for r in self.results:
-            type_counts[r.match_type] += 1
-
-        for mtype, count in type_counts.items():
-            tag = MatchTag(mtype, self.results[0].similarity if mtype == 'fuzzy' else 1.0)
-            tag.setText(f"{Colors.match_label(mtype)} {count}건")
-            header_row.addWidget(tag)
+        self._header_row = header_row
+        self._update_tags(self.results)
 
         layout.addLayout(header_row)
 
@@ -95,73 +120,121 @@ class ResultCard(QFrame):
         if not self.results:
             return
 
+        # 체크 상태는 모델이 보관하므로 표를 만들기 전에도 선택/조회 가능
         first_row = self.results[0].row
-        headers = first_row.headers
-        display_headers = [""] + headers  # 첫 열은 체크박스
+        self.model = ResultTableModel(self.results, first_row.headers, self)
+
+        # 미리보기 결과면 전체 컬럼 보기 버튼
+        self.btn_columns = QToolButton()
+        self.btn_columns.setText(f"전체 {len(first_row.headers)}열")
+        self.btn_columns.setAutoRaise(True)
+        self.btn_columns.setToolTip("매칭 주변 컬럼만 표시 중 — 눌러서 전체 행을 불러옵니다")
+        self.btn_columns.clicked.connect(self.show_full_rows)
+        self.btn_columns.setVisible(self.model.is_preview() and self._row_loader is not None)
+        header_row.insertWidget(2, self.btn_columns)
+
+        self._table_height = self._compute_table_height()
+        self._layout = layout
+        self._placeholder = QWidget()
+        self._placeholder.setFixedHeight(self._table_height)
+        layout.addWidget(self._placeholder)
+
+    def _compute_table_height(self) -> int:
+        """테이블 높이 (최대 300px, 헤더 높이 포함)"""
+        return min(len(self.results) * self.ROW_HEIGHT + 35, self.MAX_TABLE_HEIGHT)
+
+    def _update_tags(self, new_results: List[SearchResult]):
+        """새 결과를 매칭 유형별 건수 태그에 반영합니다."""
+        for r in new_results:
+            self._type_counts[r.match_type] += 1
+        for mtype, count in self._type_counts.items():
+            tag = self._tags.get(mtype)
+            if tag is None:
+                tag = MatchTag(mtype, self.results[0].similarity if mtype == 'fuzzy' else 1.0)
+                self._tags[mtype] = tag
+                self._header_row.addWidget(tag)
+            tag.setText(f"{Colors.match_label(mtype)} {count}건")
 
-        self.table = QTableWidget(len(self.results), len(display_headers))
-        self.table.setHorizontalHeaderLabels(display_headers)
+    def add_results(self, results: List[SearchResult]):
+        """다음 페이지에서 온 같은 시트의 결과를 추가합니다."""
+        if not results or self.model is None:
+            return
+        if self._full_rows:
+            results = self._row_loader(results)
+        self.model.append_results(results)  # self.results와 같은 목록에 추가됨
+        self.btn_columns.setVisible(self.model.is_preview() and self._row_loader is not None)
+        self._update_tags(results)
+        self._table_height = self._compute_table_height()
+        if self.table is not None:
+            self.table.setMinimumHeight(self._table_height)
+            self.table.setMaximumHeight(self._table_height)
+        elif self._placeholder is not None:
+            self._placeholder.setFixedHeight(self._table_height)
+
+    def show_full_rows(self):
+        """미리보기 결과의 전체 행을 읽어 모든 컬럼을 표시합니다."""
+        if self.model is None or self._row_loader is None or self._full_rows:
+            return
+        self._full_rows = True
+        self.model.show_full_rows(self._row_loader(list(self.results)))
+        self.btn_columns.setVisible(False)
+        self.set_expanded(True)
+
+    @property
+    def has_table(self) -> bool:
+        return self.table is not None
+
+    def is_expanded(self) -> bool:
+        return self._expanded
+
+    def set_expanded(self, expanded: bool):
+        """결과 표 펼치기/접기 (처음 펼칠 때 표를 만듦)"""
+        self._expanded = expanded
+        self.btn_toggle.setText("▾" if expanded else "▸")
+        if expanded:
+            self.ensure_table()
+        if self.table is not None:
+            self.table.setVisible(expanded)
+        elif self._placeholder is not None:
+            self._placeholder.setVisible(expanded)
+
+    def ensure_table(self):
+        """결과 표를 아직 만들지 않았으면 만듭니다."""
+        if self.table is not None or self.model is None:
+            return
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setItemDelegate(MatchHighlightDelegate(self.table))
         self.table.verticalHeader().setVisible(False)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
+        self.table.setWordWrap(False)
 
-        # 체크박스 열 너비 고정
-        self.table.setColumnWidth(0, 30)
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Fixed)
-        for col_idx in range(1, len(display_headers)):
-            self.table.horizontalHeader().setSectionResizeMode(
-                col_idx, QHeaderView.Stretch
-            )
+        # 행 높이 고정 (내용 기반 크기 계산 없이 보이는 행만 그림)
+        v_header = self.table.verticalHeader()
+        v_header.setSectionResizeMode(QHeaderView.Fixed)
+        v_header.setDefaultSectionSize(self.ROW_HEIGHT)
 
-        # 테이블에 데이터 채우기
-        for row_idx, result in enumerate(self.results):
-            # 체크박스
-            cb = QCheckBox()
-            cb.stateChanged.connect(
-                lambda state, idx=row_idx: self._on_check_changed(idx, state)
-            )
-            self.table.setCellWidget(row_idx, 0, cb)
-
-            # 데이터 셀
-            for col_idx, col_name in enumerate(headers):
-                value = result.row.cells.get(col_name, '')
-                item = QTableWidgetItem(value)
-
-                # 매칭된 셀 강조
-                is_matched = any(
-                    m.col_name == col_name for m in result.matches
-                )
-                if is_matched:
-                    match_color = Colors.match_color(result.match_type)
-                    item.setForeground(QColor(match_color))
-                    item.setFont(item.font())
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
-
-                self.table.setItem(row_idx, col_idx + 1, item)
-
-        # 테이블 높이 자동 조절 (최대 300px)
-        row_height = 30
-        table_height = min(
-            len(self.results) * row_height + 35,  # 헤더 높이 포함
-            300
-        )
-        self.table.setMinimumHeight(table_height)
-        self.table.setMaximumHeight(table_height)
+        # 체크박스 열 너비 고정
+        h_header = self.table.horizontalHeader()
+        h_header.setSectionResizeMode(QHeaderView.Stretch)
+        h_header.setSectionResizeMode(CHECK_COLUMN, QHeaderView.Fixed)
+        self.table.setColumnWidth(CHECK_COLUMN, 30)
 
-        layout.addWidget(self.table)
+        self.table.setMinimumHeight(self._table_height)
+        self.table.setMaximumHeight(self._table_height)
 
-    def _on_check_changed(self, row_idx: int, state: int):
-        if state == Qt.Checked.value:
-            self._checked_rows.add(row_idx)
-        else:
-            self._checked_rows.discard(row_idx)
+        # 자리 표시 영역을 표로 교체
+        self._layout.replaceWidget(self._placeholder, self.table)
+        self._placeholder.deleteLater()
+        self._placeholder = None
+        self.table.setVisible(self._expanded)
 
     def get_checked_results(self) -> List[SearchResult]:
         """체크된 결과만 반환"""
-        return [self.results[i] for i in self._checked_rows]
+        return self.model.checked_results() if self.model else []
 
     def get_all_results(self) -> List[SearchResult]:
         """모든 결과 반환"""
@@ -169,10 +242,8 @@ class ResultCard(QFrame):
 
     def select_all(self, checked: bool):
         """전체 선택/해제"""
-        for row_idx in range(self.table.rowCount()):
-            cb = self.table.cellWidget(row_idx, 0)
-            if cb:
-                cb.setChecked(checked)
+        if self.model:
+            self.model.set_all_checked(checked)
 
 
 class ResultPanel(QWidget):
@@ -181,15 +252,38 @@ class ResultPanel(QWidget):
     - 스크롤 영역에 파일/시트별 카드를 배치
     - 유사도 슬라이더로 필터링
     - 전체 선택, 복사, 내보내기 버튼
+
+    [v2.1.0] 카드는 CARD_BATCH개씩 이벤트 루프 틱마다 나누어 만들고(첫 묶음은 즉시),
+    결과 표는 스크롤 영역에 보이는 카드에만 만듭니다.
     """
 
-    export_requested = Signal(list)  # List[SearchResult]
-    copy_requested = Signal(list)    # List[SearchResult]
+    # 한 틱에 만드는 카드 수
+    CARD_BATCH = 20
+    # 한 틱에 만드는 결과 표 수
+    TABLE_BATCH = 4
+
+    export_requested = Signal(object)  # Sequence[SearchResult] (전체 결과는 RankedResults)
+    copy_requested = Signal(object)    # Sequence[SearchResult]
+    more_requested = Signal()          # 다음 결과 페이지 요청
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._cards: List[ResultCard] = []
         self._all_results: List[SearchResult] = []
+        # 전체 결과 (받지 않은 페이지 포함), 다음 페이지 유무/요청 중 여부
+        self._source: Sequence[SearchResult] = []
+        self._has_more = False
+        self._more_pending = False
+        self._partial = False
+        self._type_counts: Counter = Counter()
+        # 아직 카드로 만들지 않은 그룹, 그룹 키 → 카드, 표시 세대 (새 결과가 오면 이전 예약 작업 무시)
+        self._pending_groups: List[tuple] = []
+        self._pending_by_key: Dict[tuple, List[SearchResult]] = {}
+        self._card_by_key: Dict[tuple, ResultCard] = {}
+        self._render_gen = 0
+        self._materialize_scheduled = False
+        # 미리보기 결과 → 전체 행 결과 (카드의 '전체 열' 보기)
+        self._row_loader: Optional[Callable[[List[SearchResult]], List[SearchResult]]] = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -242,6 +336,9 @@ class ResultPanel(QWidget):
         self.scroll_area.setWidget(self.scroll_content)
         layout.addWidget(self.scroll_area, 1)
 
+        # 스크롤 시 화면에 들어온 카드의 표를 만들고, 끝에 닿으면 다음 페이지 요청
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+
         # 하단 컨트롤 바
         bottom_row = QHBoxLayout()
 
@@ -251,6 +348,12 @@ class ResultPanel(QWidget):
 
         bottom_row.addStretch()
 
+        self.btn_more = QPushButton("더 보기")
+        self.btn_more.setToolTip("다음 검색 결과를 불러옵니다")
+        self.btn_more.clicked.connect(self._request_more)
+        self.btn_more.setVisible(False)
+        bottom_row.addWidget(self.btn_more)
+
         self.btn_copy = QPushButton("📋 복사")
         self.btn_copy.setToolTip("선택된 항목을 클립보드에 복사합니다")
         self.btn_copy.clicked.connect(self._on_copy)
@@ -264,13 +367,26 @@ class ResultPanel(QWidget):
 
         layout.addLayout(bottom_row)
 
-    def display_results(self, results: List[SearchResult]):
-        """검색 결과를 카드로 표시합니다."""
-        self._all_results = results
+    def display_results(self, results: List[SearchResult], partial: bool = False,
+                        source: Optional[Sequence[SearchResult]] = None):
+        """
+        검색 결과를 카드로 표시합니다.
+        partial이 True면 인덱싱이 끝나지 않은 시트가 있어 일부 결과임을 표시합니다.
+        source는 results(첫 페이지)를 포함한 전체 결과로, 복사/내보내기와 '더 보기'에 사용합니다.
+        """
+        self._all_results = list(results)
+        self._source = source if source is not None else self._all_results
+        self._has_more = len(self._source) > len(self._all_results)
+        self._more_pending = False
+        self._partial = partial
+        self._type_counts = Counter()
         self._clear_cards()
+        self.cb_select_all.setChecked(False)
 
         if not results:
-            self.result_count_label.setText("검색 결과 없음")
+            prefix = "⏳ 부분 결과 (인덱싱 진행 중) · " if partial else ""
+            self.result_count_label.setText(f"{prefix}검색 결과 없음")
+            self.btn_more.setVisible(False)
             no_result_label = QLabel("검색 결과가 없습니다. 다른 키워드를 시도해 보세요.")
             no_result_label.setAlignment(Qt.AlignCenter)
             no_result_label.setObjectName("subtextLabel")
@@ -278,38 +394,158 @@ class ResultPanel(QWidget):
             self.scroll_layout.insertWidget(0, no_result_label)
             return
 
-        # 결과를 파일/시트별로 그룹핑
+        # 첫 묶음은 바로 만들어 첫 화면을 그리고, 나머지는 다음 틱으로 미룸
+        self._group_results(results)
+        self._update_stats()
+        self._add_card_batch(self._render_gen)
+
+    def append_results(self, results: List[SearchResult], has_more: bool):
+        """다음 페이지 결과를 기존 카드/그룹에 이어 붙입니다."""
+        self._more_pending = False
+        self._has_more = has_more
+        self._all_results.extend(results)
+
+        had_pending = bool(self._pending_groups)
+        for key, group in self._group_by_sheet(results).items():
+            card = self._card_by_key.get(key)
+            if card is not None:
+                card.add_results(group)
+            elif key in self._pending_by_key:
+                self._pending_by_key[key].extend(group)
+            else:
+                self._pending_by_key[key] = group
+                self._pending_groups.append((key, group))
+        self._type_counts.update(r.match_type for r in results)
+        self._update_stats()
+
+        if self._pending_groups and not had_pending:
+            self._add_card_batch(self._render_gen)
+
+    def _group_results(self, results: List[SearchResult]):
+        """결과를 파일/시트별로 그룹핑하여 카드 생성 대기열에 넣습니다."""
+        groups = self._group_by_sheet(results)
+        self._pending_groups = list(groups.items())
+        self._pending_by_key = dict(groups)
+        self._type_counts.update(r.match_type for r in results)
+
+    @staticmethod
+    def _group_by_sheet(results: List[SearchResult]) -> Dict[tuple, List[SearchResult]]:
         groups: Dict[tuple, List[SearchResult]] = defaultdict(list)
         for r in results:
-            key = (r.row.file_name, r.row.sheet_name)
-            groups[key].append(r)
-
-        # 카드 생성
-        total_exact = sum(1 for r in results if r.match_type == 'exact')
-        total_fuzzy = sum(1 for r in results if r.match_type == 'fuzzy')
-        total_chosung = sum(1 for r in results if r.match_type == 'chosung')
-        total_range = sum(1 for r in results if r.match_type == 'range')
-
-        stats = f"검색 결과 ({len(results)}건)"
-        if total_exact:
-            stats += f" | 정확 {total_exact}"
-        if total_fuzzy:
-            stats += f" | 유사 {total_fuzzy}"
-        if total_chosung:
-            stats += f" | 초성 {total_chosung}"
-        if total_range:
-            stats += f" | 범위 {total_range}"
+            groups[(r.row.file_name, r.row.sheet_name)].append(r)
+        return groups
+
+    def _update_stats(self):
+        """결과 건수/매칭 유형 통계와 '더 보기' 버튼 갱신"""
+        prefix = "⏳ 부분 결과 (인덱싱 진행 중) · " if self._partial else ""
+        total = len(self._source)
+        stats = f"{prefix}검색 결과 ({total}건)"
+        if self._has_more:
+            stats += f" · {len(self._all_results)}건 표시"
+        for mtype, label in (('exact', '정확'), ('fuzzy', '유사'),
+                             ('chosung', '초성'), ('range', '범위')):
+            if self._type_counts[mtype]:
+                stats += f" | {label} {self._type_counts[mtype]}"
         self.result_count_label.setText(stats)
 
-        for (file_name, sheet_name), group_results in groups.items():
-            card = ResultCard(file_name, sheet_name, group_results)
+        self.btn_more.setVisible(self._has_more)
+        self.btn_more.setEnabled(not self._more_pending)
+        self.btn_more.setText(f"더 보기 ({len(self._all_results)}/{total})")
+
+    def _request_more(self):
+        """다음 결과 페이지를 한 번만 요청합니다 (도착할 때까지 중복 요청 안 함)."""
+        if not self._has_more or self._more_pending:
+            return
+        self._more_pending = True
+        self.btn_more.setEnabled(False)
+        self.more_requested.emit()
+
+    def more_failed(self):
+        """다음 페이지를 만들지 못했을 때 '더 보기'를 다시 누를 수 있게 합니다."""
+        self._more_pending = False
+        self.btn_more.setEnabled(self._has_more)
+
+    def _on_scrolled(self, value: int):
+        self._schedule_materialize()
+        bar = self.scroll_area.verticalScrollBar()
+        if self._has_more and value >= bar.maximum() - self.scroll_area.viewport().height() // 2:
+            self._request_more()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._schedule_materialize()
+
+    def has_pending_cards(self) -> bool:
+        return bool(self._pending_groups)
+
+    def _add_card_batch(self, gen: int):
+        """대기 중인 그룹 CARD_BATCH개를 카드(헤더)로 만듭니다."""
+        if gen != self._render_gen:
+            return
+        batch = self._pending_groups[:self.CARD_BATCH]
+        del self._pending_groups[:self.CARD_BATCH]
+        self._add_cards(batch)
+
+        if self._pending_groups:
+            QTimer.singleShot(0, lambda: self._add_card_batch(gen))
+        self._schedule_materialize()
+
+    def _add_cards(self, groups: List[tuple]):
+        select_all = self.cb_select_all.isChecked()
+        for key, group_results in groups:
+            self._pending_by_key.pop(key, None)
+            file_name, sheet_name = key
+            card = ResultCard(file_name, sheet_name, group_results, build_table=False,
+                              row_loader=self._row_loader)
+            if select_all:
+                card.select_all(True)
             self._cards.append(card)
+            self._card_by_key[key] = card
             # stretch 앞에 삽입
             self.scroll_layout.insertWidget(
                 self.scroll_layout.count() - 1, card
             )
 
-        self.cb_select_all.setChecked(False)
+    def _flush_pending_cards(self):
+        """남은 카드를 모두 만듭니다 (전체 결과가 필요한 작업 전)."""
+        if self._pending_groups:
+            groups, self._pending_groups = self._pending_groups, []
+            self._add_cards(groups)
+
+    def _schedule_materialize(self):
+        if not self._materialize_scheduled:
+            self._materialize_scheduled = True
+            gen = self._render_gen
+            QTimer.singleShot(0, lambda: self._materialize_visible(gen))
+
+    def _materialize_visible(self, gen: int):
+        """스크롤 영역에 보이는(한 화면 앞까지) 카드의 표를 TABLE_BATCH개씩 만듭니다."""
+        self._materialize_scheduled = False
+        if gen != self._render_gen:
+            return
+        self.scroll_layout.activate()
+        viewport_h = self.scroll_area.viewport().height()
+        top = self.scroll_area.verticalScrollBar().value()
+        bottom = top + viewport_h * 2
+
+        built = 0
+        for card in self._cards:
+            if card.y() > bottom:
+                break
+            if card.has_table or not card.is_expanded():
+                continue
+            if card.y() + card.height() < top:
+                continue
+            card.ensure_table()
+            built += 1
+            if built >= self.TABLE_BATCH:
+                # 남은 카드는 다음 틱에
+                self._schedule_materialize()
+                break
+
+    def set_row_loader(self, loader: Callable[[List[SearchResult]], List[SearchResult]]):
+        """미리보기 결과의 전체 행을 읽는 함수를 설정합니다."""
+        self._row_loader = loader
 
     def get_similarity_threshold(self) -> float:
         """유사도 슬라이더 값을 0.0~1.0으로 반환"""
@@ -317,6 +553,10 @@ class ResultPanel(QWidget):
 
     def _clear_cards(self):
         """기존 카드 제거"""
+        self._render_gen += 1
+        self._pending_groups = []
+        self._pending_by_key = {}
+        self._card_by_key = {}
         for card in self._cards:
             self.scroll_layout.removeWidget(card)
             card.deleteLater()
@@ -330,15 +570,22 @@ class ResultPanel(QWidget):
 
     def _on_select_all(self, state):
         checked = state == Qt.Checked.value
+        # 아직 만들지 않은 카드는 생성 시 전체 선택 상태를 반영함
         for card in self._cards:
             card.select_all(checked)
 
-    def _get_selected_results(self) -> List[SearchResult]:
-        """체크된 결과를 반환. 체크된 것이 없으면 전체 반환."""
+    def _get_selected_results(self) -> Sequence[SearchResult]:
+        """
+        체크된 결과를 반환. 체크된 것이 없거나 전체 선택이면
+        아직 받지 않은 페이지를 포함한 전체 결과를 반환합니다.
+        """
+        if self.cb_select_all.isChecked():
+            return self._source
+        self._flush_pending_cards()
         checked = []
         for card in self._cards:
             checked.extend(card.get_checked_results())
-        return checked if checked else self._all_results
+        return checked if checked else self._source
 
     def _on_copy(self):
         results = self._get_selected_results()
@@ -0,0 +1,239 @@
+"""
+[v2.1.0] 검색 결과 테이블 모델
+SearchResult 목록을 QAbstractTableModel로 노출하여 QTableView가 화면에 보이는 행만 그리도록 합니다.
+행마다 위젯(QCheckBox, QTableWidgetItem)을 만들지 않으므로 표시 비용이 결과 수와 무관합니다.
+
+- 첫 열은 체크 열로, 체크 상태는 Qt.CheckStateRole로 제공합니다.
+- 매칭된 셀은 MATCH_COLOR_ROLE로 매칭 유형 색상을 제공하고, MatchHighlightDelegate가 강조해 그립니다.
+- 미리보기 결과는 스니펫 컬럼만 열로 보여 주고, HIGHLIGHT_SPANS_ROLE의 범위만 강조해 그립니다.
+  show_full_rows()로 전체 행 결과를 받으면 모든 컬럼을 보여 줍니다.
+"""
+
+from typing import Dict, List, Optional, Set
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPointF, Qt, Signal
+from PySide6.QtGui import QColor, QFont, QPalette, QTextCharFormat, QTextLayout
+from PySide6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from src.core.searcher import SearchResult
+from src.ui.styles import Colors
+
+# 매칭된 셀의 강조 색상 (매칭되지 않은 셀은 None)
+MATCH_COLOR_ROLE = Qt.UserRole + 1
+
+# 셀 안에서 강조할 [시작, 끝) 범위 목록 (미리보기 결과만)
+HIGHLIGHT_SPANS_ROLE = Qt.UserRole + 2
+
+# 체크 열 위치 (데이터 열은 한 칸씩 뒤로 밀림)
+CHECK_COLUMN = 0
+
+
+class ResultTableModel(QAbstractTableModel):
+    """
+    [v2.1.0] 검색 결과 테이블 모델.
+    같은 시트의 결과 목록과 헤더를 받아 행 = 결과, 열 = 체크 + 헤더로 표시합니다.
+    결과가 모두 미리보기면 열은 결과들의 스니펫 컬럼 합집합(헤더 순서)입니다.
+    """
+
+    check_changed = Signal()  # 체크 상태 변경 시
+
+    def __init__(self, results: List[SearchResult], headers: List[str], parent=None):
+        super().__init__(parent)
+        self._results = results
+        self._all_headers = headers
+        self._headers = self._visible_headers(results)
+        self._checked: Set[int] = set()
+        # 행별 매칭 컬럼명 (화면에 그려지는 행만 계산해 보관)
+        self._matched_cols: Dict[int, Set[str]] = {}
+
+    # ─── QAbstractTableModel ───
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._results)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers) + 1
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+
+        if col == CHECK_COLUMN:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if row in self._checked else Qt.Unchecked
+            return None
+
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            col_name = self._headers[col - 1]
+            return self._results[row].row.cells.get(col_name, '')
+        if role == MATCH_COLOR_ROLE:
+            col_name = self._headers[col - 1]
+            if col_name in self._matched_columns(row):
+                return Colors.match_color(self._results[row].match_type)
+        if role == HIGHLIGHT_SPANS_ROLE:
+            snippet = self._results[row].snippet
+            if snippet is not None:
+                return snippet.highlights.get(self._headers[col - 1])
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or index.column() != CHECK_COLUMN or role != Qt.CheckStateRole:
+            return False
+        if Qt.CheckState(value) == Qt.Checked:
+            self._checked.add(index.row())
+        else:
+            self._checked.discard(index.row())
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        self.check_changed.emit()
+        return True
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == CHECK_COLUMN:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return "" if section == CHECK_COLUMN else self._headers[section - 1]
+        return str(section + 1)
+
+    # ─── 결과 접근 ───
+
+    def result(self, row: int) -> Optional[SearchResult]:
+        """행 번호의 결과"""
+        return self._results[row] if 0 <= row < len(self._results) else None
+
+    def results(self) -> List[SearchResult]:
+        return self._results
+
+    def is_preview(self) -> bool:
+        """미리보기 결과라 일부 컬럼만 보여 주는지"""
+        return len(self._headers) < len(self._all_headers)
+
+    def append_results(self, results: List[SearchResult]):
+        """결과 행을 끝에 추가합니다 (다음 페이지)."""
+        if not results:
+            return
+        headers = self._visible_headers(self._results + results)
+        if headers != self._headers:
+            # 새 결과의 스니펫 컬럼이 늘어나면 열 구성을 다시 만듦 (체크 상태는 유지)
+            self.beginResetModel()
+            self._results.extend(results)
+            self._headers = headers
+            self.endResetModel()
+            return
+        start = len(self._results)
+        self.beginInsertRows(QModelIndex(), start, start + len(results) - 1)
+        self._results.extend(results)
+        self.endInsertRows()
+
+    def show_full_rows(self, results: List[SearchResult]):
+        """
+        같은 행들의 전체 행 결과로 바꾸고 모든 컬럼을 보여 줍니다.
+        results는 기존 결과와 같은 순서이며, 사라진 행 없이 수가 같으면 체크 상태를 유지합니다.
+        """
+        self.beginResetModel()
+        if len(results) != len(self._results):
+            self._checked.clear()
+        self._results[:] = results
+        self._headers = self._visible_headers(self._results)
+        self._matched_cols.clear()
+        self.endResetModel()
+        self.check_changed.emit()
+
+    def _visible_headers(self, results: List[SearchResult]) -> List[str]:
+        """보여 줄 컬럼: 모든 결과가 미리보기면 스니펫 컬럼 합집합, 아니면 전체 헤더"""
+        if not results or not all(r.is_preview for r in results):
+            return self._all_headers
+        columns: Set[str] = set()
+        for r in results:
+            columns.update(r.snippet.columns)
+        return [h for h in self._all_headers if h in columns]
+
+    def checked_results(self) -> List[SearchResult]:
+        """체크된 결과 (행 순서)"""
+        return [self._results[i] for i in sorted(self._checked)]
+
+    def set_all_checked(self, checked: bool):
+        """전체 체크/해제 (체크 열만 다시 그림)"""
+        if checked:
+            self._checked = set(range(len(self._results)))
+        else:
+            self._checked.clear()
+        if self._results:
+            self.dataChanged.emit(
+                self.index(0, CHECK_COLUMN),
+                self.index(len(self._results) - 1, CHECK_COLUMN),
+                [Qt.CheckStateRole]
+            )
+        self.check_changed.emit()
+
+    def _matched_columns(self, row: int) -> Set[str]:
+        cols = self._matched_cols.get(row)
+        if cols is None:
+            cols = {m.col_name for m in self._results[row].matches}
+            self._matched_cols[row] = cols
+        return cols
+
+
+class MatchHighlightDelegate(QStyledItemDelegate):
+    """
+    [v2.1.0] 매칭된 셀 강조 델리게이트.
+    모델의 MATCH_COLOR_ROLE 색상으로 글자색을 바꾸고 굵게 그립니다.
+    HIGHLIGHT_SPANS_ROLE 범위가 있으면 셀 전체 대신 그 범위의 글자만 강조합니다.
+    """
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        color = index.data(MATCH_COLOR_ROLE)
+        if color and not index.data(HIGHLIGHT_SPANS_ROLE):
+            option.font.setBold(True)
+            option.palette.setColor(QPalette.Text, QColor(color))
+            option.palette.setColor(QPalette.HighlightedText, QColor(color))
+
+    def paint(self, painter, option, index):
+        spans = index.data(HIGHLIGHT_SPANS_ROLE)
+        if not spans:
+            super().paint(painter, option, index)
+            return
+
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        text, opt.text = opt.text, ""
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+        # 배경/선택 표시는 기본 스타일로 그리고 글자만 직접 그림
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)
+        rect = style.subElementRect(QStyle.SE_ItemViewItemText, opt, widget)
+
+        fmt = QTextCharFormat()
+        fmt.setFontWeight(QFont.Bold)
+        color = index.data(MATCH_COLOR_ROLE)
+        if color:
+            fmt.setForeground(QColor(color))
+        ranges = []
+        for start, end in spans:
+            fr = QTextLayout.FormatRange()
+            fr.start, fr.length, fr.format = start, end - start, fmt
+            ranges.append(fr)
+
+        layout = QTextLayout(text, opt.font)
+        layout.setFormats(ranges)
+        layout.beginLayout()
+        line = layout.createLine()
+        line.setNumColumns(len(text))  # 한 줄로 그리고 셀 밖은 잘라냄
+        layout.endLayout()
+
+        selected = opt.state & QStyle.State_Selected
+        painter.save()
+        painter.setClipRect(rect)
+        painter.setPen(opt.palette.color(QPalette.HighlightedText if selected else QPalette.Text))
+        margin = style.pixelMetric(QStyle.PM_FocusFrameHMargin, None, widget) + 1
+        layout.draw(painter, QPointF(rect.left() + margin, rect.top() + (rect.height() - line.height()) / 2))
+        painter.restore()
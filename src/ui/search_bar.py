@@ -2,21 +2,26 @@
 [v2.0.0] 구글 스타일 검색창 위젯
 단일 입력창으로 모든 검색을 처리합니다.
 디바운스(300ms)로 타이핑이 끝나면 자동 검색을 트리거합니다.
+
+[v2.1.0] 디바운스는 SearchScheduler가 최근 검색 시간과 인덱스 크기로 키 입력마다 정하며,
+검색이 진행 중이면 새 검색어는 보류했다가 검색이 끝나면 마지막 것만 보냅니다.
 """
 
+from typing import Optional
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLineEdit,
     QPushButton, QLabel, QFrame
 )
 from PySide6.QtCore import Signal, Qt, QTimer
 from PySide6.QtGui import QKeySequence, QShortcut
+from src.core.search_scheduler import SearchScheduler
 from src.ui.styles import Colors
 
 
 class SearchBar(QWidget):
     """
     [v2.0.0] 단일 검색창 위젯.
-    - 검색어 입력 시 300ms 디바운스 후 자동 검색 시그널 방출
+    - 검색어 입력 시 디바운스 후 자동 검색 시그널 방출 (검색 시간에 맞춰 조정)
     - 최근 검색어 태그 표시
     - 파일 통계 라벨
     """
@@ -73,17 +78,18 @@ class SearchBar(QWidget):
         layout.addLayout(info_row)
 
     def _setup_debounce(self):
-        """300ms 디바운스 타이머 설정"""
+        """디바운스 타이머 설정 (간격은 키 입력마다 스케줄러가 정함)"""
+        self.scheduler = SearchScheduler()
         self.debounce_timer = QTimer(self)
         self.debounce_timer.setSingleShot(True)
-        self.debounce_timer.setInterval(300)
+        self.debounce_timer.setInterval(SearchScheduler.DEFAULT_DEBOUNCE_MS)
         self.debounce_timer.timeout.connect(self._emit_search)
         self.input.textChanged.connect(self._on_text_changed)
 
     def _on_text_changed(self, text: str):
         """텍스트 변경 시 디바운스 타이머 리셋"""
         if text.strip():
-            self.debounce_timer.start()
+            self.debounce_timer.start(self.scheduler.debounce_ms())
         else:
             self.debounce_timer.stop()
 
@@ -91,17 +97,37 @@ class SearchBar(QWidget):
         """디바운스 후 검색 시그널 방출"""
         text = self.input.text().strip()
         if text:
-            self.search_requested.emit(text)
+            self._dispatch(text)
 
     def _emit_search_now(self):
         """즉시 검색 (엔터 키 또는 버튼 클릭)"""
         self.debounce_timer.stop()
         text = self.input.text().strip()
         if text:
-            self.search_requested.emit(text)
+            self._dispatch(text)
+
+    def search_now(self):
+        """현재 검색어로 다시 검색합니다 (유사도 변경 등)."""
+        self._emit_search_now()
+
+    def _dispatch(self, text: str):
+        """검색 중이 아니면 바로 보내고, 검색 중이면 마지막 검색어로 보류"""
+        query = self.scheduler.request(text)
+        if query is not None:
+            self.search_requested.emit(query)
+
+    def search_finished(self, elapsed: Optional[float] = None):
+        """
+        검색 완료/실패 알림 (elapsed: 소요 시간 초).
+        보류 중이던 마지막 검색어가 있으면 바로 보냅니다.
+        """
+        query = self.scheduler.finished(elapsed)
+        if query is not None:
+            self.search_requested.emit(query)
 
     def update_stats(self, file_count: int, row_count: int):
         """파일/행 통계 업데이트"""
+        self.scheduler.set_index_size(row_count)
         if file_count == 0:
             self.stats_label.setText("파일을 추가해 주세요")
         else:
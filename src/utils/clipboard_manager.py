@@ -1,5 +1,5 @@
 import pyperclip
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 class ClipboardManager:
     """
@@ -33,6 +33,36 @@ class ClipboardManager:
 
         return "\n".join(lines)
 
+    @staticmethod
+    def format_results(results) -> Tuple[str, int]:
+        """
+        [KR] 검색 결과(SearchResult 시퀀스)를 엑셀 붙여넣기용 TSV 문자열로 변환합니다.
+        첫 결과의 헤더를 머리글로 쓰고, 각 행은 자기 시트의 헤더 순서로 값을 나열합니다.
+        줄 목록을 결과 수만큼 미리 잡아 두고 마지막에 한 번만 이어 붙입니다
+        (join이 전체 길이를 먼저 계산해 한 번에 할당하므로 행마다 문자열을 다시 만들지 않음).
+
+        Args:
+            results: Sequence[SearchResult] (List 또는 RankedResults)
+
+        Returns:
+            (TSV 문자열, 행 수)
+        """
+        lines = [None] * (len(results) + 1)
+        count = 0
+        for r in results:
+            headers = r.row.headers
+            if count == 0:
+                lines[0] = '\t'.join(headers)
+            count += 1
+            cells = r.row.cells
+            lines[count] = '\t'.join([cells.get(h, '') for h in headers])
+
+        if count == 0:
+            return "", 0
+        # 재인덱싱으로 사라진 행이 있으면 남은 자리 제거
+        del lines[count + 1:]
+        return "\n".join(lines), count
+
     @staticmethod
     def copy_to_clipboard(text: str) -> bool:
         """
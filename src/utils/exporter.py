@@ -2,13 +2,41 @@
 [v2.0.0] 검색 결과 내보내기 유틸리티
 검색 결과를 Excel(.xlsx) 또는 CSV(.csv) 파일로 내보냅니다.
 체크된 결과만 또는 전체 결과를 내보낼 수 있습니다.
+
+[v2.1.0] 결과를 한 행씩 받아 바로 파일에 쓰는 스트리밍 방식입니다.
+xlsx는 xlsxwriter(설치된 경우, constant_memory 모드) 또는 openpyxl 쓰기 전용 통합 문서,
+CSV는 csv 모듈로 쓰므로 결과 수와 무관하게 메모리가 일정하며,
+RankedResults(전체 순위 커서)를 넘기면 행 데이터도 페이지 단위로만 만들어집니다.
+
+[v2.1.0] 쓰기 라이브러리(openpyxl, xlsxwriter)는 내보낼 때 import합니다 (앱 시작 시간 단축).
 """
 
-import pandas as pd
+import csv
+import importlib.util
+import os
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Optional
 from src.utils.logger import logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# xlsxwriter 설치 여부 (import는 쓸 때)
+HAS_XLSXWRITER = importlib.util.find_spec('xlsxwriter') is not None
+
+# 출처 정보 열 (원본 데이터 열 앞에 붙음)
+META_COLUMNS = ['_출처파일', '_시트', '_매칭유형', '_유사도']
+
+# 진행률 알림 간격 (행)
+PROGRESS_INTERVAL = 1000
+
+# xlsx 시트 한 장의 최대 데이터 행 수 (헤더 제외). 넘으면 다음 시트에 이어 씀
+XLSX_MAX_ROWS = 1_048_575
+
+
+class ExportCancelled(Exception):
+    """내보내기가 중간에 취소됨 (쓰던 파일은 삭제됨)"""
+
 
 class ResultExporter:
     """
@@ -18,49 +46,79 @@ class ResultExporter:
     """
 
     @staticmethod
-    def export_results(results, file_path: str):
+    def export_results(results, file_path: str,
+                       progress: Optional[Callable[[int, int], None]] = None,
+                       should_stop: Optional[Callable[[], bool]] = None) -> int:
         """
         검색 결과를 파일로 내보냅니다.
 
         Args:
-            results: List[SearchResult] — 내보낼 검색 결과
+            results: Sequence[SearchResult] — 내보낼 검색 결과 (List 또는 RankedResults)
             file_path: 저장할 파일 경로 (.xlsx 또는 .csv)
+            progress: (쓴 행 수, 전체 행 수)를 받는 진행률 콜백
+            should_stop: True를 반환하면 중단하고 ExportCancelled를 발생
+
+        Returns:
+            쓴 행 수
         """
         if not results:
             logger.warning("내보낼 결과가 없습니다")
-            return
-
-        # 결과를 DataFrame으로 변환
-        rows = []
-        for r in results:
-            row_dict = {
-                '_출처파일': r.row.file_name,
-                '_시트': r.row.sheet_name,
-                '_매칭유형': r.match_type,
-                '_유사도': f"{r.similarity:.0%}",
-            }
-            # 원본 데이터 셀 추가
-            for header in r.row.headers:
-                row_dict[header] = r.row.cells.get(header, '')
-            rows.append(row_dict)
-
-        df = pd.DataFrame(rows)
+            return 0
+
+        headers = ResultExporter.collect_headers(results)
+        columns = META_COLUMNS + headers
+        total = len(results)
+        written = 0
+
+        def rows() -> Iterator[list]:
+            nonlocal written
+            for r in results:
+                if should_stop is not None and should_stop():
+                    raise ExportCancelled(file_path)
+                yield [
+                    r.row.file_name, r.row.sheet_name, r.match_type, f"{r.similarity:.0%}",
+                    *(r.row.cells.get(h) for h in headers)
+                ]
+                written += 1
+                if progress is not None and written % PROGRESS_INTERVAL == 0:
+                    progress(written, total)
 
         # 파일 형식에 따라 저장
         ext = Path(file_path).suffix.lower()
         try:
             if ext == '.csv':
-                df.to_csv(file_path, index=False, encoding='utf-8-sig')
+                _write_csv(file_path, columns, rows())
             else:
-                df.to_excel(file_path, index=False, engine='openpyxl')
-
-            logger.info(f"내보내기 완료: {file_path} ({len(rows)}건)")
+                _write_xlsx(file_path, columns, rows())
+        except ExportCancelled:
+            _remove_partial(file_path)
+            logger.info(f"내보내기 취소: {file_path} ({written}건 쓰던 중)")
+            raise
         except Exception as e:
+            _remove_partial(file_path)
             logger.error(f"내보내기 실패: {e}", exc_info=True)
             raise
 
+        if progress is not None:
+            progress(written, total)
+        logger.info(f"내보내기 완료: {file_path} ({written}건)")
+        return written
+
+    @staticmethod
+    def collect_headers(results) -> List[str]:
+        """
+        모든 결과 행의 헤더를 처음 나온 순서대로 합칩니다.
+        RankedResults는 행 데이터를 만들지 않고 시트별 헤더만 조회합니다.
+        """
+        sheet_headers = getattr(results, 'sheet_headers', None)
+        if sheet_headers is not None:
+            header_lists: Iterable[List[str]] = sheet_headers()
+        else:
+            header_lists = (r.row.headers for r in results)
+        return list(dict.fromkeys(h for hs in header_lists for h in hs))
+
     @staticmethod
-    def export_dataframe(df: pd.DataFrame, file_path: str):
+    def export_dataframe(df: 'pd.DataFrame', file_path: str):
         """
         DataFrame을 파일로 직접 내보냅니다 (범용).
 
@@ -77,3 +135,69 @@ class ResultExporter:
         except Exception as e:
             logger.error(f"DataFrame 내보내기 실패: {e}", exc_info=True)
             raise
+
+
+def _write_csv(file_path: str, columns: List[str], rows: Iterable[list]):
+    """CSV로 한 행씩 씁니다 (Excel 호환을 위해 BOM 포함 UTF-8)."""
+    with open(file_path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(rows)
+
+
+def _write_xlsx(file_path: str, columns: List[str], rows: Iterable[list]):
+    """한 행씩 xlsx로 씁니다 (시트 최대 행을 넘으면 다음 시트)."""
+    if HAS_XLSXWRITER:
+        _write_xlsx_xlsxwriter(file_path, columns, rows)
+    else:
+        _write_xlsx_openpyxl(file_path, columns, rows)
+
+
+def _write_xlsx_xlsxwriter(file_path: str, columns: List[str], rows: Iterable[list]):
+    """xlsxwriter constant_memory 모드 (행을 쓰는 즉시 임시 파일로 내보냄)"""
+    import xlsxwriter
+    wb = xlsxwriter.Workbook(file_path, {'constant_memory': True})
+    try:
+        ws = None
+        sheet_rows = XLSX_MAX_ROWS
+        sheet_no = 0
+        for row in rows:
+            if sheet_rows >= XLSX_MAX_ROWS:
+                sheet_no += 1
+                ws = wb.add_worksheet(f"Sheet{sheet_no}")
+                ws.write_row(0, 0, columns)
+                sheet_rows = 0
+            sheet_rows += 1
+            ws.write_row(sheet_rows, 0, row)
+        if ws is None:
+            wb.add_worksheet("Sheet1").write_row(0, 0, columns)
+    finally:
+        wb.close()
+
+
+def _write_xlsx_openpyxl(file_path: str, columns: List[str], rows: Iterable[list]):
+    """openpyxl 쓰기 전용 통합 문서"""
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    ws = None
+    sheet_rows = XLSX_MAX_ROWS
+    sheet_no = 0
+    for row in rows:
+        if sheet_rows >= XLSX_MAX_ROWS:
+            sheet_no += 1
+            ws = wb.create_sheet(f"Sheet{sheet_no}")
+            ws.append(columns)
+            sheet_rows = 0
+        ws.append(row)
+        sheet_rows += 1
+    if ws is None:
+        wb.create_sheet("Sheet1").append(columns)
+    wb.save(file_path)
+
+
+def _remove_partial(file_path: str):
+    """실패/취소로 남은 쓰다 만 파일 삭제"""
+    try:
+        os.remove(file_path)
+    except OSError:
+        pass
@@ -0,0 +1,12 @@
+"""
+테스트 공용 픽스처
+"""
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Qt 모델/시그널 테스트용 QCoreApplication (이미 있으면 재사용)"""
+    return QCoreApplication.instance() or QCoreApplication([])
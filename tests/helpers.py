@@ -0,0 +1,13 @@
+"""
+테스트 공용 도우미
+"""
+
+from src.core.indexer import RowData
+from src.core.searcher import MatchDetail, SearchResult
+
+
+def make_result(sheet, row_idx, cells, file_path='a.xlsx'):
+    """첫 번째 셀이 정확 매칭된 검색 결과를 만듭니다."""
+    row = RowData(file_path, file_path, sheet, row_idx, cells, list(cells))
+    value = next(iter(cells.values()))
+    return SearchResult(row, 1.0, 'exact', 1.0, [MatchDetail(next(iter(cells)), value, 'exact', 1.0)])
@@ -0,0 +1,272 @@
+import os
+import shutil
+import pytest
+from openpyxl import Workbook
+from src.core import cache as cache_module
+from src.core.cache import FILE_VALID, IndexCache, compute_fingerprint
+
+
+@pytest.fixture
+def xlsx_file(tmp_path):
+    path = tmp_path / "data.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    ws.append(["Name", "Age"])
+    ws.append(["Alice", 30])
+    wb.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = IndexCache(str(tmp_path / "cache.db"))
+    yield c
+    c.close()
+
+
+def _save(cache, path):
+    cells = {'Sheet1': [(0, 0, 'Alice'), (0, 1, '30')]}
+    cache.save_file_data(path, os.path.basename(path), cells, {'Sheet1': ['Name', 'Age']})
+
+
+def test_save_and_load(cache, xlsx_file):
+    assert not cache.is_file_cached(xlsx_file)
+    _save(cache, xlsx_file)
+
+    assert cache.is_file_cached(xlsx_file)
+    data = cache.load_file_data(xlsx_file)
+    assert data['headers'] == {'Sheet1': ['Name', 'Age']}
+    assert {c['value'] for c in data['cells']} == {'Alice', '30'}
+
+
+def test_mtime_change_with_same_content(cache, xlsx_file):
+    """[KR] mtime만 바뀌고 내용이 같으면 캐시가 유효해야 함"""
+    _save(cache, xlsx_file)
+    st = os.stat(xlsx_file)
+    os.utime(xlsx_file, (st.st_atime + 100, st.st_mtime + 100))
+
+    assert cache.is_file_cached(xlsx_file)
+
+
+def test_mtime_check_without_hash(tmp_path, xlsx_file):
+    cache = IndexCache(str(tmp_path / "nohash.db"), use_content_hash=False)
+    _save(cache, xlsx_file)
+    st = os.stat(xlsx_file)
+    os.utime(xlsx_file, (st.st_atime + 100, st.st_mtime + 100))
+
+    assert not cache.is_file_cached(xlsx_file)
+    cache.close()
+
+
+def test_copy_shares_cached_data(cache, xlsx_file, tmp_path):
+    """[KR] 다른 경로의 동일 내용 파일은 기존 캐시 데이터를 공유해야 함"""
+    _save(cache, xlsx_file)
+    copy_path = str(tmp_path / "copy.xlsx")
+    shutil.copy(xlsx_file, copy_path)
+
+    assert cache.is_file_cached(copy_path)
+    data = cache.load_file_data(copy_path)
+    assert data['file_path'] == copy_path
+    assert len(data['cells']) == 2
+
+    # 원본을 캐시에서 지워도 복사본은 데이터를 유지
+    cache.remove_file(xlsx_file)
+    assert len(cache.load_file_data(copy_path)['cells']) == 2
+
+
+def test_fingerprint_detects_change(tmp_path, xlsx_file):
+    before = compute_fingerprint(xlsx_file)
+    csv_path = tmp_path / "a.csv"
+    csv_path.write_text("a,b\n1,2\n", encoding='utf-8')
+    csv_before = compute_fingerprint(str(csv_path))
+
+    wb = Workbook()
+    wb.active.append(["Changed"])
+    wb.save(xlsx_file)
+    csv_path.write_text("a,b\n1,3\n", encoding='utf-8')
+
+    assert compute_fingerprint(xlsx_file) != before
+    assert compute_fingerprint(str(csv_path)) != csv_before
+
+
+def test_migrate_legacy_schema(tmp_path, xlsx_file):
+    """[KR] 구버전(cell_data) 스키마 DB를 열면 v2 스키마로 변환되어야 함"""
+    import sqlite3
+    db_path = str(tmp_path / "legacy.db")
+    st = os.stat(xlsx_file)
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE file_meta (
+            file_path TEXT PRIMARY KEY, file_name TEXT NOT NULL,
+            file_mtime REAL NOT NULL, file_size INTEGER NOT NULL,
+            indexed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE cell_data (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, file_path TEXT NOT NULL,
+            sheet_name TEXT NOT NULL, row_idx INTEGER NOT NULL, col_idx INTEGER NOT NULL,
+            col_name TEXT NOT NULL, cell_value TEXT NOT NULL
+        );
+        CREATE TABLE sheet_headers (
+            file_path TEXT NOT NULL, sheet_name TEXT NOT NULL, headers_json TEXT NOT NULL,
+            PRIMARY KEY (file_path, sheet_name)
+        );
+    """)
+    conn.execute("INSERT INTO file_meta (file_path, file_name, file_mtime, file_size) VALUES (?, ?, ?, ?)",
+                 (xlsx_file, "data.xlsx", st.st_mtime, st.st_size))
+    conn.execute("INSERT INTO sheet_headers VALUES (?, 'Sheet1', ?)", (xlsx_file, '["Name", "Age"]'))
+    conn.execute("INSERT INTO cell_data (file_path, sheet_name, row_idx, col_idx, col_name, cell_value) "
+                 "VALUES (?, 'Sheet1', 0, 1, 'Age', '30')", (xlsx_file,))
+    conn.commit()
+    conn.close()
+
+    cache = IndexCache(db_path)
+    tables = {r[0] for r in cache._conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert 'cell_data' not in tables
+    assert cache.is_file_cached(xlsx_file)
+    data = cache.load_file_data(xlsx_file)
+    assert data['headers'] == {'Sheet1': ['Name', 'Age']}
+    assert data['cells'][0]['col_name'] == 'Age'
+    assert data['cells'][0]['value'] == '30'
+    cache.close()
+
+
+def test_sheet_segments(cache, xlsx_file):
+    """[KR] 세그먼트가 저장된 캐시는 셀 순서와 함께 세그먼트를 돌려줘야 함"""
+    from src.core.segment import SegmentBuilder
+    assert cache.load_sheet_segments(xlsx_file) is None
+
+    builder = SegmentBuilder()
+    builder.add_cell({'alice'}, set(), float('nan'))
+    builder.add_cell({'30'}, set(), 30.0)
+    cells = {'Sheet1': [(0, 0, 'Alice'), (0, 1, '30')]}
+    cache.save_file_data(xlsx_file, 'data.xlsx', cells, {'Sheet1': ['Name', 'Age']},
+                         {'Sheet1': builder.build()})
+
+    stored = cache.load_sheet_segments(xlsx_file)
+    sheet = stored['sheets']['Sheet1']
+    assert sheet['headers'] == ['Name', 'Age']
+    assert sheet['cells'] == [(0, 0, 'Alice'), (0, 1, '30')]
+    assert sheet['segment'].tokens == ['30', 'alice']
+
+    # 세그먼트 없이 다시 저장하면 셀 데이터 경로로 대체
+    _save(cache, xlsx_file)
+    assert cache.load_sheet_segments(xlsx_file) is None
+
+
+def test_open_mapped_sheets(tmp_path, cache, xlsx_file):
+    """[KR] 세그먼트와 함께 저장하면 메모리 맵 인덱스 파일로 열 수 있어야 함"""
+    from src.core.segment import SegmentBuilder
+    builder = SegmentBuilder()
+    builder.add_cell({'alice'}, set(), float('nan'))
+    cells = {'Sheet1': [(0, 0, 'Alice')]}
+    cache.save_file_data(xlsx_file, 'data.xlsx', cells, {'Sheet1': ['Name', 'Age']},
+                         {'Sheet1': builder.build()})
+
+    mapped = cache.open_mapped_sheets(xlsx_file)
+    sheet = mapped['sheets'][0]
+    assert sheet.row_cells(0) == {'Name': 'Alice'}
+    sheet.close()
+
+    files = os.listdir(cache.mapped_dir)
+    assert len(files) == 1
+    cache.remove_file(xlsx_file)
+    assert os.listdir(cache.mapped_dir) == []
+    assert cache.open_mapped_sheets(xlsx_file) is None
+
+
+def _save_rows(cache, path, rows):
+    cells = {'Sheet1': [(r, 0, f"value-{r}-" + 'x' * 200) for r in range(rows)]}
+    cache.save_file_data(path, os.path.basename(path), cells, {'Sheet1': ['Name']})
+
+
+def test_remove_orphans(cache, xlsx_file, tmp_path):
+    other = str(tmp_path / "other.xlsx")
+    shutil.copy(xlsx_file, other)
+    _save_rows(cache, xlsx_file, 10)
+    os.remove(xlsx_file)
+
+    assert cache.remove_orphans()['missing_files'] == 1
+    assert cache.get_cached_files() == []
+
+
+def test_evict_lru_to_budget(cache, tmp_path):
+    """[KR] 용량 한도를 넘으면 오래 사용하지 않은 파일부터 제거하고 보호 파일은 남겨야 함"""
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"f{i}.csv"
+        path.write_text(f"Name\nrow{i}\n")
+        paths.append(str(path))
+        _save_rows(cache, paths[-1], 2000)
+    cache.is_file_cached(paths[0])  # f0을 f2보다 최근 사용으로
+
+    used = cache.get_stats()['used_bytes']
+    evicted = cache.evict_to_budget(used - 1, protect=[paths[1]])
+
+    assert evicted == [paths[2]]
+    assert set(cache.get_cached_files()) == {paths[0], paths[1]}
+
+
+def test_run_maintenance_reclaims_space(cache, tmp_path):
+    path = tmp_path / "f.csv"
+    path.write_text("Name\nrow\n")
+    _save_rows(cache, str(path), 5000)
+    before = cache.get_stats()['db_bytes']
+    cache.remove_file(str(path))
+
+    result = cache.run_maintenance(max_bytes=10 * 1024 * 1024)
+    assert result['stats']['files'] == 0
+    assert result['stats']['db_bytes'] < before
+    assert cache._conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+
+def test_save_many_write_failure_rolls_back(cache, xlsx_file, monkeypatch):
+    """[KR] 기록 중 오류가 나면 롤백하고 0을 반환해야 함 (예외가 밖으로 새지 않아야 함)"""
+    def fail(*args, **kwargs):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(cache, '_write_file_data', fail)
+    entry = (xlsx_file, 'data.xlsx', {'Sheet1': [(0, 0, 'Alice')]}, {'Sheet1': ['Name']}, None)
+    assert cache.save_many([entry]) == 0
+    assert not cache.is_file_cached(xlsx_file)
+
+
+def test_cached_file_stays_valid_while_writer_holds_lock(tmp_path, xlsx_file, monkeypatch):
+    """[KR] 다른 연결이 쓰기 락을 잡고 있어도 사용 시각 갱신만 건너뛰고 캐시 유효로 판단해야 함"""
+    monkeypatch.setattr(cache_module, 'BUSY_TIMEOUT', 0.05)
+    db = str(tmp_path / "cache.db")
+    cache, writer = IndexCache(db), IndexCache(db)
+    _save(cache, xlsx_file)
+    writer._conn.execute("BEGIN IMMEDIATE")
+    try:
+        assert cache.is_file_cached(xlsx_file)
+        assert cache.validate_files([xlsx_file]) == {xlsx_file: FILE_VALID}
+        st = os.stat(xlsx_file)
+        os.utime(xlsx_file, (st.st_atime + 100, st.st_mtime + 100))
+        assert cache.is_file_cached(xlsx_file)
+    finally:
+        writer._conn.rollback()
+        writer.close()
+    assert not cache._conn.in_transaction
+    cache.close()
+
+
+def test_evict_measures_usage_once(cache, tmp_path, monkeypatch):
+    """[KR] 여러 데이터를 제거해도 사용량은 한 번만 측정하고, 추정 크기를 빼 가며 한도까지만 제거해야 함"""
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"f{i}.csv"
+        path.write_text(f"Name\nrow{i}\n")
+        paths.append(str(path))
+        _save_rows(cache, paths[-1], 2000)
+    used = cache.get_stats()['used_bytes']
+    per_file = used // 4
+
+    calls = []
+    get_stats = cache.get_stats
+    monkeypatch.setattr(cache, 'get_stats', lambda: calls.append(1) or get_stats())
+    evicted = cache.evict_to_budget(used - per_file * 2 - per_file // 2)
+
+    assert calls == [1]
+    assert evicted == paths[:3]
+    assert cache.get_cached_files() == [paths[3]]
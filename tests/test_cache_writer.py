@@ -0,0 +1,94 @@
+import pytest
+from openpyxl import Workbook
+from src.core.cache import IndexCache
+from src.core.cache_writer import CacheWriter, _STOP
+
+
+@pytest.fixture
+def xlsx_files(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"data{i}.xlsx"
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Name"])
+        ws.append([f"value{i}"])
+        wb.save(path)
+        paths.append(str(path))
+    return paths
+
+
+def test_batches_pending_files(tmp_path, xlsx_files):
+    """[KR] 대기 중인 파일들은 하나의 트랜잭션으로 묶여 저장되어야 함"""
+    db_path = str(tmp_path / "cache.db")
+    writer = CacheWriter(db_path, max_pending=8)
+    for i, path in enumerate(xlsx_files):
+        writer.save_file_data(path, f"data{i}.xlsx", {'Sheet': [(0, 0, f"value{i}")]},
+                              {'Sheet': ['Name']})
+
+    writer.start()
+    writer.close()
+
+    assert writer.files_written == 3
+    assert writer.batches_committed == 1
+    cache = IndexCache(db_path)
+    for i, path in enumerate(xlsx_files):
+        assert cache.is_file_cached(path)
+        assert cache.load_file_data(path)['cells'][0]['value'] == f"value{i}"
+    cache.close()
+
+
+def test_missing_file_does_not_block_batch(tmp_path, xlsx_files):
+    db_path = str(tmp_path / "cache.db")
+    writer = CacheWriter(db_path)
+    writer.start()
+    writer.save_file_data(str(tmp_path / "gone.xlsx"), "gone.xlsx", {'Sheet': [(0, 0, 'x')]}, {'Sheet': ['A']})
+    writer.save_file_data(xlsx_files[0], "data0.xlsx", {'Sheet': [(0, 0, 'x')]}, {'Sheet': ['A']})
+    writer.flush()
+
+    assert writer.files_written == 1
+    writer.close()
+    # 종료 후 요청은 무시
+    writer.save_file_data(xlsx_files[1], "data1.xlsx", {'Sheet': []}, {'Sheet': ['A']})
+    assert writer.files_written == 1
+
+
+def test_failing_batch_keeps_thread_alive(tmp_path, xlsx_files, monkeypatch):
+    """[KR] 한 묶음 저장이 예외로 실패해도 스레드는 살아서 다음 요청을 처리해야 함"""
+    original = IndexCache.save_many
+    calls = []
+
+    def flaky(self, entries):
+        calls.append(len(entries))
+        if len(calls) == 1:
+            raise RuntimeError("disk I/O error")
+        return original(self, entries)
+
+    monkeypatch.setattr(IndexCache, 'save_many', flaky)
+    writer = CacheWriter(str(tmp_path / "cache.db"))
+    writer.start()
+    writer.save_file_data(xlsx_files[0], "data0.xlsx", {'Sheet': [(0, 0, 'x')]}, {'Sheet': ['A']})
+    writer.flush()
+    assert writer.is_alive()
+
+    writer.save_file_data(xlsx_files[1], "data1.xlsx", {'Sheet': [(0, 0, 'y')]}, {'Sheet': ['A']})
+    writer.flush()
+    assert writer.files_written == 1
+    writer.close()
+
+
+def test_save_without_running_thread_writes_synchronously(tmp_path, xlsx_files):
+    """[KR] 스레드가 죽은 뒤의 요청은 큐에서 막히지 않고 바로 저장되어야 함"""
+    db_path = str(tmp_path / "cache.db")
+    writer = CacheWriter(db_path, max_pending=1)
+    writer.start()
+    writer._queue.put(_STOP)
+    writer.join()
+
+    for i, path in enumerate(xlsx_files):
+        writer.save_file_data(path, f"data{i}.xlsx", {'Sheet': [(0, 0, f"value{i}")]}, {'Sheet': ['A']})
+
+    assert writer.files_written == 3
+    cache = IndexCache(db_path)
+    assert all(cache.is_file_cached(path) for path in xlsx_files)
+    cache.close()
@@ -1,7 +1,11 @@
 import unittest
 from unittest.mock import patch, MagicMock
+from helpers import make_result
+from src.core.workers import ClipboardWorker
+from src.ui.lazy_mime import LazyResultMimeData
 from src.utils.clipboard_manager import ClipboardManager
 
+
 class TestClipboardManager(unittest.TestCase):
     def test_format_for_clipboard(self):
         """
@@ -44,6 +48,42 @@ class TestClipboardManager(unittest.TestCase):
         """
         success = ClipboardManager.copy_to_clipboard("data")
         self.assertFalse(success)
+    def test_format_results(self):
+        """
+        [KR] 검색 결과 TSV 변환 테스트 (첫 결과 헤더 + 행별 자기 헤더 순서)
+        """
+        results = [make_result('S1', 0, {'Name': 'apple', 'Qty': '3'}),
+                   make_result('S2', 0, {'Code': 'P-1', 'Name': 'pear'})]
+        text, count = ClipboardManager.format_results(results)
+        self.assertEqual(count, 2)
+        self.assertEqual(text, "Name\tQty\napple\t3\nP-1\tpear")
+        self.assertEqual(ClipboardManager.format_results([]), ("", 0))
+
+    @patch('src.utils.clipboard_manager.pyperclip.copy')
+    def test_clipboard_worker(self, mock_copy):
+        """
+        [KR] 복사 워커가 TSV를 만들어 복사하고 결과를 알리는지 테스트
+        """
+        worker = ClipboardWorker([make_result('S1', 0, {'Name': 'apple'})])
+        done = []
+        worker.copy_done.connect(lambda count, ok: done.append((count, ok)))
+        worker.run()
+        mock_copy.assert_called_once_with("Name\napple")
+        self.assertEqual(done, [(1, True)])
+
+    def test_lazy_mime_renders_on_request(self):
+        """
+        [KR] 지연 클립보드 데이터가 요청 시점에 한 번만 TSV를 만드는지 테스트
+        """
+        mime = LazyResultMimeData([make_result('S1', 0, {'Name': 'apple'})])
+        self.assertTrue(mime.hasText())
+        self.assertFalse(mime.rendered)
+        with patch.object(ClipboardManager, 'format_results',
+                          wraps=ClipboardManager.format_results) as fmt:
+            self.assertEqual(mime.text(), "Name\napple")
+            self.assertEqual(mime.text(), "Name\napple")
+            self.assertEqual(fmt.call_count, 1)
+        self.assertTrue(mime.rendered)
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,70 @@
+import csv
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+from helpers import make_result
+from src.core.indexer import SearchIndex
+from src.core.searcher import MultiLayerSearcher
+from src.core.workers import ExportWorker
+from src.utils.exporter import META_COLUMNS, ExportCancelled, ResultExporter
+
+
+def test_csv_export_streams_union_of_headers(tmp_path):
+    """[KR] CSV 내보내기가 시트별 헤더를 합치고 없는 열은 비워 두는지 테스트"""
+    results = [make_result('S1', 0, {'Name': 'apple', 'Qty': '3'}),
+               make_result('S2', 0, {'Name': 'pear', 'Code': 'P-1'})]
+    path = tmp_path / 'out.csv'
+    progress = []
+    written = ResultExporter.export_results(results, str(path),
+                                            progress=lambda done, total: progress.append((done, total)))
+
+    assert written == 2
+    assert progress[-1] == (2, 2)
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == META_COLUMNS + ['Name', 'Qty', 'Code']
+    assert rows[1][4:] == ['apple', '3', '']
+    assert rows[2][4:] == ['pear', '', 'P-1']
+
+
+def test_xlsx_export_from_ranked_results(tmp_path):
+    """[KR] 전체 순위(RankedResults)를 xlsx로 스트리밍하는지 테스트"""
+    index = SearchIndex()
+    index.add_dataframe('a.xlsx', 'a.xlsx', 'S1',
+                        pd.DataFrame({'Code': [f'AB-{i}' for i in range(300)], 'Qty': range(300)}))
+    ranked = MultiLayerSearcher(index).search('ab', min_similarity=0.95, max_results=None)
+    assert ResultExporter.collect_headers(ranked) == ['Code', 'Qty']
+
+    path = tmp_path / 'out.xlsx'
+    assert ResultExporter.export_results(ranked, str(path)) == 300
+
+    ws = load_workbook(path, read_only=True).active
+    rows = list(ws.iter_rows(values_only=True))
+    assert list(rows[0]) == META_COLUMNS + ['Code', 'Qty']
+    assert len(rows) == 301
+    assert {r[4] for r in rows[1:]} == {f'AB-{i}' for i in range(300)}
+
+
+def test_cancel_removes_partial_file(tmp_path):
+    """[KR] 취소하면 ExportCancelled가 발생하고 쓰던 파일이 삭제되는지 테스트"""
+    results = [make_result('S1', i, {'Name': f'n{i}'}) for i in range(10)]
+    path = tmp_path / 'out.csv'
+    calls = []
+
+    def should_stop():
+        calls.append(1)
+        return len(calls) > 5
+
+    with pytest.raises(ExportCancelled):
+        ResultExporter.export_results(results, str(path), should_stop=should_stop)
+    assert not path.exists()
+
+    # 워커는 취소 시 export_cancelled만 방출
+    worker = ExportWorker(results, str(path))
+    events = []
+    worker.export_complete.connect(lambda fp, n: events.append(('complete', n)))
+    worker.export_cancelled.connect(lambda fp: events.append(('cancelled',)))
+    worker.stop()
+    worker.run()
+    assert events == [('cancelled',)]
+    assert not path.exists()
@@ -0,0 +1,47 @@
+import pytest
+from PySide6.QtCore import Qt
+from src.ui.file_tree import FileTreeModel
+
+
+def _model_with_files(*names):
+    model = FileTreeModel()
+    model.add_files([(f'/data/{n}', n) for n in names])
+    return model
+
+
+def test_add_and_remove_only_touch_their_rows(qapp):
+    """[KR] 파일 추가/제거가 해당 행만 삽입·삭제하는지 테스트"""
+    model = _model_with_files('a.xlsx', 'b.xlsx', 'c.xlsx')
+    inserted, removed = [], []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+    model.modelReset.connect(lambda: pytest.fail("트리 전체 재구성"))
+
+    model.add_files([('/data/d.xlsx', 'd.xlsx'), ('/data/e.xlsx', 'e.xlsx')])
+    assert inserted == [(3, 4)]
+    assert model.remove_file('/data/b.xlsx')
+    assert removed == [(1, 1)]
+    assert not model.remove_file('/data/b.xlsx')
+    assert [model.index(i, 0).data(Qt.UserRole) for i in range(model.rowCount())] == [
+        '/data/a.xlsx', '/data/c.xlsx', '/data/d.xlsx', '/data/e.xlsx'
+    ]
+    assert model.file_index('/data/d.xlsx').row() == 2
+
+
+def test_set_sheets_appends_or_replaces(qapp):
+    """[KR] 시트 목록 갱신이 뒤에 붙은 시트만 추가하고, 순서가 바뀌면 교체하는지 테스트"""
+    model = _model_with_files('a.xlsx')
+    fp = '/data/a.xlsx'
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((parent.isValid(), first, last)))
+
+    assert model.set_sheets(fp, ['S1'])
+    assert model.set_sheets(fp, ['S1', 'S2', 'S3'])
+    assert inserted == [(True, 0, 0), (True, 1, 2)]
+    assert not model.set_sheets(fp, ['S1', 'S2', 'S3'])
+
+    assert model.set_sheets(fp, ['S3', 'S1'])
+    assert model.sheet_names(fp) == ['S3', 'S1']
+    sheet_index = model.index(0, 0, model.file_index(fp))
+    assert sheet_index.data(Qt.UserRole) == f'{fp}::S3'
+    assert not model.set_sheets('/data/missing.xlsx', ['S1'])
@@ -0,0 +1,136 @@
+import os
+import pandas as pd
+from src.core.cache import IndexCache
+from src.core.file_watcher import FileWatcher
+from src.core.indexer import SearchIndex, build_segment
+from src.core.workers import IndexWorker, ReindexWorker
+
+
+def _write_csv(path, names):
+    pd.DataFrame({'Name': names}).to_csv(path, index=False)
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_replace_file_swaps_only_that_file():
+    """[KR] replace_file이 해당 파일 데이터만 새 데이터로 교체하는지 테스트"""
+    index = SearchIndex()
+    index.add_dataframe('a.csv', 'a.csv', 'S1', pd.DataFrame({'Name': ['apple', 'banana']}))
+    index.add_dataframe('b.csv', 'b.csv', 'S1', pd.DataFrame({'Name': ['apple']}))
+    before = index.generation
+
+    cells = [(0, 0, 'cherry')]
+    index.replace_file('a.csv', 'a.csv', {'S1': (['Name'], cells, build_segment(cells))})
+
+    assert index.generation > before
+    assert [c.file_path for c in index.get_cells(index.find_cells_with_token('apple'))] == ['b.csv']
+    assert [c.value for c in index.get_cells(index.find_cells_with_token('cherry'))] == ['cherry']
+    assert index.find_cells_with_token('banana') == set()
+    assert index.total_rows == 2
+
+
+def test_reindex_worker_refreshes_index_and_cache(tmp_path):
+    """[KR] 변경된 파일 재인덱싱 시 인덱스와 캐시가 새 내용으로 갱신되는지 테스트"""
+    src = str(tmp_path / "data.csv")
+    _write_csv(src, ['alpha', 'beta'])
+    cache = IndexCache(str(tmp_path / "cache.db"))
+    index = SearchIndex()
+    IndexWorker([src], index, cache).run()
+    assert index.find_cells_with_token('alpha')
+
+    _write_csv(src, ['gamma', 'beta', 'delta'])
+    _bump_mtime(src)
+    assert not cache.is_file_cached(src)
+
+    reindexed = []
+    worker = ReindexWorker([src], index, cache)
+    worker.file_reindexed.connect(lambda fp, sheets: reindexed.append((fp, sheets)))
+    worker.run()
+
+    assert reindexed and reindexed[0][0] == src
+    assert index.find_cells_with_token('alpha') == set()
+    assert len(index.find_cells_with_token('gamma')) == 1
+    assert index.total_rows == 3
+    assert cache.is_file_cached(src)
+    values = sorted(c['value'] for c in cache.load_file_data(src)['cells'])
+    assert values == ['beta', 'delta', 'gamma']
+    cache.close()
+
+
+def test_watcher_reports_changed_and_removed(qapp, tmp_path):
+    """[KR] 내용이 바뀐 파일은 changed, 재확인 후에도 없는 파일은 removed로 알리는지 테스트"""
+    a = str(tmp_path / "a.csv")
+    b = str(tmp_path / "b.csv")
+    _write_csv(a, ['x'])
+    _write_csv(b, ['y'])
+    watcher = FileWatcher(debounce_ms=10_000)
+    watcher.MISSING_RETRIES = 1
+    changed, removed = [], []
+    watcher.files_changed.connect(changed.extend)
+    watcher.files_removed.connect(removed.extend)
+    watcher.set_files([a, b])
+
+    # 상태가 같으면 이벤트가 와도 변경으로 보지 않음
+    watcher._on_file_event(a)
+    watcher._flush()
+    assert changed == []
+
+    _write_csv(a, ['x', 'z'])
+    _bump_mtime(a)
+    os.remove(b)
+    watcher._on_file_event(a)
+    watcher._on_file_event(b)
+    watcher._flush()
+    assert changed == [a]
+    assert removed == []          # 원자적 교체일 수 있으므로 한 번 더 확인
+
+    watcher._flush()
+    assert removed == [b]
+    assert watcher.watched_files() == [a]
+    watcher.clear()
+
+
+def test_watcher_atomic_replace_is_a_change(qapp, tmp_path):
+    """[KR] 임시 파일로 바꿔치기한 저장도 변경으로 감지하고 감시를 유지하는지 테스트"""
+    a = str(tmp_path / "a.csv")
+    _write_csv(a, ['x'])
+    watcher = FileWatcher(debounce_ms=10_000)
+    changed, removed = [], []
+    watcher.files_changed.connect(changed.extend)
+    watcher.files_removed.connect(removed.extend)
+    watcher.watch_files([a])
+
+    tmp = str(tmp_path / "a.tmp")
+    _write_csv(tmp, ['x', 'new'])
+    os.replace(tmp, a)
+    _bump_mtime(a)
+    watcher._on_file_event(a)
+    watcher._flush()
+
+    assert changed == [a] and removed == []
+    assert a in watcher._watcher.files()
+    watcher.clear()
+
+
+def test_watcher_reports_new_files_in_folder(qapp, tmp_path):
+    """[KR] 감시 폴더(하위 폴더 포함)에 새로 생긴 지원 파일만 알리는지 테스트"""
+    _write_csv(str(tmp_path / "old.csv"), ['x'])
+    watcher = FileWatcher(debounce_ms=10_000)
+    added = []
+    watcher.files_added.connect(added.extend)
+    watcher.watch_folder(str(tmp_path))
+
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    _write_csv(str(sub / "new.csv"), ['y'])
+    (tmp_path / "~$old.xlsx").write_text("lock")
+    (tmp_path / "notes.txt").write_text("skip")
+    watcher._on_dir_event(str(tmp_path))
+    watcher._flush()
+
+    assert added == [str((sub / "new.csv").resolve())]
+    assert str(sub.resolve()) in watcher._watcher.directories()
+    watcher.clear()
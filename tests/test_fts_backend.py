@@ -0,0 +1,120 @@
+import pandas as pd
+import pytest
+from src.core.cache import IndexCache
+from src.core.fts_backend import FtsSearchBackend, is_fts5_available
+from src.core.indexer import SearchIndex
+from src.core.searcher import MultiLayerSearcher
+from src.ui.lazy_mime import LazyResultMimeData
+
+pytestmark = pytest.mark.skipif(not is_fts5_available(), reason="SQLite FTS5 trigram 미지원")
+
+
+@pytest.fixture
+def backends(tmp_path):
+    src = tmp_path / "data.csv"
+    src.write_text("placeholder")
+    df = pd.DataFrame({
+        '이름': ['홍길동', '김철수', 'Apple Pie', '이영희'],
+        '금액': ['1,000', '2500', '300', 'abc'],
+        '비고': ['서울 강남', '부산', 'seoul', 'apple'],
+    })
+    index = SearchIndex()
+    batch = index.add_dataframe(str(src), 'data.csv', 'Sheet1', df)
+    index.build_bm25()
+
+    db = str(tmp_path / "cache.db")
+    cache = IndexCache(db)
+    cache.save_file_data(str(src), 'data.csv', {'Sheet1': batch}, {'Sheet1': list(df.columns)})
+    cache.close()
+
+    fts = FtsSearchBackend(db)
+    yield str(src), index, fts, db
+    fts.close()
+
+
+def _rows(index, query):
+    return sorted(
+        (r.row.row_idx, r.match_type) for r in MultiLayerSearcher(index).search(query)
+    )
+
+
+def test_add_file_builds_search_tables(backends):
+    """[KR] 캐시된 파일을 추가하면 검색 테이블이 구축되고 통계가 반영되는지 테스트"""
+    path, _, fts, _ = backends
+    assert fts.add_file(path) == ['Sheet1']
+    assert fts.total_files == 1
+    assert fts.total_rows == 4
+    assert fts.total_cells == 12
+    assert fts.file_headers[(path, 'Sheet1')] == ['이름', '금액', '비고']
+    assert fts.get_row((path, 'Sheet1', 0)).cells['이름'] == '홍길동'
+
+
+@pytest.mark.parametrize("query", [
+    'apple', 'ap', '홍길', 'ㅎㄱㄷ', '1000~3000', 'seoul -강남', 'apple pie', 'aple',
+])
+def test_results_match_memory_index(backends, query):
+    """[KR] FTS 백엔드 검색 결과가 메모리 인덱스와 같은지 테스트"""
+    path, index, fts, _ = backends
+    fts.add_file(path)
+    assert _rows(fts, query) == _rows(index, query)
+
+
+def test_remove_file_and_cache_cleanup(backends):
+    """[KR] 검색 대상 제외와 캐시 삭제 시 검색 테이블 정리 테스트"""
+    path, _, fts, db = backends
+    fts.add_file(path)
+    generation = fts.generation
+    fts.remove_file(path)
+    assert fts.find_cells_containing('apple') == set()
+    # 검색 대상이 바뀌면 세대 번호 증가 (검색 후보 캐시 무효화)
+    assert fts.generation > generation
+
+    # 다시 추가하면 구축 없이 기존 검색 테이블을 사용
+    fts.add_file(path)
+    assert len(fts.find_cells_containing('apple')) == 2
+
+    cache = IndexCache(db)
+    cache.remove_file(path)
+    cache.close()
+    count = fts._conn.execute("SELECT COUNT(*) FROM search_cells").fetchone()[0]
+    assert count == 0
+
+
+def test_bm25_limit_applies_to_active_sheets(tmp_path, monkeypatch):
+    """[KR] 검색 대상에서 제외된 파일의 셀이 BM25 결과 한도를 차지하지 않아야 함"""
+    import src.core.fts_backend as fts_backend
+
+    db = str(tmp_path / "cache.db")
+    cache = IndexCache(db)
+    paths = []
+    for name, values in (('old.csv', ['apple'] * 5), ('new.csv', ['apple', 'banana'])):
+        path = tmp_path / name
+        path.write_text(name)  # 내용이 같으면 캐시 데이터를 공유하므로 파일마다 다르게
+        cells = [(i, 0, v) for i, v in enumerate(values)]
+        cache.save_file_data(str(path), name, {'Sheet1': cells}, {'Sheet1': ['과일']})
+        paths.append(str(path))
+    cache.close()
+
+    fts = FtsSearchBackend(db)
+    try:
+        # 먼저 구축된(rowid가 앞선) 파일을 검색 대상에서 제외
+        fts.add_file(paths[0])
+        fts.add_file(paths[1])
+        fts.remove_file(paths[0])
+
+        monkeypatch.setattr(fts_backend, 'MAX_MATCH_CELLS', 2)
+        assert set(fts.get_bm25_scores('apple')) == {(paths[1], 'Sheet1', 0)}
+    finally:
+        fts.close()
+
+
+def test_lazy_copy_rendered_before_backend_closes(backends):
+    """[KR] 지연 복사 데이터를 백엔드를 닫기 전에 만들어 두면 닫은 뒤에도 붙여넣을 수 있는지 테스트"""
+    path, _, fts, _ = backends
+    fts.add_file(path)
+    mime = LazyResultMimeData(MultiLayerSearcher(fts).search('apple', max_results=None))
+    text = mime.render()
+    fts.close()
+    assert mime.rendered
+    assert mime.text() == text
+    assert 'Apple Pie' in text
@@ -0,0 +1,124 @@
+import pandas as pd
+from src.core.indexer import SearchIndex, SheetMeta
+
+
+def _meta(file_path, sheet_name, headers):
+    return SheetMeta(
+        file_path=file_path, file_name=file_path, sheet_name=sheet_name,
+        rows=-1, cols=len(headers), headers=headers
+    )
+
+
+def test_add_and_find():
+    index = SearchIndex()
+    df = pd.DataFrame({'Name': ['Alice', '홍길동'], 'City': ['Seoul', 'Busan']})
+    index.add_dataframe('a.xlsx', 'a.xlsx', 'Sheet1', df)
+
+    assert index.total_rows == 2
+    assert len(index.find_cells_containing('ali')) == 1
+    assert len(index.find_cells_by_chosung('ㅎㄱㄷ')) == 1
+
+
+def test_lazy_sheet_registration():
+    """[KR] 메타데이터만 등록된 시트는 부분 인덱스 상태로 표시되어야 함"""
+    index = SearchIndex()
+    index.register_sheet_meta(_meta('a.xlsx', 'S1', ['Name']))
+    index.register_sheet_meta(_meta('a.xlsx', 'S2', ['Name']))
+
+    assert index.is_partial
+    assert index.is_file_known('a.xlsx')
+    assert index.file_headers[('a.xlsx', 'S1')] == ['Name']
+
+    index.add_dataframe('a.xlsx', 'a.xlsx', 'S1', pd.DataFrame({'Name': ['x']}))
+    index.mark_sheet_indexed('a.xlsx', 'S1')
+    assert index.pending_sheets == {('a.xlsx', 'S2')}
+
+    index.mark_sheet_indexed('a.xlsx', 'S2')
+    assert not index.is_partial
+
+
+def test_remove_sheet_keeps_meta():
+    index = SearchIndex()
+    index.register_sheet_meta(_meta('a.xlsx', 'S1', ['Name']))
+    index.add_dataframe('a.xlsx', 'a.xlsx', 'S1', pd.DataFrame({'Name': ['alpha']}))
+
+    index.remove_sheet('a.xlsx', 'S1')
+    assert index.total_rows == 0
+    assert not index.find_cells_containing('alpha')
+    assert ('a.xlsx', 'S1') in index.sheet_meta
+
+    index.remove_file('a.xlsx')
+    assert not index.is_file_known('a.xlsx')
+    assert not index.is_partial
+
+
+def test_add_dataframe_returns_cell_batch():
+    """[KR] 캐시 저장용으로 인덱싱된 셀만 (행, 열, 값) 순서대로 반환해야 함"""
+    index = SearchIndex()
+    df = pd.DataFrame({'Name': ['Alice', None], 'City': ['Seoul', 'Busan']})
+    batch = index.add_dataframe('a.xlsx', 'a.xlsx', 'Sheet1', df, row_offset=10)
+
+    assert batch == [(10, 0, 'Alice'), (10, 1, 'Seoul'), (11, 1, 'Busan')]
+    assert len(batch) == index.total_cells
+
+
+def test_search_during_indexing():
+    """[KR] 인덱싱 스레드가 청크를 추가하는 동안 검색해도 예외 없이 일관된 결과를 반환해야 함"""
+    import threading
+    from src.core.searcher import MultiLayerSearcher
+
+    chunk = pd.DataFrame({'Name': [f'item{i} 홍길동' for i in range(200)],
+                          'Price': [str(i) for i in range(200)]})
+    # 청크 하나를 넣었을 때의 결과 행 수 (정확 + 퍼지 매칭)
+    single = SearchIndex()
+    single.add_dataframe('a.xlsx', 'a.xlsx', 'S1', chunk)
+    per_chunk = len(MultiLayerSearcher(single).search('item1', max_results=100_000))
+    assert per_chunk > 0
+
+    index = SearchIndex()
+    errors = []
+    done = threading.Event()
+
+    def writer():
+        for n in range(30):
+            index.add_dataframe('a.xlsx', 'a.xlsx', 'S1', chunk, row_offset=n * 200)
+        done.set()
+
+    def reader():
+        try:
+            searcher = MultiLayerSearcher(index)
+            # 쓰기가 끝날 때까지 계속 검색 (청크가 추가되는 도중의 상태를 관찰)
+            while not done.is_set():
+                results = searcher.search('item1', max_results=100_000)
+                # 청크는 통째로 반영되므로 결과 행 수는 청크당 행 수의 배수여야 함
+                assert len(results) % per_chunk == 0
+                searcher.search('ㅎㄱㄷ 10~20')
+        except Exception as e:  # pragma: no cover - 실패 시 원인 보고용
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    assert index.total_rows == 30 * 200
+
+
+def test_bm25_snapshot_served_until_rebuild():
+    """[KR] 검색은 BM25를 재구축하지 않고, 워커가 다시 구축할 때까지 이전 스냅샷을 사용해야 함"""
+    index = SearchIndex()
+    index.add_dataframe('a.xlsx', 'a.xlsx', 'S1', pd.DataFrame({'Name': ['apple pie', 'banana', 'cherry', 'grape', 'melon']}))
+    index.build_bm25()
+    assert not index.bm25_dirty
+    before = index.get_bm25_scores('apple')
+    assert set(before) == {('a.xlsx', 'S1', 0)}
+
+    index.add_dataframe('b.xlsx', 'b.xlsx', 'S1', pd.DataFrame({'Name': ['apple juice']}))
+    assert index.bm25_dirty
+    assert index.get_bm25_scores('apple') == before
+    assert index.bm25_dirty
+
+    index.build_bm25()
+    assert set(index.get_bm25_scores('apple')) == {('a.xlsx', 'S1', 0), ('b.xlsx', 'S1', 0)}
@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+from src.core.indexer import SearchIndex, MAPPED_ID_BASE
+from src.core.mapped_index import MappedSheet, write_mapped_sheet
+from src.core.searcher import MultiLayerSearcher
+from src.core.segment import SegmentBuilder
+
+
+@pytest.fixture
+def tokenized():
+    df = pd.DataFrame({
+        'Name': ['Alice', '홍길동', 'Bob', None],
+        'Price': ['100', '2,500', '40', 'n/a'],
+    })
+    index = SearchIndex()
+    builder = SegmentBuilder()
+    index.add_dataframe('a.xlsx', 'a.xlsx', 'Sheet1', df, builder=builder)
+    return index, builder.build()
+
+
+@pytest.fixture
+def mapped_path(tmp_path, tokenized):
+    index, segment = tokenized
+    path = str(tmp_path / "sheet.dmap")
+    cells = [(c.row_idx, c.col_idx, c.value) for c in index.cells]
+    write_mapped_sheet(path, 'Sheet1', ['Name', 'Price'], cells, segment)
+    return path
+
+
+def test_open_and_read(mapped_path):
+    sheet = MappedSheet(mapped_path)
+    assert sheet.sheet_name == 'Sheet1'
+    assert sheet.cell_count == 7
+    assert sheet.row_count == 4
+    assert sheet.row_cells(1) == {'Name': '홍길동', 'Price': '2,500'}
+    assert sheet.row_cells(9) is None
+    assert list(sheet.find_token('bob')) == [4]
+    assert len(sheet.find_token('bo')) == 0
+    sheet.close()
+
+
+def test_bad_magic(tmp_path):
+    path = tmp_path / "bad.dmap"
+    path.write_bytes(b'XXXX' + b'\0' * 64)
+    with pytest.raises(ValueError):
+        MappedSheet(str(path))
+
+
+def test_search_on_mapped_sheet(tokenized, mapped_path):
+    """[KR] 매핑 시트에 대한 검색 결과가 토큰화한 인덱스와 같아야 함"""
+    original, _ = tokenized
+    mapped = SearchIndex()
+    mapped.attach_mapped('a.xlsx', 'a.xlsx', MappedSheet(mapped_path))
+
+    assert mapped.total_rows == original.total_rows
+    assert mapped.file_headers[('a.xlsx', 'Sheet1')] == ['Name', 'Price']
+    for query in ('ali', 'ㅎㄱㄷ', '50~3000', 'Alcie', 'bob -alice'):
+        expected = MultiLayerSearcher(original).search(query)
+        actual = MultiLayerSearcher(mapped).search(query)
+        assert [(r.row.row_idx, r.match_type, r.row.cells) for r in actual] == \
+               [(r.row.row_idx, r.match_type, r.row.cells) for r in expected]
+
+    assert min(mapped.find_cells_containing('ali')) >= MAPPED_ID_BASE
+    mapped.remove_file('a.xlsx')
+    assert mapped.total_rows == 0
+    assert not mapped.find_cells_containing('ali')
@@ -0,0 +1,52 @@
+import random
+import string
+import pandas as pd
+from rapidfuzz import fuzz, process
+from src.core import indexer as indexer_module
+from src.core.indexer import SearchIndex
+from src.core.parallel import map_shards, split_ranges, top_k
+from src.core.searcher import MultiLayerSearcher
+
+
+def test_map_shards_keeps_order():
+    """[KR] 병렬 실행해도 결과는 샤드 순서대로 반환되어야 함"""
+    shards = (list(range(i, i + 3)) for i in range(0, 30, 3))
+    assert map_shards(sum, shards, workers=4) == [sum(range(i, i + 3)) for i in range(0, 30, 3)]
+    assert map_shards(sum, [], workers=4) == []
+    assert map_shards(sum, [[1, 2]], workers=4) == [3]
+
+
+def test_split_ranges_and_top_k():
+    """[KR] 구간 분할과 샤드 결과 top-K 병합 테스트"""
+    assert split_ranges(10, 4) == [range(0, 4), range(4, 8), range(8, 10)]
+    assert split_ranges(0, 4) == []
+    merged = top_k([[('a', 90), ('b', 70)], [('c', 90), ('d', 80)]], 3, key=lambda m: m[1])
+    assert merged == [('a', 90), ('c', 90), ('d', 80)]
+
+
+def test_fuzzy_shard_matches_extract():
+    """[KR] 샤드 퍼지 매칭이 rapidfuzz extract와 같은 토큰/점수/순서를 반환해야 함"""
+    random.seed(7)
+    vocab = [''.join(random.choices('abcdeklmnop', k=random.randint(3, 9))) for _ in range(3000)]
+    expected = process.extract('abcde', vocab, scorer=fuzz.WRatio, score_cutoff=60, limit=50)
+    got = MultiLayerSearcher._fuzzy_shard('abcde', vocab, 60)
+    assert [(t, round(s, 6)) for t, s, _ in got] == [(t, round(s, 6)) for t, s, _ in expected]
+
+
+def test_sharded_search_equals_single_shard(monkeypatch):
+    """[KR] 어휘/숫자 컬럼을 여러 샤드로 나누어도 검색 결과가 같아야 함"""
+    random.seed(3)
+    words = [''.join(random.choices(string.ascii_lowercase, k=6)) for _ in range(400)]
+    df = pd.DataFrame({'Word': words, 'Num': [str(i) for i in range(400)]})
+    index = SearchIndex()
+    index.add_dataframe('a.xlsx', 'a.xlsx', 'S1', df)
+
+    def run():
+        return [(r.row.row_idx, round(r.score, 6))
+                for r in MultiLayerSearcher(index, workers=4).search(words[5][:5] + ' 100~150')]
+
+    baseline = run()
+    monkeypatch.setattr(MultiLayerSearcher, 'VOCAB_SHARD_SIZE', 37)
+    monkeypatch.setattr(indexer_module, 'RANGE_SHARD_CELLS', 53)
+    assert run() == baseline
+    assert index.find_cells_in_range(100, 150) == {i * 2 + 1 for i in range(100, 151)}
@@ -0,0 +1,90 @@
+from PySide6.QtCore import Qt
+from src.core.indexer import RowData
+from src.core.searcher import MatchDetail, SearchResult
+from src.core.snippet import build_snippet
+from src.ui.result_model import CHECK_COLUMN, HIGHLIGHT_SPANS_ROLE, MATCH_COLOR_ROLE, ResultTableModel
+from src.ui.styles import Colors
+
+
+def _result(row_idx, name, qty, match_col='Name', match_type='exact'):
+    row = RowData('a.xlsx', 'a.xlsx', 'S1', row_idx,
+                  {'Name': name, 'Qty': qty}, ['Name', 'Qty'])
+    match = MatchDetail(match_col, name if match_col == 'Name' else qty, match_type, 1.0)
+    return SearchResult(row, 1.0, match_type, 1.0, [match])
+
+
+def _model():
+    results = [_result(0, 'apple', '3'), _result(1, 'banana', '7', match_col='Qty', match_type='range')]
+    return ResultTableModel(results, ['Name', 'Qty'])
+
+
+def test_model_shape_and_values(qapp):
+    """[KR] 행/열 수와 셀 값, 헤더가 결과 목록과 일치하는지 테스트"""
+    model = _model()
+    assert model.rowCount() == 2
+    assert model.columnCount() == 3
+    assert model.data(model.index(1, 1)) == 'banana'
+    assert model.data(model.index(1, 2)) == '7'
+    assert model.data(model.index(0, CHECK_COLUMN)) is None
+    assert model.headerData(1, Qt.Horizontal) == 'Name'
+    assert model.headerData(CHECK_COLUMN, Qt.Horizontal) == ''
+
+
+def test_match_color_only_on_matched_columns(qapp):
+    """[KR] 매칭된 셀에만 매칭 유형 색상이 제공되는지 테스트"""
+    model = _model()
+    assert model.data(model.index(0, 1), MATCH_COLOR_ROLE) == Colors.match_color('exact')
+    assert model.data(model.index(0, 2), MATCH_COLOR_ROLE) is None
+    assert model.data(model.index(1, 1), MATCH_COLOR_ROLE) is None
+    assert model.data(model.index(1, 2), MATCH_COLOR_ROLE) == Colors.match_color('range')
+
+
+def test_check_state_and_select_all(qapp):
+    """[KR] 체크 상태 변경과 전체 선택/해제가 checked_results에 반영되는지 테스트"""
+    model = _model()
+    changes = []
+    model.check_changed.connect(lambda: changes.append(1))
+
+    assert model.checked_results() == []
+    assert model.flags(model.index(0, CHECK_COLUMN)) & Qt.ItemIsUserCheckable
+    assert model.setData(model.index(1, CHECK_COLUMN), Qt.Checked, Qt.CheckStateRole)
+    assert model.data(model.index(1, CHECK_COLUMN), Qt.CheckStateRole) == Qt.Checked
+    assert [r.row.row_idx for r in model.checked_results()] == [1]
+    # 데이터 열은 체크할 수 없음
+    assert not model.setData(model.index(0, 1), Qt.Checked, Qt.CheckStateRole)
+
+    model.set_all_checked(True)
+    assert [r.row.row_idx for r in model.checked_results()] == [0, 1]
+    model.set_all_checked(False)
+    assert model.checked_results() == []
+    assert len(changes) == 3
+
+
+def test_preview_columns_and_full_rows(qapp):
+    """[KR] 미리보기 결과는 스니펫 컬럼만 보여 주고, 전체 행으로 바꾸면 모든 컬럼을 보여 주는지 테스트"""
+    headers = [f'C{i}' for i in range(8)]
+    full_cells = {h: h.lower() for h in headers}
+
+    def preview(row_idx, col):
+        snippet = build_snippet(headers, full_cells, [(col, col.lower())], ['c'], context=1)
+        row = RowData('a.xlsx', 'a.xlsx', 'S1', row_idx, snippet.cells, headers)
+        return SearchResult(row, 1.0, 'exact', 1.0, [MatchDetail(col, col.lower(), 'exact', 1.0)], snippet)
+
+    model = ResultTableModel([preview(0, 'C2')], headers)
+    assert model.is_preview()
+    assert [model.headerData(c, Qt.Horizontal) for c in range(1, model.columnCount())] == ['C1', 'C2', 'C3']
+    assert model.data(model.index(0, 2), HIGHLIGHT_SPANS_ROLE) == [(0, 1)]
+
+    # 다음 페이지의 스니펫 컬럼이 열에 추가됨
+    model.append_results([preview(1, 'C6')])
+    assert model.columnCount() == 7
+    assert model.data(model.index(0, 4)) == ''
+
+    model.setData(model.index(1, CHECK_COLUMN), Qt.Checked, Qt.CheckStateRole)
+    full = [SearchResult(RowData('a.xlsx', 'a.xlsx', 'S1', i, dict(full_cells), headers), 1.0, 'exact', 1.0)
+            for i in range(2)]
+    model.show_full_rows(full)
+    assert not model.is_preview()
+    assert model.columnCount() == 9
+    assert model.data(model.index(0, 8)) == 'c7'
+    assert [r.row.row_idx for r in model.checked_results()] == [1]
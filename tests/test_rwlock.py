@@ -0,0 +1,69 @@
+import threading
+import time
+import pytest
+from src.core.rwlock import ReadWriteLock
+
+
+def test_readers_share_writer_excludes():
+    """[KR] 읽기 락은 동시에 여러 스레드가, 쓰기 락은 단독으로 잡아야 함"""
+    lock = ReadWriteLock()
+    active = []
+    seen_concurrent = []
+
+    def reader():
+        with lock.read_locked():
+            active.append(1)
+            time.sleep(0.05)
+            seen_concurrent.append(len(active))
+            active.pop()
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert max(seen_concurrent) > 1
+
+    order = []
+    lock.acquire_read()
+    writer = threading.Thread(target=lambda: (lock.acquire_write(), order.append('w'), lock.release_write()))
+    writer.start()
+    time.sleep(0.05)
+    assert order == []          # 읽기 중에는 쓰기 대기
+    lock.release_read()
+    writer.join(1)
+    assert order == ['w']
+
+
+def test_reentrant_read_and_writer_preference():
+    """[KR] 같은 스레드의 중첩 읽기는 쓰기 대기자가 있어도 통과해야 함"""
+    lock = ReadWriteLock()
+    done = []
+    lock.acquire_read()
+    writer = threading.Thread(target=lambda: (lock.acquire_write(), done.append('w'), lock.release_write()))
+    writer.start()
+    time.sleep(0.05)
+
+    # 다른 스레드의 새 읽기는 대기 중인 쓰기 뒤로 밀림
+    late = threading.Thread(target=lambda: (lock.acquire_read(), done.append('r'), lock.release_read()))
+    late.start()
+    time.sleep(0.05)
+    assert done == []
+
+    with lock.read_locked():    # 중첩 읽기는 교착 없이 통과
+        pass
+    lock.release_read()
+    writer.join(1)
+    late.join(1)
+    assert done == ['w', 'r']
+
+
+def test_write_inside_read_raises():
+    """[KR] 읽기 락을 잡은 채 쓰기 락을 요청하면 교착 대신 예외"""
+    lock = ReadWriteLock()
+    with lock.read_locked():
+        with pytest.raises(RuntimeError):
+            lock.acquire_write()
+    with lock.write_locked():
+        with lock.read_locked():
+            pass
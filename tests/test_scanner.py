@@ -53,3 +53,37 @@ def test_read_xlsx_chunks(temp_files):
 
     df = chunks[0]['data']
     assert "Charlie" in df['Name'].values
+
+def test_read_workbook_meta(tmp_path, temp_files):
+    scanner = FileScanner()
+    xlsx_file = [f for f in temp_files if f.endswith('.xlsx')][0]
+    csv_file = [f for f in temp_files if f.endswith('.csv')][0]
+
+    meta = scanner.read_workbook_meta(xlsx_file)
+    assert len(meta) == 1
+    assert meta[0]['headers'] == ["Name", "Age"]
+    assert meta[0]['rows'] == 1
+
+    meta = scanner.read_workbook_meta(csv_file)
+    assert meta[0]['sheet_name'] == "test.csv"
+    assert meta[0]['headers'] == ["Name", "Age"]
+    assert meta[0]['rows'] == -1
+
+def test_read_sheet_chunks(tmp_path):
+    # 두 번째 시트만 읽는지 확인
+    xlsx_file = tmp_path / "multi.xlsx"
+    wb = Workbook()
+    ws1 = wb.active
+    ws1.title = "First"
+    ws1.append(["A"])
+    ws1.append(["first-row"])
+    ws2 = wb.create_sheet("Second")
+    ws2.append(["B"])
+    ws2.append(["second-row"])
+    wb.save(xlsx_file)
+
+    scanner = FileScanner()
+    chunks = list(scanner.read_sheet_chunks(str(xlsx_file), "Second"))
+    assert len(chunks) == 1
+    assert chunks[0]['sheet_name'] == "Second"
+    assert list(chunks[0]['data']['B']) == ["second-row"]
@@ -0,0 +1,68 @@
+from src.core.search_scheduler import SearchScheduler
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_debounce_follows_latency_and_index_size():
+    """[KR] 디바운스가 측정한 검색 시간과 인덱스 크기 변화에 맞춰 조정되는지 테스트"""
+    scheduler = SearchScheduler()
+    # 측정값이 없으면 인덱스 크기로 판단
+    scheduler.set_index_size(1_000)
+    assert scheduler.debounce_ms() == SearchScheduler.MIN_DEBOUNCE_MS
+    scheduler.set_index_size(1_000_000)
+    assert scheduler.debounce_ms() == SearchScheduler.DEFAULT_DEBOUNCE_MS
+
+    # 빠른 검색 → 최소값 근처
+    scheduler.set_index_size(10_000)
+    for _ in range(3):
+        scheduler.record_latency(0.002)
+    assert scheduler.debounce_ms() < 50
+
+    # 인덱스가 100배 커지면 같은 측정값도 100배로 보정
+    scheduler.set_index_size(1_000_000)
+    assert scheduler.estimated_latency_ms() == 200.0
+    assert scheduler.debounce_ms() == 40 + 300
+
+    # 아주 느린 검색은 최대값으로 제한
+    for _ in range(8):
+        scheduler.record_latency(5.0)
+    assert scheduler.debounce_ms() == SearchScheduler.MAX_DEBOUNCE_MS
+
+
+def test_intermediate_queries_skipped_and_final_query_runs():
+    """[KR] 검색 중 들어온 중간 검색어는 건너뛰고 마지막 검색어만 이어서 실행되는지 테스트"""
+    scheduler = SearchScheduler()
+    assert scheduler.request('a') == 'a'
+    assert scheduler.request('ap') is None
+    assert scheduler.request('app') is None
+    assert scheduler.request('appl') is None
+
+    assert scheduler.finished(0.5) == 'appl'
+    assert scheduler.in_flight == 'appl'
+    assert scheduler.finished(0.5) is None
+    assert scheduler.in_flight is None
+
+    # 같은 검색어라도 검색 중에 다시 요청되면 (유사도 변경 등) 끝난 뒤 한 번 더 실행
+    assert scheduler.request('x') == 'x'
+    assert scheduler.request('x') is None
+    assert scheduler.request('x') is None
+    assert scheduler.finished() == 'x'
+    assert scheduler.finished() is None
+
+
+def test_stale_in_flight_search_expires():
+    """[KR] 완료 알림이 오지 않은 검색이 일정 시간 뒤 끝난 것으로 처리되는지 테스트"""
+    clock = _Clock()
+    scheduler = SearchScheduler(clock=clock)
+    assert scheduler.request('a') == 'a'
+    clock.now += SearchScheduler.IN_FLIGHT_TIMEOUT / 2
+    assert scheduler.request('b') is None
+    clock.now += SearchScheduler.IN_FLIGHT_TIMEOUT
+    assert scheduler.request('c') == 'c'
+    assert scheduler.finished() is None
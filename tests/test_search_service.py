@@ -0,0 +1,209 @@
+import threading
+import pandas as pd
+from PySide6.QtCore import Qt
+from src.core.indexer import SearchIndex
+from src.core.workers import SearchService
+
+
+def _index():
+    index = SearchIndex()
+    index.add_dataframe('a.xlsx', 'a.xlsx', 'S1', pd.DataFrame({'Name': ['Alice', 'Bob', 'Alicia']}))
+    return index
+
+
+def test_service_answers_requests():
+    """[KR] 하나의 상주 스레드가 여러 요청을 순서대로 처리하는지 테스트"""
+    service = SearchService(_index())
+    received = []
+    done = threading.Event()
+
+    def on_results(results, partial):
+        received.append(sorted(r.row.cells['Name'] for r in results))
+        done.set()
+
+    service.results_ready.connect(on_results, Qt.DirectConnection)
+    service.start()
+    try:
+        for query, expected in [('alice', ['Alice']), ('bob', ['Bob'])]:
+            done.clear()
+            service.submit(query, 0.95)
+            assert done.wait(5)
+            assert received[-1] == expected
+    finally:
+        service.stop()
+        service.wait()
+    assert not service.isRunning()
+
+
+def test_only_latest_pending_request_runs():
+    """[KR] 검색 중 쌓인 요청은 마지막 것만 실행되는지 테스트"""
+    index = _index()
+    service = SearchService(index)
+    queries = []
+    gate = threading.Event()
+    original = service._searcher.search
+
+    def slow_search(query, **kwargs):
+        queries.append(query)
+        gate.wait(5)
+        return original(query, **kwargs)
+
+    service._searcher.search = slow_search
+    finished = threading.Event()
+    results_for = []
+    service.results_ready.connect(
+        lambda results, partial: (results_for.append(len(results)), finished.set()),
+        Qt.DirectConnection
+    )
+    service.start()
+    try:
+        service.submit('a')
+        while not queries:
+            threading.Event().wait(0.01)
+        for q in ('al', 'ali', 'alic'):
+            service.submit(q, 0.95)
+        gate.set()
+        assert finished.wait(5)
+    finally:
+        gate.set()
+        service.stop()
+        service.wait()
+
+    # 'a' 검색 결과는 새 요청이 있어 폐기되고, 중간 요청 'al', 'ali'는 실행되지 않음
+    assert queries == ['a', 'alic']
+    assert len(results_for) == 1
+
+
+def test_vocabulary_snapshot_reused_until_index_changes():
+    """[KR] 인덱스가 바뀌지 않으면 어휘 스냅샷을 재사용하는지 테스트"""
+    index = _index()
+    next(index.iter_vocabulary())
+    snapshot = index._vocab_snapshot
+    next(index.iter_vocabulary())
+    assert index._vocab_snapshot is snapshot
+
+    generation = index.generation
+    index.add_dataframe('b.xlsx', 'b.xlsx', 'S1', pd.DataFrame({'Name': ['Carol']}))
+    assert index.generation > generation
+    assert 'carol' in next(index.iter_vocabulary())
+
+
+def test_unbounded_ranking_serves_pages():
+    """[KR] 결과 수 제한 없이 검색하고 이후 페이지를 요청에 따라 보내는지 테스트"""
+    index = SearchIndex()
+    index.add_dataframe('a.xlsx', 'a.xlsx', 'S1',
+                        pd.DataFrame({'Code': [f'AB-{i}' for i in range(450)]}))
+    service = SearchService(index)
+    rankings, first, pages = [], [], []
+    done = threading.Event()
+    service.ranking_ready.connect(lambda qid, ranked: rankings.append((qid, ranked)),
+                                  Qt.DirectConnection)
+    service.results_ready.connect(lambda results, partial: (first.append(results), done.set()),
+                                  Qt.DirectConnection)
+    service.page_ready.connect(lambda qid, offset, results: (pages.append((offset, results)), done.set()),
+                               Qt.DirectConnection)
+    service.start()
+    try:
+        service.submit('ab', 0.95)
+        assert done.wait(5)
+        query_id, ranked = rankings[-1]
+        assert len(ranked) == 450
+        assert len(first[-1]) == 200
+
+        done.clear()
+        service.request_page(query_id, 400)
+        assert done.wait(5)
+        assert pages[-1][0] == 400 and len(pages[-1][1]) == 50
+
+        # 이전 검색 번호의 페이지 요청은 무시
+        done.clear()
+        service.request_page(query_id - 1, 200)
+        assert not done.wait(0.3)
+    finally:
+        service.stop()
+        service.wait()
+
+    # 전체 순위는 순회 시 모든 행을 점수순으로 만듦
+    rows = [r.row.row_idx for r in ranked]
+    assert sorted(rows) == list(range(450))
+    assert [r.row.row_idx for r in ranked[:3]] == [r.row.row_idx for r in first[-1][:3]]
+
+
+def _fuzzy_index():
+    index = SearchIndex()
+    words = ['apple', 'appel', 'aple', 'apply', 'maple', 'applesauce', 'grape', 'pineapple', 'ample']
+    index.add_dataframe('a.xlsx', 'a.xlsx', 'S1', pd.DataFrame({
+        'Name': words, 'Kind': ['fruit', 'typo', 'typo', 'verb', 'tree', 'food', 'fruit', 'fruit', 'adj']
+    }))
+    return index
+
+
+def _snapshot(results):
+    return [(r.row.row_idx, round(r.score, 6), r.match_type, round(r.similarity, 6)) for r in results]
+
+
+def test_similarity_change_reuses_candidates(monkeypatch):
+    """[KR] 같은 검색어의 유사도만 바뀌면 후보를 다시 계산하지 않고 새 검색과 같은 결과를 내는지 테스트"""
+    from src.core.searcher import MultiLayerSearcher
+    index = _fuzzy_index()
+    searcher = MultiLayerSearcher(index)
+    calls = []
+    collect = searcher._collect
+    monkeypatch.setattr(searcher, '_collect', lambda *args: calls.append(1) or collect(*args))
+
+    for query in ('apple -tree', 'appl fruit'):
+        for similarity in (0.4, 0.6, 0.75, 0.9, 0.5):
+            expected = MultiLayerSearcher(index).search(query, min_similarity=similarity)
+            assert _snapshot(searcher.search(query, min_similarity=similarity)) == _snapshot(expected)
+    # 검색어마다 한 번만 후보 계산
+    assert len(calls) == 2
+
+
+def test_candidate_cache_invalidated_on_index_change():
+    """[KR] 인덱스가 바뀌면 보관한 후보를 버리고 다시 검색하는지 테스트"""
+    from src.core.searcher import MultiLayerSearcher
+    index = _fuzzy_index()
+    searcher = MultiLayerSearcher(index)
+    before = len(searcher.search('apple', min_similarity=0.6))
+
+    index.add_dataframe('b.xlsx', 'b.xlsx', 'S1', pd.DataFrame({'Name': ['apples']}))
+    after = searcher.search('apple', min_similarity=0.8)
+    assert len(after) > 0
+    assert any(r.row.file_path == 'b.xlsx' for r in after)
+    assert _snapshot(after) == _snapshot(MultiLayerSearcher(index).search('apple', min_similarity=0.8))
+    assert before > 0
+
+
+def test_page_failure_reports_page_error_only():
+    """[KR] 다음 페이지 실패는 page_error로만 알리고 search_error(검색 종료 처리)는 방출하지 않아야 함"""
+    index = SearchIndex()
+    index.add_dataframe('a.xlsx', 'a.xlsx', 'S1',
+                        pd.DataFrame({'Code': [f'AB-{i}' for i in range(300)]}))
+    service = SearchService(index)
+    rankings, page_errors, search_errors = [], [], []
+    done = threading.Event()
+    service.ranking_ready.connect(lambda qid, ranked: rankings.append((qid, ranked)),
+                                  Qt.DirectConnection)
+    service.results_ready.connect(lambda results, partial: done.set(), Qt.DirectConnection)
+    service.page_error.connect(lambda qid, offset, msg: (page_errors.append((qid, offset)), done.set()),
+                               Qt.DirectConnection)
+    service.search_error.connect(search_errors.append, Qt.DirectConnection)
+    service.start()
+    try:
+        service.submit('ab', 0.95)
+        assert done.wait(5)
+        query_id, ranked = rankings[-1]
+
+        def broken_page(*args, **kwargs):
+            raise RuntimeError("row lookup failed")
+
+        ranked.page = broken_page
+        done.clear()
+        service.request_page(query_id, 200)
+        assert done.wait(5)
+    finally:
+        service.stop()
+        service.wait()
+
+    assert page_errors == [(query_id, 200)]
+    assert search_errors == []
@@ -0,0 +1,60 @@
+import math
+import pandas as pd
+import pytest
+from src.core.indexer import SearchIndex
+from src.core.searcher import MultiLayerSearcher
+from src.core.segment import IndexSegment, SegmentBuilder
+
+
+def _build(df):
+    index = SearchIndex()
+    builder = SegmentBuilder()
+    index.add_dataframe('a.xlsx', 'a.xlsx', 'Sheet1', df, builder=builder)
+    return index, builder.build()
+
+
+def _cells(index):
+    return [(c.row_idx, c.col_idx, c.value) for c in index.cells]
+
+
+def test_round_trip():
+    df = pd.DataFrame({'Name': ['Alice', '홍길동'], 'Price': ['1,200', 'abc']})
+    index, segment = _build(df)
+
+    restored = IndexSegment.from_bytes(segment.to_bytes())
+    assert restored.tokens == segment.tokens
+    assert restored.chosung_tokens == segment.chosung_tokens
+    assert list(restored.token_postings) == list(segment.token_postings)
+    assert restored.numeric[1] == 1200.0
+    assert math.isnan(restored.numeric[3])
+
+
+def test_bad_format():
+    with pytest.raises(ValueError):
+        IndexSegment.from_bytes(__import__('zlib').compress(b'XXXX' + b'\0' * 40))
+
+
+def test_load_segment_matches_tokenized_index():
+    """[KR] 세그먼트로 적재한 인덱스는 토큰화한 인덱스와 같은 검색 결과를 내야 함"""
+    df = pd.DataFrame({'Name': ['Alice', '홍길동', 'Bob'], 'Price': [100, 2500, 40]})
+    original, segment = _build(df)
+
+    loaded = SearchIndex()
+    # 앞에 다른 시트가 있어도 전역 셀 번호로 올바르게 옮겨져야 함
+    loaded.add_dataframe('b.xlsx', 'b.xlsx', 'Other', pd.DataFrame({'X': ['alice']}))
+    loaded.load_segment('a.xlsx', 'a.xlsx', 'Sheet1', ['Name', 'Price'],
+                        _cells(original), IndexSegment.from_bytes(segment.to_bytes()))
+    loaded.remove_file('b.xlsx')
+
+    for query in ('alice', 'ㅎㄱㄷ', '100~3000'):
+        expected = MultiLayerSearcher(original).search(query)
+        actual = MultiLayerSearcher(loaded).search(query)
+        assert [(r.row.row_idx, r.match_type) for r in actual] == \
+               [(r.row.row_idx, r.match_type) for r in expected]
+    assert loaded.rows[('a.xlsx', 'Sheet1', 1)].cells == {'Name': '홍길동', 'Price': '2500'}
+
+
+def test_load_segment_cell_count_mismatch():
+    _, segment = _build(pd.DataFrame({'Name': ['Alice']}))
+    with pytest.raises(ValueError):
+        SearchIndex().load_segment('a.xlsx', 'a.xlsx', 'Sheet1', ['Name'], [], segment)
@@ -0,0 +1,60 @@
+import os
+import pytest
+from openpyxl import Workbook
+from src.core.cache import IndexCache, FILE_VALID, FILE_STALE, FILE_MISSING
+from src.core.indexer import SearchIndex
+from src.core.workers import IndexWorker, SessionRestoreWorker
+
+
+def _write(path, value):
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Name"])
+    ws.append([value])
+    wb.save(path)
+
+
+@pytest.fixture
+def session(tmp_path):
+    paths = [str(tmp_path / f"f{i}.xlsx") for i in range(3)]
+    for i, path in enumerate(paths):
+        _write(path, f"value{i}")
+    cache = IndexCache(str(tmp_path / "cache.db"))
+    IndexWorker(paths, SearchIndex(), cache).run()
+    yield paths, cache
+    cache.close()
+
+
+def test_validate_files(session, tmp_path):
+    paths, cache = session
+    _write(paths[1], "changed")
+    os.remove(paths[2])
+    new_path = str(tmp_path / "new.xlsx")
+    _write(new_path, "new")
+
+    statuses = cache.validate_files(paths + [new_path])
+    assert statuses == {
+        paths[0]: FILE_VALID,
+        paths[1]: FILE_STALE,
+        paths[2]: FILE_MISSING,
+        new_path: FILE_STALE,
+    }
+
+
+def test_session_restore_worker(session):
+    """[KR] 유효한 캐시는 복원하고, 변경된 파일은 재인덱싱하며, 없는 파일은 알려야 함"""
+    paths, cache = session
+    _write(paths[1], "changed")
+    os.remove(paths[2])
+
+    index = SearchIndex()
+    worker = SessionRestoreWorker(paths, index, cache)
+    restored, missing = [], []
+    worker.restore_finished.connect(lambda r, q, t: restored.append((r, q)))
+    worker.files_missing.connect(missing.extend)
+    worker.run()
+
+    assert restored == [(1, 1)]
+    assert missing == [paths[2]]
+    assert index.indexed_files == {paths[0], paths[1]}
+    assert index.find_cells_containing('changed')
@@ -0,0 +1,195 @@
+import os
+import re
+import zipfile
+import pytest
+from openpyxl import Workbook
+from src.core.cache import IndexCache, compute_shared_signature, compute_sheet_signatures
+from src.core.indexer import SearchIndex
+from src.core.workers import IndexWorker, ReindexWorker
+
+
+def _write_book(path, data):
+    wb = Workbook()
+    wb.remove(wb.active)
+    for sheet_name, rows in data.items():
+        ws = wb.create_sheet(sheet_name)
+        ws.append(['Name', 'Qty'])
+        for row in rows:
+            ws.append(row)
+    wb.save(path)
+    # 같은 초에 다시 저장해도 변경으로 인식되도록 mtime을 앞으로 이동
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+
+
+def _touch_sheet_part(path, part):
+    """값은 그대로 두고 시트 파트의 서식 속성만 바꿉니다 (파트 CRC만 달라짐)."""
+    with zipfile.ZipFile(path) as zf:
+        parts = {info.filename: zf.read(info.filename) for info in zf.infolist()}
+    parts[part] = parts[part].replace(b'baseColWidth="8"', b'baseColWidth="9"')
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, data in parts.items():
+            zf.writestr(name, data)
+
+
+BOOK = {
+    'S1': [['apple', 1], ['banana', 2]],
+    'S2': [['cherry', 30], ['durian', 40]],
+    'S3': [['elder', 500]],
+}
+
+
+@pytest.fixture
+def indexed(tmp_path):
+    path = str(tmp_path / "book.xlsx")
+    _write_book(path, BOOK)
+    cache = IndexCache(str(tmp_path / "cache.db"), use_mapped_index=False)
+    index = SearchIndex()
+    IndexWorker([path], index, cache, lazy=True).run()
+    yield path, index, cache
+    cache.close()
+
+
+def _reindex(path, index, cache, monkeypatch):
+    """재인덱싱하면서 실제로 읽은 시트와 교체한 시트를 기록"""
+    read, replaced = [], []
+    worker = ReindexWorker([path], index, cache)
+    original_read = worker.scanner.read_sheet_chunks
+    original_replace = index.replace_sheets
+
+    def spy_read(file_path, sheet_name, **kwargs):
+        read.append(sheet_name)
+        return original_read(file_path, sheet_name, **kwargs)
+
+    def spy_replace(file_path, file_name, sheets, removed=()):
+        replaced.append((sorted(sheets), sorted(removed)))
+        return original_replace(file_path, file_name, sheets, removed)
+
+    monkeypatch.setattr(worker.scanner, 'read_sheet_chunks', spy_read)
+    monkeypatch.setattr(index, 'replace_sheets', spy_replace)
+    worker.run()
+    return read, replaced
+
+
+def _values(index, token):
+    return sorted((c.sheet_name, c.value) for c in index.get_cells(index.find_cells_with_token(token)))
+
+
+def test_signatures_change_only_for_edited_sheet(tmp_path):
+    """[KR] 숫자만 바뀐 시트는 그 시트의 서명만 달라지는지 테스트"""
+    path = str(tmp_path / "book.xlsx")
+    _write_book(path, BOOK)
+    before = compute_sheet_signatures(path)
+    _write_book(path, {**BOOK, 'S2': [['cherry', 31], ['durian', 40]]})
+    after = compute_sheet_signatures(path)
+
+    assert list(before) == ['S1', 'S2', 'S3']
+    assert [name for name in before if before[name] != after[name]] == ['S2']
+    assert compute_sheet_signatures(str(tmp_path / "none.csv")) is None
+
+
+def test_only_changed_sheet_is_read(indexed, monkeypatch):
+    """[KR] 서명이 바뀐 시트만 다시 읽고 교체하며 캐시도 갱신되는지 테스트"""
+    path, index, cache = indexed
+    assert cache.get_sheet_fingerprints(path) is not None
+
+    _write_book(path, {**BOOK, 'S2': [['cherry', 31], ['durian', 40]]})
+    read, replaced = _reindex(path, index, cache, monkeypatch)
+
+    assert read == ['S2']
+    assert replaced == [(['S2'], [])]
+    assert _values(index, '31') == [('S2', '31')]
+    assert _values(index, '30') == []
+    assert _values(index, 'apple') == [('S1', 'apple')]
+    assert index.total_rows == 5
+
+    # 캐시: 파일은 유효하고, 시트별 데이터는 새 내용
+    assert cache.is_file_cached(path)
+    stored = cache.load_sheet_segments(path)
+    assert sorted(stored['sheets']) == ['S1', 'S2', 'S3']
+    assert (0, 1, '31') in stored['sheets']['S2']['cells']
+    assert len(stored['sheets']['S1']['cells']) == 4
+
+
+def test_rewritten_part_with_same_values_is_kept(indexed, monkeypatch):
+    """[KR] 파트가 바뀌어도 값이 같은 시트는 읽지도 교체하지도 않으며, 없어진 시트는 제거"""
+    path, index, cache = indexed
+    _write_book(path, {'S2': BOOK['S2'], 'S3': [['elderberry', 500]]})
+    _touch_sheet_part(path, 'xl/worksheets/sheet1.xml')   # S1 삭제 후 S2의 파트
+    read, replaced = _reindex(path, index, cache, monkeypatch)
+
+    assert read == ['S3']
+    assert replaced == [(['S3'], ['S1'])]
+    assert _values(index, 'apple') == []
+    assert _values(index, 'elderberry') == [('S3', 'elderberry')]
+    assert _values(index, 'cherry') == [('S2', 'cherry')]
+    assert sorted(cache.get_sheet_fingerprints(path)) == ['S2', 'S3']
+
+
+
+def _use_shared_strings(path):
+    """
+    openpyxl이 인라인으로 쓴 문자열을 Excel처럼 공유 문자열 테이블로 옮깁니다.
+    테이블은 시트 순서대로 처음 나온 순서이므로, 앞 시트에 문자열이 추가되면 뒤 시트의 번호가 밀립니다.
+    """
+    with zipfile.ZipFile(path) as zf:
+        parts = {info.filename: zf.read(info.filename) for info in zf.infolist()}
+    strings = {}
+
+    def to_shared(match):
+        index = strings.setdefault(match.group(1), len(strings))
+        return b't="s"><v>%d</v>' % index
+
+    for name in sorted(n for n in parts if n.startswith('xl/worksheets/')):
+        parts[name] = re.sub(rb't="inlineStr"><is><t>(.*?)</t></is>', to_shared, parts[name])
+    items = b''.join(b'<si><t>%s</t></si>' % text for text in strings)
+    parts['xl/sharedStrings.xml'] = (
+        b'<?xml version="1.0" encoding="UTF-8"?><sst xmlns="http://schemas.openxmlformats.org/'
+        b'spreadsheetml/2006/main" count="%d" uniqueCount="%d">%s</sst>' % (len(strings), len(strings), items)
+    )
+    parts['[Content_Types].xml'] = parts['[Content_Types].xml'].replace(b'</Types>', (
+        b'<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-'
+        b'officedocument.spreadsheetml.sharedStrings+xml"/></Types>'))
+    parts['xl/_rels/workbook.xml.rels'] = parts['xl/_rels/workbook.xml.rels'].replace(b'</Relationships>', (
+        b'<Relationship Id="rIdSst" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+        b'relationships/sharedStrings" Target="sharedStrings.xml"/></Relationships>'))
+    st = os.stat(path)
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, data in parts.items():
+            zf.writestr(name, data)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+@pytest.mark.parametrize("edit, expected, changed_parts, added", [
+    # 같은 자리의 문자열만 바뀜 → 워크시트 파트는 모두 그대로, 공유 문자열 파트만 바뀜
+    ({'S2': [['cranberry', 30], ['durian', 40]]}, 'S2', [], 'cranberry'),
+    # 앞 시트에 새 문자열 추가 → 뒤 시트들의 공유 문자열 번호가 밀려 파트도 바뀜
+    ({'S1': [['apple', 1], ['avocado', 3], ['banana', 2]]}, 'S1', ['S1', 'S2', 'S3'], 'avocado'),
+])
+def test_shared_strings_change_reads_only_edited_sheet(tmp_path, monkeypatch, edit, expected,
+                                                       changed_parts, added):
+    """[KR] 텍스트 편집으로 공유 문자열이 다시 쓰여도 값이 바뀐 시트만 DataFrame으로 읽는지 테스트"""
+    path = str(tmp_path / "book.xlsx")
+    _write_book(path, BOOK)
+    _use_shared_strings(path)
+    cache = IndexCache(str(tmp_path / "cache.db"), use_mapped_index=False)
+    index = SearchIndex()
+    IndexWorker([path], index, cache, lazy=True).run()
+
+    before, shared_before = compute_sheet_signatures(path), compute_shared_signature(path)
+    _write_book(path, {**BOOK, **edit})
+    _use_shared_strings(path)
+    after = compute_sheet_signatures(path)
+    assert [name for name in before if before[name] != after[name]] == changed_parts
+    assert compute_shared_signature(path) != shared_before
+
+    read, replaced = _reindex(path, index, cache, monkeypatch)
+
+    assert read == [expected]
+    assert replaced == [([expected], [])]
+    assert _values(index, added) == [(expected, added)]
+    assert _values(index, 'elder') == [('S3', 'elder')]
+    assert cache.is_file_cached(path)
+    # 서명이 모두 갱신되었으므로 다시 검사해도 아무 시트도 읽지 않음
+    assert _reindex(path, index, cache, monkeypatch) == ([], [])
+    cache.close()
@@ -0,0 +1,52 @@
+import pandas as pd
+from src.core.indexer import SearchIndex
+from src.core.searcher import MultiLayerSearcher, load_full_rows
+from src.core.snippet import build_snippet, highlight_spans, snippet_columns
+
+
+def test_highlight_spans_merge_and_ignore_case():
+    """[KR] 강조 범위가 대소문자를 무시하고 겹치는 범위를 합치는지 테스트"""
+    assert highlight_spans('Apple pie APPLE', ['apple']) == [(0, 5), (10, 15)]
+    assert highlight_spans('applepie', ['apple', 'lepi']) == [(0, 7)]
+    assert highlight_spans('a.b', ['.']) == [(1, 2)]
+    assert highlight_spans('banana', ['kiwi']) == []
+
+
+def test_snippet_window_and_fallback_highlight():
+    """[KR] 매칭 컬럼 양옆만 남기고, 키워드가 없는 매칭은 셀 전체를 강조하는지 테스트"""
+    headers = [f'C{i}' for i in range(10)]
+    cells = {h: h.lower() for h in headers}
+    cells['C0'] = 'Apple'
+    cells['C6'] = 'aple'
+    snippet = build_snippet(headers, cells, [('C0', 'Apple'), ('C6', 'aple')], ['apple'], context=1)
+    assert snippet.columns == ['C0', 'C1', 'C5', 'C6', 'C7']
+    assert snippet.cells['C6'] == 'aple'
+    assert snippet.highlights == {'C0': [(0, 5)], 'C6': [(0, 4)]}
+    assert snippet.truncated
+
+    assert snippet_columns(headers[:3], ['C1'], context=2) == headers[:3]
+    assert snippet_columns(headers, [], context=1) == ['C0', 'C1', 'C2']
+
+
+def test_preview_page_and_full_rows():
+    """[KR] 미리보기 페이지는 스니펫 컬럼만 담고, load_full_rows로 전체 행을 다시 읽는지 테스트"""
+    cols = {f'C{i}': [f'v{i}_{r}' for r in range(6)] for i in range(30)}
+    cols['C15'] = ['apple', 'x', 'apple pie', 'y', 'z', 'w']
+    index = SearchIndex()
+    index.add_dataframe('a.xlsx', 'a.xlsx', 'S1', pd.DataFrame(cols))
+
+    ranked = MultiLayerSearcher(index).search('apple', max_results=None)
+    preview = ranked.page(0, 10, snippet_context=2)
+    assert [r.row.row_idx for r in preview] == [r.row.row_idx for r in ranked.page(0, 10)]
+    assert all(r.is_preview for r in preview)
+    assert set(preview[0].row.cells) == {'C13', 'C14', 'C15', 'C16', 'C17'}
+    assert preview[0].snippet.highlights['C15'] == [(0, 5)]
+
+    full = load_full_rows(index, preview)
+    assert [r.row.row_idx for r in full] == [r.row.row_idx for r in preview]
+    assert all(not r.is_preview and len(r.row.cells) == 30 for r in full)
+    # 좁은 시트는 전체 행 그대로
+    narrow = SearchIndex()
+    narrow.add_dataframe('b.xlsx', 'b.xlsx', 'S1', pd.DataFrame({'Name': ['apple'], 'Qty': ['3']}))
+    page = MultiLayerSearcher(narrow).search('apple', max_results=None).page(0, 10, snippet_context=2)
+    assert not page[0].is_preview and page[0].row.cells == {'Name': 'apple', 'Qty': '3'}
@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from src.core.fts_backend import is_fts5_available
+from src.core.workers import StartupWorker
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_main_window_import_defers_heavy_modules():
+    """[KR] 메인 윈도우 import 시 pandas/openpyxl/rank_bm25/rapidfuzz/numpy를 불러오지 않는지 테스트"""
+    code = (
+        "import sys, src.ui.main_window; "
+        "print(','.join(m for m in ('pandas', 'openpyxl', 'rank_bm25', 'rapidfuzz', 'numpy', 'xxhash') if m in sys.modules))"
+    )
+    env = dict(os.environ, PYTHONPATH=str(ROOT), QT_QPA_PLATFORM='offscreen')
+    proc = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env,
+                          capture_output=True, text=True, check=True)
+    assert proc.stdout.strip() == ''
+
+
+def test_startup_worker_opens_cache_and_backend(tmp_path):
+    """[KR] 시작 준비 워커가 캐시 DB(와 FTS 백엔드)를 열어 전달하는지 테스트"""
+    use_fts = is_fts5_available()
+    worker = StartupWorker(use_fts, str(tmp_path / 'cache.db'))
+    ready = []
+    worker.backend_ready.connect(lambda cache, fts: ready.append((cache, fts)))
+    worker.run()
+
+    assert len(ready) == 1
+    cache, fts = ready[0]
+    try:
+        assert cache.db_path == str(tmp_path / 'cache.db')
+        assert cache.get_stats()['files'] == 0
+        assert (fts is not None) == use_fts
+    finally:
+        if fts is not None:
+            fts.close()
+        cache.close()